@@ -2,7 +2,7 @@ from typing import Any
 
 from apify_client import ApifyClientAsync
 from apify_client.http_clients import HttpClientAsync, HttpResponse
-from apify_client.types import Timeout
+from apify_client.types import RequestDataAsync, Timeout
 
 TOKEN = 'MY-APIFY-TOKEN'
 
@@ -17,7 +17,7 @@ class MyHttpClientAsync(HttpClientAsync):
         url: str,
         headers: dict[str, str] | None = None,
         params: dict[str, Any] | None = None,
-        data: str | bytes | bytearray | None = None,
+        data: RequestDataAsync | None = None,
         json: Any = None,
         stream: bool | None = None,
         timeout: Timeout = 'medium',
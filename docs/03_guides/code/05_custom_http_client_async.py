@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import asyncio
 from http import HTTPStatus
+from mmap import mmap
 from typing import TYPE_CHECKING, Any
 
 import httpx
@@ -11,7 +12,7 @@ from apify_client.errors import ApifyApiError
 from apify_client.http_clients import HttpClientAsync, HttpResponse
 
 if TYPE_CHECKING:
-    from apify_client.types import Timeout
+    from apify_client.types import RequestDataAsync, Timeout
 
 TOKEN = 'MY-APIFY-TOKEN'
 
@@ -30,7 +31,7 @@ class HttpxClientAsync(HttpClientAsync):
         url: str,
         headers: dict[str, str] | None = None,
         params: dict[str, Any] | None = None,
-        data: str | bytes | bytearray | None = None,
+        data: RequestDataAsync | None = None,
         json: Any = None,
         stream: bool | None = None,
         timeout: Timeout = 'medium',
@@ -41,12 +42,16 @@ class HttpxClientAsync(HttpClientAsync):
         # with the per-request ones.
         headers = self._merge_headers(self._headers, headers)
 
+        # HTTPX takes strings, bytes and iterables of bytes chunks as they are,
+        # but not buffers, so a memory-mapped file or a memoryview is copied.
+        content = bytes(data) if isinstance(data, (memoryview, mmap)) else data
+
         response = await self._client.request(
             method=method,
             url=url,
             headers=headers,
             params=params,
-            content=data,
+            content=content,
             json=json,
             timeout=timeout_secs,
         )
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from http import HTTPStatus
+from mmap import mmap
 from typing import TYPE_CHECKING, Any
 
 import httpx
@@ -10,7 +11,7 @@ from apify_client.errors import ApifyApiError
 from apify_client.http_clients import HttpClient, HttpResponse
 
 if TYPE_CHECKING:
-    from apify_client.types import Timeout
+    from apify_client.types import RequestData, Timeout
 
 TOKEN = 'MY-APIFY-TOKEN'
 
@@ -29,7 +30,7 @@ class HttpxClient(HttpClient):
         url: str,
         headers: dict[str, str] | None = None,
         params: dict[str, Any] | None = None,
-        data: str | bytes | bytearray | None = None,
+        data: RequestData | None = None,
         json: Any = None,
         stream: bool | None = None,
         timeout: Timeout = 'medium',
@@ -40,12 +41,16 @@ class HttpxClient(HttpClient):
         # with the per-request ones.
         headers = self._merge_headers(self._headers, headers)
 
+        # HTTPX takes strings, bytes and iterables of bytes chunks as they are,
+        # but not buffers, so a memory-mapped file or a memoryview is copied.
+        content = bytes(data) if isinstance(data, (memoryview, mmap)) else data
+
         response = self._client.request(
             method=method,
             url=url,
             headers=headers,
             params=params,
-            content=data,
+            content=content,
             json=json,
             timeout=timeout_secs,
         )
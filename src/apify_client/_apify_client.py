@@ -13,6 +13,7 @@ from apify_client._consts import (
     DEFAULT_TIMEOUT_MAX,
     DEFAULT_TIMEOUT_MEDIUM,
     DEFAULT_TIMEOUT_SHORT,
+    MIN_COMPRESSION_SIZE,
 )
 from apify_client._docs import docs_group
 from apify_client._resource_clients import (
@@ -80,6 +81,7 @@ if TYPE_CHECKING:
     from datetime import timedelta
 
     from apify_client.http_compressors._base import HttpCompressor
+    from apify_client.record_cache import RecordCache
     from apify_client.types import HttpCompressionAlgorithm
 
 
@@ -346,13 +348,35 @@ class ApifyClient:
         """Get the sub-client for the dataset collection, allowing to list and create datasets."""
         return DatasetCollectionClient(**self._base_kwargs)
 
-    def key_value_store(self, key_value_store_id: str) -> KeyValueStoreClient:
+    def key_value_store(
+        self,
+        key_value_store_id: str,
+        *,
+        record_cache: RecordCache | None = None,
+        record_compression: HttpCompressionAlgorithm | HttpCompressor | None = None,
+        record_compression_min_size: int = MIN_COMPRESSION_SIZE,
+    ) -> KeyValueStoreClient:
         """Get the sub-client for a specific key-value store.
 
         Args:
             key_value_store_id: ID of the key-value store to be manipulated.
+            record_cache: Disk cache to keep the records read with `get_record` and `get_record_as_bytes` in, so that
+                repeated reads of a record skip downloading it again. See `RecordCache`.
+            record_compression: Compression to store the records set with `set_record` and `set_record_from_path`
+                with. Values of at least `record_compression_min_size` bytes, whose content type is not compressed
+                already and which are not already compressed with the same encoding, such as a gzip file with gzip,
+                are compressed with it and stored with the matching `Content-Encoding`, and the records read back are
+                decompressed transparently. Pass a string literal to select an algorithm, or an `HttpCompressor`
+                instance for a custom one. By default, records are stored the way they are uploaded.
+            record_compression_min_size: Smallest record value, in bytes, that is stored compressed.
         """
-        return KeyValueStoreClient(resource_id=key_value_store_id, **self._base_kwargs)
+        return KeyValueStoreClient(
+            resource_id=key_value_store_id,
+            record_cache=record_cache,
+            record_compression=record_compression,
+            record_compression_min_size=record_compression_min_size,
+            **self._base_kwargs,
+        )
 
     def key_value_stores(self) -> KeyValueStoreCollectionClient:
         """Get the sub-client for the key-value store collection, allowing to list and create key-value stores."""
@@ -709,13 +733,35 @@ class ApifyClientAsync:
         """Get the sub-client for the dataset collection, allowing to list and create datasets."""
         return DatasetCollectionClientAsync(**self._base_kwargs)
 
-    def key_value_store(self, key_value_store_id: str) -> KeyValueStoreClientAsync:
+    def key_value_store(
+        self,
+        key_value_store_id: str,
+        *,
+        record_cache: RecordCache | None = None,
+        record_compression: HttpCompressionAlgorithm | HttpCompressor | None = None,
+        record_compression_min_size: int = MIN_COMPRESSION_SIZE,
+    ) -> KeyValueStoreClientAsync:
         """Get the sub-client for a specific key-value store.
 
         Args:
             key_value_store_id: ID of the key-value store to be manipulated.
+            record_cache: Disk cache to keep the records read with `get_record` and `get_record_as_bytes` in, so that
+                repeated reads of a record skip downloading it again. See `RecordCache`.
+            record_compression: Compression to store the records set with `set_record` and `set_record_from_path`
+                with. Values of at least `record_compression_min_size` bytes, whose content type is not compressed
+                already and which are not already compressed with the same encoding, such as a gzip file with gzip,
+                are compressed with it and stored with the matching `Content-Encoding`, and the records read back are
+                decompressed transparently. Pass a string literal to select an algorithm, or an `HttpCompressor`
+                instance for a custom one. By default, records are stored the way they are uploaded.
+            record_compression_min_size: Smallest record value, in bytes, that is stored compressed.
         """
-        return KeyValueStoreClientAsync(resource_id=key_value_store_id, **self._base_kwargs)
+        return KeyValueStoreClientAsync(
+            resource_id=key_value_store_id,
+            record_cache=record_cache,
+            record_compression=record_compression,
+            record_compression_min_size=record_compression_min_size,
+            **self._base_kwargs,
+        )
 
     def key_value_stores(self) -> KeyValueStoreCollectionClientAsync:
         """Get the sub-client for the key-value store collection, allowing to list and create key-value stores."""
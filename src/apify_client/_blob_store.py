@@ -0,0 +1,274 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from apify_client._docs import docs_group
+from apify_client._logging import logger_name
+from apify_client._utils.concurrency import ContextThreadPoolExecutor
+
+if TYPE_CHECKING:
+    import os
+    from collections.abc import Iterable
+
+    from apify_client._resource_clients import KeyValueStoreClient, KeyValueStoreClientAsync
+    from apify_client.types import Timeout
+
+logger = logging.getLogger(logger_name)
+
+
+class BlobStoreBase:
+    """Base class for deriving the keys of `BlobStore` blobs and tracking the blobs known to be stored."""
+
+    def __init__(
+        self,
+        *,
+        store_url: str,
+        key_prefix: str,
+        manifest_path: str | os.PathLike[str] | None,
+        max_parallel: int,
+    ) -> None:
+        if max_parallel < 1:
+            raise ValueError(f'max_parallel must be at least 1, got {max_parallel}')
+
+        self._key_prefix = key_prefix
+        self._manifest_path = Path(manifest_path) if manifest_path is not None else None
+        self._max_parallel = max_parallel
+        self._known_keys = set[str]()
+        self._manifest_lock = threading.Lock()
+        # The first line of the manifest names the store its keys were found in, so that a manifest written for
+        # another store is not taken for this one.
+        self._manifest_header = f'# store: {store_url}'
+        self._manifest_started = False
+        if self._manifest_path is not None and self._manifest_path.exists():
+            header, _, keys = self._manifest_path.read_text(encoding='utf-8').partition('\n')
+            if header == self._manifest_header:
+                self._known_keys.update(keys.split())
+                self._manifest_started = True
+            else:
+                logger.warning(
+                    f'Ignoring the blob store manifest {self._manifest_path}, it was not written for the store '
+                    f'{store_url}. It will be overwritten.'
+                )
+
+    @property
+    def known_keys(self) -> frozenset[str]:
+        """Keys of the blobs known to be stored, from the manifest and from the blobs stored or found so far."""
+        return frozenset(self._known_keys)
+
+    def key_for(self, value: bytes) -> str:
+        """Return the key a value is stored under, derived from the SHA-256 hash of its content.
+
+        Args:
+            value: The content of the blob.
+        """
+        return f'{self._key_prefix}{hashlib.sha256(value).hexdigest()}'
+
+    def _unknown_blobs(self, values: Iterable[bytes]) -> tuple[list[str], dict[str, bytes]]:
+        """Return the key of each value, in order, and the distinct values whose keys are not known to be stored."""
+        keys = list[str]()
+        unknown = dict[str, bytes]()
+        for value in values:
+            key = self.key_for(value)
+            keys.append(key)
+            if key not in self._known_keys:
+                unknown.setdefault(key, value)
+        return keys, unknown
+
+    def _remember(self, keys: Iterable[str]) -> None:
+        """Record that blobs are stored, appending the keys that are new to the manifest."""
+        with self._manifest_lock:
+            new_keys = [key for key in keys if key not in self._known_keys]
+            self._known_keys.update(new_keys)
+            if self._manifest_path is not None and new_keys:
+                with self._manifest_path.open('a' if self._manifest_started else 'w', encoding='utf-8') as manifest:
+                    if not self._manifest_started:
+                        manifest.write(f'{self._manifest_header}\n')
+                        self._manifest_started = True
+                    manifest.writelines(f'{key}\n' for key in new_keys)
+
+
+@docs_group('Other')
+class BlobStore(BlobStoreBase):
+    """Stores values in a key-value store under keys derived from their content, uploading each distinct value once.
+
+    The key of a blob is the SHA-256 hash of its content, so identical values share one record. Before a value is
+    uploaded, the store checks whether its record already exists, with the checks of a batch of values running in
+    parallel, and skips the upload if it does. Keys of blobs known to be stored are remembered, and kept in a manifest
+    file when one is given, so that storing the same value again, also in a later run, takes no request at all. The
+    manifest is tied to the store by its URL, and a manifest written for another store is ignored and overwritten.
+    Blobs deleted from the store are not noticed, so delete the manifest together with them.
+
+    The content type of a blob is the one it was first uploaded with, as values with the same content share a record.
+    Obtain an instance via `KeyValueStoreClient.get_blob_store`.
+    """
+
+    def __init__(
+        self,
+        key_value_store_client: KeyValueStoreClient,
+        *,
+        store_url: str,
+        key_prefix: str,
+        manifest_path: str | os.PathLike[str] | None,
+        max_parallel: int,
+    ) -> None:
+        """Initialize the blob store, reading the manifest if it exists.
+
+        Args:
+            key_value_store_client: Client of the key-value store the blobs are stored in.
+            store_url: URL of the key-value store, recorded in the manifest to tie it to the store.
+            key_prefix: Prefix of the keys of the blobs.
+            manifest_path: File the keys of the blobs known to be stored are kept in, or None to keep them in memory.
+            max_parallel: Maximum number of existence checks or uploads running at the same time.
+        """
+        super().__init__(
+            store_url=store_url, key_prefix=key_prefix, manifest_path=manifest_path, max_parallel=max_parallel
+        )
+        self._key_value_store_client = key_value_store_client
+
+    def put(self, value: bytes, *, content_type: str | None = None, timeout: Timeout = 'long') -> str:
+        """Store a value, unless a blob with the same content is already stored.
+
+        Args:
+            value: The content of the blob.
+            content_type: The content type the blob is uploaded with, if it is uploaded.
+            timeout: Timeout for each API HTTP request.
+
+        Returns:
+            The key the value is stored under.
+        """
+        return self.put_many([value], content_type=content_type, timeout=timeout)[0]
+
+    def put_many(
+        self, values: Iterable[bytes], *, content_type: str | None = None, timeout: Timeout = 'long'
+    ) -> list[str]:
+        """Store many values, uploading only those whose content is not stored yet.
+
+        The existence of the blobs that are not known to be stored is checked in parallel, and the missing ones are
+        then uploaded in parallel. Duplicate values within the batch are checked and uploaded once.
+
+        Args:
+            values: The contents of the blobs. They are held in memory until the batch is stored.
+            content_type: The content type the blobs are uploaded with, if they are uploaded.
+            timeout: Timeout for each API HTTP request.
+
+        Returns:
+            The key of each value, in the order of the values.
+        """
+        keys, unknown = self._unknown_blobs(values)
+        if not unknown:
+            return keys
+
+        with ContextThreadPoolExecutor(max_workers=self._max_parallel) as executor:
+            exists = list(
+                executor.map(lambda key: self._key_value_store_client.record_exists(key, timeout=timeout), unknown)
+            )
+        self._remember(key for key, found in zip(unknown, exists, strict=True) if found)
+
+        missing = {key: unknown[key] for key, found in zip(unknown, exists, strict=True) if not found}
+        results = self._key_value_store_client.set_records(
+            missing, content_type=content_type, max_parallel=self._max_parallel, timeout=timeout
+        )
+        self._remember(result.key for result in results if result.error is None)
+
+        for result in results:
+            if result.error is not None:
+                raise result.error
+        return keys
+
+
+@docs_group('Other')
+class BlobStoreAsync(BlobStoreBase):
+    """Stores values in a key-value store under keys derived from their content, uploading each distinct value once.
+
+    The key of a blob is the SHA-256 hash of its content, so identical values share one record. Before a value is
+    uploaded, the store checks whether its record already exists, with the checks of a batch of values running in
+    parallel, and skips the upload if it does. Keys of blobs known to be stored are remembered, and kept in a manifest
+    file when one is given, so that storing the same value again, also in a later run, takes no request at all. The
+    manifest is tied to the store by its URL, and a manifest written for another store is ignored and overwritten.
+    Blobs deleted from the store are not noticed, so delete the manifest together with them.
+
+    The content type of a blob is the one it was first uploaded with, as values with the same content share a record.
+    Obtain an instance via `KeyValueStoreClientAsync.get_blob_store`.
+    """
+
+    def __init__(
+        self,
+        key_value_store_client: KeyValueStoreClientAsync,
+        *,
+        store_url: str,
+        key_prefix: str,
+        manifest_path: str | os.PathLike[str] | None,
+        max_parallel: int,
+    ) -> None:
+        """Initialize the blob store, reading the manifest if it exists.
+
+        Args:
+            key_value_store_client: Client of the key-value store the blobs are stored in.
+            store_url: URL of the key-value store, recorded in the manifest to tie it to the store.
+            key_prefix: Prefix of the keys of the blobs.
+            manifest_path: File the keys of the blobs known to be stored are kept in, or None to keep them in memory.
+            max_parallel: Maximum number of existence checks or uploads running at the same time.
+        """
+        super().__init__(
+            store_url=store_url, key_prefix=key_prefix, manifest_path=manifest_path, max_parallel=max_parallel
+        )
+        self._key_value_store_client = key_value_store_client
+
+    async def put(self, value: bytes, *, content_type: str | None = None, timeout: Timeout = 'long') -> str:
+        """Store a value, unless a blob with the same content is already stored.
+
+        Args:
+            value: The content of the blob.
+            content_type: The content type the blob is uploaded with, if it is uploaded.
+            timeout: Timeout for each API HTTP request.
+
+        Returns:
+            The key the value is stored under.
+        """
+        return (await self.put_many([value], content_type=content_type, timeout=timeout))[0]
+
+    async def put_many(
+        self, values: Iterable[bytes], *, content_type: str | None = None, timeout: Timeout = 'long'
+    ) -> list[str]:
+        """Store many values, uploading only those whose content is not stored yet.
+
+        The existence of the blobs that are not known to be stored is checked in parallel, and the missing ones are
+        then uploaded in parallel. Duplicate values within the batch are checked and uploaded once.
+
+        Args:
+            values: The contents of the blobs. They are held in memory until the batch is stored.
+            content_type: The content type the blobs are uploaded with, if they are uploaded.
+            timeout: Timeout for each API HTTP request.
+
+        Returns:
+            The key of each value, in the order of the values.
+        """
+        # Hashing large values would block the event loop, so it runs in a worker thread.
+        keys, unknown = await asyncio.to_thread(self._unknown_blobs, values)
+        if not unknown:
+            return keys
+
+        semaphore = asyncio.Semaphore(self._max_parallel)
+
+        async def check(key: str) -> bool:
+            async with semaphore:
+                return await self._key_value_store_client.record_exists(key, timeout=timeout)
+
+        exists = await asyncio.gather(*(check(key) for key in unknown))
+        await asyncio.to_thread(self._remember, [key for key, found in zip(unknown, exists, strict=True) if found])
+
+        missing = {key: unknown[key] for key, found in zip(unknown, exists, strict=True) if not found}
+        results = await self._key_value_store_client.set_records(
+            missing, content_type=content_type, max_parallel=self._max_parallel, timeout=timeout
+        )
+        await asyncio.to_thread(self._remember, [result.key for result in results if result.error is None])
+
+        for result in results:
+            if result.error is not None:
+                raise result.error
+        return keys
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
+from apify_client._utils.signing import SigningKeyCache
+
 if TYPE_CHECKING:
     from apify_client._resource_clients import (
         ActorClient,
@@ -64,7 +66,7 @@ if TYPE_CHECKING:
 
 @dataclass
 class ClientRegistry:
-    """Bundle of all sync client classes for dependency injection.
+    """Bundle of all sync client classes, and the state they share, for dependency injection.
 
     This config object is passed to the resource clients to avoid circular dependencies. Each resource client
     receives this config and can instantiate other clients as needed.
@@ -98,10 +100,13 @@ class ClientRegistry:
     webhook_dispatch_client: type[WebhookDispatchClient]
     webhook_dispatch_collection_client: type[WebhookDispatchCollectionClient]
 
+    signing_keys: SigningKeyCache = field(default_factory=SigningKeyCache)
+    """Cache of the URL signing secret keys of storages, shared by the clients created from the same `ApifyClient`."""
+
 
 @dataclass
 class ClientRegistryAsync:
-    """Bundle of all async client classes for dependency injection.
+    """Bundle of all async client classes, and the state they share, for dependency injection.
 
     This config object is passed to the resource clients to avoid circular dependencies. Each resource client
     receives this config and can instantiate other clients as needed.
@@ -134,3 +139,6 @@ class ClientRegistryAsync:
     webhook_collection_client: type[WebhookCollectionClientAsync]
     webhook_dispatch_client: type[WebhookDispatchClientAsync]
     webhook_dispatch_collection_client: type[WebhookDispatchCollectionClientAsync]
+
+    signing_keys: SigningKeyCache = field(default_factory=SigningKeyCache)
+    """Cache of the URL signing secret keys of storages, shared by the clients created from the same `ApifyClient`."""
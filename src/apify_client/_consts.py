@@ -35,6 +35,28 @@ DEFAULT_WAIT_WHEN_JOB_NOT_EXIST = timedelta(seconds=3)
 OVERRIDABLE_DEFAULT_HEADERS = {'Accept', 'Authorization', 'Accept-Encoding', 'User-Agent'}
 """Headers that can be overridden by users, but will trigger a warning if they do so, as it may lead to API errors."""
 
+MAX_PAYLOAD_SIZE_BYTES = 9 * 1024 * 1024
+"""Maximum payload size (9 MB) the API accepts for a single batch call."""
+
+PAYLOAD_SAFETY_BUFFER_PERCENT = 0.01 / 100
+"""Safety margin (0.01%) deducted from the maximum payload size when splitting payloads into batches."""
+
+DEFAULT_SIGNING_KEY_TTL = timedelta(minutes=10)
+"""How long the URL signing secret key of a storage is cached before it is fetched again."""
+
+DEFAULT_SPOOL_MAX_MEMORY_BYTES = 16 * 1024 * 1024
+"""Default size (16 MB) up to which a downloaded body is spooled in memory before it rolls over to a temporary file."""
+
+MIN_DOWNLOAD_PART_SIZE = 8 * 1024 * 1024
+"""Smallest byte range (8 MB) a record download is split into when it is downloaded in parallel parts."""
+
+DEFAULT_RECORD_CACHE_MAX_SIZE_BYTES = 256 * 1024 * 1024
+"""Default size (256 MB) the records in a key-value store record cache may take on disk before the least recently used
+ones are evicted."""
+
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+"""Size (1 MB) of the chunks a streamed or memory-mapped request body is read and compressed in."""
+
 MIN_COMPRESSION_SIZE = 1024
 """Smallest request body, in bytes, that is worth compressing.
 
@@ -0,0 +1,358 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import sqlite3
+from contextlib import closing
+from itertools import islice
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Literal
+
+from more_itertools import chunked
+
+from apify_client._docs import docs_group
+from apify_client._utils.concurrency import ContextThreadPoolExecutor
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Iterator
+
+    from apify_client._resource_clients import DatasetClient, DatasetClientAsync
+    from apify_client.types import Timeout
+
+MirrorStorage = Literal['jsonl', 'sqlite']
+"""Formats of the local copy kept by `DatasetMirror`."""
+
+_READ_CHUNK_SIZE = 1000
+"""Number of lines `DatasetMirrorAsync.iterate_items` reads from the local copy in one worker thread call."""
+
+
+class _JsonlMirrorStore:
+    """Keeps the mirrored items in a JSON Lines file, with the sync state in a JSON file next to it.
+
+    The state records the byte size of the data file along with the item count. Items appended by a sync that was
+    interrupted before its state was saved are cut off on the next load, so the file and the count never diverge.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self._path = path
+        self._state_path = path.with_name(f'{path.name}.state.json')
+
+    def load_offset(self) -> int:
+        state = json.loads(self._state_path.read_text()) if self._state_path.exists() else {'offset': 0, 'size': 0}
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        with self._path.open('ab') as file:
+            file.truncate(state['size'])
+        return state['offset']
+
+    def append(self, lines: list[bytes], *, offset: int) -> None:
+        with self._path.open('ab') as file:
+            for line in lines:
+                file.write(line + b'\n')
+            size = file.tell()
+        # Replace the state file in one step, so an interruption leaves either the old or the new state behind.
+        temporary_path = self._state_path.with_name(f'{self._state_path.name}.tmp')
+        temporary_path.write_text(json.dumps({'offset': offset, 'size': size}))
+        os.replace(temporary_path, self._state_path)
+
+    def iterate(self) -> Iterator[bytes]:
+        if not self._path.exists():
+            return
+        with self._path.open('rb') as file:
+            yield from (line for line in file if line.strip())
+
+
+class _SqliteMirrorStore:
+    """Keeps the mirrored items in an SQLite table keyed by their position in the dataset.
+
+    Each sync appends its items in one transaction, so the item count is always the number of rows.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self._path = path
+
+    def _connect(self) -> sqlite3.Connection:
+        # The connection is used by one thread at a time, but the async mirror may hop between worker threads.
+        connection = sqlite3.connect(self._path, check_same_thread=False)
+        connection.execute('CREATE TABLE IF NOT EXISTS items (position INTEGER PRIMARY KEY, item TEXT NOT NULL)')
+        return connection
+
+    def load_offset(self) -> int:
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        with closing(self._connect()) as connection:
+            (count,) = connection.execute('SELECT COUNT(*) FROM items').fetchone()
+        return count
+
+    def append(self, lines: list[bytes], *, offset: int) -> None:
+        first_position = offset - len(lines)
+        with closing(self._connect()) as connection, connection:
+            connection.executemany(
+                'INSERT INTO items (position, item) VALUES (?, ?)',
+                ((first_position + index, line.decode('utf-8')) for index, line in enumerate(lines)),
+            )
+
+    def iterate(self) -> Iterator[bytes]:
+        if not self._path.exists():
+            return
+        with closing(self._connect()) as connection:
+            for (item,) in connection.execute('SELECT item FROM items ORDER BY position'):
+                yield item.encode('utf-8')
+
+
+def _create_store(path: Path, storage: MirrorStorage) -> _JsonlMirrorStore | _SqliteMirrorStore:
+    if storage == 'jsonl':
+        return _JsonlMirrorStore(path)
+    if storage == 'sqlite':
+        return _SqliteMirrorStore(path)
+    raise ValueError(f'Unsupported mirror storage {storage!r}, use "jsonl" or "sqlite".')
+
+
+def _split_lines(content: bytes) -> list[bytes]:
+    return [line for line in content.split(b'\n') if line.strip()]
+
+
+class DatasetMirrorBase:
+    """Base class for keeping an incrementally synced local copy of an append-only dataset."""
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        *,
+        storage: MirrorStorage,
+        page_size: int,
+        max_parallel: int,
+        fields: list[str] | None,
+        omit: list[str] | None,
+        timeout: Timeout,
+    ) -> None:
+        if page_size < 1:
+            raise ValueError(f'page_size must be at least 1, got {page_size}')
+        if max_parallel < 1:
+            raise ValueError(f'max_parallel must be at least 1, got {max_parallel}')
+
+        self._store = _create_store(Path(path), storage)
+        self._page_size = page_size
+        self._max_parallel = max_parallel
+        self._fields = fields
+        self._omit = omit
+        self._timeout = timeout
+        self._offset: int | None = None
+
+    def _page_ranges(self, start: int, end: int) -> list[tuple[int, int]]:
+        return [(offset, min(self._page_size, end - offset)) for offset in range(start, end, self._page_size)]
+
+    @staticmethod
+    def _complete_lines(pages: list[tuple[tuple[int, int], bytes]]) -> tuple[list[bytes], bool]:
+        """Join the lines of consecutive pages, stopping after a page that came back short.
+
+        A short page means the dataset did not have all the items it reported yet, and appending the pages after it
+        would leave a gap in the copy. Returns the lines and whether all the pages were complete.
+        """
+        lines = list[bytes]()
+        for (_, limit), content in pages:
+            page_lines = _split_lines(content)
+            lines.extend(page_lines)
+            if len(page_lines) < limit:
+                return lines, False
+        return lines, True
+
+
+@docs_group('Other')
+class DatasetMirror(DatasetMirrorBase):
+    """Keeps an incrementally synced local copy of an append-only dataset.
+
+    The items are stored in a local JSON Lines file or SQLite database, together with the number of items copied so
+    far. Each `sync` downloads only the items added to the dataset since the previous one, in pages fetched in
+    parallel, and appends them to the copy. The state is saved after each round of pages, so an interrupted sync
+    resumes where it stopped.
+
+    The items are mirrored by their position in the dataset, so the dataset must only ever be appended to. Obtain
+    an instance via `DatasetClient.get_mirror`.
+    """
+
+    def __init__(
+        self,
+        dataset_client: DatasetClient,
+        path: str | os.PathLike[str],
+        *,
+        storage: MirrorStorage,
+        page_size: int,
+        max_parallel: int,
+        fields: list[str] | None,
+        omit: list[str] | None,
+        timeout: Timeout,
+    ) -> None:
+        """Initialize `DatasetMirror`.
+
+        Args:
+            dataset_client: The client of the mirrored dataset.
+            path: Path of the local copy.
+            storage: Format of the local copy, either `jsonl` or `sqlite`.
+            page_size: Number of items downloaded in a single API call.
+            max_parallel: Maximum number of pages downloaded at the same time.
+            fields: A list of fields which should be picked from the items.
+            omit: A list of fields which should be omitted from the items.
+            timeout: Timeout for the API HTTP request of each page.
+        """
+        super().__init__(
+            path,
+            storage=storage,
+            page_size=page_size,
+            max_parallel=max_parallel,
+            fields=fields,
+            omit=omit,
+            timeout=timeout,
+        )
+        self._dataset_client = dataset_client
+
+    @property
+    def offset(self) -> int:
+        """Number of items in the local copy, which is also the dataset offset the next sync starts from."""
+        if self._offset is None:
+            self._offset = self._store.load_offset()
+        return self._offset
+
+    def sync(self) -> int:
+        """Download the items added to the dataset since the last sync and append them to the local copy.
+
+        Returns:
+            The number of newly mirrored items.
+        """
+        dataset = self._dataset_client.get()
+        if dataset is None:
+            raise ValueError('The mirrored dataset does not exist.')
+
+        start = self.offset
+        with ContextThreadPoolExecutor(max_workers=self._max_parallel) as executor:
+            for window in chunked(self._page_ranges(start, dataset.item_count), self._max_parallel):
+                contents = list(executor.map(self._fetch_page, window))
+                lines, complete = self._complete_lines(list(zip(window, contents, strict=True)))
+                if lines:
+                    offset = self.offset + len(lines)
+                    self._store.append(lines, offset=offset)
+                    self._offset = offset
+                if not complete:
+                    break
+
+        return self.offset - start
+
+    def iterate_items(self) -> Iterator[Any]:
+        """Iterate over the items in the local copy, in the order of the dataset.
+
+        Yields:
+            An item from the local copy.
+        """
+        for line in self._store.iterate():
+            yield json.loads(line)
+
+    def _fetch_page(self, page: tuple[int, int]) -> bytes:
+        offset, limit = page
+        return self._dataset_client.get_items_as_bytes(
+            item_format='jsonl',
+            offset=offset,
+            limit=limit,
+            fields=self._fields,
+            omit=self._omit,
+            timeout=self._timeout,
+        )
+
+
+@docs_group('Other')
+class DatasetMirrorAsync(DatasetMirrorBase):
+    """Keeps an incrementally synced local copy of an append-only dataset, using the async client.
+
+    The items are stored in a local JSON Lines file or SQLite database, together with the number of items copied so
+    far. Each `sync` downloads only the items added to the dataset since the previous one, in pages fetched
+    concurrently, and appends them to the copy. The state is saved after each round of pages, so an interrupted sync
+    resumes where it stopped. The local file operations run in worker threads to keep the event loop responsive.
+
+    The items are mirrored by their position in the dataset, so the dataset must only ever be appended to. Obtain
+    an instance via `DatasetClientAsync.get_mirror`.
+    """
+
+    def __init__(
+        self,
+        dataset_client: DatasetClientAsync,
+        path: str | os.PathLike[str],
+        *,
+        storage: MirrorStorage,
+        page_size: int,
+        max_parallel: int,
+        fields: list[str] | None,
+        omit: list[str] | None,
+        timeout: Timeout,
+    ) -> None:
+        """Initialize `DatasetMirrorAsync`.
+
+        Args:
+            dataset_client: The async client of the mirrored dataset.
+            path: Path of the local copy.
+            storage: Format of the local copy, either `jsonl` or `sqlite`.
+            page_size: Number of items downloaded in a single API call.
+            max_parallel: Maximum number of pages downloaded at the same time.
+            fields: A list of fields which should be picked from the items.
+            omit: A list of fields which should be omitted from the items.
+            timeout: Timeout for the API HTTP request of each page.
+        """
+        super().__init__(
+            path,
+            storage=storage,
+            page_size=page_size,
+            max_parallel=max_parallel,
+            fields=fields,
+            omit=omit,
+            timeout=timeout,
+        )
+        self._dataset_client = dataset_client
+
+    async def get_offset(self) -> int:
+        """Return the number of items in the local copy, which is also the dataset offset the next sync starts from."""
+        if self._offset is None:
+            self._offset = await asyncio.to_thread(self._store.load_offset)
+        return self._offset
+
+    async def sync(self) -> int:
+        """Download the items added to the dataset since the last sync and append them to the local copy.
+
+        Returns:
+            The number of newly mirrored items.
+        """
+        dataset = await self._dataset_client.get()
+        if dataset is None:
+            raise ValueError('The mirrored dataset does not exist.')
+
+        start = offset = await self.get_offset()
+        for window in chunked(self._page_ranges(start, dataset.item_count), self._max_parallel):
+            contents = await asyncio.gather(*(self._fetch_page(page) for page in window))
+            lines, complete = self._complete_lines(list(zip(window, contents, strict=True)))
+            if lines:
+                offset += len(lines)
+                await asyncio.to_thread(self._store.append, lines, offset=offset)
+                self._offset = offset
+            if not complete:
+                break
+
+        return offset - start
+
+    async def iterate_items(self) -> AsyncIterator[Any]:
+        """Iterate over the items in the local copy, in the order of the dataset.
+
+        Yields:
+            An item from the local copy.
+        """
+        lines = self._store.iterate()
+        # The copy is read in worker threads, a chunk of lines at a time.
+        while chunk := await asyncio.to_thread(lambda: list(islice(lines, _READ_CHUNK_SIZE))):
+            for line in chunk:
+                yield json.loads(line)
+
+    async def _fetch_page(self, page: tuple[int, int]) -> bytes:
+        offset, limit = page
+        return await self._dataset_client.get_items_as_bytes(
+            item_format='jsonl',
+            offset=offset,
+            limit=limit,
+            fields=self._fields,
+            omit=self._omit,
+            timeout=self._timeout,
+        )
@@ -0,0 +1,398 @@
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import json
+import logging
+import threading
+from dataclasses import dataclass
+from queue import Empty, Queue
+from typing import TYPE_CHECKING, Any, Self
+
+from apify_client._docs import docs_group
+from apify_client._logging import logger_name
+from apify_client._utils.batching import PAYLOAD_SIZE_LIMIT_BYTES, serialize_json
+from apify_client._utils.time import to_seconds
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from datetime import timedelta
+    from types import TracebackType
+
+    from apify_client._resource_clients import DatasetClient, DatasetClientAsync
+    from apify_client.types import JsonSerializable, Timeout
+
+logger = logging.getLogger(logger_name)
+
+
+@docs_group('Other')
+@dataclass
+class DatasetWriterBatchFailure:
+    """A batch of items that a dataset writer failed to push to the dataset."""
+
+    items: list[Any]
+    """The items of the batch, in the order they were added to the writer."""
+
+    error: Exception
+    """The exception raised by the push request."""
+
+
+class DatasetWriterBase:
+    """Base class for buffering dataset items and packing them into batches for `DatasetWriter`."""
+
+    def __init__(
+        self,
+        *,
+        max_batch_bytes: int,
+        max_batch_items: int,
+        flush_interval: timedelta,
+        max_pending_batches: int,
+        on_batch_error: Callable[[DatasetWriterBatchFailure], None] | None,
+        timeout: Timeout,
+    ) -> None:
+        if not len(b'[]') < max_batch_bytes <= PAYLOAD_SIZE_LIMIT_BYTES:
+            raise ValueError(f'max_batch_bytes must be between 3 and {PAYLOAD_SIZE_LIMIT_BYTES}, got {max_batch_bytes}')
+        if max_batch_items < 1:
+            raise ValueError(f'max_batch_items must be at least 1, got {max_batch_items}')
+        if max_pending_batches < 1:
+            raise ValueError(f'max_pending_batches must be at least 1, got {max_pending_batches}')
+
+        self._max_batch_bytes = max_batch_bytes
+        self._max_batch_items = max_batch_items
+        self._flush_interval_seconds = to_seconds(flush_interval)
+        self._max_pending_batches = max_pending_batches
+        self._on_batch_error = on_batch_error
+        self._timeout = timeout
+        self._buffer = list[bytes]()
+        self._buffer_bytes = len(b'[]')
+        self._failures = list[DatasetWriterBatchFailure]()
+        self._closed = False
+
+    @property
+    def failures(self) -> list[DatasetWriterBatchFailure]:
+        """The batches that could not be pushed so far, in the order they failed."""
+        return list(self._failures)
+
+    def _buffer_item(self, item: JsonSerializable) -> list[list[bytes]]:
+        """Serialize an item into the buffer and return the batches it completed, in order."""
+        self._check_open()
+        serialized = serialize_json(item)
+        # Every item but the first one also takes a comma in the JSON array.
+        item_bytes = len(serialized) + (len(b',') if self._buffer else 0)
+        completed = list[list[bytes]]()
+
+        if self._buffer and self._buffer_bytes + item_bytes > self._max_batch_bytes:
+            completed.append(self._take_buffer())
+            item_bytes = len(serialized)
+
+        self._buffer.append(serialized)
+        self._buffer_bytes += item_bytes
+
+        if len(self._buffer) >= self._max_batch_items:
+            completed.append(self._take_buffer())
+
+        return completed
+
+    def _check_open(self) -> None:
+        if self._closed:
+            raise RuntimeError('The dataset writer is already closed')
+
+    def _take_buffer(self) -> list[bytes]:
+        """Empty the buffer and return its items as a batch, which is empty if nothing was buffered."""
+        batch, self._buffer = self._buffer, []
+        self._buffer_bytes = len(b'[]')
+        return batch
+
+    def _record_failure(self, batch: list[bytes], exc: Exception) -> None:
+        failure = DatasetWriterBatchFailure(items=[json.loads(item) for item in batch], error=exc)
+        self._failures.append(failure)
+        logger.warning('Failed to push a batch of dataset items', extra={'item_count': len(batch)}, exc_info=exc)
+        if self._on_batch_error:
+            # An exception from the callback must not stop the background pushing, which `flush` and `close` wait on.
+            try:
+                self._on_batch_error(failure)
+            except Exception:
+                logger.exception('The on_batch_error callback of a dataset writer raised an exception')
+
+
+@docs_group('Other')
+class DatasetWriter(DatasetWriterBase):
+    """Buffers dataset items and pushes them in batches from a background thread.
+
+    Items are added one at a time and packed into batches, which are pushed once they reach a size in bytes or a count
+    of items, or once the buffer has waited for the flush interval. When the background thread falls behind, adding
+    items blocks until a pending batch is pushed, which bounds the memory held by the writer.
+
+    A batch that fails to be pushed does not stop the writer. It is logged, passed to the `on_batch_error` callback if
+    one is given, and kept in `failures`. An exception raised by the callback is logged and does not stop the writer
+    either. Batches are pushed in the order their items were added.
+
+    Can be used as a context manager, which flushes the remaining items and stops the thread on exit. Alternatively,
+    call `close` manually. Obtain an instance via `DatasetClient.get_writer`.
+    """
+
+    def __init__(
+        self,
+        dataset_client: DatasetClient,
+        *,
+        max_batch_bytes: int,
+        max_batch_items: int,
+        flush_interval: timedelta,
+        max_pending_batches: int,
+        on_batch_error: Callable[[DatasetWriterBatchFailure], None] | None,
+        timeout: Timeout,
+    ) -> None:
+        """Initialize `DatasetWriter`.
+
+        Args:
+            dataset_client: The client of the dataset the items are pushed to.
+            max_batch_bytes: Maximum size of the body of a single push request, in bytes.
+            max_batch_items: Maximum number of items in a single push request.
+            flush_interval: Longest time buffered items wait before they are pushed.
+            max_pending_batches: Maximum number of completed batches waiting to be pushed before adding items blocks.
+            on_batch_error: Function called with each batch that fails to be pushed.
+            timeout: Timeout for the API HTTP request of each batch.
+        """
+        super().__init__(
+            max_batch_bytes=max_batch_bytes,
+            max_batch_items=max_batch_items,
+            flush_interval=flush_interval,
+            max_pending_batches=max_pending_batches,
+            on_batch_error=on_batch_error,
+            timeout=timeout,
+        )
+        self._dataset_client = dataset_client
+        # Held while taking batches from the buffer and until they are queued, so batches are pushed in the order their
+        # items were added, even with several threads adding items.
+        self._lock = threading.Lock()
+        # Besides batches, the queue carries events which flushes wait on, and `None`, which stops the thread.
+        self._queue = Queue[list[bytes] | threading.Event | None](maxsize=max_pending_batches)
+        self._pushing_thread: threading.Thread | None = None
+
+    def add(self, item: JsonSerializable) -> None:
+        """Add an item to the buffer, blocking while too many completed batches are waiting to be pushed.
+
+        Args:
+            item: The item to push into the dataset.
+        """
+        with self._lock:
+            completed = self._buffer_item(item)
+            self._ensure_started()
+            for batch in completed:
+                self._queue.put(batch)
+
+    def flush(self) -> None:
+        """Push all buffered items and wait until every batch added so far is pushed."""
+        pushed = threading.Event()
+        with self._lock:
+            self._check_open()
+            batch = self._take_buffer()
+            self._ensure_started()
+            if batch:
+                self._queue.put(batch)
+            self._queue.put(pushed)
+        pushed.wait()
+
+    def close(self) -> None:
+        """Push all buffered items, wait until they are pushed and stop the background thread."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            batch = self._take_buffer()
+            if self._pushing_thread is None:
+                # Nothing was ever added, so there is no thread to stop.
+                return
+            if batch:
+                self._queue.put(batch)
+            self._queue.put(None)
+        self._pushing_thread.join()
+
+    def __enter__(self) -> Self:
+        """Return the writer. Exiting the context will flush the remaining items and stop the background thread."""
+        return self
+
+    def __exit__(
+        self, exc_type: type[BaseException] | None, exc_val: BaseException | None, exc_tb: TracebackType | None
+    ) -> None:
+        """Flush the remaining items and stop the background thread."""
+        self.close()
+
+    def _ensure_started(self) -> None:
+        if self._pushing_thread is None:
+            # A daemon thread so a writer that is never closed cannot hold up interpreter shutdown. It runs in a copy
+            # of the current context, as the asyncio task of the async writer does, to keep the log context.
+            self._pushing_thread = threading.Thread(
+                target=contextvars.copy_context().run, args=(self._push_batches,), daemon=True
+            )
+            self._pushing_thread.start()
+
+    def _push_batches(self) -> None:
+        while True:
+            try:
+                entry = self._queue.get(timeout=self._flush_interval_seconds)
+            except Empty:
+                # Nothing completed a batch for the whole interval, so push whatever is buffered. If the lock is held,
+                # items are being added and queued right now, and waiting for it could wait for this thread to make
+                # room in the queue. A batch queued since the wait timed out holds older items than the buffer, so the
+                # buffer is left for later then, to keep the batches in order.
+                if not self._lock.acquire(blocking=False):
+                    continue
+                try:
+                    entry = self._take_buffer() if self._queue.empty() else []
+                finally:
+                    self._lock.release()
+                self._push_batch(entry)
+                continue
+
+            if entry is None:
+                return
+            if isinstance(entry, threading.Event):
+                entry.set()
+            else:
+                self._push_batch(entry)
+
+    def _push_batch(self, batch: list[bytes]) -> None:
+        if not batch:
+            return
+        try:
+            self._dataset_client._push_serialized_items(batch, timeout=self._timeout)  # noqa: SLF001
+        except Exception as exc:
+            self._record_failure(batch, exc)
+
+
+@docs_group('Other')
+class DatasetWriterAsync(DatasetWriterBase):
+    """Buffers dataset items and pushes them in batches from a background asyncio task.
+
+    Items are added one at a time and packed into batches, which are pushed once they reach a size in bytes or a count
+    of items, or once the buffer has waited for the flush interval. When the background task falls behind, adding
+    items waits until a pending batch is pushed, which bounds the memory held by the writer.
+
+    A batch that fails to be pushed does not stop the writer. It is logged, passed to the `on_batch_error` callback if
+    one is given, and kept in `failures`. An exception raised by the callback is logged and does not stop the writer
+    either. Batches are pushed in the order their items were added.
+
+    Can be used as an async context manager, which flushes the remaining items and stops the task on exit.
+    Alternatively, call `close` manually. Obtain an instance via `DatasetClientAsync.get_writer`.
+    """
+
+    def __init__(
+        self,
+        dataset_client: DatasetClientAsync,
+        *,
+        max_batch_bytes: int,
+        max_batch_items: int,
+        flush_interval: timedelta,
+        max_pending_batches: int,
+        on_batch_error: Callable[[DatasetWriterBatchFailure], None] | None,
+        timeout: Timeout,
+    ) -> None:
+        """Initialize `DatasetWriterAsync`.
+
+        Args:
+            dataset_client: The async client of the dataset the items are pushed to.
+            max_batch_bytes: Maximum size of the body of a single push request, in bytes.
+            max_batch_items: Maximum number of items in a single push request.
+            flush_interval: Longest time buffered items wait before they are pushed.
+            max_pending_batches: Maximum number of completed batches waiting to be pushed before adding items waits.
+            on_batch_error: Function called with each batch that fails to be pushed.
+            timeout: Timeout for the API HTTP request of each batch.
+        """
+        super().__init__(
+            max_batch_bytes=max_batch_bytes,
+            max_batch_items=max_batch_items,
+            flush_interval=flush_interval,
+            max_pending_batches=max_pending_batches,
+            on_batch_error=on_batch_error,
+            timeout=timeout,
+        )
+        self._dataset_client = dataset_client
+        # The queue is created with the task, because it has to belong to the event loop that runs the task.
+        self._queue: asyncio.Queue[list[bytes] | asyncio.Event | None] | None = None
+        self._pushing_task: asyncio.Task | None = None
+        # Held while taking batches from the buffer and until they are queued, so batches are pushed in the order their
+        # items were added, even with several tasks adding items.
+        self._lock = asyncio.Lock()
+
+    async def add(self, item: JsonSerializable) -> None:
+        """Add an item to the buffer, waiting while too many completed batches are waiting to be pushed.
+
+        Args:
+            item: The item to push into the dataset.
+        """
+        async with self._lock:
+            completed = self._buffer_item(item)
+            queue = self._ensure_started()
+            for batch in completed:
+                await queue.put(batch)
+
+    async def flush(self) -> None:
+        """Push all buffered items and wait until every batch added so far is pushed."""
+        pushed = asyncio.Event()
+        async with self._lock:
+            self._check_open()
+            batch = self._take_buffer()
+            queue = self._ensure_started()
+            if batch:
+                await queue.put(batch)
+            await queue.put(pushed)
+        await pushed.wait()
+
+    async def close(self) -> None:
+        """Push all buffered items, wait until they are pushed and stop the background task."""
+        async with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            batch = self._take_buffer()
+            if self._queue is None or self._pushing_task is None:
+                # Nothing was ever added, so there is no task to stop.
+                return
+            if batch:
+                await self._queue.put(batch)
+            await self._queue.put(None)
+        await self._pushing_task
+
+    async def __aenter__(self) -> Self:
+        """Return the writer. Exiting the context will flush the remaining items and stop the background task."""
+        return self
+
+    async def __aexit__(
+        self, exc_type: type[BaseException] | None, exc_val: BaseException | None, exc_tb: TracebackType | None
+    ) -> None:
+        """Flush the remaining items and stop the background task."""
+        await self.close()
+
+    def _ensure_started(self) -> asyncio.Queue[list[bytes] | asyncio.Event | None]:
+        if self._queue is None:
+            self._queue = asyncio.Queue(maxsize=self._max_pending_batches)
+            self._pushing_task = asyncio.create_task(self._push_batches(self._queue))
+        return self._queue
+
+    async def _push_batches(self, queue: asyncio.Queue[list[bytes] | asyncio.Event | None]) -> None:
+        while True:
+            try:
+                entry = await asyncio.wait_for(queue.get(), timeout=self._flush_interval_seconds)
+            except TimeoutError:
+                # Nothing completed a batch for the whole interval, so push whatever is buffered, unless items are
+                # being added and queued right now, which could be waiting for this task to make room in the queue,
+                # or a batch was queued since the wait timed out, which holds older items than the buffer.
+                if not self._lock.locked() and queue.empty():
+                    await self._push_batch(self._take_buffer())
+                continue
+
+            if entry is None:
+                return
+            if isinstance(entry, asyncio.Event):
+                entry.set()
+            else:
+                await self._push_batch(entry)
+
+    async def _push_batch(self, batch: list[bytes]) -> None:
+        if not batch:
+            return
+        try:
+            await self._dataset_client._push_serialized_items(batch, timeout=self._timeout)  # noqa: SLF001
+        except Exception as exc:
+            self._record_failure(batch, exc)
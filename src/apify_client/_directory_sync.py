@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+import hashlib
+import threading
+from contextlib import suppress
+from dataclasses import asdict, dataclass, field
+from pathlib import Path, PurePosixPath
+from typing import TYPE_CHECKING, Literal
+
+from apify_client._consts import UPLOAD_CHUNK_SIZE
+from apify_client._docs import docs_group
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+DEFAULT_SYNC_MANIFEST_KEY = 'DIRECTORY-SYNC-MANIFEST'
+"""Key of the record that keeps the manifest of the files synced to a key-value store from a directory."""
+
+_MANIFEST_VERSION = 1
+
+
+@docs_group('Other')
+@dataclass
+class DirectorySyncProgress:
+    """Progress of `KeyValueStoreClient.sync_directory`, reported after each entry is transferred or deleted."""
+
+    key: str
+    """Key of the entry."""
+
+    action: Literal['transferred', 'deleted', 'failed']
+    """What happened to the entry."""
+
+    completed: int
+    """Number of entries transferred, deleted or failed so far, including this one."""
+
+    total: int
+    """Number of entries to transfer or delete in total."""
+
+
+@docs_group('Other')
+@dataclass
+class DirectorySyncResult:
+    """The outcome of `KeyValueStoreClient.sync_directory`."""
+
+    transferred: list[str] = field(default_factory=list)
+    """Keys of the entries that were uploaded or downloaded because they were new or changed."""
+
+    deleted: list[str] = field(default_factory=list)
+    """Keys of the entries that were deleted because they no longer exist at the source."""
+
+    unchanged: list[str] = field(default_factory=list)
+    """Keys of the entries that were already up to date."""
+
+    failed: dict[str, Exception] = field(default_factory=dict)
+    """The error of each entry that could not be transferred or deleted, by its key."""
+
+
+@dataclass(frozen=True)
+class SyncedFile:
+    """A file as recorded in the manifest of a synced directory."""
+
+    path: str
+    """Path of the file relative to the directory, with `/` as the separator."""
+
+    size: int
+    """Size of the file in bytes."""
+
+    sha256: str
+    """SHA-256 hash of the content of the file."""
+
+
+class DirectorySyncTracker:
+    """Collects the outcome of the transfers and deletions of a directory sync, and reports its progress."""
+
+    def __init__(
+        self,
+        *,
+        total: int,
+        unchanged: list[str],
+        on_progress: Callable[[DirectorySyncProgress], None] | None,
+    ) -> None:
+        self.result = DirectorySyncResult(unchanged=unchanged)
+        self._total = total
+        self._completed = 0
+        self._on_progress = on_progress
+        self._lock = threading.Lock()
+
+    def record(self, key: str, action: Literal['transferred', 'deleted'], error: Exception | None = None) -> None:
+        """Record the outcome of transferring or deleting an entry, from any thread."""
+        with self._lock:
+            if error is not None:
+                self.result.failed[key] = error
+            elif action == 'transferred':
+                self.result.transferred.append(key)
+            else:
+                self.result.deleted.append(key)
+            self._completed += 1
+            progress = DirectorySyncProgress(
+                key=key, action=action if error is None else 'failed', completed=self._completed, total=self._total
+            )
+
+        if self._on_progress is not None:
+            self._on_progress(progress)
+
+
+def path_to_key(relative_path: str) -> str:
+    """Return the key a file is stored under, which is its path relative to the directory with `/` replaced by `!`."""
+    return '!'.join(PurePosixPath(relative_path).parts)
+
+
+def list_local_files(directory: Path) -> dict[str, Path]:
+    """Map the key of each file in the directory and its subdirectories to the path of the file."""
+    files = dict[str, Path]()
+    for path in sorted(directory.rglob('*')):
+        if not path.is_file():
+            continue
+        key = path_to_key(path.relative_to(directory).as_posix())
+        if key in files:
+            raise ValueError(f'The files {files[key]} and {path} would be stored under the same key {key!r}')
+        files[key] = path
+    return files
+
+
+def hash_file(path: Path) -> str:
+    """Return the SHA-256 hash of the content of a file, read in chunks."""
+    digest = hashlib.sha256()
+    with path.open('rb') as file:
+        while chunk := file.read(UPLOAD_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def describe_file(directory: Path, path: Path) -> SyncedFile:
+    """Return the manifest entry of a file in the directory."""
+    return SyncedFile(path=path.relative_to(directory).as_posix(), size=path.stat().st_size, sha256=hash_file(path))
+
+
+def file_differs(path: Path, *, size: int, sha256: str | None) -> bool:
+    """Whether a local file is missing or differs from a record of the given size and, if it is known, hash."""
+    try:
+        if path.stat().st_size != size:
+            return True
+    except FileNotFoundError:
+        return True
+    return sha256 is not None and hash_file(path) != sha256
+
+
+def resolve_local_path(directory: Path, relative_path: str) -> Path:
+    """Return the path in the directory a record is downloaded to, refusing paths that lead out of the directory."""
+    path = PurePosixPath(relative_path)
+    if not path.parts or path.is_absolute() or '..' in path.parts:
+        raise ValueError(f'Refusing to download a record to {relative_path!r}, which is outside of the directory')
+    return directory.joinpath(*path.parts)
+
+
+def parse_manifest(record: dict | None) -> dict[str, SyncedFile]:
+    """Read the entries of a manifest record by key, treating a missing or unrecognized record as an empty one."""
+    value = record['value'] if record is not None else None
+    if not isinstance(value, dict) or value.get('version') != _MANIFEST_VERSION:
+        return {}
+
+    entries = dict[str, SyncedFile]()
+    for key, entry in value.get('files', {}).items():
+        with suppress(KeyError, TypeError):
+            entries[key] = SyncedFile(path=entry['path'], size=entry['size'], sha256=entry['sha256'])
+    return entries
+
+
+def build_manifest(entries: dict[str, SyncedFile]) -> dict:
+    """Build the value of a manifest record from its entries."""
+    return {'version': _MANIFEST_VERSION, 'files': {key: asdict(entry) for key, entry in sorted(entries.items())}}
@@ -1,37 +1,188 @@
 from __future__ import annotations
 
-from contextlib import asynccontextmanager, contextmanager
+import asyncio
+import codecs
+import json
+import logging
+import random
+import shutil
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from contextlib import ExitStack, asynccontextmanager, contextmanager
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any
-
+from datetime import timedelta
+from functools import cache
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, Any, Generic
+
+from more_itertools import chunked, constrained_batches
+from pydantic import TypeAdapter
+from typing_extensions import TypeVar
+
+from apify_client._consts import DEFAULT_MAX_RETRIES, DEFAULT_SPOOL_MAX_MEMORY_BYTES
+from apify_client._dataset_mirror import DatasetMirror, DatasetMirrorAsync
+from apify_client._dataset_writer import DatasetWriter, DatasetWriterAsync
 from apify_client._docs import docs_group
+from apify_client._logging import logger_name
 from apify_client._models import Dataset, DatasetResponse, DatasetStatistics, DatasetStatisticsResponse
 from apify_client._pagination import DEFAULT_CHUNK_SIZE, get_items_iterator, get_items_iterator_async
 from apify_client._resource_clients._resource_client import ResourceClient, ResourceClientAsync
+from apify_client._utils.batching import (
+    PAYLOAD_SIZE_LIMIT_BYTES,
+    aconstrained_batches,
+    iterate_any,
+    join_json_array,
+    serialize_json,
+)
+from apify_client._utils.columns import ColumnBuilder, import_column_libraries
+from apify_client._utils.concurrency import ContextThreadPoolExecutor
 from apify_client._utils.crypto import create_storage_content_signature
 from apify_client._utils.http import response_to_dict, response_to_list
+from apify_client._utils.jsonl import JsonLinesDecoder
+from apify_client._utils.signing import StorageSigningKey
+from apify_client._utils.spool import spool_response, spool_response_async
 
 if TYPE_CHECKING:
-    from collections.abc import AsyncIterator, Iterator
-    from datetime import timedelta
+    import os
+    from collections.abc import AsyncIterable, AsyncIterator, Callable, Iterable, Iterator
 
+    from apify_client._dataset_mirror import MirrorStorage
+    from apify_client._dataset_writer import DatasetWriterBatchFailure
     from apify_client._literals import GeneralAccess
+    from apify_client.aggregation import ItemAggregation
     from apify_client.http_clients import HttpResponse
     from apify_client.types import JsonSerializable, Timeout
 
+logger = logging.getLogger(logger_name)
+
+
+_CONCATENABLE_ITEM_FORMATS = frozenset({'csv', 'jsonl'})
+"""Item formats whose shards can be joined into one valid file, given that the CSV header is written only once."""
+
+
+class _TruncatedStreamError(Exception):
+    """The item stream ended in the middle of an item, so the connection was cut off before the body was complete."""
+
+
+def _split_into_shards(start: int, end: int, shards: int) -> list[tuple[int, int]]:
+    """Split the item range from `start` (inclusive) to `end` (exclusive) into contiguous `(offset, limit)` shards.
+
+    The shard sizes differ by one item at most. No shard is empty, so a range shorter than `shards` gets fewer shards.
+    """
+    total = max(end - start, 0)
+    shards = min(shards, total)
+    ranges = list[tuple[int, int]]()
+    offset = start
+    for index in range(shards):
+        limit = total // shards + (1 if index < total % shards else 0)
+        ranges.append((offset, limit))
+        offset += limit
+    return ranges
+
+
+def _export_part_paths(path: Path, *, item_format: str, shards: int, concatenate: bool) -> list[Path]:
+    """Return the file each shard is downloaded into - the final files, or the parts joined into `path` later."""
+    if concatenate:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        return [path.with_name(f'{path.name}.part{index}') for index in range(shards)]
+    path.mkdir(parents=True, exist_ok=True)
+    return [path / f'part-{index:05d}.{item_format}' for index in range(shards)]
+
+
+def _read_csv_header(part: Path) -> bytes:
+    """Return the header row of a CSV shard file, without its BOM and line break."""
+    with part.open('rb') as source:
+        return source.readline().removeprefix(codecs.BOM_UTF8).rstrip(b'\r\n')
+
+
+def _concatenate_parts(parts: list[Path], path: Path, *, csv: bool = False, keep_header: bool = True) -> None:
+    """Join the shard files into `path` in order, deleting each part once it is copied.
+
+    With `csv`, each part starts with its header row, which is written only once, and only if `keep_header` is set.
+    The API takes the columns of a CSV response from its items, so parts with different header rows would not line
+    up, and fail the export instead.
+
+    Raises:
+        ValueError: If the CSV parts have different header rows.
+    """
+    if csv and len({header for header in map(_read_csv_header, parts) if header}) > 1:
+        for part in parts:
+            part.unlink(missing_ok=True)
+        raise ValueError(
+            'The shards of the dataset have different CSV columns, so they cannot be concatenated. Pass `fields` to '
+            'export the same columns from every shard.'
+        )
+
+    with path.open('wb') as target:
+        for index, part in enumerate(parts):
+            with part.open('rb') as source:
+                if csv and (index > 0 or not keep_header):
+                    header = source.readline()
+                    # The BOM of the first part is kept, as the API keeps it when skipping the header row.
+                    if index == 0 and header.startswith(codecs.BOM_UTF8):
+                        target.write(codecs.BOM_UTF8)
+                shutil.copyfileobj(source, target)
+            part.unlink()
+
+
+def _aggregate_jsonl(aggregation: ItemAggregation, content: bytes) -> dict[Any, dict[str, Any]]:
+    """Aggregate a page of items in the JSON Lines format into a partial state of `aggregation`.
+
+    Defined at module level so the pages can be aggregated in worker processes.
+    """
+    state = aggregation.create_state()
+    for line in content.splitlines():
+        if line.strip():
+            aggregation.update(state, json.loads(line))
+    return state
+
+
+ItemT = TypeVar('ItemT', default=dict[str, Any])
+
+
+@cache
+def _item_list_adapter(item_model: type[Any]) -> TypeAdapter[list[Any]]:
+    """Return the adapter validating a list of `item_model` items, built once per model."""
+    return TypeAdapter(list[item_model])  # ty: ignore[invalid-type-form]
+
+
+def _validate_items(content: bytes, item_model: type[ItemT]) -> list[ItemT]:
+    """Validate the raw body of an items response as a list of `item_model` items in a single pass."""
+    # Same as `response_to_list`, a single object in the body is taken for a one-item list.
+    if content.lstrip().startswith(b'{'):
+        content = b'[' + content + b']'
+    return _item_list_adapter(item_model).validate_json(content)
+
+
+def _group_into_windows(offsets: list[int], *, max_gap: int, max_size: int) -> list[tuple[int, list[int]]]:
+    """Group sorted offsets into windows of nearby offsets, each fetched by one request.
+
+    An offset joins the current window if it is at most `max_gap` items past the previous one and the window stays
+    within `max_size` items. Returns the window start together with the offsets it covers.
+    """
+    windows = list[tuple[int, list[int]]]()
+    for offset in offsets:
+        if windows:
+            start, members = windows[-1]
+            if offset - members[-1] <= max_gap and offset - start < max_size:
+                members.append(offset)
+                continue
+        windows.append((offset, [offset]))
+    return windows
+
 
 @docs_group('Other')
 @dataclass
-class DatasetItemsPage:
+class DatasetItemsPage(Generic[ItemT]):
     """A page of dataset items returned by the `list_items` method.
 
     Dataset items are arbitrary JSON objects stored in the dataset, so they cannot be
     represented by a specific Pydantic model. This class provides pagination metadata
-    along with the raw items.
+    along with the raw items, or with the items validated into the `item_model` passed
+    to `list_items`.
     """
 
-    items: list[dict[str, Any]]
-    """List of dataset items. Each item is a JSON object (dictionary)."""
+    items: list[ItemT]
+    """List of dataset items. Each item is a JSON object (dictionary), or an instance of the requested item model."""
 
     total: int
     """Total number of items in the dataset."""
@@ -137,8 +288,9 @@ class DatasetClient(ResourceClient):
         flatten: list[str] | None = None,
         view: str | None = None,
         signature: str | None = None,
+        item_model: type[ItemT] | None = None,
         timeout: Timeout = 'long',
-    ) -> DatasetItemsPage:
+    ) -> DatasetItemsPage[ItemT]:
         """List the items of the dataset.
 
         https://docs.apify.com/api/v2#/reference/datasets/item-collection/get-items
@@ -170,6 +322,8 @@ class DatasetClient(ResourceClient):
             flatten: A list of fields that should be flattened.
             view: Name of the dataset view to be used.
             signature: Signature used to access the items.
+            item_model: A Pydantic model or a `TypedDict` to validate the items into. The whole page is validated
+                in a single pass over the raw response body.
             timeout: Timeout for the API HTTP request.
 
         Returns:
@@ -198,7 +352,7 @@ class DatasetClient(ResourceClient):
         )
 
         # When using signature, API returns items as list directly
-        items = response_to_list(response)
+        items = response_to_list(response) if item_model is None else _validate_items(response.content, item_model)
 
         return DatasetItemsPage(
             items=items,
@@ -226,8 +380,9 @@ class DatasetClient(ResourceClient):
         skip_hidden: bool | None = None,
         signature: str | None = None,
         chunk_size: int | None = None,
+        item_model: type[ItemT] | None = None,
         timeout: Timeout = 'long',
-    ) -> Iterator[dict]:
+    ) -> Iterator[ItemT]:
         """Iterate over the items in the dataset.
 
         Simple `list_items` does only one API call, possibly not listing all items matching the criteria. This method
@@ -261,13 +416,15 @@ class DatasetClient(ResourceClient):
                 the # character.
             signature: Signature used to access the items.
             chunk_size: Maximum number of items requested per API call when iterating across pages.
+            item_model: A Pydantic model or a `TypedDict` to validate the items into. Each page is validated
+                in a single pass over the raw response body.
             timeout: Timeout for the API HTTP request.
 
         Yields:
             An item from the dataset.
         """
 
-        def _callback(*, limit: int | None = None, offset: int | None = None) -> DatasetItemsPage:
+        def _callback(*, limit: int | None = None, offset: int | None = None) -> DatasetItemsPage[ItemT]:
             return self.list_items(
                 offset=offset,
                 limit=limit,
@@ -279,6 +436,7 @@ class DatasetClient(ResourceClient):
                 skip_empty=skip_empty,
                 skip_hidden=skip_hidden,
                 signature=signature,
+                item_model=item_model,
                 timeout=timeout,
             )
 
@@ -382,6 +540,117 @@ class DatasetClient(ResourceClient):
 
         return response.content
 
+    def get_items_as_file(
+        self,
+        file: IO[bytes] | None = None,
+        *,
+        item_format: str = 'json',
+        offset: int | None = None,
+        limit: int | None = None,
+        desc: bool | None = None,
+        clean: bool | None = None,
+        bom: bool | None = None,
+        delimiter: str | None = None,
+        fields: list[str] | None = None,
+        omit: list[str] | None = None,
+        unwind: list[str] | None = None,
+        skip_empty: bool | None = None,
+        skip_header_row: bool | None = None,
+        skip_hidden: bool | None = None,
+        xml_root: str | None = None,
+        xml_row: str | None = None,
+        flatten: list[str] | None = None,
+        signature: str | None = None,
+        max_memory_bytes: int = DEFAULT_SPOOL_MAX_MEMORY_BYTES,
+        timeout: Timeout = 'long',
+    ) -> IO[bytes]:
+        """Get the items in the dataset as a file, without holding the raw body in memory whole.
+
+        The response is streamed into `file` as it arrives. Without a `file`, it is spooled into a temporary file,
+        which stays in memory up to `max_memory_bytes` and moves to disk past that. Use this instead of
+        `get_items_as_bytes` for exports too large to fit in memory.
+
+        https://docs.apify.com/api/v2#/reference/datasets/item-collection/get-items
+
+        Args:
+            file: A binary file or buffer to write the items into. By default a spooled temporary file is created.
+            item_format: Format of the results, possible values are: json, jsonl, csv, html, xlsx, xml and rss.
+                The default value is json.
+            offset: Number of items that should be skipped at the start. The default value is 0.
+            limit: Maximum number of items to return. By default there is no limit.
+            desc: By default, results are returned in the same order as they were stored. To reverse the order,
+                set this parameter to True.
+            clean: If True, returns only non-empty items and skips hidden fields (i.e. fields starting with
+                the # character). The clean parameter is just a shortcut for skip_hidden=True and skip_empty=True
+                parameters. Note that since some objects might be skipped from the output, that the result might
+                contain less items than the limit value.
+            bom: All text responses are encoded in UTF-8 encoding. By default, csv files are prefixed with
+                the UTF-8 Byte Order Mark (BOM), while json, jsonl, xml, html and rss files are not. If you want
+                to override this default behavior, specify bom=True query parameter to include the BOM or bom=False
+                to skip it.
+            delimiter: A delimiter character for CSV files. The default delimiter is a simple comma (,).
+            fields: A list of fields which should be picked from the items, only these fields will remain
+                in the resulting record objects. Note that the fields in the outputted items are sorted the same
+                way as they are specified in the fields parameter. You can use this feature to effectively fix
+                the output format.
+                You can use this feature to effectively fix the output format.
+            omit: A list of fields which should be omitted from the items.
+            unwind: A list of fields which should be unwound, in order which they should be processed. Each field
+                should be either an array or an object. If the field is an array then every element of the array
+                will become a separate record and merged with parent object. If the unwound field is an object then
+                it is merged with the parent object. If the unwound field is missing or its value is neither an array
+                nor an object and therefore cannot be merged with a parent object, then the item gets preserved
+                as it is. Note that the unwound items ignore the desc parameter.
+            skip_empty: If True, then empty items are skipped from the output. Note that if used, the results might
+                contain less items than the limit value.
+            skip_header_row: If True, then header row in the csv format is skipped.
+            skip_hidden: If True, then hidden fields are skipped from the output, i.e. fields starting with
+                the # character.
+            xml_root: Overrides default root element name of xml output. By default the root element is items.
+            xml_row: Overrides default element name that wraps each page or page function result object in xml output.
+                By default the element name is item.
+            flatten: A list of fields that should be flattened.
+            signature: Signature used to access the items.
+            max_memory_bytes: Size up to which the spooled temporary file is kept in memory.
+            timeout: Timeout for the API HTTP request.
+
+        Returns:
+            The file with the items. A spooled temporary file is rewound to its start and should be closed after
+                use, a given `file` is returned as it is after the last write.
+        """
+        request_params = self._build_params(
+            format=item_format,
+            offset=offset,
+            limit=limit,
+            desc=desc,
+            clean=clean,
+            bom=bom,
+            delimiter=delimiter,
+            fields=fields,
+            omit=omit,
+            unwind=unwind,
+            skipEmpty=skip_empty,
+            skipHeaderRow=skip_header_row,
+            skipHidden=skip_hidden,
+            xmlRoot=xml_root,
+            xmlRow=xml_row,
+            flatten=flatten,
+            signature=signature,
+        )
+
+        response = self._http_client.call(
+            url=self._build_url('items'),
+            method='GET',
+            params=request_params,
+            stream=True,
+            timeout=timeout,
+        )
+
+        try:
+            return spool_response(response, file, max_memory_bytes=max_memory_bytes)
+        finally:
+            response.close()
+
     @contextmanager
     def stream_items(
         self,
@@ -483,130 +752,761 @@ class DatasetClient(ResourceClient):
             if response:
                 response.close()
 
-    def push_items(self, items: JsonSerializable, *, timeout: Timeout = 'medium') -> None:
-        """Push items to the dataset.
+    def iterate_streamed_items(
+        self,
+        *,
+        offset: int | None = None,
+        limit: int | None = None,
+        clean: bool | None = None,
+        desc: bool | None = None,
+        fields: list[str] | None = None,
+        omit: list[str] | None = None,
+        skip_empty: bool | None = None,
+        skip_hidden: bool | None = None,
+        signature: str | None = None,
+        max_resumes: int = DEFAULT_MAX_RETRIES,
+        timeout: Timeout = 'long',
+    ) -> Iterator[dict]:
+        """Iterate over the items in the dataset over a single resumable stream.
 
-        https://docs.apify.com/api/v2#/reference/datasets/item-collection/put-items
+        Unlike `iterate_items`, which requests one page after another, this method downloads the items as one JSON
+        Lines stream and decodes them as they arrive. Retries of the HTTP client only cover opening the stream, so
+        when the connection drops mid-transfer, the stream is reopened transparently at the offset right after the
+        last delivered item, with the same filters. The partially received item is discarded and delivered again in
+        full from the reopened stream, so every item is yielded exactly once.
 
-        Args:
-            items: The items which to push in the dataset. Either a stringified JSON, a dictionary, or a list
-                of strings or dictionaries.
-            timeout: Timeout for the API HTTP request.
-        """
-        data = None
-        json = None
+        https://docs.apify.com/api/v2#/reference/datasets/item-collection/get-items
 
-        if isinstance(items, str):
-            data = items
-        else:
-            json = items
+        Args:
+            offset: Number of items that should be skipped at the start. The default value is 0.
+            limit: Maximum number of items to return. By default there is no limit.
+            desc: By default, results are returned in the same order as they were stored. To reverse the order,
+                set this parameter to True.
+            clean: If True, returns only non-empty items and skips hidden fields (i.e. fields starting with
+                the # character). The clean parameter is just a shortcut for skip_hidden=True and skip_empty=True
+                parameters.
+            fields: A list of fields which should be picked from the items, only these fields will remain in
+                the resulting record objects. Note that the fields in the outputted items are sorted the same way
+                as they are specified in the fields parameter.
+            omit: A list of fields which should be omitted from the items.
+            skip_empty: If True, then empty items are skipped from the output. The client drops them itself, so the
+                offset a resumed stream continues from keeps counting every stored item.
+            skip_hidden: If True, then hidden fields are skipped from the output, i.e. fields starting with
+                the # character.
+            signature: Signature used to access the items.
+            max_resumes: How many times in a row the stream is reopened after a dropped connection without
+                delivering any item in between, before the error is raised.
+            timeout: Timeout for each API HTTP request that opens the stream.
 
-        self._http_client.call(
-            url=self._build_url('items'),
-            method='POST',
-            headers={'content-type': 'application/json; charset=utf-8'},
-            params=self._build_params(),
-            data=data,
-            json=json,
-            timeout=timeout,
-        )
+        Yields:
+            An item from the dataset.
+        """
+        # Offsets count stored items, so empty items are dropped here instead of by the API. Otherwise a resumed stream
+        # would start from an offset short by the number of items the API skipped.
+        drop_empty = bool(clean or skip_empty)
+        skip_hidden = True if clean else skip_hidden
+        start_offset = offset or 0
+        delivered = 0
+        failed_resumes = 0
+
+        while not limit or delivered < limit:
+            delivered_before = delivered
+            decoder = JsonLinesDecoder()
+            try:
+                with self.stream_items(
+                    item_format='jsonl',
+                    offset=start_offset + delivered,
+                    limit=limit - delivered if limit else None,
+                    desc=desc,
+                    fields=fields,
+                    omit=omit,
+                    skip_hidden=skip_hidden,
+                    signature=signature,
+                    timeout=timeout,
+                ) as response:
+                    for chunk in response.iter_bytes():
+                        for item in decoder.feed(chunk):
+                            delivered += 1
+                            if item or not drop_empty:
+                                yield item
+                    try:
+                        tail = decoder.finish()
+                    except json.JSONDecodeError as exc:
+                        raise _TruncatedStreamError from exc
+                    for item in tail:
+                        delivered += 1
+                        if item or not drop_empty:
+                            yield item
+            except Exception as exc:
+                truncated = isinstance(exc, _TruncatedStreamError)
+                # Reset the streak whenever the interrupted stream made progress, so only a connection that keeps
+                # failing before delivering anything exhausts the resumes.
+                failed_resumes = 0 if delivered > delivered_before else failed_resumes + 1
+                if (
+                    not (truncated or self._http_client.is_retryable_transport_error(exc))
+                    or failed_resumes > max_resumes
+                ):
+                    raise
+                logger.debug('Item stream interrupted, resuming', extra={'offset': start_offset + delivered})
+            else:
+                return
+
+    def sample(
+        self,
+        n: int,
+        *,
+        seed: int | None = None,
+        fields: list[str] | None = None,
+        omit: list[str] | None = None,
+        max_gap: int = 100,
+        max_parallel: int = 5,
+        timeout: Timeout = 'long',
+    ) -> list[dict[str, Any]]:
+        """Get a random sample of the dataset items.
 
-    def get_statistics(self, *, timeout: Timeout = 'short') -> DatasetStatistics:
-        """Get the dataset statistics.
+        Random offsets are picked across the whole dataset, offsets close to each other are grouped into windows
+        fetched by a single request, and the windows are fetched concurrently. Only the windows are downloaded,
+        so sampling a huge dataset costs a fraction of reading it whole.
 
-        https://docs.apify.com/api/v2#tag/DatasetsStatistics/operation/dataset_statistics_get
+        https://docs.apify.com/api/v2#/reference/datasets/item-collection/get-items
 
         Args:
-            timeout: Timeout for the API HTTP request.
+            n: Number of items to sample. If the dataset has fewer items, all of them are returned.
+            seed: Seed of the random generator, which makes the sample reproducible for an unchanged dataset.
+            fields: A list of fields which should be picked from the items, only these fields will remain
+                in the resulting record objects.
+            omit: A list of fields which should be omitted from the items.
+            max_gap: Largest distance between two sampled offsets that are still fetched by the same request.
+                A larger value means fewer requests, at the cost of downloading more items that are thrown away.
+            max_parallel: Maximum number of requests made at the same time.
+            timeout: Timeout for the API HTTP request of each window.
 
         Returns:
-            The dataset statistics.
+            The sampled items, in the order they are stored in the dataset.
 
         Raises:
-            NotFoundError: If the dataset does not exist.
+            ValueError: If the dataset does not exist.
         """
-        response = self._http_client.call(
-            url=self._build_url('statistics'),
-            method='GET',
-            params=self._build_params(),
-            timeout=timeout,
-        )
-        result = response_to_dict(response)
-        return DatasetStatisticsResponse.model_validate(result).data
+        if n < 0:
+            raise ValueError(f'n must not be negative, got {n}')
 
-    def create_items_public_url(
+        dataset = self.get()
+        if dataset is None:
+            raise ValueError(f'Dataset {self.resource_id!r} does not exist.')
+
+        offsets = sorted(random.Random(seed).sample(range(dataset.item_count), min(n, dataset.item_count)))
+        windows = _group_into_windows(offsets, max_gap=max_gap, max_size=DEFAULT_CHUNK_SIZE)
+
+        def fetch_window(window: tuple[int, list[int]]) -> list[dict[str, Any]]:
+            start, members = window
+            page = self.list_items(
+                offset=start, limit=members[-1] - start + 1, fields=fields, omit=omit, timeout=timeout
+            )
+            # Offsets past the end of a page are dropped, in case the dataset shrank since its size was read.
+            return [page.items[offset - start] for offset in members if offset - start < len(page.items)]
+
+        with ContextThreadPoolExecutor(max_workers=max_parallel) as executor:
+            return [item for items in executor.map(fetch_window, windows) for item in items]
+
+    def to_columns(
         self,
+        fields: list[str],
         *,
         offset: int | None = None,
         limit: int | None = None,
         clean: bool | None = None,
         desc: bool | None = None,
-        fields: list[str] | None = None,
-        omit: list[str] | None = None,
-        unwind: list[str] | None = None,
         skip_empty: bool | None = None,
         skip_hidden: bool | None = None,
-        flatten: list[str] | None = None,
-        view: str | None = None,
-        expires_in: timedelta | None = None,
+        signature: str | None = None,
         timeout: Timeout = 'long',
-    ) -> str:
-        """Generate a URL that can be used to access dataset items.
-
-        If the client has permission to access the dataset's URL signing key,
-        the URL will include a signature to verify its authenticity.
+    ) -> dict[str, Any]:
+        """Load the given fields of the dataset items into typed columns.
 
-        You can optionally control how long the signed URL should be valid using the `expires_in` option.
-        This value sets the expiration duration from the time the URL is generated.
-        If not provided, the URL will not expire.
+        The items are streamed as JSON Lines and each value is appended straight to the column of its field, so no
+        item outlives its own decoding. Booleans, integers and floats are packed into compact typed buffers - NumPy
+        arrays if NumPy is installed, `array.array` buffers otherwise. Strings become Arrow string arrays if PyArrow
+        is installed, and lists otherwise. Integer columns containing nulls become float columns with NaN in place
+        of the nulls. Columns mixing other types, or holding objects and arrays, stay lists of Python values.
 
-        Any other options (like `limit` or `offset`) will be included as query parameters in the URL.
+        https://docs.apify.com/api/v2#/reference/datasets/item-collection/get-items
 
         Args:
+            fields: The fields to load, each of them into its own column. A field an item lacks counts as null.
             offset: Number of items that should be skipped at the start. The default value is 0.
-            limit: Maximum number of items to return. By default there is no limit.
-            clean: If True, returns only non-empty items and skips hidden fields.
+            limit: Maximum number of items to load. By default there is no limit.
+            clean: If True, returns only non-empty items and skips hidden fields (i.e. fields starting with
+                the # character). The clean parameter is just a shortcut for skip_hidden=True and skip_empty=True
+                parameters.
             desc: By default, results are returned in the same order as they were stored. To reverse the order,
                 set this parameter to True.
-            fields: A list of fields which should be picked from the items.
-            omit: A list of fields which should be omitted from the items.
-            unwind: A list of fields which should be unwound, in order which they should be processed.
             skip_empty: If True, then empty items are skipped from the output.
-            skip_hidden: If True, then hidden fields are skipped from the output.
-            flatten: A list of fields that should be flattened.
-            view: Name of the dataset view to be used.
-            expires_in: How long the signed URL should be valid.
+            skip_hidden: If True, then hidden fields are skipped from the output, i.e. fields starting with
+                the # character.
+            signature: Signature used to access the items.
             timeout: Timeout for the API HTTP request.
 
         Returns:
-            The public dataset items URL.
+            A dictionary mapping each of the fields to its column, all the columns having the same length.
         """
-        dataset = self.get(timeout=timeout)
+        if not fields:
+            raise ValueError('At least one field must be given.')
 
-        request_params = self._build_params(
+        columns = {field: ColumnBuilder() for field in fields}
+        for item in self.iterate_streamed_items(
             offset=offset,
             limit=limit,
-            desc=desc,
             clean=clean,
+            desc=desc,
             fields=fields,
-            omit=omit,
-            unwind=unwind,
-            skipEmpty=skip_empty,
-            skipHidden=skip_hidden,
-            flatten=flatten,
-            view=view,
-        )
-
-        if dataset and dataset.url_signing_secret_key:
+            skip_empty=skip_empty,
+            skip_hidden=skip_hidden,
+            signature=signature,
+            timeout=timeout,
+        ):
+            for field, column in columns.items():
+                column.append(item.get(field))
+
+        numpy, pyarrow = import_column_libraries()
+        return {field: column.build(numpy=numpy, pyarrow=pyarrow) for field, column in columns.items()}
+
+    def aggregate(
+        self,
+        aggregation: ItemAggregation,
+        *,
+        offset: int | None = None,
+        limit: int | None = None,
+        clean: bool | None = None,
+        fields: list[str] | None = None,
+        omit: list[str] | None = None,
+        page_size: int = DEFAULT_CHUNK_SIZE,
+        max_parallel: int = 4,
+        processes: int | None = None,
+        timeout: Timeout = 'long',
+    ) -> dict[Any, Any]:
+        """Run a streaming aggregation pipeline over the dataset items.
+
+        The dataset is split by offset into pages that are downloaded concurrently as JSON Lines, each page is
+        aggregated into a partial state, and the partial states are merged. The next pages are downloaded while the
+        previous ones are being aggregated, and only the aggregator states and the pages of one round are held in
+        memory, whatever the size of the dataset.
+
+        With `processes` set, the pages are parsed and aggregated in a pool of worker processes, which helps when
+        the pipeline is CPU-heavy. The pipeline is then sent to the workers by pickling, so its filter, map and key
+        functions must be defined at module level rather than as lambdas or closures.
+
+        https://docs.apify.com/api/v2#/reference/datasets/item-collection/get-items
+
+        Args:
+            aggregation: The aggregation pipeline to run, see `apify_client.aggregation`.
+            offset: Number of items that should be skipped at the start. The default value is 0.
+            limit: Maximum number of items to aggregate. By default there is no limit.
+            clean: If True, returns only non-empty items and skips hidden fields (i.e. fields starting with
+                the # character). The clean parameter is just a shortcut for skip_hidden=True and skip_empty=True
+                parameters.
+            fields: A list of fields which should be picked from the items, only these fields will remain
+                in the aggregated items.
+            omit: A list of fields which should be omitted from the items.
+            page_size: Number of items downloaded in a single API call.
+            max_parallel: Maximum number of pages downloaded at the same time.
+            processes: Number of worker processes aggregating the pages. By default the pages are aggregated in
+                the current process.
+            timeout: Timeout for the API HTTP request of each page.
+
+        Returns:
+            The results of the pipeline, as returned by `ItemAggregation.finish`.
+
+        Raises:
+            ValueError: If the dataset does not exist.
+        """
+        if page_size < 1:
+            raise ValueError(f'page_size must be at least 1, got {page_size}')
+        if max_parallel < 1:
+            raise ValueError(f'max_parallel must be at least 1, got {max_parallel}')
+
+        dataset = self.get()
+        if dataset is None:
+            raise ValueError(f'Dataset {self.resource_id!r} does not exist.')
+
+        start = offset or 0
+        end = dataset.item_count if not limit else min(dataset.item_count, start + limit)
+        pages = [(page_offset, min(page_size, end - page_offset)) for page_offset in range(start, end, page_size)]
+
+        def fetch_page(page: tuple[int, int]) -> bytes:
+            page_offset, page_limit = page
+            return self.get_items_as_bytes(
+                item_format='jsonl',
+                offset=page_offset,
+                limit=page_limit,
+                clean=clean,
+                fields=fields,
+                omit=omit,
+                timeout=timeout,
+            )
+
+        state = aggregation.create_state()
+        with ExitStack() as stack:
+            fetcher = stack.enter_context(ContextThreadPoolExecutor(max_workers=max_parallel))
+            # Without worker processes, a single thread aggregates the pages while the next ones are downloaded.
+            aggregator = stack.enter_context(
+                ProcessPoolExecutor(max_workers=processes) if processes else ThreadPoolExecutor(max_workers=1)
+            )
+            pending = list[Future[dict[Any, dict[str, Any]]]]()
+            for window in chunked(pages, max_parallel):
+                contents = list(fetcher.map(fetch_page, window))
+                for future in pending:
+                    aggregation.merge(state, future.result())
+                pending = [aggregator.submit(_aggregate_jsonl, aggregation, content) for content in contents]
+            for future in pending:
+                aggregation.merge(state, future.result())
+
+        return aggregation.finish(state)
+
+    def export_to_files(
+        self,
+        path: str | os.PathLike[str],
+        *,
+        item_format: str = 'jsonl',
+        shards: int = 4,
+        concatenate: bool = False,
+        offset: int | None = None,
+        limit: int | None = None,
+        desc: bool | None = None,
+        clean: bool | None = None,
+        bom: bool | None = None,
+        delimiter: str | None = None,
+        fields: list[str] | None = None,
+        omit: list[str] | None = None,
+        unwind: list[str] | None = None,
+        skip_empty: bool | None = None,
+        skip_header_row: bool | None = None,
+        skip_hidden: bool | None = None,
+        xml_root: str | None = None,
+        xml_row: str | None = None,
+        signature: str | None = None,
+        timeout: Timeout = 'long',
+    ) -> list[Path]:
+        """Export the items of the dataset to local files, downloading several shards of the dataset concurrently.
+
+        The dataset is split by offset into `shards` contiguous ranges, each of which is streamed straight to disk
+        by its own request, so the exported items are never held in memory whole.
+
+        https://docs.apify.com/api/v2#/reference/datasets/item-collection/get-items
+
+        Args:
+            path: Directory to write the shard files into, or the file to write when `concatenate` is set.
+            item_format: Format of the exported items, possible values are: json, jsonl, csv, html, xlsx, xml and
+                rss. The default value is jsonl.
+            shards: Number of shards downloaded concurrently.
+            concatenate: If True, the shards are joined into the single file at `path`. Only the jsonl and csv
+                formats can be joined, and a CSV file keeps the header row and the BOM of its first shard only. The
+                API takes the CSV columns of each shard from its items, so the export fails if they differ between
+                the shards; pass `fields` to export the same columns from a dataset whose items differ.
+            offset: Number of items that should be skipped at the start. The default value is 0.
+            limit: Maximum number of items to export. By default there is no limit.
+            desc: By default, results are returned in the same order as they were stored. To reverse the order,
+                set this parameter to True.
+            clean: If True, returns only non-empty items and skips hidden fields (i.e. fields starting with
+                the # character). The clean parameter is just a shortcut for skip_hidden=True and skip_empty=True
+                parameters.
+            bom: All text responses are encoded in UTF-8 encoding. By default, csv files are prefixed with
+                the UTF-8 Byte Order Mark (BOM), while json, jsonl, xml, html and rss files are not. If you want
+                to override this default behavior, specify bom=True query parameter to include the BOM or bom=False
+                to skip it.
+            delimiter: A delimiter character for CSV files. The default delimiter is a simple comma (,).
+            fields: A list of fields which should be picked from the items, only these fields will remain
+                in the resulting record objects.
+            omit: A list of fields which should be omitted from the items.
+            unwind: A list of fields which should be unwound, in order which they should be processed.
+            skip_empty: If True, then empty items are skipped from the output.
+            skip_header_row: If True, then header row in the csv format is skipped.
+            skip_hidden: If True, then hidden fields are skipped from the output, i.e. fields starting with
+                the # character.
+            xml_root: Overrides default root element name of xml output. By default the root element is items.
+            xml_row: Overrides default element name that wraps each page or page function result object in xml output.
+                By default the element name is item.
+            signature: Signature used to access the items.
+            timeout: Timeout for the API HTTP request of each shard.
+
+        Returns:
+            Paths of the written files, one per shard, or just `path` when the shards were concatenated.
+
+        Raises:
+            ValueError: If the shards of `item_format` cannot be concatenated, the CSV shards have different columns,
+                or the dataset does not exist.
+        """
+        if shards < 1:
+            raise ValueError(f'shards must be at least 1, got {shards}')
+        if concatenate and item_format not in _CONCATENABLE_ITEM_FORMATS:
+            raise ValueError(f'Shards in the {item_format!r} format cannot be concatenated into a single file.')
+
+        dataset = self.get()
+        if dataset is None:
+            raise ValueError(f'Dataset {self.resource_id!r} does not exist.')
+
+        start = offset or 0
+        end = dataset.item_count if not limit else min(dataset.item_count, start + limit)
+        ranges = _split_into_shards(start, end, shards)
+        target = Path(path)
+        parts = _export_part_paths(target, item_format=item_format, shards=len(ranges), concatenate=concatenate)
+
+        def export_shard(index: int) -> None:
+            # A CSV shard appended to another one must not repeat the BOM. Each shard keeps its header row, which is
+            # checked against the first one and dropped when the shards are concatenated.
+            is_continuation = concatenate and index > 0 and item_format == 'csv'
+            shard_offset, shard_limit = ranges[index]
+            with (
+                self.stream_items(
+                    item_format=item_format,
+                    offset=shard_offset,
+                    limit=shard_limit,
+                    desc=desc,
+                    clean=clean,
+                    bom=False if is_continuation else bom,
+                    delimiter=delimiter,
+                    fields=fields,
+                    omit=omit,
+                    unwind=unwind,
+                    skip_empty=skip_empty,
+                    skip_header_row=False if concatenate and item_format == 'csv' else skip_header_row,
+                    skip_hidden=skip_hidden,
+                    xml_root=xml_root,
+                    xml_row=xml_row,
+                    signature=signature,
+                    timeout=timeout,
+                ) as response,
+                parts[index].open('wb') as file,
+            ):
+                for chunk in response.iter_bytes():
+                    file.write(chunk)
+
+        try:
+            with ContextThreadPoolExecutor(max_workers=max(len(ranges), 1)) as executor:
+                list(executor.map(export_shard, range(len(ranges))))
+        except BaseException:
+            if concatenate:
+                for part in parts:
+                    part.unlink(missing_ok=True)
+            raise
+
+        if not concatenate:
+            return parts
+
+        _concatenate_parts(parts, target, csv=item_format == 'csv', keep_header=not skip_header_row)
+        return [target]
+
+    def push_items(self, items: JsonSerializable, *, timeout: Timeout = 'medium') -> None:
+        """Push items to the dataset.
+
+        https://docs.apify.com/api/v2#/reference/datasets/item-collection/put-items
+
+        Args:
+            items: The items which to push in the dataset. Either a stringified JSON, a dictionary, or a list
+                of strings or dictionaries.
+            timeout: Timeout for the API HTTP request.
+        """
+        data = None
+        json = None
+
+        if isinstance(items, str):
+            data = items
+        else:
+            json = items
+
+        self._http_client.call(
+            url=self._build_url('items'),
+            method='POST',
+            headers={'content-type': 'application/json; charset=utf-8'},
+            params=self._build_params(),
+            data=data,
+            json=json,
+            timeout=timeout,
+        )
+
+    def push_items_batched(
+        self,
+        items: Iterable[JsonSerializable],
+        *,
+        max_parallel: int = 5,
+        timeout: Timeout = 'medium',
+    ) -> None:
+        """Push items to the dataset in size-bounded batches, uploading several batches concurrently.
+
+        Unlike `push_items`, which sends all the items in a single request, this method consumes the items lazily and
+        packs them into batches that stay under the payload size limit of the API. Each item is serialized exactly once,
+        and only the batches being uploaded are held in memory, so the items can come from a generator.
+
+        https://docs.apify.com/api/v2#/reference/datasets/item-collection/put-items
+
+        Args:
+            items: The items to push into the dataset, each of them a JSON-serializable object.
+            max_parallel: Maximum number of batches uploaded at the same time.
+            timeout: Timeout for the API HTTP request of each batch.
+        """
+        if max_parallel < 1:
+            raise ValueError(f'max_parallel must be at least 1, got {max_parallel}')
+
+        # Split the items into batches by payload size, counting the commas and brackets of the JSON array.
+        batches = constrained_batches(
+            (serialize_json(item) for item in items),
+            max_size=PAYLOAD_SIZE_LIMIT_BYTES - len(b'[]'),
+            get_len=lambda serialized: len(serialized) + len(b','),
+            strict=False,
+        )
+
+        with ContextThreadPoolExecutor(max_workers=max_parallel) as executor:
+            in_flight = set[Future[None]]()
+            for batch in batches:
+                # Keep at most `max_parallel` batches in flight, so the input is not consumed ahead of the uploads.
+                if len(in_flight) >= max_parallel:
+                    done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        future.result()
+                in_flight.add(executor.submit(self._push_serialized_items, batch, timeout=timeout))
+
+            for future in in_flight:
+                future.result()
+
+    def copy_to(self, target: DatasetClient, *, max_parallel: int = 1, timeout: Timeout = 'long') -> int:
+        """Copy the items of this dataset into another dataset, streaming them through the client.
+
+        The items are downloaded over a single resumable stream with `iterate_streamed_items`, and packed into batches
+        pushed to the target dataset with `push_items_batched` as they arrive, so only the batches being uploaded are
+        held in memory however large the dataset is. The target can belong to another client, for example one with
+        the token of another account. By default the batches are uploaded one at a time, which keeps the order of the
+        items. A higher `max_parallel` copies a large dataset faster, but the batches can then be stored in a different
+        order than they were read in.
+
+        https://docs.apify.com/api/v2#/reference/datasets/item-collection/put-items
+
+        Args:
+            target: The dataset to copy the items into.
+            max_parallel: Maximum number of batches uploaded at the same time. With more than 1, the order of the
+                items in the target dataset is not kept.
+            timeout: Timeout for the API HTTP request that opens the stream, and for the request of each batch.
+
+        Returns:
+            The number of items copied.
+        """
+        copied = 0
+
+        def count_items() -> Iterator[dict]:
+            nonlocal copied
+            for item in self.iterate_streamed_items(timeout=timeout):
+                copied += 1
+                yield item
+
+        target.push_items_batched(count_items(), max_parallel=max_parallel, timeout=timeout)
+        return copied
+
+    def _push_serialized_items(self, serialized_items: Iterable[bytes], *, timeout: Timeout) -> None:
+        """Push a batch of already serialized items to the dataset."""
+        self._http_client.call(
+            url=self._build_url('items'),
+            method='POST',
+            headers={'content-type': 'application/json; charset=utf-8'},
+            params=self._build_params(),
+            data=join_json_array(serialized_items),
+            timeout=timeout,
+        )
+
+    def get_mirror(
+        self,
+        path: str | os.PathLike[str],
+        *,
+        storage: MirrorStorage = 'jsonl',
+        page_size: int = DEFAULT_CHUNK_SIZE,
+        max_parallel: int = 4,
+        fields: list[str] | None = None,
+        omit: list[str] | None = None,
+        timeout: Timeout = 'long',
+    ) -> DatasetMirror:
+        """Get a dataset mirror that keeps an incrementally synced local copy of the dataset.
+
+        Each `sync` of the mirror downloads only the items added since the previous one and appends them to the
+        local copy, so an append-only dataset does not have to be downloaded whole again to pick up new items.
+
+        Args:
+            path: Path of the local copy. With the jsonl storage, the sync state is kept in a `.state.json` file
+                next to it.
+            storage: Format of the local copy, either `jsonl` for a JSON Lines file or `sqlite` for an SQLite
+                database.
+            page_size: Number of items downloaded in a single API call.
+            max_parallel: Maximum number of pages downloaded at the same time.
+            fields: A list of fields which should be picked from the items, only these fields will remain
+                in the local copy.
+            omit: A list of fields which should be omitted from the items.
+            timeout: Timeout for the API HTTP request of each page.
+
+        Returns:
+            The dataset mirror.
+        """
+        return DatasetMirror(
+            self,
+            path,
+            storage=storage,
+            page_size=page_size,
+            max_parallel=max_parallel,
+            fields=fields,
+            omit=omit,
+            timeout=timeout,
+        )
+
+    def get_writer(
+        self,
+        *,
+        max_batch_bytes: int = PAYLOAD_SIZE_LIMIT_BYTES,
+        max_batch_items: int = 1000,
+        flush_interval: timedelta = timedelta(seconds=5),
+        max_pending_batches: int = 2,
+        on_batch_error: Callable[[DatasetWriterBatchFailure], None] | None = None,
+        timeout: Timeout = 'medium',
+    ) -> DatasetWriter:
+        """Get a dataset writer that buffers items and pushes them to the dataset in batches.
+
+        Instead of sending one request per item, the writer packs the added items into batches and pushes them from
+        the background, which keeps the number of requests low when items are produced one at a time. Use the writer
+        as a context manager, or call its `close` method, to push the remaining items when done.
+
+        Args:
+            max_batch_bytes: Maximum size of the body of a single push request, in bytes. Defaults to the largest
+                payload the API accepts.
+            max_batch_items: Maximum number of items in a single push request.
+            flush_interval: Longest time buffered items wait before they are pushed.
+            max_pending_batches: Maximum number of completed batches waiting to be pushed. Once reached, adding
+                items waits until a batch is pushed.
+            on_batch_error: Function called with each batch that fails to be pushed. Failed batches are also
+                logged and collected in the `failures` property of the writer.
+            timeout: Timeout for the API HTTP request of each batch.
+
+        Returns:
+            The dataset writer for pushing the items.
+        """
+        return DatasetWriter(
+            self,
+            max_batch_bytes=max_batch_bytes,
+            max_batch_items=max_batch_items,
+            flush_interval=flush_interval,
+            max_pending_batches=max_pending_batches,
+            on_batch_error=on_batch_error,
+            timeout=timeout,
+        )
+
+    def get_statistics(self, *, timeout: Timeout = 'short') -> DatasetStatistics:
+        """Get the dataset statistics.
+
+        https://docs.apify.com/api/v2#tag/DatasetsStatistics/operation/dataset_statistics_get
+
+        Args:
+            timeout: Timeout for the API HTTP request.
+
+        Returns:
+            The dataset statistics.
+
+        Raises:
+            NotFoundError: If the dataset does not exist.
+        """
+        response = self._http_client.call(
+            url=self._build_url('statistics'),
+            method='GET',
+            params=self._build_params(),
+            timeout=timeout,
+        )
+        result = response_to_dict(response)
+        return DatasetStatisticsResponse.model_validate(result).data
+
+    def create_items_public_url(
+        self,
+        *,
+        offset: int | None = None,
+        limit: int | None = None,
+        clean: bool | None = None,
+        desc: bool | None = None,
+        fields: list[str] | None = None,
+        omit: list[str] | None = None,
+        unwind: list[str] | None = None,
+        skip_empty: bool | None = None,
+        skip_hidden: bool | None = None,
+        flatten: list[str] | None = None,
+        view: str | None = None,
+        expires_in: timedelta | None = None,
+        timeout: Timeout = 'long',
+    ) -> str:
+        """Generate a URL that can be used to access dataset items.
+
+        If the client has permission to access the dataset's URL signing key,
+        the URL will include a signature to verify its authenticity.
+
+        You can optionally control how long the signed URL should be valid using the `expires_in` option.
+        This value sets the expiration duration from the time the URL is generated.
+        If not provided, the URL will not expire.
+
+        Any other options (like `limit` or `offset`) will be included as query parameters in the URL.
+
+        Args:
+            offset: Number of items that should be skipped at the start. The default value is 0.
+            limit: Maximum number of items to return. By default there is no limit.
+            clean: If True, returns only non-empty items and skips hidden fields.
+            desc: By default, results are returned in the same order as they were stored. To reverse the order,
+                set this parameter to True.
+            fields: A list of fields which should be picked from the items.
+            omit: A list of fields which should be omitted from the items.
+            unwind: A list of fields which should be unwound, in order which they should be processed.
+            skip_empty: If True, then empty items are skipped from the output.
+            skip_hidden: If True, then hidden fields are skipped from the output.
+            flatten: A list of fields that should be flattened.
+            view: Name of the dataset view to be used.
+            expires_in: How long the signed URL should be valid.
+            timeout: Timeout for the API HTTP request.
+
+        Returns:
+            The public dataset items URL.
+        """
+        signing_key = self._get_signing_key(timeout=timeout)
+
+        request_params = self._build_params(
+            offset=offset,
+            limit=limit,
+            desc=desc,
+            clean=clean,
+            fields=fields,
+            omit=omit,
+            unwind=unwind,
+            skipEmpty=skip_empty,
+            skipHidden=skip_hidden,
+            flatten=flatten,
+            view=view,
+        )
+
+        if signing_key and signing_key.secret_key:
             signature = create_storage_content_signature(
-                dataset.id,
-                dataset.url_signing_secret_key,
+                signing_key.storage_id,
+                signing_key.secret_key,
                 expires_in=expires_in,
             )
             request_params['signature'] = signature
 
         return self._build_public_url('items', request_params)
 
+    def invalidate_signing_key(self) -> None:
+        """Drop the cached URL signing key of the dataset, so that the next signed URL fetches it again.
+
+        The key is cached for a while after it is first fetched, so signing many URLs takes a single request. Call
+        this after the key is rotated, to stop signing URLs with the old one.
+        """
+        self._client_registry.signing_keys.invalidate(self._resource_url)
+
+    def _get_signing_key(self, *, timeout: Timeout) -> StorageSigningKey | None:
+        """Return the URL signing key of the dataset, fetching the dataset only if the key is not cached."""
+        signing_key = self._client_registry.signing_keys.get(self._resource_url)
+        if signing_key is None:
+            dataset = self.get(timeout=timeout)
+            if dataset is None:
+                return None
+            signing_key = StorageSigningKey(storage_id=dataset.id, secret_key=dataset.url_signing_secret_key)
+            self._client_registry.signing_keys.set(self._resource_url, signing_key)
+        return signing_key
+
 
 @docs_group('Resource clients')
 class DatasetClientAsync(ResourceClientAsync):
@@ -696,8 +1596,9 @@ class DatasetClientAsync(ResourceClientAsync):
         flatten: list[str] | None = None,
         view: str | None = None,
         signature: str | None = None,
+        item_model: type[ItemT] | None = None,
         timeout: Timeout = 'long',
-    ) -> DatasetItemsPage:
+    ) -> DatasetItemsPage[ItemT]:
         """List the items of the dataset.
 
         https://docs.apify.com/api/v2#/reference/datasets/item-collection/get-items
@@ -729,6 +1630,8 @@ class DatasetClientAsync(ResourceClientAsync):
             flatten: A list of fields that should be flattened.
             view: Name of the dataset view to be used.
             signature: Signature used to access the items.
+            item_model: A Pydantic model or a `TypedDict` to validate the items into. The whole page is validated
+                in a single pass over the raw response body.
             timeout: Timeout for the API HTTP request.
 
         Returns:
@@ -757,7 +1660,7 @@ class DatasetClientAsync(ResourceClientAsync):
         )
 
         # When using signature, API returns items as list directly
-        items = response_to_list(response)
+        items = response_to_list(response) if item_model is None else _validate_items(response.content, item_model)
 
         return DatasetItemsPage(
             items=items,
@@ -785,8 +1688,9 @@ class DatasetClientAsync(ResourceClientAsync):
         skip_hidden: bool | None = None,
         signature: str | None = None,
         chunk_size: int | None = None,
+        item_model: type[ItemT] | None = None,
         timeout: Timeout = 'long',
-    ) -> AsyncIterator[dict]:
+    ) -> AsyncIterator[ItemT]:
         """Iterate over the items in the dataset.
 
         Simple `list_items` does only one API call, possibly not listing all items matching the criteria. This method
@@ -820,13 +1724,15 @@ class DatasetClientAsync(ResourceClientAsync):
                 the # character.
             signature: Signature used to access the items.
             chunk_size: Maximum number of items requested per API call when iterating across pages.
+            item_model: A Pydantic model or a `TypedDict` to validate the items into. Each page is validated
+                in a single pass over the raw response body.
             timeout: Timeout for the API HTTP request.
 
         Yields:
             An item from the dataset.
         """
 
-        async def _callback(*, limit: int | None = None, offset: int | None = None) -> DatasetItemsPage:
+        async def _callback(*, limit: int | None = None, offset: int | None = None) -> DatasetItemsPage[ItemT]:
             return await self.list_items(
                 offset=offset,
                 limit=limit,
@@ -838,6 +1744,7 @@ class DatasetClientAsync(ResourceClientAsync):
                 skip_empty=skip_empty,
                 skip_hidden=skip_hidden,
                 signature=signature,
+                item_model=item_model,
                 timeout=timeout,
             )
 
@@ -912,7 +1819,114 @@ class DatasetClientAsync(ResourceClientAsync):
             timeout: Timeout for the API HTTP request.
 
         Returns:
-            The dataset items as raw bytes.
+            The dataset items as raw bytes.
+        """
+        request_params = self._build_params(
+            format=item_format,
+            offset=offset,
+            limit=limit,
+            desc=desc,
+            clean=clean,
+            bom=bom,
+            delimiter=delimiter,
+            fields=fields,
+            omit=omit,
+            unwind=unwind,
+            skipEmpty=skip_empty,
+            skipHeaderRow=skip_header_row,
+            skipHidden=skip_hidden,
+            xmlRoot=xml_root,
+            xmlRow=xml_row,
+            flatten=flatten,
+            signature=signature,
+        )
+
+        response = await self._http_client.call(
+            url=self._build_url('items'),
+            method='GET',
+            params=request_params,
+            timeout=timeout,
+        )
+
+        return response.content
+
+    async def get_items_as_file(
+        self,
+        file: IO[bytes] | None = None,
+        *,
+        item_format: str = 'json',
+        offset: int | None = None,
+        limit: int | None = None,
+        desc: bool | None = None,
+        clean: bool | None = None,
+        bom: bool | None = None,
+        delimiter: str | None = None,
+        fields: list[str] | None = None,
+        omit: list[str] | None = None,
+        unwind: list[str] | None = None,
+        skip_empty: bool | None = None,
+        skip_header_row: bool | None = None,
+        skip_hidden: bool | None = None,
+        xml_root: str | None = None,
+        xml_row: str | None = None,
+        flatten: list[str] | None = None,
+        signature: str | None = None,
+        max_memory_bytes: int = DEFAULT_SPOOL_MAX_MEMORY_BYTES,
+        timeout: Timeout = 'long',
+    ) -> IO[bytes]:
+        """Get the items in the dataset as a file, without holding the raw body in memory whole.
+
+        The response is streamed into `file` as it arrives. Without a `file`, it is spooled into a temporary file,
+        which stays in memory up to `max_memory_bytes` and moves to disk past that. Use this instead of
+        `get_items_as_bytes` for exports too large to fit in memory.
+
+        https://docs.apify.com/api/v2#/reference/datasets/item-collection/get-items
+
+        Args:
+            file: A binary file or buffer to write the items into. By default a spooled temporary file is created.
+            item_format: Format of the results, possible values are: json, jsonl, csv, html, xlsx, xml and rss.
+                The default value is json.
+            offset: Number of items that should be skipped at the start. The default value is 0.
+            limit: Maximum number of items to return. By default there is no limit.
+            desc: By default, results are returned in the same order as they were stored. To reverse the order,
+                set this parameter to True.
+            clean: If True, returns only non-empty items and skips hidden fields (i.e. fields starting with
+                the # character). The clean parameter is just a shortcut for skip_hidden=True and skip_empty=True
+                parameters. Note that since some objects might be skipped from the output, that the result might
+                contain less items than the limit value.
+            bom: All text responses are encoded in UTF-8 encoding. By default, csv files are prefixed with
+                the UTF-8 Byte Order Mark (BOM), while json, jsonl, xml, html and rss files are not. If you want
+                to override this default behavior, specify bom=True query parameter to include the BOM or bom=False
+                to skip it.
+            delimiter: A delimiter character for CSV files. The default delimiter is a simple comma (,).
+            fields: A list of fields which should be picked from the items, only these fields will remain
+                in the resulting record objects. Note that the fields in the outputted items are sorted the same
+                way as they are specified in the fields parameter. You can use this feature to effectively fix
+                the output format.
+                You can use this feature to effectively fix the output format.
+            omit: A list of fields which should be omitted from the items.
+            unwind: A list of fields which should be unwound, in order which they should be processed. Each field
+                should be either an array or an object. If the field is an array then every element of the array
+                will become a separate record and merged with parent object. If the unwound field is an object then
+                it is merged with the parent object. If the unwound field is missing or its value is neither an array
+                nor an object and therefore cannot be merged with a parent object, then the item gets preserved
+                as it is. Note that the unwound items ignore the desc parameter.
+            skip_empty: If True, then empty items are skipped from the output. Note that if used, the results might
+                contain less items than the limit value.
+            skip_header_row: If True, then header row in the csv format is skipped.
+            skip_hidden: If True, then hidden fields are skipped from the output, i.e. fields starting with
+                the # character.
+            xml_root: Overrides default root element name of xml output. By default the root element is items.
+            xml_row: Overrides default element name that wraps each page or page function result object in xml output.
+                By default the element name is item.
+            flatten: A list of fields that should be flattened.
+            signature: Signature used to access the items.
+            max_memory_bytes: Size up to which the spooled temporary file is kept in memory.
+            timeout: Timeout for the API HTTP request.
+
+        Returns:
+            The file with the items. A spooled temporary file is rewound to its start and should be closed after
+                use, a given `file` is returned as it is after the last write.
         """
         request_params = self._build_params(
             format=item_format,
@@ -938,10 +1952,14 @@ class DatasetClientAsync(ResourceClientAsync):
             url=self._build_url('items'),
             method='GET',
             params=request_params,
+            stream=True,
             timeout=timeout,
         )
 
-        return response.content
+        try:
+            return await spool_response_async(response, file, max_memory_bytes=max_memory_bytes)
+        finally:
+            await response.aclose()
 
     @asynccontextmanager
     async def stream_items(
@@ -1044,6 +2062,462 @@ class DatasetClientAsync(ResourceClientAsync):
             if response:
                 await response.aclose()
 
+    async def iterate_streamed_items(
+        self,
+        *,
+        offset: int | None = None,
+        limit: int | None = None,
+        clean: bool | None = None,
+        desc: bool | None = None,
+        fields: list[str] | None = None,
+        omit: list[str] | None = None,
+        skip_empty: bool | None = None,
+        skip_hidden: bool | None = None,
+        signature: str | None = None,
+        max_resumes: int = DEFAULT_MAX_RETRIES,
+        timeout: Timeout = 'long',
+    ) -> AsyncIterator[dict]:
+        """Iterate over the items in the dataset over a single resumable stream.
+
+        Unlike `iterate_items`, which requests one page after another, this method downloads the items as one JSON
+        Lines stream and decodes them as they arrive. Retries of the HTTP client only cover opening the stream, so
+        when the connection drops mid-transfer, the stream is reopened transparently at the offset right after the
+        last delivered item, with the same filters. The partially received item is discarded and delivered again in
+        full from the reopened stream, so every item is yielded exactly once.
+
+        https://docs.apify.com/api/v2#/reference/datasets/item-collection/get-items
+
+        Args:
+            offset: Number of items that should be skipped at the start. The default value is 0.
+            limit: Maximum number of items to return. By default there is no limit.
+            desc: By default, results are returned in the same order as they were stored. To reverse the order,
+                set this parameter to True.
+            clean: If True, returns only non-empty items and skips hidden fields (i.e. fields starting with
+                the # character). The clean parameter is just a shortcut for skip_hidden=True and skip_empty=True
+                parameters.
+            fields: A list of fields which should be picked from the items, only these fields will remain in
+                the resulting record objects. Note that the fields in the outputted items are sorted the same way
+                as they are specified in the fields parameter.
+            omit: A list of fields which should be omitted from the items.
+            skip_empty: If True, then empty items are skipped from the output. The client drops them itself, so the
+                offset a resumed stream continues from keeps counting every stored item.
+            skip_hidden: If True, then hidden fields are skipped from the output, i.e. fields starting with
+                the # character.
+            signature: Signature used to access the items.
+            max_resumes: How many times in a row the stream is reopened after a dropped connection without
+                delivering any item in between, before the error is raised.
+            timeout: Timeout for each API HTTP request that opens the stream.
+
+        Yields:
+            An item from the dataset.
+        """
+        # Offsets count stored items, so empty items are dropped here instead of by the API. Otherwise a resumed stream
+        # would start from an offset short by the number of items the API skipped.
+        drop_empty = bool(clean or skip_empty)
+        skip_hidden = True if clean else skip_hidden
+        start_offset = offset or 0
+        delivered = 0
+        failed_resumes = 0
+
+        while not limit or delivered < limit:
+            delivered_before = delivered
+            decoder = JsonLinesDecoder()
+            try:
+                async with self.stream_items(
+                    item_format='jsonl',
+                    offset=start_offset + delivered,
+                    limit=limit - delivered if limit else None,
+                    desc=desc,
+                    fields=fields,
+                    omit=omit,
+                    skip_hidden=skip_hidden,
+                    signature=signature,
+                    timeout=timeout,
+                ) as response:
+                    async for chunk in response.aiter_bytes():
+                        for item in decoder.feed(chunk):
+                            delivered += 1
+                            if item or not drop_empty:
+                                yield item
+                    try:
+                        tail = decoder.finish()
+                    except json.JSONDecodeError as exc:
+                        raise _TruncatedStreamError from exc
+                    for item in tail:
+                        delivered += 1
+                        if item or not drop_empty:
+                            yield item
+            except Exception as exc:
+                truncated = isinstance(exc, _TruncatedStreamError)
+                # Reset the streak whenever the interrupted stream made progress, so only a connection that keeps
+                # failing before delivering anything exhausts the resumes.
+                failed_resumes = 0 if delivered > delivered_before else failed_resumes + 1
+                if (
+                    not (truncated or self._http_client.is_retryable_transport_error(exc))
+                    or failed_resumes > max_resumes
+                ):
+                    raise
+                logger.debug('Item stream interrupted, resuming', extra={'offset': start_offset + delivered})
+            else:
+                return
+
+    async def sample(
+        self,
+        n: int,
+        *,
+        seed: int | None = None,
+        fields: list[str] | None = None,
+        omit: list[str] | None = None,
+        max_gap: int = 100,
+        max_parallel: int = 5,
+        timeout: Timeout = 'long',
+    ) -> list[dict[str, Any]]:
+        """Get a random sample of the dataset items.
+
+        Random offsets are picked across the whole dataset, offsets close to each other are grouped into windows
+        fetched by a single request, and the windows are fetched concurrently. Only the windows are downloaded,
+        so sampling a huge dataset costs a fraction of reading it whole.
+
+        https://docs.apify.com/api/v2#/reference/datasets/item-collection/get-items
+
+        Args:
+            n: Number of items to sample. If the dataset has fewer items, all of them are returned.
+            seed: Seed of the random generator, which makes the sample reproducible for an unchanged dataset.
+            fields: A list of fields which should be picked from the items, only these fields will remain
+                in the resulting record objects.
+            omit: A list of fields which should be omitted from the items.
+            max_gap: Largest distance between two sampled offsets that are still fetched by the same request.
+                A larger value means fewer requests, at the cost of downloading more items that are thrown away.
+            max_parallel: Maximum number of requests made at the same time.
+            timeout: Timeout for the API HTTP request of each window.
+
+        Returns:
+            The sampled items, in the order they are stored in the dataset.
+
+        Raises:
+            ValueError: If the dataset does not exist.
+        """
+        if n < 0:
+            raise ValueError(f'n must not be negative, got {n}')
+
+        dataset = await self.get()
+        if dataset is None:
+            raise ValueError(f'Dataset {self.resource_id!r} does not exist.')
+
+        offsets = sorted(random.Random(seed).sample(range(dataset.item_count), min(n, dataset.item_count)))
+        windows = _group_into_windows(offsets, max_gap=max_gap, max_size=DEFAULT_CHUNK_SIZE)
+
+        semaphore = asyncio.Semaphore(max_parallel)
+
+        async def fetch_window(window: tuple[int, list[int]]) -> list[dict[str, Any]]:
+            start, members = window
+            async with semaphore:
+                page = await self.list_items(
+                    offset=start, limit=members[-1] - start + 1, fields=fields, omit=omit, timeout=timeout
+                )
+            # Offsets past the end of a page are dropped, in case the dataset shrank since its size was read.
+            return [page.items[offset - start] for offset in members if offset - start < len(page.items)]
+
+        results = await asyncio.gather(*(fetch_window(window) for window in windows))
+        return [item for items in results for item in items]
+
+    async def to_columns(
+        self,
+        fields: list[str],
+        *,
+        offset: int | None = None,
+        limit: int | None = None,
+        clean: bool | None = None,
+        desc: bool | None = None,
+        skip_empty: bool | None = None,
+        skip_hidden: bool | None = None,
+        signature: str | None = None,
+        timeout: Timeout = 'long',
+    ) -> dict[str, Any]:
+        """Load the given fields of the dataset items into typed columns.
+
+        The items are streamed as JSON Lines and each value is appended straight to the column of its field, so no
+        item outlives its own decoding. Booleans, integers and floats are packed into compact typed buffers - NumPy
+        arrays if NumPy is installed, `array.array` buffers otherwise. Strings become Arrow string arrays if PyArrow
+        is installed, and lists otherwise. Integer columns containing nulls become float columns with NaN in place
+        of the nulls. Columns mixing other types, or holding objects and arrays, stay lists of Python values.
+
+        https://docs.apify.com/api/v2#/reference/datasets/item-collection/get-items
+
+        Args:
+            fields: The fields to load, each of them into its own column. A field an item lacks counts as null.
+            offset: Number of items that should be skipped at the start. The default value is 0.
+            limit: Maximum number of items to load. By default there is no limit.
+            clean: If True, returns only non-empty items and skips hidden fields (i.e. fields starting with
+                the # character). The clean parameter is just a shortcut for skip_hidden=True and skip_empty=True
+                parameters.
+            desc: By default, results are returned in the same order as they were stored. To reverse the order,
+                set this parameter to True.
+            skip_empty: If True, then empty items are skipped from the output.
+            skip_hidden: If True, then hidden fields are skipped from the output, i.e. fields starting with
+                the # character.
+            signature: Signature used to access the items.
+            timeout: Timeout for the API HTTP request.
+
+        Returns:
+            A dictionary mapping each of the fields to its column, all the columns having the same length.
+        """
+        if not fields:
+            raise ValueError('At least one field must be given.')
+
+        columns = {field: ColumnBuilder() for field in fields}
+        async for item in self.iterate_streamed_items(
+            offset=offset,
+            limit=limit,
+            clean=clean,
+            desc=desc,
+            fields=fields,
+            skip_empty=skip_empty,
+            skip_hidden=skip_hidden,
+            signature=signature,
+            timeout=timeout,
+        ):
+            for field, column in columns.items():
+                column.append(item.get(field))
+
+        numpy, pyarrow = import_column_libraries()
+        return {field: column.build(numpy=numpy, pyarrow=pyarrow) for field, column in columns.items()}
+
+    async def aggregate(
+        self,
+        aggregation: ItemAggregation,
+        *,
+        offset: int | None = None,
+        limit: int | None = None,
+        clean: bool | None = None,
+        fields: list[str] | None = None,
+        omit: list[str] | None = None,
+        page_size: int = DEFAULT_CHUNK_SIZE,
+        max_parallel: int = 4,
+        processes: int | None = None,
+        timeout: Timeout = 'long',
+    ) -> dict[Any, Any]:
+        """Run a streaming aggregation pipeline over the dataset items.
+
+        The dataset is split by offset into pages that are downloaded concurrently as JSON Lines, each page is
+        aggregated into a partial state, and the partial states are merged. The next pages are downloaded while the
+        previous ones are being aggregated, and only the aggregator states and the pages of one round are held in
+        memory, whatever the size of the dataset.
+
+        With `processes` set, the pages are parsed and aggregated in a pool of worker processes, which helps when
+        the pipeline is CPU-heavy. The pipeline is then sent to the workers by pickling, so its filter, map and key
+        functions must be defined at module level rather than as lambdas or closures.
+
+        https://docs.apify.com/api/v2#/reference/datasets/item-collection/get-items
+
+        Args:
+            aggregation: The aggregation pipeline to run, see `apify_client.aggregation`.
+            offset: Number of items that should be skipped at the start. The default value is 0.
+            limit: Maximum number of items to aggregate. By default there is no limit.
+            clean: If True, returns only non-empty items and skips hidden fields (i.e. fields starting with
+                the # character). The clean parameter is just a shortcut for skip_hidden=True and skip_empty=True
+                parameters.
+            fields: A list of fields which should be picked from the items, only these fields will remain
+                in the aggregated items.
+            omit: A list of fields which should be omitted from the items.
+            page_size: Number of items downloaded in a single API call.
+            max_parallel: Maximum number of pages downloaded at the same time.
+            processes: Number of worker processes aggregating the pages. By default the pages are aggregated in
+                the current process.
+            timeout: Timeout for the API HTTP request of each page.
+
+        Returns:
+            The results of the pipeline, as returned by `ItemAggregation.finish`.
+
+        Raises:
+            ValueError: If the dataset does not exist.
+        """
+        if page_size < 1:
+            raise ValueError(f'page_size must be at least 1, got {page_size}')
+        if max_parallel < 1:
+            raise ValueError(f'max_parallel must be at least 1, got {max_parallel}')
+
+        dataset = await self.get()
+        if dataset is None:
+            raise ValueError(f'Dataset {self.resource_id!r} does not exist.')
+
+        start = offset or 0
+        end = dataset.item_count if not limit else min(dataset.item_count, start + limit)
+        pages = [(page_offset, min(page_size, end - page_offset)) for page_offset in range(start, end, page_size)]
+
+        async def fetch_page(page: tuple[int, int]) -> bytes:
+            page_offset, page_limit = page
+            return await self.get_items_as_bytes(
+                item_format='jsonl',
+                offset=page_offset,
+                limit=page_limit,
+                clean=clean,
+                fields=fields,
+                omit=omit,
+                timeout=timeout,
+            )
+
+        loop = asyncio.get_running_loop()
+        state = aggregation.create_state()
+        with ExitStack() as stack:
+            # Without worker processes, a single thread aggregates the pages while the next ones are downloaded.
+            aggregator = stack.enter_context(
+                ProcessPoolExecutor(max_workers=processes) if processes else ThreadPoolExecutor(max_workers=1)
+            )
+            pending = list[asyncio.Future[dict[Any, dict[str, Any]]]]()
+            for window in chunked(pages, max_parallel):
+                contents = await asyncio.gather(*(fetch_page(page) for page in window))
+                for future in pending:
+                    aggregation.merge(state, await future)
+                pending = [
+                    loop.run_in_executor(aggregator, _aggregate_jsonl, aggregation, content) for content in contents
+                ]
+            for future in pending:
+                aggregation.merge(state, await future)
+
+        return aggregation.finish(state)
+
+    async def export_to_files(
+        self,
+        path: str | os.PathLike[str],
+        *,
+        item_format: str = 'jsonl',
+        shards: int = 4,
+        concatenate: bool = False,
+        offset: int | None = None,
+        limit: int | None = None,
+        desc: bool | None = None,
+        clean: bool | None = None,
+        bom: bool | None = None,
+        delimiter: str | None = None,
+        fields: list[str] | None = None,
+        omit: list[str] | None = None,
+        unwind: list[str] | None = None,
+        skip_empty: bool | None = None,
+        skip_header_row: bool | None = None,
+        skip_hidden: bool | None = None,
+        xml_root: str | None = None,
+        xml_row: str | None = None,
+        signature: str | None = None,
+        timeout: Timeout = 'long',
+    ) -> list[Path]:
+        """Export the items of the dataset to local files, downloading several shards of the dataset concurrently.
+
+        The dataset is split by offset into `shards` contiguous ranges, each of which is streamed straight to disk
+        by its own request, so the exported items are never held in memory whole.
+
+        https://docs.apify.com/api/v2#/reference/datasets/item-collection/get-items
+
+        Args:
+            path: Directory to write the shard files into, or the file to write when `concatenate` is set.
+            item_format: Format of the exported items, possible values are: json, jsonl, csv, html, xlsx, xml and
+                rss. The default value is jsonl.
+            shards: Number of shards downloaded concurrently.
+            concatenate: If True, the shards are joined into the single file at `path`. Only the jsonl and csv
+                formats can be joined, and a CSV file keeps the header row and the BOM of its first shard only. The
+                API takes the CSV columns of each shard from its items, so the export fails if they differ between
+                the shards; pass `fields` to export the same columns from a dataset whose items differ.
+            offset: Number of items that should be skipped at the start. The default value is 0.
+            limit: Maximum number of items to export. By default there is no limit.
+            desc: By default, results are returned in the same order as they were stored. To reverse the order,
+                set this parameter to True.
+            clean: If True, returns only non-empty items and skips hidden fields (i.e. fields starting with
+                the # character). The clean parameter is just a shortcut for skip_hidden=True and skip_empty=True
+                parameters.
+            bom: All text responses are encoded in UTF-8 encoding. By default, csv files are prefixed with
+                the UTF-8 Byte Order Mark (BOM), while json, jsonl, xml, html and rss files are not. If you want
+                to override this default behavior, specify bom=True query parameter to include the BOM or bom=False
+                to skip it.
+            delimiter: A delimiter character for CSV files. The default delimiter is a simple comma (,).
+            fields: A list of fields which should be picked from the items, only these fields will remain
+                in the resulting record objects.
+            omit: A list of fields which should be omitted from the items.
+            unwind: A list of fields which should be unwound, in order which they should be processed.
+            skip_empty: If True, then empty items are skipped from the output.
+            skip_header_row: If True, then header row in the csv format is skipped.
+            skip_hidden: If True, then hidden fields are skipped from the output, i.e. fields starting with
+                the # character.
+            xml_root: Overrides default root element name of xml output. By default the root element is items.
+            xml_row: Overrides default element name that wraps each page or page function result object in xml output.
+                By default the element name is item.
+            signature: Signature used to access the items.
+            timeout: Timeout for the API HTTP request of each shard.
+
+        Returns:
+            Paths of the written files, one per shard, or just `path` when the shards were concatenated.
+
+        Raises:
+            ValueError: If the shards of `item_format` cannot be concatenated, the CSV shards have different columns,
+                or the dataset does not exist.
+        """
+        if shards < 1:
+            raise ValueError(f'shards must be at least 1, got {shards}')
+        if concatenate and item_format not in _CONCATENABLE_ITEM_FORMATS:
+            raise ValueError(f'Shards in the {item_format!r} format cannot be concatenated into a single file.')
+
+        dataset = await self.get()
+        if dataset is None:
+            raise ValueError(f'Dataset {self.resource_id!r} does not exist.')
+
+        start = offset or 0
+        end = dataset.item_count if not limit else min(dataset.item_count, start + limit)
+        ranges = _split_into_shards(start, end, shards)
+        target = Path(path)
+        parts = _export_part_paths(target, item_format=item_format, shards=len(ranges), concatenate=concatenate)
+
+        async def export_shard(index: int) -> None:
+            # A CSV shard appended to another one must not repeat the BOM. Each shard keeps its header row, which is
+            # checked against the first one and dropped when the shards are concatenated.
+            is_continuation = concatenate and index > 0 and item_format == 'csv'
+            shard_offset, shard_limit = ranges[index]
+            async with self.stream_items(
+                item_format=item_format,
+                offset=shard_offset,
+                limit=shard_limit,
+                desc=desc,
+                clean=clean,
+                bom=False if is_continuation else bom,
+                delimiter=delimiter,
+                fields=fields,
+                omit=omit,
+                unwind=unwind,
+                skip_empty=skip_empty,
+                skip_header_row=False if concatenate and item_format == 'csv' else skip_header_row,
+                skip_hidden=skip_hidden,
+                xml_root=xml_root,
+                xml_row=xml_row,
+                signature=signature,
+                timeout=timeout,
+            ) as response:
+                # File writes block, so they run in a worker thread to keep the event loop serving the other shards.
+                file = await asyncio.to_thread(lambda: parts[index].open('wb'))
+                try:
+                    async for chunk in response.aiter_bytes():
+                        await asyncio.to_thread(file.write, chunk)
+                finally:
+                    await asyncio.to_thread(file.close)
+
+        try:
+            async with asyncio.TaskGroup() as tg:
+                for index in range(len(ranges)):
+                    tg.create_task(export_shard(index), name=f'export_to_files_shard_{index}')
+        except BaseException as exc:
+            if concatenate:
+                for part in parts:
+                    part.unlink(missing_ok=True)
+            if isinstance(exc, ExceptionGroup):
+                # Re-raise the first shard exception directly, as the sync client does.
+                raise exc.exceptions[0] from None
+            raise
+
+        if not concatenate:
+            return parts
+
+        await asyncio.to_thread(
+            _concatenate_parts, parts, target, csv=item_format == 'csv', keep_header=not skip_header_row
+        )
+        return [target]
+
     async def push_items(self, items: JsonSerializable, *, timeout: Timeout = 'medium') -> None:
         """Push items to the dataset.
 
@@ -1072,6 +2546,185 @@ class DatasetClientAsync(ResourceClientAsync):
             timeout=timeout,
         )
 
+    async def push_items_batched(
+        self,
+        items: Iterable[JsonSerializable] | AsyncIterable[JsonSerializable],
+        *,
+        max_parallel: int = 5,
+        timeout: Timeout = 'medium',
+    ) -> None:
+        """Push items to the dataset in size-bounded batches, uploading several batches concurrently.
+
+        Unlike `push_items`, which sends all the items in a single request, this method consumes the items lazily and
+        packs them into batches that stay under the payload size limit of the API. Each item is serialized exactly once,
+        and only the batches being uploaded are held in memory, so the items can come from a generator.
+
+        https://docs.apify.com/api/v2#/reference/datasets/item-collection/put-items
+
+        Args:
+            items: The items to push into the dataset, each of them a JSON-serializable object.
+            max_parallel: Maximum number of batches uploaded at the same time.
+            timeout: Timeout for the API HTTP request of each batch.
+        """
+        if max_parallel < 1:
+            raise ValueError(f'max_parallel must be at least 1, got {max_parallel}')
+
+        # A bounded queue makes the producer wait for the workers, so the input is not consumed ahead of the uploads.
+        batch_queue = asyncio.Queue[list[bytes]](maxsize=max_parallel)
+
+        async def worker() -> None:
+            while True:
+                batch = await batch_queue.get()
+                try:
+                    await self._push_serialized_items(batch, timeout=timeout)
+                finally:
+                    batch_queue.task_done()
+
+        try:
+            async with asyncio.TaskGroup() as tg:
+                workers = [tg.create_task(worker(), name=f'push_items_batched_worker_{i}') for i in range(max_parallel)]
+
+                # Split the items into batches by payload size, counting the commas and brackets of the JSON array.
+                async for batch in aconstrained_batches(
+                    (serialize_json(item) async for item in iterate_any(items)),
+                    max_size=PAYLOAD_SIZE_LIMIT_BYTES - len(b'[]'),
+                    get_len=lambda serialized: len(serialized) + len(b','),
+                ):
+                    await batch_queue.put(batch)
+
+                # Wait for all batches to be uploaded, then cancel idle workers.
+                await batch_queue.join()
+                for task in workers:
+                    task.cancel()
+        except ExceptionGroup as eg:
+            # Re-raise the first worker exception directly, as the sync client does.
+            raise eg.exceptions[0] from None
+
+    async def copy_to(self, target: DatasetClientAsync, *, max_parallel: int = 1, timeout: Timeout = 'long') -> int:
+        """Copy the items of this dataset into another dataset, streaming them through the client.
+
+        The items are downloaded over a single resumable stream with `iterate_streamed_items`, and packed into batches
+        pushed to the target dataset with `push_items_batched` as they arrive, so only the batches being uploaded are
+        held in memory however large the dataset is. The target can belong to another client, for example one with
+        the token of another account. By default the batches are uploaded one at a time, which keeps the order of the
+        items. A higher `max_parallel` copies a large dataset faster, but the batches can then be stored in a different
+        order than they were read in.
+
+        https://docs.apify.com/api/v2#/reference/datasets/item-collection/put-items
+
+        Args:
+            target: The dataset to copy the items into.
+            max_parallel: Maximum number of batches uploaded at the same time. With more than 1, the order of the
+                items in the target dataset is not kept.
+            timeout: Timeout for the API HTTP request that opens the stream, and for the request of each batch.
+
+        Returns:
+            The number of items copied.
+        """
+        copied = 0
+
+        async def count_items() -> AsyncIterator[dict]:
+            nonlocal copied
+            async for item in self.iterate_streamed_items(timeout=timeout):
+                copied += 1
+                yield item
+
+        await target.push_items_batched(count_items(), max_parallel=max_parallel, timeout=timeout)
+        return copied
+
+    async def _push_serialized_items(self, serialized_items: Iterable[bytes], *, timeout: Timeout) -> None:
+        """Push a batch of already serialized items to the dataset."""
+        await self._http_client.call(
+            url=self._build_url('items'),
+            method='POST',
+            headers={'content-type': 'application/json; charset=utf-8'},
+            params=self._build_params(),
+            data=join_json_array(serialized_items),
+            timeout=timeout,
+        )
+
+    def get_mirror(
+        self,
+        path: str | os.PathLike[str],
+        *,
+        storage: MirrorStorage = 'jsonl',
+        page_size: int = DEFAULT_CHUNK_SIZE,
+        max_parallel: int = 4,
+        fields: list[str] | None = None,
+        omit: list[str] | None = None,
+        timeout: Timeout = 'long',
+    ) -> DatasetMirrorAsync:
+        """Get a dataset mirror that keeps an incrementally synced local copy of the dataset.
+
+        Each `sync` of the mirror downloads only the items added since the previous one and appends them to the
+        local copy, so an append-only dataset does not have to be downloaded whole again to pick up new items.
+
+        Args:
+            path: Path of the local copy. With the jsonl storage, the sync state is kept in a `.state.json` file
+                next to it.
+            storage: Format of the local copy, either `jsonl` for a JSON Lines file or `sqlite` for an SQLite
+                database.
+            page_size: Number of items downloaded in a single API call.
+            max_parallel: Maximum number of pages downloaded at the same time.
+            fields: A list of fields which should be picked from the items, only these fields will remain
+                in the local copy.
+            omit: A list of fields which should be omitted from the items.
+            timeout: Timeout for the API HTTP request of each page.
+
+        Returns:
+            The dataset mirror.
+        """
+        return DatasetMirrorAsync(
+            self,
+            path,
+            storage=storage,
+            page_size=page_size,
+            max_parallel=max_parallel,
+            fields=fields,
+            omit=omit,
+            timeout=timeout,
+        )
+
+    def get_writer(
+        self,
+        *,
+        max_batch_bytes: int = PAYLOAD_SIZE_LIMIT_BYTES,
+        max_batch_items: int = 1000,
+        flush_interval: timedelta = timedelta(seconds=5),
+        max_pending_batches: int = 2,
+        on_batch_error: Callable[[DatasetWriterBatchFailure], None] | None = None,
+        timeout: Timeout = 'medium',
+    ) -> DatasetWriterAsync:
+        """Get a dataset writer that buffers items and pushes them to the dataset in batches.
+
+        Instead of sending one request per item, the writer packs the added items into batches and pushes them from
+        the background, which keeps the number of requests low when items are produced one at a time. Use the writer
+        as a context manager, or call its `close` method, to push the remaining items when done.
+
+        Args:
+            max_batch_bytes: Maximum size of the body of a single push request, in bytes. Defaults to the largest
+                payload the API accepts.
+            max_batch_items: Maximum number of items in a single push request.
+            flush_interval: Longest time buffered items wait before they are pushed.
+            max_pending_batches: Maximum number of completed batches waiting to be pushed. Once reached, adding
+                items waits until a batch is pushed.
+            on_batch_error: Function called with each batch that fails to be pushed. Failed batches are also
+                logged and collected in the `failures` property of the writer.
+            timeout: Timeout for the API HTTP request of each batch.
+
+        Returns:
+            The dataset writer for pushing the items.
+        """
+        return DatasetWriterAsync(
+            self,
+            max_batch_bytes=max_batch_bytes,
+            max_batch_items=max_batch_items,
+            flush_interval=flush_interval,
+            max_pending_batches=max_pending_batches,
+            on_batch_error=on_batch_error,
+            timeout=timeout,
+        )
+
     async def get_statistics(self, *, timeout: Timeout = 'short') -> DatasetStatistics:
         """Get the dataset statistics.
 
@@ -1142,7 +2795,7 @@ class DatasetClientAsync(ResourceClientAsync):
         Returns:
             The public dataset items URL.
         """
-        dataset = await self.get(timeout=timeout)
+        signing_key = await self._get_signing_key(timeout=timeout)
 
         request_params = self._build_params(
             offset=offset,
@@ -1158,12 +2811,31 @@ class DatasetClientAsync(ResourceClientAsync):
             view=view,
         )
 
-        if dataset and dataset.url_signing_secret_key:
+        if signing_key and signing_key.secret_key:
             signature = create_storage_content_signature(
-                dataset.id,
-                dataset.url_signing_secret_key,
+                signing_key.storage_id,
+                signing_key.secret_key,
                 expires_in=expires_in,
             )
             request_params['signature'] = signature
 
         return self._build_public_url('items', request_params)
+
+    def invalidate_signing_key(self) -> None:
+        """Drop the cached URL signing key of the dataset, so that the next signed URL fetches it again.
+
+        The key is cached for a while after it is first fetched, so signing many URLs takes a single request. Call
+        this after the key is rotated, to stop signing URLs with the old one.
+        """
+        self._client_registry.signing_keys.invalidate(self._resource_url)
+
+    async def _get_signing_key(self, *, timeout: Timeout) -> StorageSigningKey | None:
+        """Return the URL signing key of the dataset, fetching the dataset only if the key is not cached."""
+        signing_key = self._client_registry.signing_keys.get(self._resource_url)
+        if signing_key is None:
+            dataset = await self.get(timeout=timeout)
+            if dataset is None:
+                return None
+            signing_key = StorageSigningKey(storage_id=dataset.id, secret_key=dataset.url_signing_secret_key)
+            self._client_registry.signing_keys.set(self._resource_url, signing_key)
+        return signing_key
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from typing import TYPE_CHECKING, Any
 
 from apify_client._docs import docs_group
@@ -11,6 +12,7 @@ from apify_client._models import (
 )
 from apify_client._pagination import get_items_iterator, get_items_iterator_async
 from apify_client._resource_clients._resource_client import ResourceClient, ResourceClientAsync
+from apify_client._sharded_dataset import ShardedDataset, ShardedDatasetAsync, shard_dataset_name
 
 if TYPE_CHECKING:
     from collections.abc import AsyncIterator, Iterator
@@ -134,6 +136,51 @@ class DatasetCollectionClient(ResourceClient):
         result = self._get_or_create(timeout=timeout, name=name, resource_fields={'schema': schema})
         return DatasetResponse.model_validate(result).data
 
+    def get_or_create_sharded(
+        self,
+        name: str,
+        *,
+        shards: int = 4,
+        schema: dict | None = None,
+        timeout: Timeout = 'short',
+    ) -> ShardedDataset:
+        """Retrieve a sharded dataset, or create the datasets of its shards when they don't exist.
+
+        A sharded dataset spreads its items over several named datasets, `<name>-shard-0` to `<name>-shard-<N-1>`,
+        so it can take more writes per second than the rate limit of a single dataset allows. Open it with the same
+        `name` and number of `shards` to read back the items written earlier.
+
+        https://docs.apify.com/api/v2#/reference/datasets/dataset-collection/create-dataset
+
+        Args:
+            name: The name of the sharded dataset, from which the names of the shard datasets are derived.
+            shards: The number of shard datasets.
+            schema: The schema of the shard datasets.
+            timeout: Timeout for the API HTTP request of each shard.
+
+        Returns:
+            The sharded dataset, with a writer spreading items over the shards and a reader merging them back.
+        """
+        if shards < 1:
+            raise ValueError(f'shards must be at least 1, got {shards}')
+
+        datasets = [
+            self.get_or_create(name=shard_dataset_name(name, index), schema=schema, timeout=timeout)
+            for index in range(shards)
+        ]
+        return ShardedDataset(
+            [
+                self._client_registry.dataset_client(
+                    resource_id=dataset.id,
+                    base_url=self._base_url,
+                    public_base_url=self._public_base_url,
+                    http_client=self._http_client,
+                    client_registry=self._client_registry,
+                )
+                for dataset in datasets
+            ]
+        )
+
 
 @docs_group('Resource clients')
 class DatasetCollectionClientAsync(ResourceClientAsync):
@@ -248,3 +295,50 @@ class DatasetCollectionClientAsync(ResourceClientAsync):
         """
         result = await self._get_or_create(timeout=timeout, name=name, resource_fields={'schema': schema})
         return DatasetResponse.model_validate(result).data
+
+    async def get_or_create_sharded(
+        self,
+        name: str,
+        *,
+        shards: int = 4,
+        schema: dict | None = None,
+        timeout: Timeout = 'short',
+    ) -> ShardedDatasetAsync:
+        """Retrieve a sharded dataset, or create the datasets of its shards when they don't exist.
+
+        A sharded dataset spreads its items over several named datasets, `<name>-shard-0` to `<name>-shard-<N-1>`,
+        so it can take more writes per second than the rate limit of a single dataset allows. Open it with the same
+        `name` and number of `shards` to read back the items written earlier.
+
+        https://docs.apify.com/api/v2#/reference/datasets/dataset-collection/create-dataset
+
+        Args:
+            name: The name of the sharded dataset, from which the names of the shard datasets are derived.
+            shards: The number of shard datasets.
+            schema: The schema of the shard datasets.
+            timeout: Timeout for the API HTTP request of each shard.
+
+        Returns:
+            The sharded dataset, with a writer spreading items over the shards and a reader merging them back.
+        """
+        if shards < 1:
+            raise ValueError(f'shards must be at least 1, got {shards}')
+
+        datasets = await asyncio.gather(
+            *(
+                self.get_or_create(name=shard_dataset_name(name, index), schema=schema, timeout=timeout)
+                for index in range(shards)
+            )
+        )
+        return ShardedDatasetAsync(
+            [
+                self._client_registry.dataset_client(
+                    resource_id=dataset.id,
+                    base_url=self._base_url,
+                    public_base_url=self._public_base_url,
+                    http_client=self._http_client,
+                    client_registry=self._client_registry,
+                )
+                for dataset in datasets
+            ]
+        )
@@ -1,10 +1,37 @@
 from __future__ import annotations
 
+import asyncio
+import mimetypes
+import os
 import re
-from contextlib import asynccontextmanager, contextmanager
+from collections.abc import Mapping
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import asynccontextmanager, contextmanager, suppress
+from dataclasses import dataclass
 from http import HTTPStatus
-from typing import TYPE_CHECKING, Any
-
+from mmap import ACCESS_READ, mmap
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, Any, cast
+
+from apify_client._blob_store import BlobStore, BlobStoreAsync
+from apify_client._consts import (
+    DEFAULT_MAX_RETRIES,
+    DEFAULT_SPOOL_MAX_MEMORY_BYTES,
+    MIN_COMPRESSION_SIZE,
+    MIN_DOWNLOAD_PART_SIZE,
+)
+from apify_client._directory_sync import (
+    DEFAULT_SYNC_MANIFEST_KEY,
+    DirectorySyncResult,
+    DirectorySyncTracker,
+    build_manifest,
+    describe_file,
+    file_differs,
+    list_local_files,
+    parse_manifest,
+    path_to_key,
+    resolve_local_path,
+)
 from apify_client._docs import docs_group
 from apify_client._models import (
     KeyValueStore,
@@ -15,19 +42,121 @@ from apify_client._models import (
 )
 from apify_client._pagination import DEFAULT_CHUNK_SIZE, get_cursor_iterator, get_cursor_iterator_async
 from apify_client._resource_clients._resource_client import ResourceClient, ResourceClientAsync
+from apify_client._utils.batching import iterate_any
+from apify_client._utils.concurrency import ContextThreadPoolExecutor
+from apify_client._utils.content_decoding import (
+    DecodedRecordResponse,
+    apeek_head,
+    decode_record_body,
+    looks_compressed,
+    parse_record_content,
+    peek_head,
+)
 from apify_client._utils.crypto import create_hmac_signature, create_storage_content_signature
 from apify_client._utils.encoding import encode_key_value_store_record_value
 from apify_client._utils.errors import catch_not_found_or_throw
-from apify_client._utils.http import response_to_dict
-from apify_client.errors import ApifyApiError, InvalidResponseBodyError
+from apify_client._utils.http import is_compressible_content_type, response_to_dict
+from apify_client._utils.request_body import AsyncRequestBody, CompressedRequestBody
+from apify_client._utils.signing import StorageSigningKey
+from apify_client._utils.spool import spool_response, spool_response_async
+from apify_client.errors import ApifyApiError, IncompleteDownloadError, InvalidResponseBodyError
+from apify_client.http_compressors._resolve import resolve_compressor
+from apify_client.key_index import KeyIndex
 
 if TYPE_CHECKING:
-    from collections.abc import AsyncIterator, Iterator
+    from collections.abc import AsyncIterable, AsyncIterator, Callable, Iterable, Iterator
     from datetime import timedelta
 
+    from apify_client._directory_sync import DirectorySyncProgress, SyncedFile
     from apify_client._literals import GeneralAccess
     from apify_client.http_clients import HttpResponse
-    from apify_client.types import Timeout
+    from apify_client.http_compressors._base import HttpCompressor
+    from apify_client.record_cache import CachedRecord, RecordCache
+    from apify_client.types import DirectorySyncDirection, HttpCompressionAlgorithm, Timeout
+
+
+def _get_resumable_size(response: HttpResponse) -> int | None:
+    """Return the size of a record response body, or None if a broken download of it cannot be resumed.
+
+    Resuming needs the size of the body, and byte offsets into it that match the bytes written. A body with a
+    `Content-Encoding` other than `identity` is decoded while it is read, so its offsets do not match.
+    """
+    encoding = response.headers.get('content-encoding', 'identity').strip().lower()
+    length = response.headers.get('content-length', '')
+    if encoding != 'identity' or not length.isdigit():
+        return None
+    return int(length)
+
+
+def _split_into_ranges(size: int, parts: int) -> list[tuple[int, int]]:
+    """Split `size` bytes into at most `parts` consecutive byte ranges of at least `MIN_DOWNLOAD_PART_SIZE` bytes."""
+    if size == 0:
+        # An empty record is a single empty range, there is nothing to split.
+        return [(0, 0)]
+    parts = max(1, min(parts, size // MIN_DOWNLOAD_PART_SIZE))
+    part_size = -(-size // parts)
+    return [(start, min(start + part_size, size)) for start in range(0, size, part_size)]
+
+
+def _format_range(start: int, end: int | None) -> str:
+    """Format an HTTP `Range` header value for the bytes from `start` up to `end` (exclusive), or to the end."""
+    return f'bytes={start}-{end - 1 if end is not None else ""}'
+
+
+def _range_headers(start: int, end: int | None, etag: str | None) -> dict[str, str]:
+    """Build the headers of a `Range` request, made conditional on the record still having the ETag `etag`.
+
+    With `If-Range`, a server returns the whole changed record instead of a range of it, which the range check then
+    rejects. Only a strong ETag can be used with `If-Range`, a weak one is checked on the response alone.
+    """
+    headers = {'Range': _format_range(start, end)}
+    if etag is not None and not etag.startswith('W/'):
+        headers['If-Range'] = etag
+    return headers
+
+
+def _check_range_response(response: HttpResponse, start: int, size: int | None, etag: str | None) -> None:
+    """Raise if a response to a `Range` request cannot be used for the record of `size` bytes with the ETag `etag`.
+
+    The response has to start at the requested byte, and belong to the same version of the record as the first
+    response of the download, so that the bytes of different versions are not mixed in one file.
+    """
+    content_range = response.headers.get('content-range', '')
+    if etag is not None and response.headers.get('etag') != etag:
+        response.close()
+        raise IncompleteDownloadError('The record changed while it was being downloaded.')
+    if response.status_code != HTTPStatus.PARTIAL_CONTENT or not content_range.startswith(f'bytes {start}-'):
+        response.close()
+        raise IncompleteDownloadError('The API did not return the requested byte range of the record.')
+    if size is not None and content_range.rpartition('/')[2] != str(size):
+        response.close()
+        raise IncompleteDownloadError('The record changed while it was being downloaded.')
+
+
+def _create_file(path: Path, size: int | None) -> None:
+    """Create or empty the file at `path`, extending it to `size` bytes if the size is known."""
+    with path.open('wb') as file:
+        if size is not None:
+            file.truncate(size)
+
+
+def _check_downloaded_size(written: int, size: int | None) -> None:
+    """Raise if the bytes written to the file do not add up to the size of the record, if that is known.
+
+    The file is extended to the size of the record before the download, so its size on disk tells nothing about
+    the bytes actually written into it.
+    """
+    if size is not None and written != size:
+        raise IncompleteDownloadError(f'The download wrote {written} bytes, but the record has {size} bytes.')
+
+
+def _map_file(path: str | os.PathLike[str]) -> mmap | None:
+    """Memory-map a file for reading, or return None for an empty file, which cannot be memory-mapped."""
+    with open(path, 'rb') as file:
+        if not os.fstat(file.fileno()).st_size:
+            return None
+        # The mapping stays valid after the file is closed.
+        return mmap(file.fileno(), 0, access=ACCESS_READ)
 
 
 def _parse_get_record_response(response: HttpResponse) -> Any:
@@ -64,6 +193,93 @@ def _parse_get_record_response(response: HttpResponse) -> Any:
         return response_data
 
 
+def _cached_record_to_dict(record: CachedRecord, *, parse: bool) -> dict | None:
+    """Convert a record served from the record cache to the dictionary `get_record` returns.
+
+    Returns None if `parse` is set and the cached body cannot be parsed by its content type. A body read with
+    `get_record_as_bytes` is cached without being parsed, so it is not known to be valid. Such a record is then
+    downloaded again, so that the `InvalidResponseBodyError` raised for it carries the response it came from.
+    """
+    if not parse:
+        return {'key': record.key, 'value': record.content, 'content_type': record.content_type}
+    try:
+        value = parse_record_content(record.content, record.content_type)
+    except ValueError:
+        return None
+    return {'key': record.key, 'value': value, 'content_type': record.content_type}
+
+
+def _decode_record_body(response: HttpResponse, compressor: HttpCompressor | None) -> bytes | None:
+    """Return the body of a record response decompressed if the client compresses records, or None if it does not.
+
+    The body is decompressed only if it is still compressed with the `Content-Encoding` it is served with, as the
+    default HTTP client decodes it while reading it already.
+    """
+    return decode_record_body(response.content, response.headers) if compressor is not None else None
+
+
+def _read_record_value(response: HttpResponse, content: bytes | None, *, parse: bool) -> Any:
+    """Read the value of a record response, from its decoded body `content` if it was decoded.
+
+    The value is parsed by its content type if `parse` is set, the way `_parse_get_record_response` parses it.
+    """
+    if content is None:
+        return _parse_get_record_response(response) if parse else response.content
+    if not parse:
+        return content
+    if response.status_code == HTTPStatus.NO_CONTENT:
+        return None
+
+    try:
+        return parse_record_content(content, response.headers.get('content-type', ''))
+    except ValueError as err:
+        raise InvalidResponseBodyError(response) from err
+
+
+def _should_compress_record(
+    size: int, content_type: str, compressor: HttpCompressor | None, min_size: int, head: bytes
+) -> bool:
+    """Whether a record value of the given size and content type, starting with `head`, is stored compressed.
+
+    A value that already starts with the header of the compressor's encoding, such as a gzip file with gzip, is stored
+    as it is, so that reading it back does not decompress the value itself.
+    """
+    return (
+        compressor is not None
+        and size >= min_size
+        and is_compressible_content_type(content_type)
+        and not looks_compressed(compressor.content_encoding, head)
+    )
+
+
+def _compress_record_value(
+    value: bytes | bytearray | str, content_type: str, compressor: HttpCompressor | None, min_size: int
+) -> tuple[bytes | bytearray | str, str | None]:
+    """Compress an encoded record value for storage, if the client compresses records and the value is worth it.
+
+    Returns:
+        The value to upload, and the `Content-Encoding` to upload it with, or None if it is uploaded as it is.
+    """
+    data = value.encode('utf-8') if isinstance(value, str) else value
+    if compressor is None or not _should_compress_record(
+        len(data), content_type, compressor, min_size, bytes(data[:2])
+    ):
+        return value, None
+    return compressor.compress(bytes(data)), compressor.content_encoding
+
+
+@docs_group('Other')
+@dataclass
+class SetRecordResult:
+    """The result of setting one record with `KeyValueStoreClient.set_records`."""
+
+    key: str
+    """Key of the record."""
+
+    error: Exception | None = None
+    """The exception that made the upload fail, or None if the record was set."""
+
+
 @docs_group('Resource clients')
 class KeyValueStoreClient(ResourceClient):
     """Sub-client for managing a specific key-value store.
@@ -72,18 +288,32 @@ class KeyValueStoreClient(ResourceClient):
     instance via an appropriate method on the `ApifyClient` class.
     """
 
-    def __init__(
+    def __init__(  # noqa: D417
         self,
         *,
         resource_id: str | None = None,
         resource_path: str = 'key-value-stores',
+        record_cache: RecordCache | None = None,
+        record_compression: HttpCompressionAlgorithm | HttpCompressor | None = None,
+        record_compression_min_size: int = MIN_COMPRESSION_SIZE,
         **kwargs: Any,
     ) -> None:
+        """Initialize a new instance.
+
+        Args:
+            record_cache: Disk cache the records read with `get_record` and `get_record_as_bytes` are kept in.
+            record_compression: Compression the records set with `set_record` and `set_record_from_path` are
+                stored with, or None to store them the way they are uploaded.
+            record_compression_min_size: Smallest record value, in bytes, that is stored compressed.
+        """
         super().__init__(
             resource_id=resource_id,
             resource_path=resource_path,
             **kwargs,
         )
+        self._record_cache = record_cache
+        self._record_compressor = resolve_compressor(record_compression) if record_compression is not None else None
+        self._record_compression_min_size = record_compression_min_size
 
     def get(self, *, timeout: Timeout = 'short') -> KeyValueStore | None:
         """Retrieve the key-value store.
@@ -224,6 +454,56 @@ class KeyValueStoreClient(ResourceClient):
             chunk_size=chunk_size or DEFAULT_CHUNK_SIZE,
         )
 
+    def build_key_index(self, *, prefix: str | None = None, timeout: Timeout = 'medium') -> KeyIndex:
+        """Build a compact, sorted index of the keys in the key-value store.
+
+        The keys are listed page by page with `list_keys` and packed into a `KeyIndex`, which keeps the key names in a
+        single buffer and the sizes of the records in a packed array. Only one page of `KeyValueStoreKey` models is
+        held in memory at a time, so even a store with millions of keys can be indexed and kept around for membership
+        checks, prefix queries, or diffs. Save the index with `KeyIndex.save` and bring it up to date later with
+        `refresh_key_index`.
+
+        https://docs.apify.com/api/v2#/reference/key-value-stores/key-collection/get-list-of-keys
+
+        Args:
+            prefix: The prefix of the keys to index. All keys are indexed by default.
+            timeout: Timeout for each API HTTP request.
+
+        Returns:
+            The index of the keys.
+        """
+        index = KeyIndex(prefix=prefix)
+        self.refresh_key_index(index, timeout=timeout)
+        return index
+
+    def refresh_key_index(self, index: KeyIndex, *, timeout: Timeout = 'medium') -> int:
+        """Add the keys created since a key index was built or last refreshed.
+
+        The listing continues after the last indexed key, the way `exclusive_start_key` continues `list_keys`, so only
+        the keys that sort after it are fetched. Keys created with a name that sorts before it, deleted keys, and
+        changed record sizes are not picked up. Build a new index with `build_key_index` to see those.
+
+        https://docs.apify.com/api/v2#/reference/key-value-stores/key-collection/get-list-of-keys
+
+        Args:
+            index: The index to update in place. It keeps covering the prefix it was built with.
+            timeout: Timeout for each API HTTP request.
+
+        Returns:
+            The number of keys added to the index.
+        """
+        added = 0
+        cursor = index.last_key
+        while True:
+            page = self.list_keys(
+                limit=DEFAULT_CHUNK_SIZE, exclusive_start_key=cursor, prefix=index.prefix, timeout=timeout
+            )
+            index.extend((item.key, item.size) for item in page.items)
+            added += len(page.items)
+            if not page.items or not page.is_truncated or page.next_exclusive_start_key is None:
+                return added
+            cursor = page.next_exclusive_start_key
+
     def get_record(self, key: str, *, signature: str | None = None, timeout: Timeout = 'long') -> dict | None:
         """Retrieve the given record from the key-value store.
 
@@ -237,6 +517,9 @@ class KeyValueStoreClient(ResourceClient):
         Returns:
             The requested record, or None, if the record does not exist.
         """
+        if self._record_cache is not None:
+            return self._get_record_through_cache(key, signature=signature, parse=True, timeout=timeout)
+
         try:
             response = self._http_client.call(
                 url=self._build_url(f'records/{key}'),
@@ -247,7 +530,9 @@ class KeyValueStoreClient(ResourceClient):
 
             return {
                 'key': key,
-                'value': _parse_get_record_response(response),
+                'value': _read_record_value(
+                    response, _decode_record_body(response, self._record_compressor), parse=True
+                ),
                 'content_type': response.headers['content-type'],
             }
 
@@ -256,6 +541,46 @@ class KeyValueStoreClient(ResourceClient):
 
         return None
 
+    def get_records(
+        self, keys: Iterable[str], *, max_parallel: int = 10, timeout: Timeout = 'long'
+    ) -> Iterator[tuple[str, dict | None]]:
+        """Retrieve many records from the key-value store concurrently.
+
+        The records are requested in parallel with at most `max_parallel` requests in flight, and each record is
+        yielded as soon as its request completes, so the order follows the completion of the requests rather than
+        the order of the keys. The keys are consumed only as fast as the records are fetched. Each record is parsed
+        the same way as by `get_record`. Collect the results with `dict(...)` to look the records up by key.
+
+        https://docs.apify.com/api/v2#/reference/key-value-stores/record/get-record
+
+        Args:
+            keys: Keys of the records to retrieve.
+            max_parallel: Maximum number of records requested at the same time.
+            timeout: Timeout for the API HTTP request of each record.
+
+        Returns:
+            An iterator of pairs of a key and its record, where the record is None if it does not exist.
+        """
+        if max_parallel < 1:
+            raise ValueError(f'max_parallel must be at least 1, got {max_parallel}')
+
+        def iterate_records() -> Iterator[tuple[str, dict | None]]:
+            with ContextThreadPoolExecutor(max_workers=max_parallel) as executor:
+                in_flight = dict[Future[dict | None], str]()
+                for key in keys:
+                    if len(in_flight) >= max_parallel:
+                        done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            yield in_flight.pop(future), future.result()
+                    in_flight[executor.submit(self.get_record, key, timeout=timeout)] = key
+
+                while in_flight:
+                    done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield in_flight.pop(future), future.result()
+
+        return iterate_records()
+
     def record_exists(self, key: str, *, timeout: Timeout = 'long') -> bool:
         """Check if given record is present in the key-value store.
 
@@ -296,6 +621,9 @@ class KeyValueStoreClient(ResourceClient):
         Returns:
             The requested record, or None, if the record does not exist.
         """
+        if self._record_cache is not None:
+            return self._get_record_through_cache(key, signature=signature, parse=False, timeout=timeout)
+
         try:
             response = self._http_client.call(
                 url=self._build_url(f'records/{key}'),
@@ -306,7 +634,9 @@ class KeyValueStoreClient(ResourceClient):
 
             return {
                 'key': key,
-                'value': response.content,
+                'value': _read_record_value(
+                    response, _decode_record_body(response, self._record_compressor), parse=False
+                ),
                 'content_type': response.headers['content-type'],
             }
 
@@ -315,6 +645,55 @@ class KeyValueStoreClient(ResourceClient):
 
         return None
 
+    def get_record_as_file(
+        self,
+        key: str,
+        file: IO[bytes] | None = None,
+        *,
+        signature: str | None = None,
+        max_memory_bytes: int = DEFAULT_SPOOL_MAX_MEMORY_BYTES,
+        timeout: Timeout = 'long',
+    ) -> dict | None:
+        """Retrieve the given record from the key-value store as a file, without holding it in memory whole.
+
+        The record is streamed into `file` as it arrives. Without a `file`, it is spooled into a temporary file,
+        which stays in memory up to `max_memory_bytes` and moves to disk past that.
+
+        https://docs.apify.com/api/v2#/reference/key-value-stores/record/get-record
+
+        Args:
+            key: Key of the record to retrieve.
+            file: A binary file or buffer to write the record into. By default a spooled temporary file is created.
+            signature: Signature used to access the items.
+            max_memory_bytes: Size up to which the spooled temporary file is kept in memory.
+            timeout: Timeout for the API HTTP request.
+
+        Returns:
+            The requested record with the file as its value, or None, if the record does not exist. A spooled
+                temporary file is rewound to its start and should be closed after use, a given `file` is returned
+                as it is after the last write.
+        """
+        try:
+            response = self._http_client.call(
+                url=self._build_url(f'records/{key}'),
+                method='GET',
+                params=self._build_params(signature=signature, attachment=True),
+                stream=True,
+                timeout=timeout,
+            )
+        except ApifyApiError as exc:
+            catch_not_found_or_throw(exc)
+            return None
+
+        try:
+            return {
+                'key': key,
+                'value': spool_response(response, file, max_memory_bytes=max_memory_bytes),
+                'content_type': response.headers['content-type'],
+            }
+        finally:
+            response.close()
+
     @contextmanager
     def stream_record(
         self, key: str, *, signature: str | None = None, timeout: Timeout = 'long'
@@ -343,7 +722,7 @@ class KeyValueStoreClient(ResourceClient):
 
             yield {
                 'key': key,
-                'value': response,
+                'value': DecodedRecordResponse(response) if self._record_compressor is not None else response,
                 'content_type': response.headers['content-type'],
             }
 
@@ -354,6 +733,161 @@ class KeyValueStoreClient(ResourceClient):
             if response:
                 response.close()
 
+    def download_record(
+        self,
+        key: str,
+        path: str | os.PathLike[str],
+        *,
+        signature: str | None = None,
+        parts: int = 1,
+        max_resumes: int = DEFAULT_MAX_RETRIES,
+        timeout: Timeout = 'long',
+    ) -> dict | None:
+        """Download a record into a file, resuming the download where it broke off if the connection fails.
+
+        The record is written to the file chunk by chunk as it arrives. If the connection breaks in the middle of the
+        body, the download continues from the bytes already written with an HTTP `Range` request instead of starting
+        over. Each `Range` request is checked against the ETag and size of the first response, so that a record
+        changed in the meantime is not pieced together from two versions, and the bytes written are checked against
+        the size of the record. A record served with a `Content-Encoding` is decoded while it is read, so byte offsets
+        into it are not known, and it is downloaded in a single pass without resuming.
+
+        https://docs.apify.com/api/v2#/reference/key-value-stores/record/get-record
+
+        Args:
+            key: Key of the record to download.
+            path: Path of the file to write the record to. An existing file is overwritten.
+            signature: Signature used to access the record.
+            parts: Number of byte ranges to download in parallel. A record is split only if each range would be at
+                least 8 MB, a smaller one is downloaded in a single request.
+            max_resumes: Maximum number of times a broken download, or each of its ranges, is resumed.
+            timeout: Timeout for each API HTTP request.
+
+        Returns:
+            The record with the path of the downloaded file as its value, or None if the record does not exist, in
+            which case no file is created.
+
+        Raises:
+            IncompleteDownloadError: If the download cannot be resumed, the record changes while it is being
+                downloaded, or the bytes written do not add up to the record size.
+        """
+        if parts < 1:
+            raise ValueError(f'parts must be at least 1, got {parts}')
+
+        url = self._build_url(f'records/{key}')
+        params = self._build_params(signature=signature, attachment=True)
+        try:
+            response = self._http_client.call(url=url, method='GET', params=params, stream=True, timeout=timeout)
+        except ApifyApiError as exc:
+            catch_not_found_or_throw(exc)
+            return None
+
+        content_type = response.headers.get('content-type', 'application/octet-stream')
+        etag = response.headers.get('etag')
+        size = _get_resumable_size(response)
+        path = Path(path)
+        _create_file(path, size)
+
+        ranges = _split_into_ranges(size, parts) if size is not None else []
+        if len(ranges) > 1:
+            # The first response only told the size, each range is requested on its own.
+            response.close()
+            with ContextThreadPoolExecutor(max_workers=len(ranges)) as executor:
+                futures = [
+                    executor.submit(
+                        self._download_range,
+                        url,
+                        params,
+                        path,
+                        start,
+                        end,
+                        size=size,
+                        etag=etag,
+                        response=None,
+                        max_resumes=max_resumes,
+                        timeout=timeout,
+                    )
+                    for start, end in ranges
+                ]
+                written = sum(future.result() for future in futures)
+        else:
+            written = self._download_range(
+                url,
+                params,
+                path,
+                0,
+                size,
+                size=size,
+                etag=etag,
+                response=response,
+                max_resumes=max_resumes if size is not None else 0,
+                timeout=timeout,
+            )
+
+        _check_downloaded_size(written, size)
+        return {
+            'key': key,
+            'value': path,
+            'content_type': content_type,
+        }
+
+    def _download_range(
+        self,
+        url: str,
+        params: dict,
+        path: Path,
+        start: int,
+        end: int | None,
+        *,
+        size: int | None,
+        etag: str | None,
+        response: HttpResponse | None,
+        max_resumes: int,
+        timeout: Timeout,
+    ) -> int:
+        """Download the bytes from `start` up to `end` of a record into the same offsets of the file.
+
+        `end` is None when the size of the record is not known, and the range then runs to the end of the body. Every
+        request for the range is checked against the `size` and `etag` of the first response of the download. The
+        `response` is an already started response for the range, if there is one. A range that breaks off is
+        resumed from the last byte written, at most `max_resumes` times. Returns the number of bytes written.
+        """
+        position = start
+        resumes = 0
+        with path.open('r+b') as file:
+            while True:
+                if response is None:
+                    response = self._http_client.call(
+                        url=url,
+                        method='GET',
+                        params=params,
+                        headers=_range_headers(position, end, etag),
+                        stream=True,
+                        timeout=timeout,
+                    )
+                    _check_range_response(response, position, size, etag)
+
+                file.seek(position)
+                try:
+                    for chunk in response.iter_bytes():
+                        file.write(chunk)
+                        position += len(chunk)
+                except Exception as exc:
+                    if resumes >= max_resumes or not self._http_client.is_retryable_transport_error(exc):
+                        raise
+                else:
+                    if end is None or position >= end:
+                        return position - start
+                    if resumes >= max_resumes:
+                        raise IncompleteDownloadError(
+                            f'The download ended after {position} of {end} bytes of the record.'
+                        )
+                finally:
+                    response.close()
+                    response = None
+
+                resumes += 1
+
     def set_record(
         self,
         key: str,
@@ -384,6 +918,10 @@ class KeyValueStoreClient(ResourceClient):
             content_type=content_type,
             content_encoding=content_encoding,
         )
+        if content_encoding is None and self._record_compressor is not None:
+            value, content_encoding = _compress_record_value(
+                value, content_type, self._record_compressor, self._record_compression_min_size
+            )
 
         headers = {'content-type': content_type}
         if content_encoding is not None:
@@ -397,6 +935,272 @@ class KeyValueStoreClient(ResourceClient):
             headers=headers,
             timeout=timeout,
         )
+        self._invalidate_cached_record(key)
+
+    def set_record_from_path(
+        self,
+        key: str,
+        path: str | os.PathLike[str],
+        *,
+        content_type: str | None = None,
+        content_encoding: str | None = None,
+        timeout: Timeout = 'long',
+    ) -> None:
+        """Set a record to the contents of a file, without reading the file into memory first.
+
+        The file is memory-mapped and the request body is read straight from the mapping. Unless the content type
+        says it is already compressed, it is compressed chunk by chunk as it is sent, so a large file never has to be
+        held in memory as a whole, next to a compressed copy of it. The default Impit-based HTTP client takes a
+        request body only as a whole bytes object, though, so it copies the body that goes over the wire into memory
+        before sending it: the compressed file, or the whole file if it is not compressed, for example because its
+        content type is already compressed or `content_encoding` is given. With that client, uploading a 2 GB file
+        that is not compressed needs 2 GB of memory. A custom HTTP client that streams request bodies avoids the copy.
+
+        https://docs.apify.com/api/v2#/reference/key-value-stores/record/put-record
+
+        Args:
+            key: The key of the record to save the file to.
+            path: Path to the file to upload.
+            content_type: The content type of the saved value. Guessed from the file name if not given, falling back
+                to `application/octet-stream`.
+            content_encoding: The encoding the file is already compressed with, sent as the `Content-Encoding`
+                header. The file is then uploaded as it is, like a pre-compressed value passed to `set_record`.
+            timeout: Timeout for the API HTTP request.
+        """
+        if content_type is None:
+            content_type = mimetypes.guess_type(path)[0] or 'application/octet-stream'
+
+        headers = {'content-type': content_type}
+        if content_encoding is not None:
+            headers['content-encoding'] = content_encoding
+
+        mapped = _map_file(path)
+        body: mmap | CompressedRequestBody | bytes = mapped if mapped is not None else b''
+        if (
+            content_encoding is None
+            and mapped is not None
+            and _should_compress_record(
+                len(mapped), content_type, self._record_compressor, self._record_compression_min_size, mapped[:2]
+            )
+        ):
+            # The file is compressed chunk by chunk while it is sent, so it is never held in memory as a whole.
+            compressor = cast('HttpCompressor', self._record_compressor)
+            body = CompressedRequestBody(memoryview(mapped), compressor)
+            headers['content-encoding'] = compressor.content_encoding
+        try:
+            self._http_client.call(
+                url=self._build_url(f'records/{key}'),
+                method='PUT',
+                params=self._build_params(),
+                data=body,
+                headers=headers,
+                timeout=timeout,
+            )
+        finally:
+            # A view of the mapping still referenced from the traceback of a failed upload keeps it from being
+            # closed now. The garbage collector closes it once the view is gone.
+            if mapped is not None:
+                with suppress(BufferError):
+                    mapped.close()
+
+        self._invalidate_cached_record(key)
+
+    def set_records(
+        self,
+        records: Mapping[str, Any] | Iterable[tuple[str, Any]],
+        *,
+        content_type: str | None = None,
+        max_parallel: int = 10,
+        timeout: Timeout = 'long',
+    ) -> list[SetRecordResult]:
+        """Set many records in the key-value store, uploading them concurrently.
+
+        Each value is encoded and uploaded the same way as by `set_record`, with at most `max_parallel` uploads in
+        flight. The records are consumed only as fast as they are uploaded, so a generator of pairs keeps the memory
+        bounded however many records there are. Transient errors are retried by the HTTP client like for any other
+        request. A record that still fails does not stop the others, and its error is reported in the results.
+
+        https://docs.apify.com/api/v2#/reference/key-value-stores/record/put-record
+
+        Args:
+            records: A mapping of keys to values, or an iterable of `(key, value)` pairs.
+            content_type: The content type of the saved values. Inferred from each value if not given.
+            max_parallel: Maximum number of records uploaded at the same time.
+            timeout: Timeout for the API HTTP request of each record.
+
+        Returns:
+            The result of each record, in the order the uploads completed.
+        """
+        if max_parallel < 1:
+            raise ValueError(f'max_parallel must be at least 1, got {max_parallel}')
+
+        pairs = cast('Iterable[tuple[str, Any]]', records.items() if isinstance(records, Mapping) else records)
+
+        def upload(key: str, value: Any) -> SetRecordResult:
+            try:
+                self.set_record(key, value, content_type=content_type, timeout=timeout)
+            except Exception as exc:
+                return SetRecordResult(key=key, error=exc)
+            return SetRecordResult(key=key)
+
+        results = list[SetRecordResult]()
+        with ContextThreadPoolExecutor(max_workers=max_parallel) as executor:
+            in_flight = set[Future[SetRecordResult]]()
+            for key, value in pairs:
+                if len(in_flight) >= max_parallel:
+                    done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                    results.extend(future.result() for future in done)
+                in_flight.add(executor.submit(upload, key, value))
+
+            while in_flight:
+                done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                results.extend(future.result() for future in done)
+
+        return results
+
+    def copy_to(
+        self,
+        target: KeyValueStoreClient,
+        keys: Iterable[str] | None = None,
+        *,
+        max_parallel: int = 10,
+        timeout: Timeout = 'long',
+    ) -> list[SetRecordResult]:
+        """Copy records from this key-value store into another one, streaming each record through the client.
+
+        Each record is downloaded as a stream and its chunks are fed into the upload to the target store as they
+        arrive, with at most `max_parallel` records copied at the same time. The keys are consumed only as fast as the
+        records are copied, so the memory stays bounded however many records there are. The default Impit-based HTTP
+        client takes a request body only as a whole, though, so it joins the chunks of each record before sending it,
+        and up to `max_parallel` whole records are held in memory at once. Lower `max_parallel` to copy large records,
+        or use a custom HTTP client that can stream the upload.
+
+        The target can belong to another client, for example one with the token of another account. A record whose
+        upload fails does not stop the others, and its error is reported in the results. Its upload is not retried, as
+        the stream it was fed from cannot be replayed, so copy the failed keys again to retry them.
+
+        https://docs.apify.com/api/v2#/reference/key-value-stores/record/put-record
+
+        Args:
+            target: The key-value store to copy the records into.
+            keys: Keys of the records to copy. All the records in the store are copied by default.
+            max_parallel: Maximum number of records copied at the same time.
+            timeout: Timeout for the API HTTP requests of each record.
+
+        Returns:
+            The result of each record, in the order the copies completed. A record that does not exist in this store
+            is reported with a `LookupError`.
+        """
+        if max_parallel < 1:
+            raise ValueError(f'max_parallel must be at least 1, got {max_parallel}')
+
+        keys_to_copy = keys if keys is not None else (item.key for item in self.iterate_keys(timeout=timeout))
+
+        def copy(key: str) -> SetRecordResult:
+            try:
+                with self.stream_record(key, timeout=timeout) as record:
+                    if record is not None:
+                        target._set_record_from_chunks(
+                            key,
+                            record['value'].iter_bytes(),
+                            content_type=record['content_type'],
+                            timeout=timeout,
+                        )
+            except Exception as exc:
+                return SetRecordResult(key=key, error=exc)
+            if record is None:
+                return SetRecordResult(key=key, error=LookupError(f'Record {key!r} does not exist.'))
+            return SetRecordResult(key=key)
+
+        results = list[SetRecordResult]()
+        with ContextThreadPoolExecutor(max_workers=max_parallel) as executor:
+            in_flight = set[Future[SetRecordResult]]()
+            for key in keys_to_copy:
+                if len(in_flight) >= max_parallel:
+                    done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                    results.extend(future.result() for future in done)
+                in_flight.add(executor.submit(copy, key))
+
+            while in_flight:
+                done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                results.extend(future.result() for future in done)
+
+        return results
+
+    def sync_directory(
+        self,
+        local_dir: str | os.PathLike[str],
+        *,
+        direction: DirectorySyncDirection = 'up',
+        delete: bool = False,
+        manifest_key: str = DEFAULT_SYNC_MANIFEST_KEY,
+        max_parallel: int = 10,
+        on_progress: Callable[[DirectorySyncProgress], None] | None = None,
+        timeout: Timeout = 'long',
+    ) -> DirectorySyncResult:
+        """Synchronize a local directory with the key-value store, transferring only new and changed files.
+
+        Each file in the directory and its subdirectories is stored under its path relative to the directory, with
+        `/` replaced by `!`, so the names of the files may contain only characters that are allowed in keys. Files are
+        compared by their size and the SHA-256 hash of their content, which are kept together with the path of each
+        file in a manifest record that every sync up updates, as the size of a stored record is that of its possibly
+        compressed body. Records that are not in the manifest are compared by their size. Only new and changed entries
+        are transferred, with at most `max_parallel` transfers at the same time.
+
+        With `direction='up'`, the store is made to match the directory. New and changed files are uploaded and,
+        with `delete`, records of files that were synced up before but no longer exist are deleted. Records that were
+        never synced up from a directory are left alone. With `direction='down'`, the directory is made to match the
+        store. New and changed records are downloaded, to the path the manifest records for them or to a file named
+        after the key, and, with `delete`, files that have no record are deleted.
+
+        A transfer or deletion that fails does not stop the others, and its error is reported in the result.
+
+        Args:
+            local_dir: The local directory to synchronize.
+            direction: `'up'` to upload the directory to the store, or `'down'` to download the store into the
+                directory.
+            delete: Whether to delete the entries that no longer exist at the source.
+            manifest_key: Key of the record that keeps the manifest of the synced files.
+            max_parallel: Maximum number of files hashed, transferred or deleted at the same time.
+            on_progress: Function called after each entry is transferred or deleted, or fails to be.
+            timeout: Timeout for each API HTTP request.
+
+        Returns:
+            The keys of the entries that were transferred, deleted, left unchanged, or failed.
+        """
+        if direction not in ('up', 'down'):
+            raise ValueError(f"direction must be 'up' or 'down', got {direction!r}")
+        if max_parallel < 1:
+            raise ValueError(f'max_parallel must be at least 1, got {max_parallel}')
+
+        directory = Path(local_dir)
+        if direction == 'up' and not directory.is_dir():
+            raise ValueError(f'{directory} is not a directory')
+
+        manifest = parse_manifest(self.get_record(manifest_key, timeout=timeout))
+        record_sizes = {item.key: item.size for item in self.iterate_keys(timeout=timeout) if item.key != manifest_key}
+
+        with ContextThreadPoolExecutor(max_workers=max_parallel) as executor:
+            if direction == 'up':
+                return self._sync_directory_up(
+                    directory,
+                    manifest,
+                    record_sizes,
+                    executor=executor,
+                    delete=delete,
+                    manifest_key=manifest_key,
+                    on_progress=on_progress,
+                    timeout=timeout,
+                )
+            return self._sync_directory_down(
+                directory,
+                manifest,
+                record_sizes,
+                executor=executor,
+                delete=delete,
+                on_progress=on_progress,
+                timeout=timeout,
+            )
 
     def delete_record(self, key: str, *, timeout: Timeout = 'short') -> None:
         """Delete the specified record from the key-value store.
@@ -413,6 +1217,39 @@ class KeyValueStoreClient(ResourceClient):
             params=self._build_params(),
             timeout=timeout,
         )
+        self._invalidate_cached_record(key)
+
+    def get_blob_store(
+        self,
+        *,
+        key_prefix: str = 'blob-',
+        manifest_path: str | os.PathLike[str] | None = None,
+        max_parallel: int = 10,
+    ) -> BlobStore:
+        """Get a blob store that stores values under keys derived from their content, uploading each one once.
+
+        Values with the same content share a single record, keyed by the SHA-256 hash of the content. A value is
+        uploaded only if its record does not exist yet, which the store checks with `record_exists`, in parallel for a
+        batch of values. Keys of the blobs known to be stored are remembered, and kept in the manifest file when
+        `manifest_path` is given, so that storing the same value again, also in a later run, takes no request at all.
+
+        Args:
+            key_prefix: Prefix of the keys of the blobs.
+            manifest_path: File the keys of the blobs known to be stored are kept in. It is read when the blob store is
+                created and appended to as blobs are found or stored. A manifest written for another store is ignored
+                and overwritten. If not given, the keys are kept only in memory.
+            max_parallel: Maximum number of existence checks or uploads running at the same time.
+
+        Returns:
+            The blob store for storing the values.
+        """
+        return BlobStore(
+            self,
+            store_url=self._resource_url,
+            key_prefix=key_prefix,
+            manifest_path=manifest_path,
+            max_parallel=max_parallel,
+        )
 
     def get_record_public_url(self, key: str, *, timeout: Timeout = 'long') -> str:
         """Generate a URL that can be used to access key-value store record.
@@ -430,15 +1267,41 @@ class KeyValueStoreClient(ResourceClient):
         if self._resource_id is None:
             raise ValueError('resource_id cannot be None when generating a public URL')
 
-        metadata = self.get(timeout=timeout)
+        signing_key = self._get_signing_key(timeout=timeout)
 
         request_params = self._build_params()
 
-        if metadata and metadata.url_signing_secret_key:
-            request_params['signature'] = create_hmac_signature(metadata.url_signing_secret_key, key)
+        if signing_key and signing_key.secret_key:
+            request_params['signature'] = create_hmac_signature(signing_key.secret_key, key)
 
         return self._build_public_url(f'records/{key}', request_params)
 
+    def get_records_public_urls(self, keys: Iterable[str], *, timeout: Timeout = 'long') -> dict[str, str]:
+        """Generate URLs that can be used to access many key-value store records.
+
+        Same as `get_record_public_url`, but the URLs of all the keys are signed locally after fetching the URL signing
+        key at most once, instead of once per key.
+
+        Args:
+            keys: The keys for which the URLs should be generated.
+            timeout: Timeout for the API HTTP request.
+
+        Returns:
+            A dictionary mapping each of the keys to its public URL.
+        """
+        if self._resource_id is None:
+            raise ValueError('resource_id cannot be None when generating a public URL')
+
+        signing_key = self._get_signing_key(timeout=timeout)
+
+        urls = dict[str, str]()
+        for key in keys:
+            request_params = self._build_params()
+            if signing_key and signing_key.secret_key:
+                request_params['signature'] = create_hmac_signature(signing_key.secret_key, key)
+            urls[key] = self._build_public_url(f'records/{key}', request_params)
+        return urls
+
     def create_keys_public_url(
         self,
         *,
@@ -471,7 +1334,7 @@ class KeyValueStoreClient(ResourceClient):
         Returns:
             The public key-value store keys URL.
         """
-        metadata = self.get(timeout=timeout)
+        signing_key = self._get_signing_key(timeout=timeout)
 
         request_params = self._build_params(
             limit=limit,
@@ -480,37 +1343,280 @@ class KeyValueStoreClient(ResourceClient):
             prefix=prefix,
         )
 
-        if metadata and metadata.url_signing_secret_key:
+        if signing_key and signing_key.secret_key:
             signature = create_storage_content_signature(
-                metadata.id,
-                metadata.url_signing_secret_key,
+                signing_key.storage_id,
+                signing_key.secret_key,
                 expires_in=expires_in,
             )
             request_params['signature'] = signature
 
         return self._build_public_url('keys', request_params)
 
+    def invalidate_signing_key(self) -> None:
+        """Drop the cached URL signing key of the key-value store, so that the next signed URL fetches it again.
 
-@docs_group('Resource clients')
-class KeyValueStoreClientAsync(ResourceClientAsync):
-    """Sub-client for managing a specific key-value store.
-
-    Provides methods to manage a specific key-value store, e.g. get it, update it, or manage its records. Obtain an
-    instance via an appropriate method on the `ApifyClientAsync` class.
-    """
-
-    def __init__(
+        The key is cached for a while after it is first fetched, so signing many URLs takes a single request. Call
+        this after the key is rotated, to stop signing URLs with the old one.
+        """
+        self._client_registry.signing_keys.invalidate(self._resource_url)
+
+    def _get_signing_key(self, *, timeout: Timeout) -> StorageSigningKey | None:
+        """Return the URL signing key of the key-value store, fetching the store only if the key is not cached."""
+        signing_key = self._client_registry.signing_keys.get(self._resource_url)
+        if signing_key is None:
+            metadata = self.get(timeout=timeout)
+            if metadata is None:
+                return None
+            signing_key = StorageSigningKey(storage_id=metadata.id, secret_key=metadata.url_signing_secret_key)
+            self._client_registry.signing_keys.set(self._resource_url, signing_key)
+        return signing_key
+
+    def _sync_directory_up(
+        self,
+        directory: Path,
+        manifest: dict[str, SyncedFile],
+        record_sizes: dict[str, int],
+        *,
+        executor: ThreadPoolExecutor,
+        delete: bool,
+        manifest_key: str,
+        on_progress: Callable[[DirectorySyncProgress], None] | None,
+        timeout: Timeout,
+    ) -> DirectorySyncResult:
+        """Upload new and changed files of a directory, delete the records of removed ones, and save the manifest."""
+        local_files = list_local_files(directory)
+        files = dict(
+            zip(
+                local_files,
+                executor.map(lambda path: describe_file(directory, path), local_files.values()),
+                strict=True,
+            )
+        )
+        changed = [
+            key
+            for key, file in files.items()
+            if key not in record_sizes or key not in manifest or manifest[key] != file
+        ]
+        removed = [key for key in manifest if key not in files and key in record_sizes] if delete else []
+        changed_keys = set(changed)
+        tracker = DirectorySyncTracker(
+            total=len(changed) + len(removed),
+            unchanged=[key for key in files if key not in changed_keys],
+            on_progress=on_progress,
+        )
+
+        def upload(key: str) -> None:
+            try:
+                self.set_record_from_path(key, local_files[key], timeout=timeout)
+            except Exception as exc:
+                tracker.record(key, 'transferred', exc)
+            else:
+                tracker.record(key, 'transferred')
+
+        def remove(key: str) -> None:
+            try:
+                self.delete_record(key, timeout=timeout)
+            except Exception as exc:
+                tracker.record(key, 'deleted', exc)
+            else:
+                tracker.record(key, 'deleted')
+
+        wait([*(executor.submit(upload, key) for key in changed), *(executor.submit(remove, key) for key in removed)])
+
+        # Records that stay in the store keep their entries, including those of files that failed to upload, so that
+        # they are compared with what the store still has on the next sync.
+        result = tracker.result
+        deleted_keys = set(result.deleted)
+        new_manifest = {key: file for key, file in manifest.items() if key in record_sizes and key not in deleted_keys}
+        new_manifest.update({key: file for key, file in files.items() if key not in result.failed})
+        if new_manifest != manifest:
+            self.set_record(manifest_key, build_manifest(new_manifest), timeout=timeout)
+        return result
+
+    def _sync_directory_down(
+        self,
+        directory: Path,
+        manifest: dict[str, SyncedFile],
+        record_sizes: dict[str, int],
+        *,
+        executor: ThreadPoolExecutor,
+        delete: bool,
+        on_progress: Callable[[DirectorySyncProgress], None] | None,
+        timeout: Timeout,
+    ) -> DirectorySyncResult:
+        """Download the new and changed records into a directory, and delete the files that have no record."""
+        directory.mkdir(parents=True, exist_ok=True)
+        local_files = list_local_files(directory)
+        targets = {key: manifest[key].path if key in manifest else key for key in record_sizes}
+
+        def is_changed(key: str) -> bool:
+            try:
+                path = resolve_local_path(directory, targets[key])
+            except ValueError:
+                # Reported when the record is downloaded.
+                return True
+            # The listed size of a record is that of its stored body, which may be compressed, so the files synced up
+            # are compared with the size and hash of the original file kept in the manifest.
+            if key in manifest:
+                return file_differs(path, size=manifest[key].size, sha256=manifest[key].sha256)
+            return file_differs(path, size=record_sizes[key], sha256=None)
+
+        changed_flags = list(executor.map(is_changed, targets))
+        changed = [key for key, is_key_changed in zip(targets, changed_flags, strict=True) if is_key_changed]
+        synced_keys = {path_to_key(path) for path in targets.values()}
+        removed = [key for key in local_files if key not in synced_keys] if delete else []
+        tracker = DirectorySyncTracker(
+            total=len(changed) + len(removed),
+            unchanged=[key for key, is_key_changed in zip(targets, changed_flags, strict=True) if not is_key_changed],
+            on_progress=on_progress,
+        )
+
+        def download(key: str) -> None:
+            try:
+                path = resolve_local_path(directory, targets[key])
+                path.parent.mkdir(parents=True, exist_ok=True)
+                record = self.download_record(key, path, timeout=timeout)
+            except Exception as exc:
+                tracker.record(key, 'transferred', exc)
+                return
+
+            if record is None:
+                tracker.record(key, 'transferred', LookupError(f'The record {key!r} was deleted during the sync'))
+            else:
+                tracker.record(key, 'transferred')
+
+        def remove(key: str) -> None:
+            try:
+                local_files[key].unlink(missing_ok=True)
+            except Exception as exc:
+                tracker.record(key, 'deleted', exc)
+            else:
+                tracker.record(key, 'deleted')
+
+        wait([*(executor.submit(download, key) for key in changed), *(executor.submit(remove, key) for key in removed)])
+        return tracker.result
+
+    def _set_record_from_chunks(
+        self, key: str, chunks: Iterator[bytes], *, content_type: str, timeout: Timeout
+    ) -> None:
+        """Set a record to a body streamed in chunks, such as one being downloaded from another store.
+
+        The chunks can be iterated only once, so the upload is not retried. A streamed body has no size known up front,
+        so with record compression it is compressed whenever its content type allows it and it does not start with the
+        header of the compressor's encoding already.
+        """
+        headers = {'content-type': content_type}
+        head, body = peek_head(chunks)
+        if (
+            self._record_compressor is not None
+            and is_compressible_content_type(content_type)
+            and not looks_compressed(self._record_compressor.content_encoding, head)
+        ):
+            # Keep the body a one-shot iterator, so the HTTP client does not retry it with the chunks used up.
+            body = iter(CompressedRequestBody(body, self._record_compressor))
+            headers['content-encoding'] = self._record_compressor.content_encoding
+
+        self._http_client.call(
+            url=self._build_url(f'records/{key}'),
+            method='PUT',
+            params=self._build_params(),
+            data=body,
+            headers=headers,
+            timeout=timeout,
+        )
+        self._invalidate_cached_record(key)
+
+    def _get_record_through_cache(
+        self, key: str, *, signature: str | None, parse: bool, timeout: Timeout
+    ) -> dict | None:
+        """Retrieve a record through the record cache, downloading it only if the cached copy expired and changed."""
+        cache = cast('RecordCache', self._record_cache)
+        cached = cache.get(self._resource_url, key)
+        cached_record = None
+        if cached is not None:
+            cached_record = _cached_record_to_dict(cached, parse=parse)
+            if cached_record is None:
+                # A cached body that cannot be parsed is downloaded again, the error is raised for the new response.
+                cached = None
+            elif cache.is_fresh(cached):
+                return cached_record
+
+        try:
+            response = self._http_client.call(
+                url=self._build_url(f'records/{key}'),
+                method='GET',
+                headers=cache.get_revalidation_headers(cached) if cached is not None else None,
+                params=self._build_params(signature=signature, attachment=True),
+                timeout=timeout,
+            )
+        except ApifyApiError as exc:
+            # The HTTP client treats every status from 300 up as an error, so an unchanged record surfaces here.
+            if exc.status_code == HTTPStatus.NOT_MODIFIED and cached is not None:
+                cache.mark_validated(cached)
+                return cached_record
+            if exc.status_code == HTTPStatus.NOT_FOUND:
+                cache.invalidate(self._resource_url, key)
+            catch_not_found_or_throw(exc)
+            return None
+
+        content = _decode_record_body(response, self._record_compressor)
+        record = {
+            'key': key,
+            'value': _read_record_value(response, content, parse=parse),
+            'content_type': response.headers['content-type'],
+        }
+        if response.status_code == HTTPStatus.OK:
+            cache.put(
+                self._resource_url,
+                key,
+                content if content is not None else response.content,
+                content_type=response.headers['content-type'],
+                etag=response.headers.get('etag'),
+                last_modified=response.headers.get('last-modified'),
+            )
+        return record
+
+    def _invalidate_cached_record(self, key: str) -> None:
+        """Drop a record that was just changed from the record cache, if the client has one."""
+        if self._record_cache is not None:
+            self._record_cache.invalidate(self._resource_url, key)
+
+
+@docs_group('Resource clients')
+class KeyValueStoreClientAsync(ResourceClientAsync):
+    """Sub-client for managing a specific key-value store.
+
+    Provides methods to manage a specific key-value store, e.g. get it, update it, or manage its records. Obtain an
+    instance via an appropriate method on the `ApifyClientAsync` class.
+    """
+
+    def __init__(  # noqa: D417
         self,
         *,
         resource_id: str | None = None,
         resource_path: str = 'key-value-stores',
+        record_cache: RecordCache | None = None,
+        record_compression: HttpCompressionAlgorithm | HttpCompressor | None = None,
+        record_compression_min_size: int = MIN_COMPRESSION_SIZE,
         **kwargs: Any,
     ) -> None:
+        """Initialize a new instance.
+
+        Args:
+            record_cache: Disk cache the records read with `get_record` and `get_record_as_bytes` are kept in.
+            record_compression: Compression the records set with `set_record` and `set_record_from_path` are
+                stored with, or None to store them the way they are uploaded.
+            record_compression_min_size: Smallest record value, in bytes, that is stored compressed.
+        """
         super().__init__(
             resource_id=resource_id,
             resource_path=resource_path,
             **kwargs,
         )
+        self._record_cache = record_cache
+        self._record_compressor = resolve_compressor(record_compression) if record_compression is not None else None
+        self._record_compression_min_size = record_compression_min_size
 
     async def get(self, *, timeout: Timeout = 'short') -> KeyValueStore | None:
         """Retrieve the key-value store.
@@ -651,6 +1757,56 @@ class KeyValueStoreClientAsync(ResourceClientAsync):
             chunk_size=chunk_size or DEFAULT_CHUNK_SIZE,
         )
 
+    async def build_key_index(self, *, prefix: str | None = None, timeout: Timeout = 'medium') -> KeyIndex:
+        """Build a compact, sorted index of the keys in the key-value store.
+
+        The keys are listed page by page with `list_keys` and packed into a `KeyIndex`, which keeps the key names in a
+        single buffer and the sizes of the records in a packed array. Only one page of `KeyValueStoreKey` models is
+        held in memory at a time, so even a store with millions of keys can be indexed and kept around for membership
+        checks, prefix queries, or diffs. Save the index with `KeyIndex.save` and bring it up to date later with
+        `refresh_key_index`.
+
+        https://docs.apify.com/api/v2#/reference/key-value-stores/key-collection/get-list-of-keys
+
+        Args:
+            prefix: The prefix of the keys to index. All keys are indexed by default.
+            timeout: Timeout for each API HTTP request.
+
+        Returns:
+            The index of the keys.
+        """
+        index = KeyIndex(prefix=prefix)
+        await self.refresh_key_index(index, timeout=timeout)
+        return index
+
+    async def refresh_key_index(self, index: KeyIndex, *, timeout: Timeout = 'medium') -> int:
+        """Add the keys created since a key index was built or last refreshed.
+
+        The listing continues after the last indexed key, the way `exclusive_start_key` continues `list_keys`, so only
+        the keys that sort after it are fetched. Keys created with a name that sorts before it, deleted keys, and
+        changed record sizes are not picked up. Build a new index with `build_key_index` to see those.
+
+        https://docs.apify.com/api/v2#/reference/key-value-stores/key-collection/get-list-of-keys
+
+        Args:
+            index: The index to update in place. It keeps covering the prefix it was built with.
+            timeout: Timeout for each API HTTP request.
+
+        Returns:
+            The number of keys added to the index.
+        """
+        added = 0
+        cursor = index.last_key
+        while True:
+            page = await self.list_keys(
+                limit=DEFAULT_CHUNK_SIZE, exclusive_start_key=cursor, prefix=index.prefix, timeout=timeout
+            )
+            index.extend((item.key, item.size) for item in page.items)
+            added += len(page.items)
+            if not page.items or not page.is_truncated or page.next_exclusive_start_key is None:
+                return added
+            cursor = page.next_exclusive_start_key
+
     async def get_record(self, key: str, *, signature: str | None = None, timeout: Timeout = 'long') -> dict | None:
         """Retrieve the given record from the key-value store.
 
@@ -664,6 +1820,9 @@ class KeyValueStoreClientAsync(ResourceClientAsync):
         Returns:
             The requested record, or None, if the record does not exist.
         """
+        if self._record_cache is not None:
+            return await self._get_record_through_cache(key, signature=signature, parse=True, timeout=timeout)
+
         try:
             response = await self._http_client.call(
                 url=self._build_url(f'records/{key}'),
@@ -674,7 +1833,9 @@ class KeyValueStoreClientAsync(ResourceClientAsync):
 
             return {
                 'key': key,
-                'value': _parse_get_record_response(response),
+                'value': _read_record_value(
+                    response, _decode_record_body(response, self._record_compressor), parse=True
+                ),
                 'content_type': response.headers['content-type'],
             }
 
@@ -683,6 +1844,51 @@ class KeyValueStoreClientAsync(ResourceClientAsync):
 
         return None
 
+    def get_records(
+        self, keys: Iterable[str] | AsyncIterable[str], *, max_parallel: int = 10, timeout: Timeout = 'long'
+    ) -> AsyncIterator[tuple[str, dict | None]]:
+        """Retrieve many records from the key-value store concurrently.
+
+        The records are requested in parallel with at most `max_parallel` requests in flight, and each record is
+        yielded as soon as its request completes, so the order follows the completion of the requests rather than
+        the order of the keys. The keys are consumed only as fast as the records are fetched. Each record is parsed
+        the same way as by `get_record`. Collect the results with `dict(...)` to look the records up by key.
+
+        https://docs.apify.com/api/v2#/reference/key-value-stores/record/get-record
+
+        Args:
+            keys: Keys of the records to retrieve.
+            max_parallel: Maximum number of records requested at the same time.
+            timeout: Timeout for the API HTTP request of each record.
+
+        Returns:
+            An iterator of pairs of a key and its record, where the record is None if it does not exist.
+        """
+        if max_parallel < 1:
+            raise ValueError(f'max_parallel must be at least 1, got {max_parallel}')
+
+        async def iterate_records() -> AsyncIterator[tuple[str, dict | None]]:
+            in_flight = dict[asyncio.Task[dict | None], str]()
+            try:
+                async for key in iterate_any(keys):
+                    if len(in_flight) >= max_parallel:
+                        done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                        for task in done:
+                            yield in_flight.pop(task), task.result()
+                    in_flight[asyncio.create_task(self.get_record(key, timeout=timeout))] = key
+
+                while in_flight:
+                    done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                    for task in done:
+                        yield in_flight.pop(task), task.result()
+            finally:
+                # Requests still running when the iteration is abandoned are not waited for.
+                for task in in_flight:
+                    task.cancel()
+                await asyncio.gather(*in_flight, return_exceptions=True)
+
+        return iterate_records()
+
     async def record_exists(self, key: str, *, timeout: Timeout = 'long') -> bool:
         """Check if given record is present in the key-value store.
 
@@ -725,6 +1931,9 @@ class KeyValueStoreClientAsync(ResourceClientAsync):
         Returns:
             The requested record, or None, if the record does not exist.
         """
+        if self._record_cache is not None:
+            return await self._get_record_through_cache(key, signature=signature, parse=False, timeout=timeout)
+
         try:
             response = await self._http_client.call(
                 url=self._build_url(f'records/{key}'),
@@ -735,7 +1944,9 @@ class KeyValueStoreClientAsync(ResourceClientAsync):
 
             return {
                 'key': key,
-                'value': response.content,
+                'value': _read_record_value(
+                    response, _decode_record_body(response, self._record_compressor), parse=False
+                ),
                 'content_type': response.headers['content-type'],
             }
 
@@ -744,6 +1955,55 @@ class KeyValueStoreClientAsync(ResourceClientAsync):
 
         return None
 
+    async def get_record_as_file(
+        self,
+        key: str,
+        file: IO[bytes] | None = None,
+        *,
+        signature: str | None = None,
+        max_memory_bytes: int = DEFAULT_SPOOL_MAX_MEMORY_BYTES,
+        timeout: Timeout = 'long',
+    ) -> dict | None:
+        """Retrieve the given record from the key-value store as a file, without holding it in memory whole.
+
+        The record is streamed into `file` as it arrives. Without a `file`, it is spooled into a temporary file,
+        which stays in memory up to `max_memory_bytes` and moves to disk past that.
+
+        https://docs.apify.com/api/v2#/reference/key-value-stores/record/get-record
+
+        Args:
+            key: Key of the record to retrieve.
+            file: A binary file or buffer to write the record into. By default a spooled temporary file is created.
+            signature: Signature used to access the items.
+            max_memory_bytes: Size up to which the spooled temporary file is kept in memory.
+            timeout: Timeout for the API HTTP request.
+
+        Returns:
+            The requested record with the file as its value, or None, if the record does not exist. A spooled
+                temporary file is rewound to its start and should be closed after use, a given `file` is returned
+                as it is after the last write.
+        """
+        try:
+            response = await self._http_client.call(
+                url=self._build_url(f'records/{key}'),
+                method='GET',
+                params=self._build_params(signature=signature, attachment=True),
+                stream=True,
+                timeout=timeout,
+            )
+        except ApifyApiError as exc:
+            catch_not_found_or_throw(exc)
+            return None
+
+        try:
+            return {
+                'key': key,
+                'value': await spool_response_async(response, file, max_memory_bytes=max_memory_bytes),
+                'content_type': response.headers['content-type'],
+            }
+        finally:
+            await response.aclose()
+
     @asynccontextmanager
     async def stream_record(
         self, key: str, *, signature: str | None = None, timeout: Timeout = 'long'
@@ -772,7 +2032,7 @@ class KeyValueStoreClientAsync(ResourceClientAsync):
 
             yield {
                 'key': key,
-                'value': response,
+                'value': DecodedRecordResponse(response) if self._record_compressor is not None else response,
                 'content_type': response.headers['content-type'],
             }
 
@@ -783,6 +2043,168 @@ class KeyValueStoreClientAsync(ResourceClientAsync):
             if response:
                 await response.aclose()
 
+    async def download_record(
+        self,
+        key: str,
+        path: str | os.PathLike[str],
+        *,
+        signature: str | None = None,
+        parts: int = 1,
+        max_resumes: int = DEFAULT_MAX_RETRIES,
+        timeout: Timeout = 'long',
+    ) -> dict | None:
+        """Download a record into a file, resuming the download where it broke off if the connection fails.
+
+        The record is written to the file chunk by chunk as it arrives. If the connection breaks in the middle of the
+        body, the download continues from the bytes already written with an HTTP `Range` request instead of starting
+        over. Each `Range` request is checked against the ETag and size of the first response, so that a record
+        changed in the meantime is not pieced together from two versions, and the bytes written are checked against
+        the size of the record. A record served with a `Content-Encoding` is decoded while it is read, so byte offsets
+        into it are not known, and it is downloaded in a single pass without resuming.
+
+        https://docs.apify.com/api/v2#/reference/key-value-stores/record/get-record
+
+        Args:
+            key: Key of the record to download.
+            path: Path of the file to write the record to. An existing file is overwritten.
+            signature: Signature used to access the record.
+            parts: Number of byte ranges to download in parallel. A record is split only if each range would be at
+                least 8 MB, a smaller one is downloaded in a single request.
+            max_resumes: Maximum number of times a broken download, or each of its ranges, is resumed.
+            timeout: Timeout for each API HTTP request.
+
+        Returns:
+            The record with the path of the downloaded file as its value, or None if the record does not exist, in
+            which case no file is created.
+
+        Raises:
+            IncompleteDownloadError: If the download cannot be resumed, the record changes while it is being
+                downloaded, or the bytes written do not add up to the record size.
+        """
+        if parts < 1:
+            raise ValueError(f'parts must be at least 1, got {parts}')
+
+        url = self._build_url(f'records/{key}')
+        params = self._build_params(signature=signature, attachment=True)
+        try:
+            response = await self._http_client.call(url=url, method='GET', params=params, stream=True, timeout=timeout)
+        except ApifyApiError as exc:
+            catch_not_found_or_throw(exc)
+            return None
+
+        content_type = response.headers.get('content-type', 'application/octet-stream')
+        etag = response.headers.get('etag')
+        size = _get_resumable_size(response)
+        path = Path(path)
+        await asyncio.to_thread(_create_file, path, size)
+
+        ranges = _split_into_ranges(size, parts) if size is not None else []
+        if len(ranges) > 1:
+            # The first response only told the size, each range is requested on its own.
+            await response.aclose()
+            try:
+                async with asyncio.TaskGroup() as task_group:
+                    tasks = [
+                        task_group.create_task(
+                            self._download_range(
+                                url,
+                                params,
+                                path,
+                                start,
+                                end,
+                                size=size,
+                                etag=etag,
+                                response=None,
+                                max_resumes=max_resumes,
+                                timeout=timeout,
+                            )
+                        )
+                        for start, end in ranges
+                    ]
+            except ExceptionGroup as eg:
+                raise eg.exceptions[0] from None
+            written = sum(task.result() for task in tasks)
+        else:
+            written = await self._download_range(
+                url,
+                params,
+                path,
+                0,
+                size,
+                size=size,
+                etag=etag,
+                response=response,
+                max_resumes=max_resumes if size is not None else 0,
+                timeout=timeout,
+            )
+
+        _check_downloaded_size(written, size)
+        return {
+            'key': key,
+            'value': path,
+            'content_type': content_type,
+        }
+
+    async def _download_range(
+        self,
+        url: str,
+        params: dict,
+        path: Path,
+        start: int,
+        end: int | None,
+        *,
+        size: int | None,
+        etag: str | None,
+        response: HttpResponse | None,
+        max_resumes: int,
+        timeout: Timeout,
+    ) -> int:
+        """Download the bytes from `start` up to `end` of a record into the same offsets of the file.
+
+        `end` is None when the size of the record is not known, and the range then runs to the end of the body. Every
+        request for the range is checked against the `size` and `etag` of the first response of the download. The
+        `response` is an already started response for the range, if there is one. A range that breaks off is
+        resumed from the last byte written, at most `max_resumes` times. Returns the number of bytes written.
+        """
+        position = start
+        resumes = 0
+        file = await asyncio.to_thread(lambda: path.open('r+b'))
+        try:
+            while True:
+                if response is None:
+                    response = await self._http_client.call(
+                        url=url,
+                        method='GET',
+                        params=params,
+                        headers=_range_headers(position, end, etag),
+                        stream=True,
+                        timeout=timeout,
+                    )
+                    _check_range_response(response, position, size, etag)
+
+                await asyncio.to_thread(file.seek, position)
+                try:
+                    async for chunk in response.aiter_bytes():
+                        await asyncio.to_thread(file.write, chunk)
+                        position += len(chunk)
+                except Exception as exc:
+                    if resumes >= max_resumes or not self._http_client.is_retryable_transport_error(exc):
+                        raise
+                else:
+                    if end is None or position >= end:
+                        return position - start
+                    if resumes >= max_resumes:
+                        raise IncompleteDownloadError(
+                            f'The download ended after {position} of {end} bytes of the record.'
+                        )
+                finally:
+                    await response.aclose()
+                    response = None
+
+                resumes += 1
+        finally:
+            await asyncio.to_thread(file.close)
+
     async def set_record(
         self,
         key: str,
@@ -813,6 +2235,10 @@ class KeyValueStoreClientAsync(ResourceClientAsync):
             content_type=content_type,
             content_encoding=content_encoding,
         )
+        if content_encoding is None and self._record_compressor is not None:
+            value, content_encoding = await asyncio.to_thread(
+                _compress_record_value, value, content_type, self._record_compressor, self._record_compression_min_size
+            )
 
         headers = {'content-type': content_type}
         if content_encoding is not None:
@@ -826,6 +2252,287 @@ class KeyValueStoreClientAsync(ResourceClientAsync):
             headers=headers,
             timeout=timeout,
         )
+        await self._invalidate_cached_record(key)
+
+    async def set_record_from_path(
+        self,
+        key: str,
+        path: str | os.PathLike[str],
+        *,
+        content_type: str | None = None,
+        content_encoding: str | None = None,
+        timeout: Timeout = 'long',
+    ) -> None:
+        """Set a record to the contents of a file, without reading the file into memory first.
+
+        The file is memory-mapped and the request body is read straight from the mapping. Unless the content type
+        says it is already compressed, it is compressed chunk by chunk as it is sent, so a large file never has to be
+        held in memory as a whole, next to a compressed copy of it. The default Impit-based HTTP client takes a
+        request body only as a whole bytes object, though, so it copies the body that goes over the wire into memory
+        before sending it: the compressed file, or the whole file if it is not compressed, for example because its
+        content type is already compressed or `content_encoding` is given. With that client, uploading a 2 GB file
+        that is not compressed needs 2 GB of memory. A custom HTTP client that streams request bodies avoids the copy.
+
+        https://docs.apify.com/api/v2#/reference/key-value-stores/record/put-record
+
+        Args:
+            key: The key of the record to save the file to.
+            path: Path to the file to upload.
+            content_type: The content type of the saved value. Guessed from the file name if not given, falling back
+                to `application/octet-stream`.
+            content_encoding: The encoding the file is already compressed with, sent as the `Content-Encoding`
+                header. The file is then uploaded as it is, like a pre-compressed value passed to `set_record`.
+            timeout: Timeout for the API HTTP request.
+        """
+        if content_type is None:
+            content_type = mimetypes.guess_type(path)[0] or 'application/octet-stream'
+
+        headers = {'content-type': content_type}
+        if content_encoding is not None:
+            headers['content-encoding'] = content_encoding
+
+        mapped = await asyncio.to_thread(_map_file, path)
+        body: mmap | CompressedRequestBody | bytes = mapped if mapped is not None else b''
+        if (
+            content_encoding is None
+            and mapped is not None
+            and _should_compress_record(
+                len(mapped), content_type, self._record_compressor, self._record_compression_min_size, mapped[:2]
+            )
+        ):
+            # The file is compressed chunk by chunk while it is sent, so it is never held in memory as a whole.
+            compressor = cast('HttpCompressor', self._record_compressor)
+            body = CompressedRequestBody(memoryview(mapped), compressor)
+            headers['content-encoding'] = compressor.content_encoding
+        try:
+            await self._http_client.call(
+                url=self._build_url(f'records/{key}'),
+                method='PUT',
+                params=self._build_params(),
+                data=body,
+                headers=headers,
+                timeout=timeout,
+            )
+        finally:
+            # A view of the mapping still referenced from the traceback of a failed upload keeps it from being
+            # closed now. The garbage collector closes it once the view is gone.
+            if mapped is not None:
+                with suppress(BufferError):
+                    mapped.close()
+
+        await self._invalidate_cached_record(key)
+
+    async def set_records(
+        self,
+        records: Mapping[str, Any] | Iterable[tuple[str, Any]] | AsyncIterable[tuple[str, Any]],
+        *,
+        content_type: str | None = None,
+        max_parallel: int = 10,
+        timeout: Timeout = 'long',
+    ) -> list[SetRecordResult]:
+        """Set many records in the key-value store, uploading them concurrently.
+
+        Each value is encoded and uploaded the same way as by `set_record`, with at most `max_parallel` uploads in
+        flight. The records are consumed only as fast as they are uploaded, so a generator of pairs keeps the memory
+        bounded however many records there are. Transient errors are retried by the HTTP client like for any other
+        request. A record that still fails does not stop the others, and its error is reported in the results.
+
+        https://docs.apify.com/api/v2#/reference/key-value-stores/record/put-record
+
+        Args:
+            records: A mapping of keys to values, or an iterable of `(key, value)` pairs.
+            content_type: The content type of the saved values. Inferred from each value if not given.
+            max_parallel: Maximum number of records uploaded at the same time.
+            timeout: Timeout for the API HTTP request of each record.
+
+        Returns:
+            The result of each record, in the order the uploads completed.
+        """
+        if max_parallel < 1:
+            raise ValueError(f'max_parallel must be at least 1, got {max_parallel}')
+
+        pairs = cast(
+            'Iterable[tuple[str, Any]] | AsyncIterable[tuple[str, Any]]',
+            records.items() if isinstance(records, Mapping) else records,
+        )
+
+        async def upload(key: str, value: Any) -> SetRecordResult:
+            try:
+                await self.set_record(key, value, content_type=content_type, timeout=timeout)
+            except Exception as exc:
+                return SetRecordResult(key=key, error=exc)
+            return SetRecordResult(key=key)
+
+        results = list[SetRecordResult]()
+        in_flight = set[asyncio.Task[SetRecordResult]]()
+        try:
+            async for key, value in iterate_any(pairs):
+                if len(in_flight) >= max_parallel:
+                    done, in_flight = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                    results.extend(task.result() for task in done)
+                in_flight.add(asyncio.create_task(upload(key, value)))
+
+            while in_flight:
+                done, in_flight = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                results.extend(task.result() for task in done)
+        finally:
+            # Uploads still running when the records fail to iterate, or the call is cancelled, are not waited for.
+            for task in in_flight:
+                task.cancel()
+            await asyncio.gather(*in_flight, return_exceptions=True)
+
+        return results
+
+    async def copy_to(
+        self,
+        target: KeyValueStoreClientAsync,
+        keys: Iterable[str] | AsyncIterable[str] | None = None,
+        *,
+        max_parallel: int = 10,
+        timeout: Timeout = 'long',
+    ) -> list[SetRecordResult]:
+        """Copy records from this key-value store into another one, streaming each record through the client.
+
+        Each record is downloaded as a stream and its chunks are fed into the upload to the target store as they
+        arrive, with at most `max_parallel` records copied at the same time. The keys are consumed only as fast as the
+        records are copied, so the memory stays bounded however many records there are. The default Impit-based HTTP
+        client takes a request body only as a whole, though, so it joins the chunks of each record before sending it,
+        and up to `max_parallel` whole records are held in memory at once. Lower `max_parallel` to copy large records,
+        or use a custom HTTP client that can stream the upload.
+
+        The target can belong to another client, for example one with the token of another account. A record whose
+        upload fails does not stop the others, and its error is reported in the results. Its upload is not retried, as
+        the stream it was fed from cannot be replayed, so copy the failed keys again to retry them.
+
+        https://docs.apify.com/api/v2#/reference/key-value-stores/record/put-record
+
+        Args:
+            target: The key-value store to copy the records into.
+            keys: Keys of the records to copy. All the records in the store are copied by default.
+            max_parallel: Maximum number of records copied at the same time.
+            timeout: Timeout for the API HTTP requests of each record.
+
+        Returns:
+            The result of each record, in the order the copies completed. A record that does not exist in this store
+            is reported with a `LookupError`.
+        """
+        if max_parallel < 1:
+            raise ValueError(f'max_parallel must be at least 1, got {max_parallel}')
+
+        keys_to_copy = keys if keys is not None else (item.key async for item in self.iterate_keys(timeout=timeout))
+
+        async def copy(key: str) -> SetRecordResult:
+            try:
+                async with self.stream_record(key, timeout=timeout) as record:
+                    if record is not None:
+                        await target._set_record_from_chunks(
+                            key,
+                            record['value'].aiter_bytes(),
+                            content_type=record['content_type'],
+                            timeout=timeout,
+                        )
+            except Exception as exc:
+                return SetRecordResult(key=key, error=exc)
+            if record is None:
+                return SetRecordResult(key=key, error=LookupError(f'Record {key!r} does not exist.'))
+            return SetRecordResult(key=key)
+
+        results = list[SetRecordResult]()
+        in_flight = set[asyncio.Task[SetRecordResult]]()
+        try:
+            async for key in iterate_any(keys_to_copy):
+                if len(in_flight) >= max_parallel:
+                    done, in_flight = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                    results.extend(task.result() for task in done)
+                in_flight.add(asyncio.create_task(copy(key)))
+
+            while in_flight:
+                done, in_flight = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                results.extend(task.result() for task in done)
+        finally:
+            # Copies still running when the keys fail to iterate, or the call is cancelled, are not waited for.
+            for task in in_flight:
+                task.cancel()
+            await asyncio.gather(*in_flight, return_exceptions=True)
+
+        return results
+
+    async def sync_directory(
+        self,
+        local_dir: str | os.PathLike[str],
+        *,
+        direction: DirectorySyncDirection = 'up',
+        delete: bool = False,
+        manifest_key: str = DEFAULT_SYNC_MANIFEST_KEY,
+        max_parallel: int = 10,
+        on_progress: Callable[[DirectorySyncProgress], None] | None = None,
+        timeout: Timeout = 'long',
+    ) -> DirectorySyncResult:
+        """Synchronize a local directory with the key-value store, transferring only new and changed files.
+
+        Each file in the directory and its subdirectories is stored under its path relative to the directory, with
+        `/` replaced by `!`, so the names of the files may contain only characters that are allowed in keys. Files are
+        compared by their size and the SHA-256 hash of their content, which are kept together with the path of each
+        file in a manifest record that every sync up updates, as the size of a stored record is that of its possibly
+        compressed body. Records that are not in the manifest are compared by their size. Only new and changed entries
+        are transferred, with at most `max_parallel` transfers at the same time.
+
+        With `direction='up'`, the store is made to match the directory. New and changed files are uploaded and,
+        with `delete`, records of files that were synced up before but no longer exist are deleted. Records that were
+        never synced up from a directory are left alone. With `direction='down'`, the directory is made to match the
+        store. New and changed records are downloaded, to the path the manifest records for them or to a file named
+        after the key, and, with `delete`, files that have no record are deleted.
+
+        A transfer or deletion that fails does not stop the others, and its error is reported in the result.
+
+        Args:
+            local_dir: The local directory to synchronize.
+            direction: `'up'` to upload the directory to the store, or `'down'` to download the store into the
+                directory.
+            delete: Whether to delete the entries that no longer exist at the source.
+            manifest_key: Key of the record that keeps the manifest of the synced files.
+            max_parallel: Maximum number of files hashed, transferred or deleted at the same time.
+            on_progress: Function called after each entry is transferred or deleted, or fails to be.
+            timeout: Timeout for each API HTTP request.
+
+        Returns:
+            The keys of the entries that were transferred, deleted, left unchanged, or failed.
+        """
+        if direction not in ('up', 'down'):
+            raise ValueError(f"direction must be 'up' or 'down', got {direction!r}")
+        if max_parallel < 1:
+            raise ValueError(f'max_parallel must be at least 1, got {max_parallel}')
+
+        directory = Path(local_dir)
+        if direction == 'up' and not await asyncio.to_thread(directory.is_dir):
+            raise ValueError(f'{directory} is not a directory')
+
+        manifest = parse_manifest(await self.get_record(manifest_key, timeout=timeout))
+        record_sizes = {
+            item.key: item.size async for item in self.iterate_keys(timeout=timeout) if item.key != manifest_key
+        }
+
+        semaphore = asyncio.Semaphore(max_parallel)
+        if direction == 'up':
+            return await self._sync_directory_up(
+                directory,
+                manifest,
+                record_sizes,
+                semaphore=semaphore,
+                delete=delete,
+                manifest_key=manifest_key,
+                on_progress=on_progress,
+                timeout=timeout,
+            )
+        return await self._sync_directory_down(
+            directory,
+            manifest,
+            record_sizes,
+            semaphore=semaphore,
+            delete=delete,
+            on_progress=on_progress,
+            timeout=timeout,
+        )
 
     async def delete_record(self, key: str, *, timeout: Timeout = 'short') -> None:
         """Delete the specified record from the key-value store.
@@ -842,6 +2549,39 @@ class KeyValueStoreClientAsync(ResourceClientAsync):
             params=self._build_params(),
             timeout=timeout,
         )
+        await self._invalidate_cached_record(key)
+
+    def get_blob_store(
+        self,
+        *,
+        key_prefix: str = 'blob-',
+        manifest_path: str | os.PathLike[str] | None = None,
+        max_parallel: int = 10,
+    ) -> BlobStoreAsync:
+        """Get a blob store that stores values under keys derived from their content, uploading each one once.
+
+        Values with the same content share a single record, keyed by the SHA-256 hash of the content. A value is
+        uploaded only if its record does not exist yet, which the store checks with `record_exists`, in parallel for a
+        batch of values. Keys of the blobs known to be stored are remembered, and kept in the manifest file when
+        `manifest_path` is given, so that storing the same value again, also in a later run, takes no request at all.
+
+        Args:
+            key_prefix: Prefix of the keys of the blobs.
+            manifest_path: File the keys of the blobs known to be stored are kept in. It is read when the blob store is
+                created and appended to as blobs are found or stored. A manifest written for another store is ignored
+                and overwritten. If not given, the keys are kept only in memory.
+            max_parallel: Maximum number of existence checks or uploads running at the same time.
+
+        Returns:
+            The blob store for storing the values.
+        """
+        return BlobStoreAsync(
+            self,
+            store_url=self._resource_url,
+            key_prefix=key_prefix,
+            manifest_path=manifest_path,
+            max_parallel=max_parallel,
+        )
 
     async def get_record_public_url(self, key: str, *, timeout: Timeout = 'long') -> str:
         """Generate a URL that can be used to access key-value store record.
@@ -859,15 +2599,41 @@ class KeyValueStoreClientAsync(ResourceClientAsync):
         if self._resource_id is None:
             raise ValueError('resource_id cannot be None when generating a public URL')
 
-        metadata = await self.get(timeout=timeout)
+        signing_key = await self._get_signing_key(timeout=timeout)
 
         request_params = self._build_params()
 
-        if metadata and metadata.url_signing_secret_key:
-            request_params['signature'] = create_hmac_signature(metadata.url_signing_secret_key, key)
+        if signing_key and signing_key.secret_key:
+            request_params['signature'] = create_hmac_signature(signing_key.secret_key, key)
 
         return self._build_public_url(f'records/{key}', request_params)
 
+    async def get_records_public_urls(self, keys: Iterable[str], *, timeout: Timeout = 'long') -> dict[str, str]:
+        """Generate URLs that can be used to access many key-value store records.
+
+        Same as `get_record_public_url`, but the URLs of all the keys are signed locally after fetching the URL signing
+        key at most once, instead of once per key.
+
+        Args:
+            keys: The keys for which the URLs should be generated.
+            timeout: Timeout for the API HTTP request.
+
+        Returns:
+            A dictionary mapping each of the keys to its public URL.
+        """
+        if self._resource_id is None:
+            raise ValueError('resource_id cannot be None when generating a public URL')
+
+        signing_key = await self._get_signing_key(timeout=timeout)
+
+        urls = dict[str, str]()
+        for key in keys:
+            request_params = self._build_params()
+            if signing_key and signing_key.secret_key:
+                request_params['signature'] = create_hmac_signature(signing_key.secret_key, key)
+            urls[key] = self._build_public_url(f'records/{key}', request_params)
+        return urls
+
     async def create_keys_public_url(
         self,
         *,
@@ -900,7 +2666,7 @@ class KeyValueStoreClientAsync(ResourceClientAsync):
         Returns:
             The public key-value store keys URL.
         """
-        metadata = await self.get(timeout=timeout)
+        signing_key = await self._get_signing_key(timeout=timeout)
 
         request_params = self._build_params(
             limit=limit,
@@ -909,12 +2675,252 @@ class KeyValueStoreClientAsync(ResourceClientAsync):
             prefix=prefix,
         )
 
-        if metadata and metadata.url_signing_secret_key:
+        if signing_key and signing_key.secret_key:
             signature = create_storage_content_signature(
-                metadata.id,
-                metadata.url_signing_secret_key,
+                signing_key.storage_id,
+                signing_key.secret_key,
                 expires_in=expires_in,
             )
             request_params['signature'] = signature
 
         return self._build_public_url('keys', request_params)
+
+    def invalidate_signing_key(self) -> None:
+        """Drop the cached URL signing key of the key-value store, so that the next signed URL fetches it again.
+
+        The key is cached for a while after it is first fetched, so signing many URLs takes a single request. Call
+        this after the key is rotated, to stop signing URLs with the old one.
+        """
+        self._client_registry.signing_keys.invalidate(self._resource_url)
+
+    async def _get_signing_key(self, *, timeout: Timeout) -> StorageSigningKey | None:
+        """Return the URL signing key of the key-value store, fetching the store only if the key is not cached."""
+        signing_key = self._client_registry.signing_keys.get(self._resource_url)
+        if signing_key is None:
+            metadata = await self.get(timeout=timeout)
+            if metadata is None:
+                return None
+            signing_key = StorageSigningKey(storage_id=metadata.id, secret_key=metadata.url_signing_secret_key)
+            self._client_registry.signing_keys.set(self._resource_url, signing_key)
+        return signing_key
+
+    async def _sync_directory_up(
+        self,
+        directory: Path,
+        manifest: dict[str, SyncedFile],
+        record_sizes: dict[str, int],
+        *,
+        semaphore: asyncio.Semaphore,
+        delete: bool,
+        manifest_key: str,
+        on_progress: Callable[[DirectorySyncProgress], None] | None,
+        timeout: Timeout,
+    ) -> DirectorySyncResult:
+        """Upload new and changed files of a directory, delete the records of removed ones, and save the manifest."""
+        local_files = await asyncio.to_thread(list_local_files, directory)
+
+        async def describe(path: Path) -> SyncedFile:
+            async with semaphore:
+                return await asyncio.to_thread(describe_file, directory, path)
+
+        files = dict(
+            zip(local_files, await asyncio.gather(*(describe(path) for path in local_files.values())), strict=True)
+        )
+        changed = [
+            key
+            for key, file in files.items()
+            if key not in record_sizes or key not in manifest or manifest[key] != file
+        ]
+        removed = [key for key in manifest if key not in files and key in record_sizes] if delete else []
+        changed_keys = set(changed)
+        tracker = DirectorySyncTracker(
+            total=len(changed) + len(removed),
+            unchanged=[key for key in files if key not in changed_keys],
+            on_progress=on_progress,
+        )
+
+        async def upload(key: str) -> None:
+            async with semaphore:
+                try:
+                    await self.set_record_from_path(key, local_files[key], timeout=timeout)
+                except Exception as exc:
+                    tracker.record(key, 'transferred', exc)
+                else:
+                    tracker.record(key, 'transferred')
+
+        async def remove(key: str) -> None:
+            async with semaphore:
+                try:
+                    await self.delete_record(key, timeout=timeout)
+                except Exception as exc:
+                    tracker.record(key, 'deleted', exc)
+                else:
+                    tracker.record(key, 'deleted')
+
+        await asyncio.gather(*(upload(key) for key in changed), *(remove(key) for key in removed))
+
+        # Records that stay in the store keep their entries, including those of files that failed to upload, so that
+        # they are compared with what the store still has on the next sync.
+        result = tracker.result
+        deleted_keys = set(result.deleted)
+        new_manifest = {key: file for key, file in manifest.items() if key in record_sizes and key not in deleted_keys}
+        new_manifest.update({key: file for key, file in files.items() if key not in result.failed})
+        if new_manifest != manifest:
+            await self.set_record(manifest_key, build_manifest(new_manifest), timeout=timeout)
+        return result
+
+    async def _sync_directory_down(
+        self,
+        directory: Path,
+        manifest: dict[str, SyncedFile],
+        record_sizes: dict[str, int],
+        *,
+        semaphore: asyncio.Semaphore,
+        delete: bool,
+        on_progress: Callable[[DirectorySyncProgress], None] | None,
+        timeout: Timeout,
+    ) -> DirectorySyncResult:
+        """Download the new and changed records into a directory, and delete the files that have no record."""
+        await asyncio.to_thread(directory.mkdir, parents=True, exist_ok=True)
+        local_files = await asyncio.to_thread(list_local_files, directory)
+        targets = {key: manifest[key].path if key in manifest else key for key in record_sizes}
+
+        def is_changed(key: str) -> bool:
+            try:
+                path = resolve_local_path(directory, targets[key])
+            except ValueError:
+                # Reported when the record is downloaded.
+                return True
+            # The listed size of a record is that of its stored body, which may be compressed, so the files synced up
+            # are compared with the size and hash of the original file kept in the manifest.
+            if key in manifest:
+                return file_differs(path, size=manifest[key].size, sha256=manifest[key].sha256)
+            return file_differs(path, size=record_sizes[key], sha256=None)
+
+        async def check(key: str) -> bool:
+            async with semaphore:
+                return await asyncio.to_thread(is_changed, key)
+
+        changed_flags = await asyncio.gather(*(check(key) for key in targets))
+        changed = [key for key, is_key_changed in zip(targets, changed_flags, strict=True) if is_key_changed]
+        synced_keys = {path_to_key(path) for path in targets.values()}
+        removed = [key for key in local_files if key not in synced_keys] if delete else []
+        tracker = DirectorySyncTracker(
+            total=len(changed) + len(removed),
+            unchanged=[key for key, is_key_changed in zip(targets, changed_flags, strict=True) if not is_key_changed],
+            on_progress=on_progress,
+        )
+
+        async def download(key: str) -> None:
+            async with semaphore:
+                try:
+                    path = resolve_local_path(directory, targets[key])
+                    await asyncio.to_thread(path.parent.mkdir, parents=True, exist_ok=True)
+                    record = await self.download_record(key, path, timeout=timeout)
+                except Exception as exc:
+                    tracker.record(key, 'transferred', exc)
+                    return
+
+                if record is None:
+                    tracker.record(key, 'transferred', LookupError(f'The record {key!r} was deleted during the sync'))
+                else:
+                    tracker.record(key, 'transferred')
+
+        async def remove(key: str) -> None:
+            async with semaphore:
+                try:
+                    await asyncio.to_thread(local_files[key].unlink, missing_ok=True)
+                except Exception as exc:
+                    tracker.record(key, 'deleted', exc)
+                else:
+                    tracker.record(key, 'deleted')
+
+        await asyncio.gather(*(download(key) for key in changed), *(remove(key) for key in removed))
+        return tracker.result
+
+    async def _set_record_from_chunks(
+        self, key: str, chunks: AsyncIterator[bytes], *, content_type: str, timeout: Timeout
+    ) -> None:
+        """Set a record to a body streamed in chunks, such as one being downloaded from another store.
+
+        The chunks can be iterated only once, so the upload is not retried. A streamed body has no size known up front,
+        so with record compression it is compressed whenever its content type allows it and it does not start with the
+        header of the compressor's encoding already.
+        """
+        headers = {'content-type': content_type}
+        head, body = await apeek_head(chunks)
+        if (
+            self._record_compressor is not None
+            and is_compressible_content_type(content_type)
+            and not looks_compressed(self._record_compressor.content_encoding, head)
+        ):
+            # Keep the body a one-shot iterator, so the HTTP client does not retry it with the chunks used up.
+            body = aiter(AsyncRequestBody(body, self._record_compressor))
+            headers['content-encoding'] = self._record_compressor.content_encoding
+
+        await self._http_client.call(
+            url=self._build_url(f'records/{key}'),
+            method='PUT',
+            params=self._build_params(),
+            data=body,
+            headers=headers,
+            timeout=timeout,
+        )
+        await self._invalidate_cached_record(key)
+
+    async def _get_record_through_cache(
+        self, key: str, *, signature: str | None, parse: bool, timeout: Timeout
+    ) -> dict | None:
+        """Retrieve a record through the record cache, downloading it only if the cached copy expired and changed."""
+        cache = cast('RecordCache', self._record_cache)
+        cached = await asyncio.to_thread(cache.get, self._resource_url, key)
+        cached_record = None
+        if cached is not None:
+            cached_record = _cached_record_to_dict(cached, parse=parse)
+            if cached_record is None:
+                # A cached body that cannot be parsed is downloaded again, the error is raised for the new response.
+                cached = None
+            elif cache.is_fresh(cached):
+                return cached_record
+
+        try:
+            response = await self._http_client.call(
+                url=self._build_url(f'records/{key}'),
+                method='GET',
+                headers=cache.get_revalidation_headers(cached) if cached is not None else None,
+                params=self._build_params(signature=signature, attachment=True),
+                timeout=timeout,
+            )
+        except ApifyApiError as exc:
+            # The HTTP client treats every status from 300 up as an error, so an unchanged record surfaces here.
+            if exc.status_code == HTTPStatus.NOT_MODIFIED and cached is not None:
+                await asyncio.to_thread(cache.mark_validated, cached)
+                return cached_record
+            if exc.status_code == HTTPStatus.NOT_FOUND:
+                await asyncio.to_thread(cache.invalidate, self._resource_url, key)
+            catch_not_found_or_throw(exc)
+            return None
+
+        content = _decode_record_body(response, self._record_compressor)
+        record = {
+            'key': key,
+            'value': _read_record_value(response, content, parse=parse),
+            'content_type': response.headers['content-type'],
+        }
+        if response.status_code == HTTPStatus.OK:
+            await asyncio.to_thread(
+                lambda: cache.put(
+                    self._resource_url,
+                    key,
+                    content if content is not None else response.content,
+                    content_type=response.headers['content-type'],
+                    etag=response.headers.get('etag'),
+                    last_modified=response.headers.get('last-modified'),
+                )
+            )
+        return record
+
+    async def _invalidate_cached_record(self, key: str) -> None:
+        """Drop a record that was just changed from the record cache, if the client has one."""
+        if self._record_cache is not None:
+            await asyncio.to_thread(self._record_cache.invalidate, self._resource_url, key)
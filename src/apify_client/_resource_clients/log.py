@@ -1,11 +1,13 @@
 from __future__ import annotations
 
 from contextlib import asynccontextmanager, contextmanager
-from typing import TYPE_CHECKING, Any
+from typing import IO, TYPE_CHECKING, Any
 
+from apify_client._consts import DEFAULT_SPOOL_MAX_MEMORY_BYTES
 from apify_client._docs import docs_group
 from apify_client._resource_clients._resource_client import ResourceClient, ResourceClientAsync
 from apify_client._utils.errors import catch_not_found_for_resource_or_throw
+from apify_client._utils.spool import spool_response, spool_response_async
 from apify_client.errors import ApifyApiError
 
 if TYPE_CHECKING:
@@ -91,6 +93,48 @@ class LogClient(ResourceClient):
 
         return None
 
+    def get_as_file(
+        self,
+        file: IO[bytes] | None = None,
+        *,
+        raw: bool = False,
+        max_memory_bytes: int = DEFAULT_SPOOL_MAX_MEMORY_BYTES,
+        timeout: Timeout = 'long',
+    ) -> IO[bytes] | None:
+        """Retrieve the log as a file, without holding it in memory whole.
+
+        The log is streamed into `file` as it arrives. Without a `file`, it is spooled into a temporary file,
+        which stays in memory up to `max_memory_bytes` and moves to disk past that.
+
+        https://docs.apify.com/api/v2#/reference/logs/log/get-log
+
+        Args:
+            file: A binary file or buffer to write the log into. By default a spooled temporary file is created.
+            raw: If true, the log will include formatting. For example, coloring character sequences.
+            max_memory_bytes: Size up to which the spooled temporary file is kept in memory.
+            timeout: Timeout for the API HTTP request.
+
+        Returns:
+            The file with the log, or None, if it does not exist. A spooled temporary file is rewound to its start
+                and should be closed after use, a given `file` is returned as it is after the last write.
+        """
+        try:
+            response = self._http_client.call(
+                url=self._build_url(),
+                method='GET',
+                params=self._build_params(raw=raw),
+                stream=True,
+                timeout=timeout,
+            )
+        except ApifyApiError as exc:
+            catch_not_found_for_resource_or_throw(exc, self._resource_id)
+            return None
+
+        try:
+            return spool_response(response, file, max_memory_bytes=max_memory_bytes)
+        finally:
+            response.close()
+
     @contextmanager
     def stream(self, *, raw: bool = False, timeout: Timeout = 'long') -> Iterator[HttpResponse | None]:
         """Retrieve the log as a stream.
@@ -199,6 +243,48 @@ class LogClientAsync(ResourceClientAsync):
 
         return None
 
+    async def get_as_file(
+        self,
+        file: IO[bytes] | None = None,
+        *,
+        raw: bool = False,
+        max_memory_bytes: int = DEFAULT_SPOOL_MAX_MEMORY_BYTES,
+        timeout: Timeout = 'long',
+    ) -> IO[bytes] | None:
+        """Retrieve the log as a file, without holding it in memory whole.
+
+        The log is streamed into `file` as it arrives. Without a `file`, it is spooled into a temporary file,
+        which stays in memory up to `max_memory_bytes` and moves to disk past that.
+
+        https://docs.apify.com/api/v2#/reference/logs/log/get-log
+
+        Args:
+            file: A binary file or buffer to write the log into. By default a spooled temporary file is created.
+            raw: If true, the log will include formatting. For example, coloring character sequences.
+            max_memory_bytes: Size up to which the spooled temporary file is kept in memory.
+            timeout: Timeout for the API HTTP request.
+
+        Returns:
+            The file with the log, or None, if it does not exist. A spooled temporary file is rewound to its start
+                and should be closed after use, a given `file` is returned as it is after the last write.
+        """
+        try:
+            response = await self._http_client.call(
+                url=self._build_url(),
+                method='GET',
+                params=self._build_params(raw=raw),
+                stream=True,
+                timeout=timeout,
+            )
+        except ApifyApiError as exc:
+            catch_not_found_for_resource_or_throw(exc, self._resource_id)
+            return None
+
+        try:
+            return await spool_response_async(response, file, max_memory_bytes=max_memory_bytes)
+        finally:
+            await response.aclose()
+
     @asynccontextmanager
     async def stream(self, *, raw: bool = False, timeout: Timeout = 'long') -> AsyncIterator[HttpResponse | None]:
         """Retrieve the log as a stream.
@@ -2,12 +2,15 @@ from __future__ import annotations
 
 import asyncio
 import json
-import math
+import threading
+import time
 from collections.abc import Iterable
-from queue import Queue
+from concurrent.futures import FIRST_COMPLETED, Future, as_completed, wait
+from datetime import timedelta
+from queue import Empty, Queue
 from typing import TYPE_CHECKING, Any, Literal
 
-from more_itertools import constrained_batches
+from more_itertools import chunked, constrained_batches
 
 from apify_client._docs import docs_group
 from apify_client._models import (
@@ -37,14 +40,15 @@ from apify_client._models import (
 )
 from apify_client._pagination import DEFAULT_CHUNK_SIZE, get_cursor_iterator, get_cursor_iterator_async
 from apify_client._resource_clients._resource_client import ResourceClient, ResourceClientAsync
+from apify_client._utils.batching import PAYLOAD_SIZE_LIMIT_BYTES, aconstrained_batches, iterate_any
+from apify_client._utils.concurrency import ContextThreadPoolExecutor
 from apify_client._utils.errors import catch_not_found_or_throw
 from apify_client._utils.http import response_to_dict
 from apify_client._utils.time import to_seconds
 from apify_client.errors import ApifyApiError
 
 if TYPE_CHECKING:
-    from collections.abc import AsyncIterator, Iterator
-    from datetime import timedelta
+    from collections.abc import AsyncIterable, AsyncIterator, Iterator
 
     from apify_client._literals import GeneralAccess
     from apify_client._typeddicts import (
@@ -60,12 +64,6 @@ if TYPE_CHECKING:
 _RQ_MAX_REQUESTS_PER_BATCH = 25
 """Maximum number of requests the API accepts in a single batch call."""
 
-_MAX_PAYLOAD_SIZE_BYTES = 9 * 1024 * 1024
-"""Maximum payload size (9 MB) the API accepts for a single batch call."""
-
-_SAFETY_BUFFER_PERCENT = 0.01 / 100
-"""Safety margin (0.01%) deducted from the maximum payload size when splitting requests into batches."""
-
 
 def _serialize_requests(
     requests: list[RequestDraft] | list[RequestDraftDict] | list[RequestDraftCamelDict],
@@ -78,17 +76,45 @@ def _serialize_requests(
     being held in memory alongside the serialized requests. Uses the same `json.dumps` options as
     `HttpClientBase._prepare_request_call` to keep the wire format consistent with other endpoints.
     """
-    return [
-        json.dumps(
-            (request if isinstance(request, RequestDraft) else RequestDraft.model_validate(request)).model_dump(
-                by_alias=True, exclude_none=True
-            ),
-            ensure_ascii=False,
-            allow_nan=False,
-            default=str,
-        ).encode('utf-8')
-        for request in requests
-    ]
+    return [_serialize_request(request) for request in requests]
+
+
+def _serialize_request(request: RequestDraft | RequestDraftDict | RequestDraftCamelDict) -> bytes:
+    """Validate a request and serialize it into the JSON bytes it will occupy in the batch request body."""
+    return json.dumps(
+        (request if isinstance(request, RequestDraft) else RequestDraft.model_validate(request)).model_dump(
+            by_alias=True, exclude_none=True
+        ),
+        ensure_ascii=False,
+        allow_nan=False,
+        default=str,
+    ).encode('utf-8')
+
+
+def _split_into_batches(serialized_requests: Iterable[bytes]) -> Iterator[tuple[bytes, ...]]:
+    """Split serialized requests into batches by payload size (counting commas and brackets) and count, lazily."""
+    return constrained_batches(
+        serialized_requests,
+        max_size=PAYLOAD_SIZE_LIMIT_BYTES - len(b'[]'),
+        max_count=_RQ_MAX_REQUESTS_PER_BATCH,
+        get_len=lambda serialized: len(serialized) + len(b','),
+        strict=False,
+    )
+
+
+def _select_unprocessed(serialized_requests: list[bytes], unprocessed_requests: list[RequestDraft]) -> list[bytes]:
+    """Pick the serialized requests the API left unprocessed, to send them again.
+
+    The API reports an unprocessed request with its unique key, URL and method only, so the request as it was sent,
+    with its user data, headers and payload, is picked by its unique key instead of re-sending the reported one.
+    """
+    unique_keys = {request.unique_key for request in unprocessed_requests}
+    return [serialized for serialized in serialized_requests if json.loads(serialized)['uniqueKey'] in unique_keys]
+
+
+def _request_to_draft(request: Request) -> RequestDraft:
+    """Turn a request listed from a queue into a draft that adds it to another queue, with its state but not its ID."""
+    return RequestDraft.model_validate(request.model_dump(by_alias=True, exclude_none=True, exclude={'id'}))
 
 
 @docs_group('Resource clients')
@@ -408,73 +434,172 @@ class RequestQueueClient(ResourceClient):
         *,
         forefront: bool = False,
         max_parallel: int = 1,
+        unprocessed_retries: int = 0,
+        unprocessed_retry_delay: timedelta = timedelta(milliseconds=500),
         timeout: Timeout = 'medium',
     ) -> BatchAddResult:
         """Add requests to the request queue in batches.
 
-        Requests are split into batches based on size and processed in parallel.
+        Requests are split into batches based on size and processed in parallel. The API may leave some requests
+        unprocessed, typically when it is rate limiting. With `unprocessed_retries`, those requests are sent again in
+        further rounds, re-packed into full batches, with an exponentially growing delay before each round, and the
+        results of all the rounds are merged.
 
         https://docs.apify.com/api/v2#/reference/request-queues/batch-request-operations/add-requests
 
         Args:
             requests: List of requests to be added to the queue.
             forefront: Whether to add requests to the front of the queue.
-            max_parallel: Specifies the maximum number of parallel tasks for API calls. This is only applicable
-                to the async client. For the sync client, this value must be set to 1, as parallel execution
-                is not supported.
+            max_parallel: Specifies the maximum number of batches sent to the API in parallel. The sync client
+                sends them from a pool of threads, the async client from concurrent tasks.
+            unprocessed_retries: Maximum number of rounds in which requests left unprocessed are sent again.
+                By default, they are returned in the result without being retried.
+            unprocessed_retry_delay: Delay before the first round of retries, doubled before each following round.
             timeout: Timeout for the API HTTP request.
 
         Returns:
-            Result containing lists of processed and unprocessed requests.
+            Result containing lists of processed requests from all the rounds, and of requests left unprocessed
+            after the last round.
         """
-        if max_parallel != 1:
-            raise NotImplementedError('max_parallel is only supported in async client')
-
         # Validate the requests and serialize each of them into JSON bytes.
         serialized_requests = _serialize_requests(requests)
 
         # Build the query parameters shared by all the batch API calls.
         request_params = self._build_params(clientKey=self.client_key, forefront=forefront)
 
-        # Compute the payload size limit to ensure it doesn't exceed the maximum allowed size.
-        payload_size_limit_bytes = _MAX_PAYLOAD_SIZE_BYTES - math.ceil(_MAX_PAYLOAD_SIZE_BYTES * _SAFETY_BUFFER_PERCENT)
-
-        # Split the requests into batches by payload size (counting commas and brackets) and max requests per batch.
-        batches = constrained_batches(
-            serialized_requests,
-            max_size=payload_size_limit_bytes - len(b'[]'),
-            max_count=_RQ_MAX_REQUESTS_PER_BATCH,
-            get_len=lambda serialized: len(serialized) + len(b','),
-            strict=False,
+        result = self._add_serialized_requests(
+            serialized_requests, request_params=request_params, max_parallel=max_parallel, timeout=timeout
         )
+        processed_requests = list(result.processed_requests)
+        unprocessed_requests = result.unprocessed_requests
 
-        # Put the batches into the queue for processing.
-        batch_queue = Queue[Iterable[bytes]]()
+        # Send the unprocessed requests again, re-packed into full batches, backing off more before each round.
+        for retry in range(unprocessed_retries):
+            if not unprocessed_requests:
+                break
+            time.sleep(to_seconds(unprocessed_retry_delay) * 2**retry)
+            serialized_requests = _select_unprocessed(serialized_requests, unprocessed_requests)
+            result = self._add_serialized_requests(
+                serialized_requests, request_params=request_params, max_parallel=max_parallel, timeout=timeout
+            )
+            processed_requests.extend(result.processed_requests)
+            unprocessed_requests = result.unprocessed_requests
 
-        for batch in batches:
-            batch_queue.put(batch)
+        return BatchAddResponse.model_construct(
+            data=BatchAddResult.model_construct(
+                processed_requests=processed_requests,
+                unprocessed_requests=unprocessed_requests,
+            )
+        ).data
+
+    def batch_add_requests_streamed(
+        self,
+        requests: Iterable[RequestDraft | RequestDraftDict | RequestDraftCamelDict],
+        *,
+        forefront: bool = False,
+        max_parallel: int = 1,
+        timeout: Timeout = 'medium',
+    ) -> Iterator[BatchAddResult]:
+        """Add requests to the request queue in batches, consuming them lazily and yielding the result of each batch.
+
+        Unlike `batch_add_requests`, which takes a list and returns the merged result at the end, this method takes any
+        iterable of requests, such as a generator, and validates, serializes and batches them only as fast as the
+        batches are sent, with at most `max_parallel` batches in flight. The result of each batch is yielded as soon
+        as the batch completes, so the memory stays bounded however many requests there are. The iteration stops with
+        the error of the first batch that fails.
+
+        https://docs.apify.com/api/v2#/reference/request-queues/batch-request-operations/add-requests
+
+        Args:
+            requests: The requests to be added to the queue.
+            forefront: Whether to add requests to the front of the queue.
+            max_parallel: Maximum number of batches sent at the same time.
+            timeout: Timeout for the API HTTP request of each batch.
+
+        Returns:
+            An iterator of the results of the batches, in the order the batches completed.
+        """
+        if max_parallel < 1:
+            raise ValueError(f'max_parallel must be at least 1, got {max_parallel}')
+
+        request_params = self._build_params(clientKey=self.client_key, forefront=forefront)
+        batches = _split_into_batches(_serialize_request(request) for request in requests)
+
+        def iterate_results() -> Iterator[BatchAddResult]:
+            with ContextThreadPoolExecutor(max_workers=max_parallel) as executor:
+                in_flight = set[Future[BatchAddResult]]()
+                for batch in batches:
+                    in_flight.add(
+                        executor.submit(self._send_request_batch, batch, request_params=request_params, timeout=timeout)
+                    )
+                    # Read the next batch only once a slot is free, so the input is not consumed ahead of the sends.
+                    if len(in_flight) >= max_parallel:
+                        done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            yield future.result()
+
+                while in_flight:
+                    done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield future.result()
+
+        return iterate_results()
+
+    def copy_to(
+        self,
+        target: RequestQueueClient,
+        *,
+        forefront: bool = False,
+        max_parallel: int = 5,
+        timeout: Timeout = 'medium',
+    ) -> BatchAddResult:
+        """Copy the requests of this request queue into another request queue.
+
+        The requests are listed page by page with `iterate_requests` and added to the target queue with
+        `batch_add_requests`, with at most `max_parallel` pages of up to 1000 requests being added at the
+        same time, so only those pages are held in memory however many requests the queue has. The requests keep
+        their state, so handled requests stay handled in the target queue. The target can belong to another client,
+        for example one with the token of another account.
+
+        https://docs.apify.com/api/v2#/reference/request-queues/batch-request-operations/add-requests
+
+        Args:
+            target: The request queue to copy the requests into.
+            forefront: Whether to add the requests to the front of the target queue.
+            max_parallel: Maximum number of pages of requests added at the same time.
+            timeout: Timeout for the API HTTP requests.
 
+        Returns:
+            Result containing lists of processed and unprocessed requests.
+        """
+        if max_parallel < 1:
+            raise ValueError(f'max_parallel must be at least 1, got {max_parallel}')
+
+        def add_page(page: list[RequestDraft]) -> BatchAddResult:
+            return target.batch_add_requests(page, forefront=forefront, timeout=timeout)
+
+        pages = chunked(
+            (_request_to_draft(request) for request in self.iterate_requests(timeout=timeout)), DEFAULT_CHUNK_SIZE
+        )
         processed_requests = list[AddedRequest]()
         unprocessed_requests = list[RequestDraft]()
 
-        # Process all batches in the queue sequentially.
-        while not batch_queue.empty():
-            request_batch = batch_queue.get()
+        def collect(done: Iterable[Future[BatchAddResult]]) -> None:
+            for future in done:
+                result = future.result()
+                processed_requests.extend(result.processed_requests)
+                unprocessed_requests.extend(result.unprocessed_requests)
 
-            # Send the batch to the API, assembling the body from the already serialized requests.
-            response = self._http_client.call(
-                url=self._build_url('requests/batch'),
-                method='POST',
-                headers={'content-type': 'application/json'},
-                params=request_params,
-                data=b'[' + b','.join(request_batch) + b']',
-                timeout=timeout,
-            )
+        with ContextThreadPoolExecutor(max_workers=max_parallel) as executor:
+            in_flight = set[Future[BatchAddResult]]()
+            for page in pages:
+                # Keep at most `max_parallel` pages in flight, so the queue is not listed ahead of the additions.
+                if len(in_flight) >= max_parallel:
+                    done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                    collect(done)
+                in_flight.add(executor.submit(add_page, page))
 
-            result = response_to_dict(response)
-            batch_response = BatchAddResponse.model_validate(result)
-            processed_requests.extend(batch_response.data.processed_requests)
-            unprocessed_requests.extend(batch_response.data.unprocessed_requests)
+            collect(wait(in_flight).done)
 
         return BatchAddResponse.model_construct(
             data=BatchAddResult.model_construct(
@@ -594,6 +719,116 @@ class RequestQueueClient(ResourceClient):
             chunk_size=chunk_size or DEFAULT_CHUNK_SIZE,
         )
 
+    def _batch_add_requests_worker(
+        self,
+        *,
+        queue: Queue[Iterable[bytes]],
+        stop: threading.Event,
+        request_params: dict,
+        timeout: Timeout,
+    ) -> BatchAddResult:
+        """Worker function to process a batch of requests.
+
+        This worker will process batches from the queue.
+
+        Return result containing lists of processed and unprocessed requests by the worker.
+        """
+        processed_requests = list[AddedRequest]()
+        unprocessed_requests = list[RequestDraft]()
+
+        # Process batches until the queue is empty, or until another worker fails.
+        while not stop.is_set():
+            # Get the next batch from the queue.
+            try:
+                request_batch = queue.get_nowait()
+            except Empty:
+                break
+
+            try:
+                batch_result = self._send_request_batch(request_batch, request_params=request_params, timeout=timeout)
+            except Exception:
+                # Stop the other workers from taking further batches, as the async workers are cancelled.
+                stop.set()
+                raise
+
+            processed_requests.extend(batch_result.processed_requests)
+            unprocessed_requests.extend(batch_result.unprocessed_requests)
+
+        return BatchAddResult.model_construct(
+            processed_requests=processed_requests,
+            unprocessed_requests=unprocessed_requests,
+        )
+
+    def _add_serialized_requests(
+        self, serialized_requests: list[bytes], *, request_params: dict, max_parallel: int, timeout: Timeout
+    ) -> BatchAddResult:
+        """Add already serialized requests in batches, returning the merged result of the batches."""
+        # Split the requests into batches by payload size (counting commas and brackets) and max requests per batch.
+        batches = _split_into_batches(serialized_requests)
+
+        # Create a queue with all the batches, from which the worker threads will consume them.
+        batch_queue = Queue[Iterable[bytes]]()
+
+        for batch in batches:
+            batch_queue.put(batch)
+
+        stop = threading.Event()
+
+        # A single worker sends the batches one after another in the calling thread, with no pool to start.
+        if max_parallel == 1:
+            return self._batch_add_requests_worker(
+                queue=batch_queue, stop=stop, request_params=request_params, timeout=timeout
+            )
+
+        # The worker threads share the HTTP client, and so its connection pool, the way the async workers do.
+        with ContextThreadPoolExecutor(
+            max_workers=max_parallel, thread_name_prefix='batch_add_requests_worker'
+        ) as executor:
+            workers = [
+                executor.submit(
+                    self._batch_add_requests_worker,
+                    queue=batch_queue,
+                    stop=stop,
+                    request_params=request_params,
+                    timeout=timeout,
+                )
+                for _ in range(min(max_parallel, batch_queue.qsize()))
+            ]
+
+            # Re-raise the exception of the first worker that fails, once the others finish their current batches.
+            for worker in as_completed(workers):
+                worker.result()
+
+        # Combine the results from all workers and return them.
+        processed_requests = list[AddedRequest]()
+        unprocessed_requests = list[RequestDraft]()
+
+        for worker in workers:
+            result = worker.result()
+            processed_requests.extend(result.processed_requests)
+            unprocessed_requests.extend(result.unprocessed_requests)
+
+        return BatchAddResult.model_construct(
+            processed_requests=processed_requests,
+            unprocessed_requests=unprocessed_requests,
+        )
+
+    def _send_request_batch(
+        self, request_batch: Iterable[bytes], *, request_params: dict, timeout: Timeout
+    ) -> BatchAddResult:
+        """Send a batch of already serialized requests to the API and return its result."""
+        response = self._http_client.call(
+            url=self._build_url('requests/batch'),
+            method='POST',
+            headers={'content-type': 'application/json'},
+            params=request_params,
+            data=b'[' + b','.join(request_batch) + b']',
+            timeout=timeout,
+        )
+
+        result = response_to_dict(response)
+        return BatchAddResponse.model_validate(result).data
+
     def unlock_requests(self: RequestQueueClient, *, timeout: Timeout = 'long') -> UnlockRequestsResult:
         """Unlock all requests in the queue, which were locked by the same clientKey or from the same Actor run.
 
@@ -925,6 +1160,70 @@ class RequestQueueClientAsync(ResourceClientAsync):
             timeout=timeout,
         )
 
+    async def _add_serialized_requests(
+        self, serialized_requests: list[bytes], *, request_params: dict, max_parallel: int, timeout: Timeout
+    ) -> BatchAddResult:
+        """Add already serialized requests in batches, returning the merged result of the batches."""
+        # Split the requests into batches by payload size (counting commas and brackets) and max requests per batch.
+        batches = _split_into_batches(serialized_requests)
+
+        # Create a queue with all the batches, from which the worker tasks will consume them.
+        batch_queue: asyncio.Queue[Iterable[bytes]] = asyncio.Queue()
+
+        for batch in batches:
+            await batch_queue.put(batch)
+
+        # Use TaskGroup for structured concurrency — automatic cleanup and error propagation.
+        try:
+            async with asyncio.TaskGroup() as tg:
+                workers = [
+                    tg.create_task(
+                        self._batch_add_requests_worker(
+                            queue=batch_queue, request_params=request_params, timeout=timeout
+                        ),
+                        name=f'batch_add_requests_worker_{i}',
+                    )
+                    for i in range(max_parallel)
+                ]
+
+                # Wait for all batches to be processed, then cancel idle workers.
+                await batch_queue.join()
+                for worker in workers:
+                    worker.cancel()
+        except ExceptionGroup as eg:
+            # Re-raise the first worker exception directly to maintain backward-compatible error types.
+            raise eg.exceptions[0] from None
+
+        # Combine the results from all workers and return them.
+        processed_requests = list[AddedRequest]()
+        unprocessed_requests = list[RequestDraft]()
+
+        for worker in workers:
+            result = worker.result()
+            processed_requests.extend(result.data.processed_requests)
+            unprocessed_requests.extend(result.data.unprocessed_requests)
+
+        return BatchAddResult.model_construct(
+            processed_requests=processed_requests,
+            unprocessed_requests=unprocessed_requests,
+        )
+
+    async def _send_request_batch(
+        self, request_batch: Iterable[bytes], *, request_params: dict, timeout: Timeout
+    ) -> BatchAddResult:
+        """Send a batch of already serialized requests to the API and return its result."""
+        response = await self._http_client.call(
+            url=self._build_url('requests/batch'),
+            method='POST',
+            headers={'content-type': 'application/json'},
+            params=request_params,
+            data=b'[' + b','.join(request_batch) + b']',
+            timeout=timeout,
+        )
+
+        result = response_to_dict(response)
+        return BatchAddResponse.model_validate(result).data
+
     async def _batch_add_requests_worker(
         self,
         *,
@@ -949,20 +1248,11 @@ class RequestQueueClientAsync(ResourceClientAsync):
                 break
 
             try:
-                # Send the batch to the API, assembling the body from the already serialized requests.
-                response = await self._http_client.call(
-                    url=self._build_url('requests/batch'),
-                    method='POST',
-                    headers={'content-type': 'application/json'},
-                    params=request_params,
-                    data=b'[' + b','.join(request_batch) + b']',
-                    timeout=timeout,
+                batch_result = await self._send_request_batch(
+                    request_batch, request_params=request_params, timeout=timeout
                 )
-
-                result = response_to_dict(response)
-                batch_response = BatchAddResponse.model_validate(result)
-                processed_requests.extend(batch_response.data.processed_requests)
-                unprocessed_requests.extend(batch_response.data.unprocessed_requests)
+                processed_requests.extend(batch_result.processed_requests)
+                unprocessed_requests.extend(batch_result.unprocessed_requests)
 
             finally:
                 # Mark the batch as done whether it succeeded or failed.
@@ -981,24 +1271,32 @@ class RequestQueueClientAsync(ResourceClientAsync):
         *,
         forefront: bool = False,
         max_parallel: int = 5,
+        unprocessed_retries: int = 0,
+        unprocessed_retry_delay: timedelta = timedelta(milliseconds=500),
         timeout: Timeout = 'medium',
     ) -> BatchAddResult:
         """Add requests to the request queue in batches.
 
-        Requests are split into batches based on size and processed in parallel.
+        Requests are split into batches based on size and processed in parallel. The API may leave some requests
+        unprocessed, typically when it is rate limiting. With `unprocessed_retries`, those requests are sent again in
+        further rounds, re-packed into full batches, with an exponentially growing delay before each round, and the
+        results of all the rounds are merged.
 
         https://docs.apify.com/api/v2#/reference/request-queues/batch-request-operations/add-requests
 
         Args:
             requests: List of requests to be added to the queue.
             forefront: Whether to add requests to the front of the queue.
-            max_parallel: Specifies the maximum number of parallel tasks for API calls. This is only applicable
-                to the async client. For the sync client, this value must be set to 1, as parallel execution
-                is not supported.
+            max_parallel: Specifies the maximum number of batches sent to the API in parallel. The sync client
+                sends them from a pool of threads, the async client from concurrent tasks.
+            unprocessed_retries: Maximum number of rounds in which requests left unprocessed are sent again.
+                By default, they are returned in the result without being retried.
+            unprocessed_retry_delay: Delay before the first round of retries, doubled before each following round.
             timeout: Timeout for the API HTTP request.
 
         Returns:
-            Result containing lists of processed and unprocessed requests.
+            Result containing lists of processed requests from all the rounds, and of requests left unprocessed
+            after the last round.
         """
         # Validate and serialize the requests in a worker thread, as it is CPU-bound and would block the event loop.
         serialized_requests = await asyncio.to_thread(_serialize_requests, requests)
@@ -1006,53 +1304,165 @@ class RequestQueueClientAsync(ResourceClientAsync):
         # Build the query parameters shared by all the batch API calls.
         request_params = self._build_params(clientKey=self.client_key, forefront=forefront)
 
-        # Compute the payload size limit to ensure it doesn't exceed the maximum allowed size.
-        payload_size_limit_bytes = _MAX_PAYLOAD_SIZE_BYTES - math.ceil(_MAX_PAYLOAD_SIZE_BYTES * _SAFETY_BUFFER_PERCENT)
-
-        # Split the requests into batches by payload size (counting commas and brackets) and max requests per batch.
-        batches = constrained_batches(
-            serialized_requests,
-            max_size=payload_size_limit_bytes - len(b'[]'),
-            max_count=_RQ_MAX_REQUESTS_PER_BATCH,
-            get_len=lambda serialized: len(serialized) + len(b','),
-            strict=False,
+        result = await self._add_serialized_requests(
+            serialized_requests, request_params=request_params, max_parallel=max_parallel, timeout=timeout
         )
+        processed_requests = list(result.processed_requests)
+        unprocessed_requests = result.unprocessed_requests
 
-        # Create a queue with all the batches, from which the worker tasks will consume them.
-        batch_queue: asyncio.Queue[Iterable[bytes]] = asyncio.Queue()
+        # Send the unprocessed requests again, re-packed into full batches, backing off more before each round.
+        for retry in range(unprocessed_retries):
+            if not unprocessed_requests:
+                break
+            await asyncio.sleep(to_seconds(unprocessed_retry_delay) * 2**retry)
+            serialized_requests = await asyncio.to_thread(
+                _select_unprocessed, serialized_requests, unprocessed_requests
+            )
+            result = await self._add_serialized_requests(
+                serialized_requests, request_params=request_params, max_parallel=max_parallel, timeout=timeout
+            )
+            processed_requests.extend(result.processed_requests)
+            unprocessed_requests = result.unprocessed_requests
 
-        for batch in batches:
-            await batch_queue.put(batch)
+        return BatchAddResponse.model_construct(
+            data=BatchAddResult.model_construct(
+                processed_requests=processed_requests,
+                unprocessed_requests=unprocessed_requests,
+            )
+        ).data
 
-        # Use TaskGroup for structured concurrency — automatic cleanup and error propagation.
-        try:
-            async with asyncio.TaskGroup() as tg:
-                workers = [
-                    tg.create_task(
-                        self._batch_add_requests_worker(
-                            queue=batch_queue, request_params=request_params, timeout=timeout
-                        ),
-                        name=f'batch_add_requests_worker_{i}',
+    def batch_add_requests_streamed(
+        self,
+        requests: Iterable[RequestDraft | RequestDraftDict | RequestDraftCamelDict]
+        | AsyncIterable[RequestDraft | RequestDraftDict | RequestDraftCamelDict],
+        *,
+        forefront: bool = False,
+        max_parallel: int = 5,
+        timeout: Timeout = 'medium',
+    ) -> AsyncIterator[BatchAddResult]:
+        """Add requests to the request queue in batches, consuming them lazily and yielding the result of each batch.
+
+        Unlike `batch_add_requests`, which takes a list and returns the merged result at the end, this method takes any
+        iterable of requests, such as a generator, and validates, serializes and batches them only as fast as the
+        batches are sent, with at most `max_parallel` batches in flight. The result of each batch is yielded as soon
+        as the batch completes, so the memory stays bounded however many requests there are. The iteration stops with
+        the error of the first batch that fails.
+
+        https://docs.apify.com/api/v2#/reference/request-queues/batch-request-operations/add-requests
+
+        Args:
+            requests: The requests to be added to the queue.
+            forefront: Whether to add requests to the front of the queue.
+            max_parallel: Maximum number of batches sent at the same time.
+            timeout: Timeout for the API HTTP request of each batch.
+
+        Returns:
+            An iterator of the results of the batches, in the order the batches completed.
+        """
+        if max_parallel < 1:
+            raise ValueError(f'max_parallel must be at least 1, got {max_parallel}')
+
+        request_params = self._build_params(clientKey=self.client_key, forefront=forefront)
+
+        async def iterate_results() -> AsyncIterator[BatchAddResult]:
+            # Each request is serialized on the event loop as it is consumed. It takes only microseconds, unlike
+            # serializing a whole list of requests at once, which `batch_add_requests` moves to a worker thread.
+            batches = aconstrained_batches(
+                (_serialize_request(request) async for request in iterate_any(requests)),
+                max_size=PAYLOAD_SIZE_LIMIT_BYTES - len(b'[]'),
+                max_count=_RQ_MAX_REQUESTS_PER_BATCH,
+                get_len=lambda serialized: len(serialized) + len(b','),
+            )
+            in_flight = set[asyncio.Task[BatchAddResult]]()
+            try:
+                async for batch in batches:
+                    in_flight.add(
+                        asyncio.create_task(
+                            self._send_request_batch(batch, request_params=request_params, timeout=timeout)
+                        )
                     )
-                    for i in range(max_parallel)
-                ]
+                    # Read the next batch only once a slot is free, so the input is not consumed ahead of the sends.
+                    if len(in_flight) >= max_parallel:
+                        done, in_flight = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                        for task in done:
+                            yield task.result()
+
+                while in_flight:
+                    done, in_flight = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                    for task in done:
+                        yield task.result()
+            finally:
+                # Batches still in flight when a batch fails, or the iteration is abandoned, are not waited for.
+                for task in in_flight:
+                    task.cancel()
+                await asyncio.gather(*in_flight, return_exceptions=True)
 
-                # Wait for all batches to be processed, then cancel idle workers.
-                await batch_queue.join()
-                for worker in workers:
-                    worker.cancel()
-        except ExceptionGroup as eg:
-            # Re-raise the first worker exception directly to maintain backward-compatible error types.
-            raise eg.exceptions[0] from None
+        return iterate_results()
 
-        # Combine the results from all workers and return them.
+    async def copy_to(
+        self,
+        target: RequestQueueClientAsync,
+        *,
+        forefront: bool = False,
+        max_parallel: int = 5,
+        timeout: Timeout = 'medium',
+    ) -> BatchAddResult:
+        """Copy the requests of this request queue into another request queue.
+
+        The requests are listed page by page with `iterate_requests` and added to the target queue with
+        `batch_add_requests`, with at most `max_parallel` pages of up to 1000 requests being added at the
+        same time, so only those pages are held in memory however many requests the queue has. The requests keep
+        their state, so handled requests stay handled in the target queue. The target can belong to another client,
+        for example one with the token of another account.
+
+        https://docs.apify.com/api/v2#/reference/request-queues/batch-request-operations/add-requests
+
+        Args:
+            target: The request queue to copy the requests into.
+            forefront: Whether to add the requests to the front of the target queue.
+            max_parallel: Maximum number of pages of requests added at the same time.
+            timeout: Timeout for the API HTTP requests.
+
+        Returns:
+            Result containing lists of processed and unprocessed requests.
+        """
+        if max_parallel < 1:
+            raise ValueError(f'max_parallel must be at least 1, got {max_parallel}')
+
+        async def add_page(page: list[RequestDraft]) -> BatchAddResult:
+            return await target.batch_add_requests(page, forefront=forefront, max_parallel=1, timeout=timeout)
+
+        pages = aconstrained_batches(
+            (_request_to_draft(request) async for request in self.iterate_requests(timeout=timeout)),
+            max_size=DEFAULT_CHUNK_SIZE,
+            get_len=lambda _: 1,
+        )
         processed_requests = list[AddedRequest]()
         unprocessed_requests = list[RequestDraft]()
 
-        for worker in workers:
-            result = worker.result()
-            processed_requests.extend(result.data.processed_requests)
-            unprocessed_requests.extend(result.data.unprocessed_requests)
+        def collect(done: Iterable[asyncio.Task[BatchAddResult]]) -> None:
+            for task in done:
+                result = task.result()
+                processed_requests.extend(result.processed_requests)
+                unprocessed_requests.extend(result.unprocessed_requests)
+
+        in_flight = set[asyncio.Task[BatchAddResult]]()
+        try:
+            async for page in pages:
+                # Keep at most `max_parallel` pages in flight, so the queue is not listed ahead of the additions.
+                if len(in_flight) >= max_parallel:
+                    done, in_flight = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                    collect(done)
+                in_flight.add(asyncio.create_task(add_page(page)))
+
+            if in_flight:
+                done, in_flight = await asyncio.wait(in_flight)
+                collect(done)
+        finally:
+            # Additions still running when a page fails, or the call is cancelled, are not waited for.
+            for task in in_flight:
+                task.cancel()
+            await asyncio.gather(*in_flight, return_exceptions=True)
 
         return BatchAddResponse.model_construct(
             data=BatchAddResult.model_construct(
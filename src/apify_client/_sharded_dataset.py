@@ -0,0 +1,481 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import itertools
+import json
+import threading
+from dataclasses import dataclass
+from datetime import timedelta
+from queue import Full, Queue
+from typing import TYPE_CHECKING, Any, Self
+
+from apify_client._docs import docs_group
+from apify_client._utils.batching import PAYLOAD_SIZE_LIMIT_BYTES
+from apify_client._utils.concurrency import ContextThreadPoolExecutor
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Callable, Iterator
+    from types import TracebackType
+
+    from apify_client._dataset_writer import DatasetWriter, DatasetWriterAsync, DatasetWriterBatchFailure
+    from apify_client._resource_clients import DatasetClient, DatasetClientAsync
+    from apify_client.types import JsonSerializable, Timeout
+
+_STOP_POLL_INTERVAL_SECONDS = 0.1
+"""How often a shard reader blocked on a full queue checks whether the iteration was abandoned."""
+
+
+def shard_dataset_name(name: str, index: int) -> str:
+    """Return the name of the dataset holding the shard `index` of the sharded dataset `name`."""
+    return f'{name}-shard-{index}'
+
+
+@dataclass
+class _ShardFailure:
+    """An exception raised while reading a shard, passed on to the iterating caller."""
+
+    error: Exception
+
+
+_SHARD_DONE = object()
+"""Marker a shard reader puts into the queue once it has read all the items of its shard."""
+
+
+class ShardedDatasetWriterBase:
+    """Base class for routing the items of `ShardedDatasetWriter` to the shards."""
+
+    def __init__(self, *, shards: int, shard_key: str | Callable[[Any], Any] | None) -> None:
+        self._shards = shards
+        self._shard_key = shard_key
+        self._next_shards = itertools.cycle(range(shards))
+
+    def _pick_shard(self, item: Any) -> int:
+        """Return the shard for the item, by the hash of its key or round-robin when no key is configured."""
+        if self._shard_key is None:
+            return next(self._next_shards)
+        if callable(self._shard_key):
+            key = self._shard_key(item)
+        else:
+            key = item.get(self._shard_key) if isinstance(item, dict) else None
+        # A hash that is stable across processes, unlike the built-in `hash` of strings.
+        encoded = json.dumps(key, sort_keys=True, default=str).encode('utf-8')
+        return int.from_bytes(hashlib.blake2b(encoded, digest_size=8).digest(), 'big') % self._shards
+
+
+@docs_group('Other')
+class ShardedDatasetWriter(ShardedDatasetWriterBase):
+    """Spreads dataset items over the shards of a sharded dataset and pushes them in batches.
+
+    Each shard has its own `DatasetWriter`, so the batches of different shards are pushed concurrently and the write
+    rate is not capped by the rate limit of a single dataset. Items go to the shards round-robin, or by the hash of a
+    key when `shard_key` is given, which keeps items with the same key in the same shard.
+
+    Can be used as a context manager, which flushes the remaining items and stops the writers on exit. Alternatively,
+    call `close` manually. Obtain an instance via `ShardedDataset.get_writer`.
+    """
+
+    def __init__(
+        self,
+        dataset_clients: list[DatasetClient],
+        *,
+        shard_key: str | Callable[[Any], Any] | None,
+        max_batch_bytes: int,
+        max_batch_items: int,
+        flush_interval: timedelta,
+        max_pending_batches: int,
+        on_batch_error: Callable[[DatasetWriterBatchFailure], None] | None,
+        timeout: Timeout,
+    ) -> None:
+        """Initialize `ShardedDatasetWriter`.
+
+        Args:
+            dataset_clients: The clients of the shard datasets, in the order of the shards.
+            shard_key: Name of the item field, or a function returning the key from the item, whose hash picks
+                the shard. Items are spread round-robin if not given.
+            max_batch_bytes: Maximum size of the body of a single push request, in bytes.
+            max_batch_items: Maximum number of items in a single push request.
+            flush_interval: Longest time buffered items wait before they are pushed.
+            max_pending_batches: Maximum number of completed batches per shard waiting to be pushed before adding
+                items blocks.
+            on_batch_error: Function called with each batch that fails to be pushed.
+            timeout: Timeout for the API HTTP request of each batch.
+        """
+        super().__init__(shards=len(dataset_clients), shard_key=shard_key)
+        self._writers: list[DatasetWriter] = [
+            dataset_client.get_writer(
+                max_batch_bytes=max_batch_bytes,
+                max_batch_items=max_batch_items,
+                flush_interval=flush_interval,
+                max_pending_batches=max_pending_batches,
+                on_batch_error=on_batch_error,
+                timeout=timeout,
+            )
+            for dataset_client in dataset_clients
+        ]
+        self._lock = threading.Lock()
+
+    @property
+    def failures(self) -> list[DatasetWriterBatchFailure]:
+        """The batches that could not be pushed so far, shard by shard."""
+        return [failure for writer in self._writers for failure in writer.failures]
+
+    def add(self, item: JsonSerializable) -> None:
+        """Add an item to the buffer of its shard, blocking while that shard has too many batches waiting.
+
+        Args:
+            item: The item to push into the sharded dataset.
+        """
+        with self._lock:
+            index = self._pick_shard(item)
+        self._writers[index].add(item)
+
+    def flush(self) -> None:
+        """Push all buffered items of all the shards and wait until every batch added so far is pushed."""
+        self._for_each_writer(lambda writer: writer.flush())
+
+    def close(self) -> None:
+        """Push all buffered items of all the shards, wait until they are pushed and stop the writers."""
+        self._for_each_writer(lambda writer: writer.close())
+
+    def __enter__(self) -> Self:
+        """Return the writer. Exiting the context will flush the remaining items and stop the writers."""
+        return self
+
+    def __exit__(
+        self, exc_type: type[BaseException] | None, exc_val: BaseException | None, exc_tb: TracebackType | None
+    ) -> None:
+        """Flush the remaining items and stop the writers."""
+        self.close()
+
+    def _for_each_writer(self, action: Callable[[DatasetWriter], None]) -> None:
+        # The shards are waited on at the same time, so the slowest shard alone determines how long this takes.
+        with ContextThreadPoolExecutor(max_workers=len(self._writers)) as executor:
+            list(executor.map(action, self._writers))
+
+
+@docs_group('Other')
+class ShardedDatasetWriterAsync(ShardedDatasetWriterBase):
+    """Spreads dataset items over the shards of a sharded dataset and pushes them in batches.
+
+    Each shard has its own `DatasetWriterAsync`, so the batches of different shards are pushed concurrently and the
+    write rate is not capped by the rate limit of a single dataset. Items go to the shards round-robin, or by the hash
+    of a key when `shard_key` is given, which keeps items with the same key in the same shard.
+
+    Can be used as an async context manager, which flushes the remaining items and stops the writers on exit.
+    Alternatively, call `close` manually. Obtain an instance via `ShardedDatasetAsync.get_writer`.
+    """
+
+    def __init__(
+        self,
+        dataset_clients: list[DatasetClientAsync],
+        *,
+        shard_key: str | Callable[[Any], Any] | None,
+        max_batch_bytes: int,
+        max_batch_items: int,
+        flush_interval: timedelta,
+        max_pending_batches: int,
+        on_batch_error: Callable[[DatasetWriterBatchFailure], None] | None,
+        timeout: Timeout,
+    ) -> None:
+        """Initialize `ShardedDatasetWriterAsync`.
+
+        Args:
+            dataset_clients: The async clients of the shard datasets, in the order of the shards.
+            shard_key: Name of the item field, or a function returning the key from the item, whose hash picks
+                the shard. Items are spread round-robin if not given.
+            max_batch_bytes: Maximum size of the body of a single push request, in bytes.
+            max_batch_items: Maximum number of items in a single push request.
+            flush_interval: Longest time buffered items wait before they are pushed.
+            max_pending_batches: Maximum number of completed batches per shard waiting to be pushed before adding
+                items waits.
+            on_batch_error: Function called with each batch that fails to be pushed.
+            timeout: Timeout for the API HTTP request of each batch.
+        """
+        super().__init__(shards=len(dataset_clients), shard_key=shard_key)
+        self._writers: list[DatasetWriterAsync] = [
+            dataset_client.get_writer(
+                max_batch_bytes=max_batch_bytes,
+                max_batch_items=max_batch_items,
+                flush_interval=flush_interval,
+                max_pending_batches=max_pending_batches,
+                on_batch_error=on_batch_error,
+                timeout=timeout,
+            )
+            for dataset_client in dataset_clients
+        ]
+
+    @property
+    def failures(self) -> list[DatasetWriterBatchFailure]:
+        """The batches that could not be pushed so far, shard by shard."""
+        return [failure for writer in self._writers for failure in writer.failures]
+
+    async def add(self, item: JsonSerializable) -> None:
+        """Add an item to the buffer of its shard, waiting while that shard has too many batches waiting.
+
+        Args:
+            item: The item to push into the sharded dataset.
+        """
+        await self._writers[self._pick_shard(item)].add(item)
+
+    async def flush(self) -> None:
+        """Push all buffered items of all the shards and wait until every batch added so far is pushed."""
+        await asyncio.gather(*(writer.flush() for writer in self._writers))
+
+    async def close(self) -> None:
+        """Push all buffered items of all the shards, wait until they are pushed and stop the writers."""
+        await asyncio.gather(*(writer.close() for writer in self._writers))
+
+    async def __aenter__(self) -> Self:
+        """Return the writer. Exiting the context will flush the remaining items and stop the writers."""
+        return self
+
+    async def __aexit__(
+        self, exc_type: type[BaseException] | None, exc_val: BaseException | None, exc_tb: TracebackType | None
+    ) -> None:
+        """Flush the remaining items and stop the writers."""
+        await self.close()
+
+
+@docs_group('Other')
+class ShardedDataset:
+    """A logical dataset spread over several shard datasets, to get past the write rate limit of a single dataset.
+
+    Write to the shards with the writer from `get_writer`, and read all of them back with `iterate_items`. The order
+    of items is kept within a shard, but not across the shards. Obtain an instance via
+    `DatasetCollectionClient.get_or_create_sharded`.
+    """
+
+    def __init__(self, dataset_clients: list[DatasetClient]) -> None:
+        """Initialize `ShardedDataset`.
+
+        Args:
+            dataset_clients: The clients of the shard datasets, in the order of the shards.
+        """
+        self._dataset_clients = dataset_clients
+
+    @property
+    def dataset_clients(self) -> list[DatasetClient]:
+        """The clients of the shard datasets, in the order of the shards."""
+        return list(self._dataset_clients)
+
+    def get_writer(
+        self,
+        *,
+        shard_key: str | Callable[[Any], Any] | None = None,
+        max_batch_bytes: int = PAYLOAD_SIZE_LIMIT_BYTES,
+        max_batch_items: int = 1000,
+        flush_interval: timedelta = timedelta(seconds=5),
+        max_pending_batches: int = 2,
+        on_batch_error: Callable[[DatasetWriterBatchFailure], None] | None = None,
+        timeout: Timeout = 'medium',
+    ) -> ShardedDatasetWriter:
+        """Get a writer that spreads the items over the shards and pushes them in batches.
+
+        Args:
+            shard_key: Name of the item field, or a function returning the key from the item, whose hash picks
+                the shard. Items with the same key always end up in the same shard. Items are spread round-robin
+                if not given.
+            max_batch_bytes: Maximum size of the body of a single push request, in bytes. Defaults to the largest
+                payload the API accepts.
+            max_batch_items: Maximum number of items in a single push request.
+            flush_interval: Longest time buffered items wait before they are pushed.
+            max_pending_batches: Maximum number of completed batches per shard waiting to be pushed.
+            on_batch_error: Function called with each batch that fails to be pushed.
+            timeout: Timeout for the API HTTP request of each batch.
+
+        Returns:
+            The sharded dataset writer for pushing the items.
+        """
+        return ShardedDatasetWriter(
+            self._dataset_clients,
+            shard_key=shard_key,
+            max_batch_bytes=max_batch_bytes,
+            max_batch_items=max_batch_items,
+            flush_interval=flush_interval,
+            max_pending_batches=max_pending_batches,
+            on_batch_error=on_batch_error,
+            timeout=timeout,
+        )
+
+    def iterate_items(
+        self,
+        *,
+        clean: bool | None = None,
+        fields: list[str] | None = None,
+        omit: list[str] | None = None,
+        max_buffered_items: int = 1000,
+        timeout: Timeout = 'long',
+    ) -> Iterator[dict[str, Any]]:
+        """Iterate over the items of all the shards, reading the shards at the same time.
+
+        Each shard is read page by page in its own thread, and the items are yielded as they arrive, so the order is
+        kept within a shard but the shards are interleaved.
+
+        Args:
+            clean: If True, returns only non-empty items and skips hidden fields (i.e. fields starting with
+                the # character).
+            fields: A list of fields which should be picked from the items.
+            omit: A list of fields which should be omitted from the items.
+            max_buffered_items: Maximum number of items read ahead of the iteration.
+            timeout: Timeout for the API HTTP request of each page.
+
+        Yields:
+            An item from one of the shards.
+        """
+        queue = Queue[Any](maxsize=max_buffered_items)
+        stopped = threading.Event()
+
+        def put(entry: Any) -> bool:
+            # Blocking on the queue for good would keep the thread alive after the caller stopped iterating.
+            while not stopped.is_set():
+                try:
+                    queue.put(entry, timeout=_STOP_POLL_INTERVAL_SECONDS)
+                except Full:
+                    continue
+                return True
+            return False
+
+        def read_shard(dataset_client: DatasetClient) -> None:
+            try:
+                for item in dataset_client.iterate_items(clean=clean, fields=fields, omit=omit, timeout=timeout):
+                    if not put(item):
+                        return
+            except Exception as exc:
+                put(_ShardFailure(exc))
+                return
+            put(_SHARD_DONE)
+
+        threads = [
+            threading.Thread(target=read_shard, args=(dataset_client,), daemon=True)
+            for dataset_client in self._dataset_clients
+        ]
+        for thread in threads:
+            thread.start()
+
+        try:
+            remaining = len(threads)
+            while remaining:
+                entry = queue.get()
+                if entry is _SHARD_DONE:
+                    remaining -= 1
+                elif isinstance(entry, _ShardFailure):
+                    raise entry.error
+                else:
+                    yield entry
+        finally:
+            stopped.set()
+
+
+@docs_group('Other')
+class ShardedDatasetAsync:
+    """A logical dataset spread over several shard datasets, to get past the write rate limit of a single dataset.
+
+    Write to the shards with the writer from `get_writer`, and read all of them back with `iterate_items`. The order
+    of items is kept within a shard, but not across the shards. Obtain an instance via
+    `DatasetCollectionClientAsync.get_or_create_sharded`.
+    """
+
+    def __init__(self, dataset_clients: list[DatasetClientAsync]) -> None:
+        """Initialize `ShardedDatasetAsync`.
+
+        Args:
+            dataset_clients: The async clients of the shard datasets, in the order of the shards.
+        """
+        self._dataset_clients = dataset_clients
+
+    @property
+    def dataset_clients(self) -> list[DatasetClientAsync]:
+        """The clients of the shard datasets, in the order of the shards."""
+        return list(self._dataset_clients)
+
+    def get_writer(
+        self,
+        *,
+        shard_key: str | Callable[[Any], Any] | None = None,
+        max_batch_bytes: int = PAYLOAD_SIZE_LIMIT_BYTES,
+        max_batch_items: int = 1000,
+        flush_interval: timedelta = timedelta(seconds=5),
+        max_pending_batches: int = 2,
+        on_batch_error: Callable[[DatasetWriterBatchFailure], None] | None = None,
+        timeout: Timeout = 'medium',
+    ) -> ShardedDatasetWriterAsync:
+        """Get a writer that spreads the items over the shards and pushes them in batches.
+
+        Args:
+            shard_key: Name of the item field, or a function returning the key from the item, whose hash picks
+                the shard. Items with the same key always end up in the same shard. Items are spread round-robin
+                if not given.
+            max_batch_bytes: Maximum size of the body of a single push request, in bytes. Defaults to the largest
+                payload the API accepts.
+            max_batch_items: Maximum number of items in a single push request.
+            flush_interval: Longest time buffered items wait before they are pushed.
+            max_pending_batches: Maximum number of completed batches per shard waiting to be pushed.
+            on_batch_error: Function called with each batch that fails to be pushed.
+            timeout: Timeout for the API HTTP request of each batch.
+
+        Returns:
+            The sharded dataset writer for pushing the items.
+        """
+        return ShardedDatasetWriterAsync(
+            self._dataset_clients,
+            shard_key=shard_key,
+            max_batch_bytes=max_batch_bytes,
+            max_batch_items=max_batch_items,
+            flush_interval=flush_interval,
+            max_pending_batches=max_pending_batches,
+            on_batch_error=on_batch_error,
+            timeout=timeout,
+        )
+
+    async def iterate_items(
+        self,
+        *,
+        clean: bool | None = None,
+        fields: list[str] | None = None,
+        omit: list[str] | None = None,
+        max_buffered_items: int = 1000,
+        timeout: Timeout = 'long',
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Iterate over the items of all the shards, reading the shards at the same time.
+
+        Each shard is read page by page in its own task, and the items are yielded as they arrive, so the order is
+        kept within a shard but the shards are interleaved.
+
+        Args:
+            clean: If True, returns only non-empty items and skips hidden fields (i.e. fields starting with
+                the # character).
+            fields: A list of fields which should be picked from the items.
+            omit: A list of fields which should be omitted from the items.
+            max_buffered_items: Maximum number of items read ahead of the iteration.
+            timeout: Timeout for the API HTTP request of each page.
+
+        Yields:
+            An item from one of the shards.
+        """
+        queue = asyncio.Queue[Any](maxsize=max_buffered_items)
+
+        async def read_shard(dataset_client: DatasetClientAsync) -> None:
+            try:
+                async for item in dataset_client.iterate_items(clean=clean, fields=fields, omit=omit, timeout=timeout):
+                    await queue.put(item)
+            except Exception as exc:
+                await queue.put(_ShardFailure(exc))
+                return
+            await queue.put(_SHARD_DONE)
+
+        tasks = [asyncio.create_task(read_shard(dataset_client)) for dataset_client in self._dataset_clients]
+        try:
+            remaining = len(tasks)
+            while remaining:
+                entry = await queue.get()
+                if entry is _SHARD_DONE:
+                    remaining -= 1
+                elif isinstance(entry, _ShardFailure):
+                    raise entry.error
+                else:
+                    yield entry
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
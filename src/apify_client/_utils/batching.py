@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import json
+import math
+from collections.abc import AsyncIterable
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from apify_client._consts import MAX_PAYLOAD_SIZE_BYTES, PAYLOAD_SAFETY_BUFFER_PERCENT
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Callable, Iterable
+
+T = TypeVar('T')
+
+PAYLOAD_SIZE_LIMIT_BYTES = MAX_PAYLOAD_SIZE_BYTES - math.ceil(MAX_PAYLOAD_SIZE_BYTES * PAYLOAD_SAFETY_BUFFER_PERCENT)
+"""Largest request body, in bytes, that batching helpers pack, leaving the safety margin below the API limit."""
+
+
+def serialize_json(value: Any) -> bytes:
+    """Serialize a value into the JSON bytes it will occupy in a request body.
+
+    Uses the same `json.dumps` options as `HttpClientBase._prepare_request_call` to keep the wire format consistent
+    with other endpoints.
+    """
+    return json.dumps(value, ensure_ascii=False, allow_nan=False, default=str).encode('utf-8')
+
+
+def join_json_array(serialized_values: Iterable[bytes]) -> bytes:
+    """Assemble already serialized values into the body of a JSON array."""
+    return b'[' + b','.join(serialized_values) + b']'
+
+
+async def iterate_any(values: Iterable[T] | AsyncIterable[T]) -> AsyncIterator[T]:
+    """Iterate a sync or an async iterable alike, so async callers can accept both."""
+    if isinstance(values, AsyncIterable):
+        async for value in values:
+            yield value
+    else:
+        for value in values:
+            yield value
+
+
+async def aconstrained_batches(
+    values: Iterable[T] | AsyncIterable[T],
+    *,
+    max_size: int,
+    get_len: Callable[[T], int],
+    max_count: int | None = None,
+) -> AsyncIterator[list[T]]:
+    """Split values into batches of bounded total size and count, consuming the input lazily.
+
+    An async counterpart of `more_itertools.constrained_batches` with `strict=False`: a value larger than `max_size`
+    gets a batch of its own.
+    """
+    batch = list[T]()
+    batch_size = 0
+    async for value in iterate_any(values):
+        value_size = get_len(value)
+        if batch and (batch_size + value_size > max_size or len(batch) == max_count):
+            yield batch
+            batch = []
+            batch_size = 0
+        batch.append(value)
+        batch_size += value_size
+    if batch:
+        yield batch
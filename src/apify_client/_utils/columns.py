@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import importlib
+from array import array
+from typing import TYPE_CHECKING, Any, Literal
+
+from apify_client._utils.try_import import try_import
+
+if TYPE_CHECKING:
+    from types import ModuleType
+
+_INT64_MIN = -(2**63)
+_INT64_MAX = 2**63 - 1
+
+_ColumnKind = Literal['bool', 'int', 'float', 'str', 'object']
+
+_ARRAY_TYPECODES: dict[_ColumnKind, str] = {'bool': 'B', 'int': 'q', 'float': 'd'}
+"""Typecodes of the `array.array` buffers of the numeric and boolean columns - 1-byte bools, int64 and float64."""
+
+
+def import_column_libraries() -> tuple[ModuleType | None, ModuleType | None]:
+    """Import numpy and pyarrow to build the columns with, each as None if it is not installed.
+
+    They are imported only when columns are built, as importing them takes long and most users never build columns.
+    """
+    numpy = pyarrow = None
+    with try_import(__name__, dependency_name='numpy'):
+        numpy = importlib.import_module('numpy')
+    with try_import(__name__, dependency_name='pyarrow'):
+        pyarrow = importlib.import_module('pyarrow')
+    return numpy, pyarrow
+
+
+def _kind_of(value: Any) -> _ColumnKind:
+    # `bool` is a subclass of `int`, so it has to be checked first.
+    if isinstance(value, bool):
+        return 'bool'
+    if isinstance(value, int):
+        return 'int' if _INT64_MIN <= value <= _INT64_MAX else 'object'
+    if isinstance(value, float):
+        return 'float'
+    if isinstance(value, str):
+        return 'str'
+    return 'object'
+
+
+def _common_kind(kind: _ColumnKind, other: _ColumnKind) -> _ColumnKind:
+    return 'float' if {kind, other} == {'int', 'float'} else 'object'
+
+
+class ColumnBuilder:
+    """Accumulate the values of one field into a typed column buffer.
+
+    Booleans, integers and floats are packed into an `array.array`, which takes one or eight bytes per value instead
+    of a Python object each. The kind of the column is taken from its first non-null value and widened when a later
+    value does not fit - integers to floats, and anything else mixed to a list of Python objects.
+    """
+
+    def __init__(self) -> None:
+        self._kind: _ColumnKind | None = None
+        self._values: array | list[Any] = []
+        self._null_positions = list[int]()
+
+    def append(self, value: Any) -> None:
+        """Append the next value of the field, None standing for a null or a missing value."""
+        if value is None:
+            self._null_positions.append(len(self._values))
+            self._values.append(self._null_placeholder())
+            return
+
+        kind = _kind_of(value)
+        if self._kind is None:
+            self._convert(kind)
+        elif kind != self._kind:
+            # The values collected so far are rebuilt only when the column widens, so that every integer in a float
+            # column, or every value in an object column, does not copy the whole column again.
+            common = _common_kind(self._kind, kind)
+            if common != self._kind:
+                self._convert(common)
+
+        self._values.append(float(value) if self._kind == 'float' else value)
+
+    def build(self, *, numpy: ModuleType | None, pyarrow: ModuleType | None) -> Any:
+        """Return the finished column.
+
+        Numeric and boolean columns become NumPy arrays when NumPy is available, and `array.array` buffers
+        otherwise. Integer columns with nulls become float columns with NaN in place of the nulls, and boolean
+        columns with nulls become object columns. String columns become Arrow string arrays when PyArrow is
+        available, and lists otherwise.
+        """
+        if self._null_positions and self._kind in ('int', 'bool'):
+            self._convert('float' if self._kind == 'int' else 'object')
+
+        values = self._values
+        if isinstance(values, array):
+            if numpy is None:
+                return values
+            dtype = {'B': numpy.bool_, 'q': numpy.int64, 'd': numpy.float64}[values.typecode]
+            # The array buffer is shared with NumPy instead of being copied.
+            return numpy.frombuffer(values, dtype=dtype)
+
+        if self._kind in ('str', None) and pyarrow is not None:
+            return pyarrow.array(values, type=pyarrow.string())
+        return values
+
+    def _null_placeholder(self) -> Any:
+        if self._kind == 'float':
+            return float('nan')
+        return 0 if self._kind in _ARRAY_TYPECODES else None
+
+    def _convert(self, kind: _ColumnKind) -> None:
+        """Rebuild the values collected so far as a column of another kind."""
+        nulls = set(self._null_positions)
+        previous_kind, values = self._kind, self._values
+        self._kind = kind
+        placeholder = self._null_placeholder()
+
+        typecode = _ARRAY_TYPECODES.get(kind)
+        if typecode is not None:
+            cast = float if kind == 'float' else int
+            self._values = array(
+                typecode, (placeholder if index in nulls else cast(value) for index, value in enumerate(values))
+            )
+        else:
+            cast = bool if previous_kind == 'bool' else _identity
+            self._values = [None if index in nulls else cast(value) for index, value in enumerate(values)]
+
+
+def _identity(value: Any) -> Any:
+    return value
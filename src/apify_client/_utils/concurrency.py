@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, ParamSpec, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from concurrent.futures import Future
+
+P = ParamSpec('P')
+T = TypeVar('T')
+
+
+class ContextThreadPoolExecutor(ThreadPoolExecutor):
+    """Thread pool that runs each task in a copy of the context the task was submitted from.
+
+    Worker threads do not inherit context variables, so without the copy the log context set by the client method
+    submitting the tasks would be missing from the log records of the requests they make. Each task gets its own copy,
+    the way each asyncio task does, which covers `map` as well, as it submits through `submit`.
+    """
+
+    def submit(self, fn: Callable[P, T], /, *args: P.args, **kwargs: P.kwargs) -> Future[T]:
+        """Submit a task to run in a copy of the current context."""
+        context = contextvars.copy_context()
+
+        def run() -> T:
+            return context.run(fn, *args, **kwargs)
+
+        return super().submit(run)
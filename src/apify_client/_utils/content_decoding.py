@@ -0,0 +1,288 @@
+from __future__ import annotations
+
+import json
+import re
+import zlib
+from itertools import chain
+from typing import TYPE_CHECKING, Any
+
+from typing_extensions import Protocol
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterable, AsyncIterator, Iterable, Iterator, Mapping
+
+    from apify_client.http_clients import HttpResponse
+
+_GZIP_MAGIC = b'\x1f\x8b'
+
+_HEAD_SIZE = 2
+"""Number of leading bytes of a body that tell whether it starts with a gzip or zlib header."""
+
+
+class _Decompression(Protocol):
+    """Incremental decompression of one body, as provided by `zlib.decompressobj`."""
+
+    def decompress(self, data: bytes, /) -> bytes: ...
+
+    def flush(self) -> bytes: ...
+
+
+class _BrotliDecompression:
+    """Adapts `brotli.Decompressor` to the `decompress`/`flush` methods of `zlib.decompressobj`."""
+
+    def __init__(self) -> None:
+        import brotli  # noqa: PLC0415
+
+        self._brotli = brotli
+        self._decompressor = brotli.Decompressor()
+
+    def decompress(self, data: bytes) -> bytes:
+        try:
+            return self._decompressor.process(data)
+        except self._brotli.error as exc:
+            raise ValueError(f'Invalid brotli data: {exc}') from exc
+
+    def flush(self) -> bytes:
+        return b''
+
+
+def get_content_encoding(headers: Mapping[str, str]) -> str:
+    """Return the normalized `Content-Encoding` of a response, `identity` if it has none."""
+    return headers.get('content-encoding', 'identity').strip().lower() or 'identity'
+
+
+def _has_zlib_header(head: bytes) -> bool:
+    """Whether a body starts with the two-byte zlib header that wraps a deflate stream."""
+    return len(head) >= 2 and head[0] & 0x0F == zlib.DEFLATED and (head[0] << 8 | head[1]) % 31 == 0  # noqa: PLR2004
+
+
+def looks_compressed(content_encoding: str, head: bytes) -> bool:
+    """Whether a body that begins with `head` starts with the header a `content_encoding` compressed body is told by.
+
+    The client does not compress such a value for storage. Once the HTTP client decoded the stored body, it could not
+    be told apart from one that is still compressed, and would be decompressed a second time on read.
+    """
+    if content_encoding == 'gzip':
+        return head.startswith(_GZIP_MAGIC)
+    return content_encoding == 'deflate' and _has_zlib_header(head)
+
+
+def peek_head(chunks: Iterable[bytes]) -> tuple[bytes, Iterator[bytes]]:
+    """Read enough leading bytes of a chunked body for `looks_compressed`, returning them and all the chunks."""
+    iterator = iter(chunks)
+    taken = list[bytes]()
+    for chunk in iterator:
+        taken.append(chunk)
+        if sum(len(piece) for piece in taken) >= _HEAD_SIZE:
+            break
+    return b''.join(taken)[:_HEAD_SIZE], chain(taken, iterator)
+
+
+async def apeek_head(chunks: AsyncIterable[bytes]) -> tuple[bytes, AsyncIterator[bytes]]:
+    """Read enough leading bytes of a chunked body for `looks_compressed`, returning them and all the chunks."""
+    iterator = aiter(chunks)
+    taken = list[bytes]()
+    async for chunk in iterator:
+        taken.append(chunk)
+        if sum(len(piece) for piece in taken) >= _HEAD_SIZE:
+            break
+
+    async def all_chunks() -> AsyncIterator[bytes]:
+        for chunk in taken:
+            yield chunk
+        async for chunk in iterator:
+            yield chunk
+
+    return b''.join(taken)[:_HEAD_SIZE], all_chunks()
+
+
+def get_charset(content_type: str) -> str:
+    """Return the charset a `Content-Type` declares, `utf-8` if it declares none."""
+    charset = re.search(r'charset=["\']?([^;"\'\s]+)', content_type, flags=re.IGNORECASE)
+    return charset.group(1) if charset else 'utf-8'
+
+
+def _start_decompression(content_encoding: str, head: bytes, *, still_encoded: bool) -> _Decompression | None:
+    """Start decompressing a body that begins with `head`, or return None if it does not look compressed.
+
+    Gzip and zlib-wrapped deflate bodies are recognized by their header. A brotli body has no header, and a decoded
+    body can happen to be valid brotli data, so it is decompressed only if it is known to be `still_encoded`.
+    """
+    if content_encoding == 'gzip' and looks_compressed(content_encoding, head):
+        return zlib.decompressobj(16 + zlib.MAX_WBITS)
+    if content_encoding == 'deflate' and looks_compressed(content_encoding, head):
+        return zlib.decompressobj()
+    if content_encoding == 'br' and still_encoded:
+        try:
+            return _BrotliDecompression()
+        except ModuleNotFoundError:
+            return None
+    return None
+
+
+class RecordBodyDecoder:
+    """Incremental decoder of a record body that may still be compressed with the `Content-Encoding` it is served with.
+
+    The API serves a record with the `Content-Encoding` it was uploaded with. The default HTTP client decodes such a
+    body while it is read, so the decoder checks the first chunk and passes the body through as it is unless the body
+    still looks compressed, as it does with an HTTP client that leaves the body alone. A brotli body cannot be told
+    apart by its first chunk, so it is decoded only if it is known to be still encoded.
+    """
+
+    def __init__(self, content_encoding: str, *, still_encoded: bool = False) -> None:
+        """Initialize a new instance.
+
+        Args:
+            content_encoding: The normalized `Content-Encoding` the body is served with.
+            still_encoded: Whether the body is known not to have been decoded by the HTTP client.
+        """
+        self._content_encoding = content_encoding
+        self._still_encoded = still_encoded
+        self._decompression: _Decompression | None = None
+        self._started = content_encoding == 'identity'
+
+    def decode(self, chunk: bytes) -> bytes:
+        """Decode the next chunk of the body, returning whatever decoded output is ready so far.
+
+        Raises:
+            ValueError: If a body that started out compressed turns out to be corrupt.
+        """
+        if not self._started:
+            if not chunk:
+                return b''
+            self._started = True
+            self._decompression = _start_decompression(self._content_encoding, chunk, still_encoded=self._still_encoded)
+            if self._decompression is not None:
+                try:
+                    return self._decompression.decompress(chunk)
+                except (ValueError, zlib.error):
+                    # The body was decoded on the way already, it only looked compressed.
+                    self._decompression = None
+                    return chunk
+
+        if self._decompression is None:
+            return chunk
+        try:
+            return self._decompression.decompress(chunk)
+        except zlib.error as exc:
+            raise ValueError(f'The record body is not valid {self._content_encoding} data: {exc}') from exc
+
+    def flush(self) -> bytes:
+        """Finish the body, returning the rest of the decoded output."""
+        return self._decompression.flush() if self._decompression is not None else b''
+
+
+def decode_record_body(content: bytes, headers: Mapping[str, str]) -> bytes:
+    """Decode a whole record body that is still compressed with the `Content-Encoding` it is served with.
+
+    A body whose size differs from its `Content-Length` was decoded by the HTTP client already and is returned as it
+    is, as is a body that does not decompress. A body whose size matches it is known to be still encoded.
+    """
+    content_encoding = get_content_encoding(headers)
+    length = headers.get('content-length', '')
+    if content_encoding == 'identity' or (length.isdigit() and int(length) != len(content)):
+        return content
+
+    decoder = RecordBodyDecoder(content_encoding, still_encoded=length.isdigit())
+    try:
+        return decoder.decode(content) + decoder.flush()
+    except ValueError:
+        return content
+
+
+def parse_record_content(content: bytes, content_type: str) -> Any:
+    """Parse a record body by its content type, the way `KeyValueStoreClient.get_record` parses a response.
+
+    Raises:
+        ValueError: If a JSON body is not valid JSON.
+    """
+    media_type = content_type.split(';', maxsplit=1)[0].strip()
+    if re.search(r'^application/json', media_type, flags=re.IGNORECASE):
+        return json.loads(content)
+    if re.search(r'^application/.*xml$', media_type, flags=re.IGNORECASE) or re.search(
+        r'^text/', media_type, flags=re.IGNORECASE
+    ):
+        return content.decode(get_charset(content_type), errors='replace')
+    return content
+
+
+class DecodedRecordResponse:
+    """A streamed record response whose body is decoded chunk by chunk while it is read.
+
+    Wraps the response of `KeyValueStoreClient.stream_record` when the client decodes compressed records, and
+    exposes the same `HttpResponse` interface, so it can be used in place of the response it wraps. Whether the HTTP
+    client decoded the body is not known while it is streamed, so a brotli body is passed through as it is read.
+    """
+
+    def __init__(self, response: HttpResponse) -> None:
+        """Initialize a new instance.
+
+        Args:
+            response: The streamed response to decode.
+        """
+        self._response = response
+        self._content: bytes | None = None
+
+    @property
+    def status_code(self) -> int:
+        """HTTP status code of the response."""
+        return self._response.status_code
+
+    @property
+    def headers(self) -> Mapping[str, str]:
+        """Response headers as a mapping."""
+        return self._response.headers
+
+    @property
+    def content(self) -> bytes:
+        """Decoded response body as bytes, available after it is read."""
+        if self._content is None:
+            raise RuntimeError('The response body was not read yet, call `read` or `aread` first.')
+        return self._content
+
+    @property
+    def text(self) -> str:
+        """Decoded response body as text."""
+        return self.content.decode(get_charset(self.headers.get('content-type', '')), errors='replace')
+
+    def json(self) -> Any:
+        """Parse the decoded response body as JSON."""
+        return json.loads(self.content)
+
+    def read(self) -> bytes:
+        """Read and decode the entire response body."""
+        if self._content is None:
+            self._content = b''.join(self.iter_bytes())
+        return self._content
+
+    async def aread(self) -> bytes:
+        """Read and decode the entire response body asynchronously."""
+        if self._content is None:
+            self._content = b''.join([chunk async for chunk in self.aiter_bytes()])
+        return self._content
+
+    def close(self) -> None:
+        """Close the response and release the connection."""
+        self._response.close()
+
+    async def aclose(self) -> None:
+        """Close the response and release the connection asynchronously."""
+        await self._response.aclose()
+
+    def iter_bytes(self) -> Iterator[bytes]:
+        """Iterate over the decoded response body in bytes chunks."""
+        decoder = RecordBodyDecoder(get_content_encoding(self.headers))
+        for chunk in self._response.iter_bytes():
+            if decoded := decoder.decode(chunk):
+                yield decoded
+        if rest := decoder.flush():
+            yield rest
+
+    async def aiter_bytes(self) -> AsyncIterator[bytes]:
+        """Iterate over the decoded response body in bytes chunks asynchronously."""
+        decoder = RecordBodyDecoder(get_content_encoding(self.headers))
+        async for chunk in self._response.aiter_bytes():
+            if decoded := decoder.decode(chunk):
+                yield decoded
+        if rest := decoder.flush():
+            yield rest
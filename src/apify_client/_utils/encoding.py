@@ -36,8 +36,9 @@ def encode_key_value_store_record_value(
             the declared `content_encoding`.
     """
     # Read file-like values into memory; the transport only accepts bytes-like bodies. Detect them by a
-    # callable `read` (not `io.IOBase`) so duck-typed file-likes are read, not JSON-serialized. Impit exposes
-    # no streaming `content=` API, so the value has to be buffered whole.
+    # callable `read` (not `io.IOBase`) so duck-typed file-likes are read, not JSON-serialized. A file-like value
+    # has to be buffered whole, as its size and content type are needed up front - a large file on disk can be
+    # uploaded from a memory mapping with `set_record_from_path` instead.
     read = getattr(value, 'read', None)
     if callable(read):
         value = read()
@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import json
+from typing import Any
+
+
+class JsonLinesDecoder:
+    """Incrementally decode a JSON Lines byte stream into items.
+
+    Chunks of a streamed response rarely end on a line boundary, so the decoder holds the trailing incomplete line
+    back until the next chunk completes it. Only that one partial line is ever buffered, which keeps the memory use
+    independent of the stream length.
+    """
+
+    def __init__(self) -> None:
+        self._pending = b''
+
+    def feed(self, chunk: bytes) -> list[Any]:
+        """Decode every line the chunk completes.
+
+        Args:
+            chunk: The next chunk of the stream.
+
+        Returns:
+            The decoded items, in stream order.
+        """
+        lines = (self._pending + chunk).split(b'\n')
+        self._pending = lines.pop()
+        return [json.loads(line) for line in lines if line.strip()]
+
+    def finish(self) -> list[Any]:
+        """Decode the last line, which the stream may end without a trailing newline.
+
+        Returns:
+            The decoded last item, or an empty list if nothing is pending.
+
+        Raises:
+            json.JSONDecodeError: If the pending line is not a complete JSON value, for example when the stream was
+                cut off in the middle of an item.
+        """
+        pending, self._pending = self._pending, b''
+        return [json.loads(pending)] if pending.strip() else []
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterable, Iterator
+from typing import TYPE_CHECKING
+
+from apify_client._consts import UPLOAD_CHUNK_SIZE
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Iterable
+
+    from apify_client.http_compressors._base import HttpCompressor
+
+
+def is_replayable_body(data: object) -> bool:
+    """Whether a request body can be sent again when a request is retried.
+
+    An iterator or an async iterator, such as a generator, is exhausted by the first attempt, so a request with
+    one is not retried. An iterable that starts over on each iteration, and any buffer, can be sent again.
+    """
+    return not isinstance(data, Iterator) and not (isinstance(data, AsyncIterable) and aiter(data) is data)
+
+
+def iterate_chunks(data: memoryview | Iterable[bytes]) -> Iterator[bytes]:
+    """Iterate over a buffer in `UPLOAD_CHUNK_SIZE` slices, or over the chunks of a chunked body as they are."""
+    if isinstance(data, memoryview):
+        for start in range(0, len(data), UPLOAD_CHUNK_SIZE):
+            yield bytes(data[start : start + UPLOAD_CHUNK_SIZE])
+    else:
+        yield from data
+
+
+class CompressedRequestBody:
+    """A request body compressed chunk by chunk while the transport reads it.
+
+    Each iteration compresses the source from its start, so the body can be sent again on a retry as long as the
+    source can be iterated again.
+    """
+
+    def __init__(self, source: memoryview | Iterable[bytes], compressor: HttpCompressor) -> None:
+        """Initialize `CompressedRequestBody`.
+
+        Args:
+            source: The uncompressed body, as a buffer or as an iterable of chunks.
+            compressor: Compressor the body is compressed with.
+        """
+        self._source = source
+        self._compressor = compressor
+
+    def __iter__(self) -> Iterator[bytes]:
+        stream = self._compressor.compress_stream()
+        for chunk in iterate_chunks(self._source):
+            compressed = stream.compress(chunk)
+            if compressed:
+                yield compressed
+        yield stream.flush()
+
+
+class AsyncRequestBody:
+    """A request body for the async transport, read and compressed off the event loop.
+
+    Chunks from a synchronous source are read in a worker thread, as reading them may block, and compressing a
+    chunk runs in a worker thread too. Each iteration starts over from the start of the source, like with
+    `CompressedRequestBody`.
+    """
+
+    def __init__(
+        self,
+        source: memoryview | Iterable[bytes] | AsyncIterable[bytes],
+        compressor: HttpCompressor | None,
+    ) -> None:
+        """Initialize `AsyncRequestBody`.
+
+        Args:
+            source: The uncompressed body, as a buffer, an iterable of chunks, or an async iterable of chunks.
+            compressor: Compressor the body is compressed with, or None to send it as it is.
+        """
+        self._source = source
+        self._compressor = compressor
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        stream = self._compressor.compress_stream() if self._compressor is not None else None
+        async for chunk in self._iterate_source():
+            if stream is None:
+                yield chunk
+                continue
+            compressed = await asyncio.to_thread(stream.compress, chunk)
+            if compressed:
+                yield compressed
+
+        if stream is not None:
+            yield await asyncio.to_thread(stream.flush)
+
+    async def _iterate_source(self) -> AsyncIterator[bytes]:
+        if isinstance(self._source, AsyncIterable):
+            async for chunk in self._source:
+                yield chunk
+            return
+
+        chunks = iterate_chunks(self._source)
+        while (chunk := await asyncio.to_thread(_next_chunk, chunks)) is not None:
+            yield chunk
+
+
+def _next_chunk(chunks: Iterator[bytes]) -> bytes | None:
+    return next(chunks, None)
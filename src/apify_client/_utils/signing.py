@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from apify_client._consts import DEFAULT_SIGNING_KEY_TTL
+from apify_client._utils.time import to_seconds
+
+if TYPE_CHECKING:
+    from datetime import timedelta
+
+
+@dataclass(frozen=True)
+class StorageSigningKey:
+    """The URL signing secret key of a storage, along with the storage ID the content signatures are bound to."""
+
+    storage_id: str
+    """ID of the storage."""
+
+    secret_key: str | None
+    """The URL signing secret key, or None if the client is not allowed to read it."""
+
+
+class SigningKeyCache:
+    """Caches the URL signing secret keys of storages, so that signing many URLs costs one metadata fetch per storage.
+
+    The entries are keyed by the storage URL and expire after `ttl`, after which the key is fetched again. The cache
+    is shared by all resource clients created from the same `ApifyClient`, and it is safe to use from multiple threads.
+    """
+
+    def __init__(self, *, ttl: timedelta = DEFAULT_SIGNING_KEY_TTL) -> None:
+        self._ttl_seconds = to_seconds(ttl)
+        self._entries = dict[str, tuple[float, StorageSigningKey]]()
+        self._lock = threading.Lock()
+
+    def get(self, storage_url: str) -> StorageSigningKey | None:
+        """Return the cached key of the storage, or None if it is not cached or has expired."""
+        with self._lock:
+            entry = self._entries.get(storage_url)
+            if entry is None:
+                return None
+            expires_at, signing_key = entry
+            if time.monotonic() >= expires_at:
+                del self._entries[storage_url]
+                return None
+            return signing_key
+
+    def set(self, storage_url: str, signing_key: StorageSigningKey) -> None:
+        """Cache the key of the storage for the TTL of the cache."""
+        with self._lock:
+            self._entries[storage_url] = (time.monotonic() + self._ttl_seconds, signing_key)
+
+    def invalidate(self, storage_url: str | None = None) -> None:
+        """Drop the cached key of the storage, or of all the storages if `storage_url` is None."""
+        with self._lock:
+            if storage_url is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(storage_url, None)
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import asyncio
+from tempfile import SpooledTemporaryFile
+from typing import IO, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from apify_client.http_clients import HttpResponse
+
+
+def spool_response(response: HttpResponse, file: IO[bytes] | None, *, max_memory_bytes: int) -> IO[bytes]:
+    """Write the body of a streamed response into `file` chunk by chunk, so it is never held in memory whole.
+
+    Without a `file`, the body goes into a new spooled temporary file, which stays in memory up to `max_memory_bytes`
+    and moves to disk past that. The new file is returned rewound to its start, a caller's file is left as it is.
+    """
+    target = file if file is not None else SpooledTemporaryFile(max_size=max_memory_bytes)  # noqa: SIM115
+    try:
+        for chunk in response.iter_bytes():
+            target.write(chunk)
+    except BaseException:
+        if file is None:
+            target.close()
+        raise
+    if file is None:
+        target.seek(0)
+    return target
+
+
+async def spool_response_async(response: HttpResponse, file: IO[bytes] | None, *, max_memory_bytes: int) -> IO[bytes]:
+    """Write the body of a streamed response into `file` chunk by chunk, so it is never held in memory whole.
+
+    Same as `spool_response`, except the writes run in a worker thread, as they may block on disk.
+    """
+    target = file if file is not None else SpooledTemporaryFile(max_size=max_memory_bytes)  # noqa: SIM115
+    try:
+        async for chunk in response.aiter_bytes():
+            await asyncio.to_thread(target.write, chunk)
+    except BaseException:
+        if file is None:
+            await asyncio.to_thread(target.close)
+        raise
+    if file is None:
+        await asyncio.to_thread(target.seek, 0)
+    return target
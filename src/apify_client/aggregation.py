@@ -0,0 +1,419 @@
+"""Composable streaming aggregations over dataset items.
+
+Build an `ItemAggregation` pipeline and run it with `DatasetClient.aggregate`, or over any iterable of items with
+`ItemAggregation.apply`:
+
+```python
+from apify_client.aggregation import Count, DistinctCount, ItemAggregation, Max, Min, Sum
+
+prices_by_domain = (
+    ItemAggregation()
+    .filter(lambda item: item.get('price') is not None)
+    .group_by('domain')
+    .agg(
+        count=Count(),
+        total=Sum('price'),
+        cheapest=Min('price'),
+        priciest=Max('price'),
+        sellers=DistinctCount('seller'),
+    )
+)
+```
+
+Every aggregator keeps a state of bounded size and knows how to merge two states, which lets a dataset be aggregated
+in independent shards and the partial results be combined afterwards.
+"""
+
+from __future__ import annotations
+
+import copy
+import hashlib
+import heapq
+import json
+import math
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
+
+from typing_extensions import override
+
+from apify_client._docs import docs_group
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+S = TypeVar('S')
+
+
+def _field_getter(field: str | Callable[[Any], Any]) -> Callable[[Any], Any]:
+    return field if callable(field) else _ItemField(field)
+
+
+class _ItemField:
+    """Picklable getter of a top-level item field, so pipelines can be sent to worker processes."""
+
+    def __init__(self, name: str) -> None:
+        self._name = name
+
+    def __call__(self, item: Any) -> Any:
+        return item.get(self._name) if isinstance(item, dict) else None
+
+
+@docs_group('Other')
+class Aggregator(ABC, Generic[S]):
+    """Base class of the aggregators used in `ItemAggregation.agg`.
+
+    An aggregator folds items into a state, merges the states of two shards and turns the final state into a result.
+    """
+
+    @abstractmethod
+    def create_state(self) -> S:
+        """Return the state of an empty aggregation."""
+
+    @abstractmethod
+    def update(self, state: S, item: Any) -> S:
+        """Fold an item into the state and return the updated state."""
+
+    @abstractmethod
+    def merge(self, state: S, other: S) -> S:
+        """Combine the states of two shards into one."""
+
+    def finish(self, state: S) -> Any:
+        """Turn the final state into the result of the aggregation."""
+        return state
+
+
+@docs_group('Other')
+class Count(Aggregator[int]):
+    """Counts the items."""
+
+    @override
+    def create_state(self) -> int:
+        return 0
+
+    @override
+    def update(self, state: int, item: Any) -> int:
+        return state + 1
+
+    @override
+    def merge(self, state: int, other: int) -> int:
+        return state + other
+
+
+@docs_group('Other')
+class Sum(Aggregator[float]):
+    """Sums the values of a field, skipping items where the value is missing or null."""
+
+    def __init__(self, field: str | Callable[[Any], Any]) -> None:
+        """Initialize the aggregator.
+
+        Args:
+            field: Name of the item field, or a function returning the value from the item.
+        """
+        self._get = _field_getter(field)
+
+    @override
+    def create_state(self) -> float:
+        return 0
+
+    @override
+    def update(self, state: float, item: Any) -> float:
+        value = self._get(item)
+        return state if value is None else state + value
+
+    @override
+    def merge(self, state: float, other: float) -> float:
+        return state + other
+
+
+@docs_group('Other')
+class Min(Aggregator[Any]):
+    """Finds the smallest value of a field, skipping items where the value is missing or null."""
+
+    def __init__(self, field: str | Callable[[Any], Any]) -> None:
+        """Initialize the aggregator.
+
+        Args:
+            field: Name of the item field, or a function returning the value from the item.
+        """
+        self._get = _field_getter(field)
+
+    @override
+    def create_state(self) -> Any:
+        return None
+
+    @override
+    def update(self, state: Any, item: Any) -> Any:
+        return self.merge(state, self._get(item))
+
+    @override
+    def merge(self, state: Any, other: Any) -> Any:
+        if state is None or other is None:
+            return other if state is None else state
+        return min(state, other)
+
+
+@docs_group('Other')
+class Max(Aggregator[Any]):
+    """Finds the largest value of a field, skipping items where the value is missing or null."""
+
+    def __init__(self, field: str | Callable[[Any], Any]) -> None:
+        """Initialize the aggregator.
+
+        Args:
+            field: Name of the item field, or a function returning the value from the item.
+        """
+        self._get = _field_getter(field)
+
+    @override
+    def create_state(self) -> Any:
+        return None
+
+    @override
+    def update(self, state: Any, item: Any) -> Any:
+        return self.merge(state, self._get(item))
+
+    @override
+    def merge(self, state: Any, other: Any) -> Any:
+        if state is None or other is None:
+            return other if state is None else state
+        return max(state, other)
+
+
+@docs_group('Other')
+class DistinctCount(Aggregator[bytearray]):
+    """Estimates the number of distinct values of a field with HyperLogLog, skipping missing or null values.
+
+    The state is a fixed array of `2 ** precision` one-byte registers, whatever the number of values. The typical
+    relative error of the estimate is `1.04 / sqrt(2 ** precision)`, which is about 0.8% for the default precision.
+    """
+
+    _min_precision = 4
+    """Lowest valid precision (16 registers)."""
+
+    _max_precision = 18
+    """Highest valid precision (262144 registers)."""
+
+    def __init__(self, field: str | Callable[[Any], Any], *, precision: int = 14) -> None:
+        """Initialize the aggregator.
+
+        Args:
+            field: Name of the item field, or a function returning the value from the item.
+            precision: Number of bits of the value hash that select a register.
+
+        Raises:
+            ValueError: If `precision` is out of the valid range.
+        """
+        if not self._min_precision <= precision <= self._max_precision:
+            raise ValueError(
+                f'precision must be between {self._min_precision} and {self._max_precision}, got {precision}.'
+            )
+        self._get = _field_getter(field)
+        self._precision = precision
+
+    @override
+    def create_state(self) -> bytearray:
+        return bytearray(1 << self._precision)
+
+    @override
+    def update(self, state: bytearray, item: Any) -> bytearray:
+        value = self._get(item)
+        if value is None:
+            return state
+        encoded = json.dumps(value, sort_keys=True, default=str).encode('utf-8')
+        hashed = int.from_bytes(hashlib.blake2b(encoded, digest_size=8).digest(), 'big')
+        remaining_bits = 64 - self._precision
+        register = hashed >> remaining_bits
+        # The rank is the position of the first set bit in the hash bits that did not select the register.
+        rank = remaining_bits - (hashed & ((1 << remaining_bits) - 1)).bit_length() + 1
+        state[register] = max(state[register], rank)
+        return state
+
+    @override
+    def merge(self, state: bytearray, other: bytearray) -> bytearray:
+        return bytearray(map(max, state, other))
+
+    @override
+    def finish(self, state: bytearray) -> int:
+        registers = len(state)
+        alpha = 0.7213 / (1 + 1.079 / registers)
+        estimate = alpha * registers * registers / sum(2.0**-rank for rank in state)
+        empty_registers = state.count(0)
+        if estimate <= 2.5 * registers and empty_registers:
+            # Linear counting is more accurate than the raw estimate while many registers are still empty.
+            estimate = registers * math.log(registers / empty_registers)
+        return round(estimate)
+
+
+class _Ranked:
+    """An item ranked by a value, comparable by the value alone so items themselves are never compared."""
+
+    __slots__ = ('item', 'value')
+
+    def __init__(self, value: Any, item: Any) -> None:
+        self.value = value
+        self.item = item
+
+    def __lt__(self, other: _Ranked) -> bool:
+        return self.value < other.value
+
+
+@docs_group('Other')
+class TopK(Aggregator[list[_Ranked]]):
+    """Keeps the `k` items with the largest values of a field, skipping items where the value is missing or null."""
+
+    def __init__(self, field: str | Callable[[Any], Any], *, k: int = 10) -> None:
+        """Initialize the aggregator.
+
+        Args:
+            field: Name of the item field, or a function returning the value from the item.
+            k: Number of items to keep.
+        """
+        if k < 1:
+            raise ValueError(f'k must be at least 1, got {k}')
+        self._get = _field_getter(field)
+        self._k = k
+
+    @override
+    def create_state(self) -> list[_Ranked]:
+        return []
+
+    @override
+    def update(self, state: list[_Ranked], item: Any) -> list[_Ranked]:
+        value = self._get(item)
+        if value is None:
+            return state
+        # A min-heap of the k best items, whose root is the first one to give way to a better item.
+        if len(state) < self._k:
+            heapq.heappush(state, _Ranked(value, item))
+        elif state[0].value < value:
+            heapq.heapreplace(state, _Ranked(value, item))
+        return state
+
+    @override
+    def merge(self, state: list[_Ranked], other: list[_Ranked]) -> list[_Ranked]:
+        merged = heapq.nlargest(self._k, [*state, *other])
+        heapq.heapify(merged)
+        return merged
+
+    @override
+    def finish(self, state: list[_Ranked]) -> list[Any]:
+        """Return the kept items, from the largest value down."""
+        return [ranked.item for ranked in sorted(state, reverse=True)]
+
+
+@docs_group('Other')
+class ItemAggregation:
+    """A streaming aggregation pipeline over dataset items.
+
+    The pipeline filters and maps the items in order, optionally groups them by a key, and folds each group into
+    the named aggregators. Every method returns a new pipeline, so pipelines can be shared and extended safely.
+
+    Items are consumed one at a time and only the aggregator states are kept, so the memory use depends on the
+    number of groups, not on the number of items. To run a pipeline in worker processes, all functions passed to it
+    must be picklable, which means defined at module level rather than as lambdas.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty pipeline counting all items. Build it up with `filter`, `map`, `group_by` and `agg`."""
+        self._steps: tuple[tuple[str, Callable[[Any], Any]], ...] = ()
+        self._get_key: Callable[[Any], Any] | None = None
+        self._aggregators: dict[str, Aggregator] = {'count': Count()}
+
+    def filter(self, predicate: Callable[[Any], bool]) -> ItemAggregation:
+        """Return the pipeline extended with a step dropping the items for which `predicate` returns a false value."""
+        return self._replace(_steps=(*self._steps, ('filter', predicate)))
+
+    def map(self, function: Callable[[Any], Any]) -> ItemAggregation:
+        """Return the pipeline extended with a step replacing each item with the return value of `function`."""
+        return self._replace(_steps=(*self._steps, ('map', function)))
+
+    def group_by(self, key: str | Callable[[Any], Any]) -> ItemAggregation:
+        """Return the pipeline aggregating each group of items separately.
+
+        Args:
+            key: Name of the item field to group by, or a function returning the group key from the item.
+        """
+        return self._replace(_get_key=_field_getter(key))
+
+    def agg(self, **aggregators: Aggregator) -> ItemAggregation:
+        """Return the pipeline computing the given aggregators, under the names they are passed with.
+
+        A pipeline without aggregators counts the items.
+        """
+        if not aggregators:
+            raise ValueError('At least one aggregator must be given.')
+        return self._replace(_aggregators=aggregators)
+
+    def create_state(self) -> dict[Any, dict[str, Any]]:
+        """Return the state of the pipeline before any item, mapping group keys to the states of the aggregators."""
+        return {}
+
+    def update(self, state: dict[Any, dict[str, Any]], item: Any) -> None:
+        """Pass an item through the pipeline steps and fold it into the state."""
+        for kind, function in self._steps:
+            if kind == 'map':
+                item = function(item)
+            elif not function(item):
+                return
+
+        key = None if self._get_key is None else self._get_key(item)
+        group = state.get(key)
+        if group is None:
+            group = state[key] = {name: aggregator.create_state() for name, aggregator in self._aggregators.items()}
+        for name, aggregator in self._aggregators.items():
+            group[name] = aggregator.update(group[name], item)
+
+    def merge(self, state: dict[Any, dict[str, Any]], other: dict[Any, dict[str, Any]]) -> None:
+        """Fold the state of another shard into the state."""
+        for key, other_group in other.items():
+            group = state.get(key)
+            if group is None:
+                state[key] = other_group
+                continue
+            for name, aggregator in self._aggregators.items():
+                group[name] = aggregator.merge(group[name], other_group[name])
+
+    def finish(self, state: dict[Any, dict[str, Any]]) -> dict[Any, Any]:
+        """Turn the final state into the results.
+
+        Returns:
+            The results of the aggregators by their names. With `group_by`, a dictionary of such results by the
+            group keys.
+        """
+        results = {
+            key: {name: aggregator.finish(group[name]) for name, aggregator in self._aggregators.items()}
+            for key, group in state.items()
+        }
+        if self._get_key is not None:
+            return results
+        if None in results:
+            return results[None]
+        return {name: aggregator.finish(aggregator.create_state()) for name, aggregator in self._aggregators.items()}
+
+    def apply(self, items: Iterable[Any]) -> dict[Any, Any]:
+        """Run the pipeline over the items in the current process.
+
+        Returns:
+            The results, as described in `finish`.
+        """
+        state = self.create_state()
+        for item in items:
+            self.update(state, item)
+        return self.finish(state)
+
+    def _replace(self, **changes: Any) -> ItemAggregation:
+        replaced = copy.copy(self)
+        replaced.__dict__.update(changes)
+        return replaced
+
+
+__all__ = [
+    'Aggregator',
+    'Count',
+    'DistinctCount',
+    'ItemAggregation',
+    'Max',
+    'Min',
+    'Sum',
+    'TopK',
+]
@@ -154,6 +154,15 @@ class InvalidResponseBodyError(ApifyClientError):
         self.response = response
 
 
+@docs_group('Errors')
+class IncompleteDownloadError(ApifyClientError):
+    """Error raised when a download of a record cannot be completed.
+
+    This occurs when a broken download cannot be resumed, because it broke off too many times or the API did not
+    return the requested byte range, or when the downloaded file does not match the size of the record.
+    """
+
+
 _STATUS_TO_CLASS: dict[int, type[ApifyApiError]] = {
     400: InvalidRequestError,
     401: UnauthorizedError,
@@ -169,6 +178,7 @@ __all__ = [
     'ApifyClientError',
     'ConflictError',
     'ForbiddenError',
+    'IncompleteDownloadError',
     'InvalidRequestError',
     'InvalidResponseBodyError',
     'NotFoundError',
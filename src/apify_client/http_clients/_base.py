@@ -7,10 +7,12 @@ import os
 import random
 import sys
 import time
+from collections.abc import AsyncIterable
 from contextlib import suppress
 from datetime import UTC, datetime, timedelta
 from http import HTTPStatus
 from importlib import metadata
+from mmap import mmap
 from typing import TYPE_CHECKING, Any, TypeVar
 from urllib.parse import urlencode
 
@@ -32,17 +34,25 @@ from apify_client._docs import docs_group
 from apify_client._logging import LoggerOnce, log_context, logger_name
 from apify_client._statistics import ClientStatistics
 from apify_client._utils.http import is_compressible_content_type
+from apify_client._utils.request_body import AsyncRequestBody, CompressedRequestBody, is_replayable_body
 from apify_client._utils.time import to_seconds
 from apify_client.errors import ApifyApiError
 from apify_client.http_compressors._gzip import GzipHttpCompressor
 
 if TYPE_CHECKING:
-    from collections.abc import AsyncIterator, Awaitable, Callable, Iterator, Mapping
+    from collections.abc import AsyncIterator, Awaitable, Callable, Iterable, Iterator, Mapping
     from types import TracebackType
     from typing import Self
 
     from apify_client.http_compressors._base import HttpCompressor
-    from apify_client.types import JsonSerializable, Timeout
+    from apify_client.types import (
+        JsonSerializable,
+        RequestContent,
+        RequestContentAsync,
+        RequestData,
+        RequestDataAsync,
+        Timeout,
+    )
 
 logger = logging.getLogger(logger_name)
 logger_once = LoggerOnce(logger)
@@ -338,6 +348,42 @@ class HttpClientBase:
 
         return (headers, self._parse_params(params), data)
 
+    def _prepare_streamed_request_call(
+        self,
+        *,
+        headers: dict[str, str] | None = None,
+        params: dict[str, Any] | None = None,
+        data: memoryview | mmap | Iterable[bytes] | AsyncIterable[bytes],
+        json: JsonSerializable | None = None,
+    ) -> tuple[
+        dict[str, str],
+        dict[str, Any] | None,
+        memoryview | Iterable[bytes] | AsyncIterable[bytes],
+        HttpCompressor | None,
+    ]:
+        """Prepare headers, params, and body for an HTTP request whose body is streamed or memory-mapped.
+
+        Works like `_prepare_request_call`, except that the body is not compressed here. If it is to be compressed,
+        the `Content-Encoding` header is set and the compressor is returned, so the body can be compressed chunk
+        by chunk while the transport reads it. A buffer is compressed under the same conditions as a bytes body.
+        A chunked body has no size known up front, so it is compressed whenever its content type allows it.
+        """
+        if json is not None:
+            raise ValueError('Cannot pass both "json" and "data" parameters at the same time!')
+
+        headers, parsed_params, _ = self._prepare_request_call(headers=headers, params=params)
+
+        body = memoryview(data) if isinstance(data, (memoryview, mmap)) else data
+        if (
+            self._get_header(headers, 'content-encoding') is None
+            and (not isinstance(body, memoryview) or len(body) >= MIN_COMPRESSION_SIZE)
+            and is_compressible_content_type(self._get_header(headers, 'content-type'))
+        ):
+            headers = self._merge_headers(headers, {'Content-Encoding': self._http_compressor.content_encoding})
+            return (headers, parsed_params, body, self._http_compressor)
+
+        return (headers, parsed_params, body, None)
+
     def _build_url_with_params(self, url: str, *, params: dict[str, Any] | None = None) -> str:
         """Build a URL with query parameters appended. List values are expanded into multiple key=value pairs."""
         if not params:
@@ -425,7 +471,7 @@ class HttpClient(HttpClientBase):
         url: str,
         headers: dict[str, str] | None = None,
         params: dict[str, Any] | None = None,
-        data: str | bytes | bytearray | None = None,
+        data: RequestData | None = None,
         json: JsonSerializable | None = None,
         stream: bool | None = None,
         timeout: Timeout = 'medium',
@@ -437,7 +483,11 @@ class HttpClient(HttpClientBase):
             url: Full URL to make the request to.
             headers: Additional headers to include.
             params: Query parameters to append to the URL.
-            data: Raw request body data. Cannot be used together with json.
+            data: Raw request body data. Besides bytes and strings, it can be a memory-mapped file or a memoryview,
+                which is read without being copied, or an iterable of bytes chunks, which is streamed (the async
+                client also takes an async iterable). Such a body is compressed chunk by chunk as it is sent. A
+                one-shot iterator, such as a generator, cannot be sent again, so the request is not retried.
+                Cannot be used together with json.
             json: JSON-serializable data for the request body. Cannot be used together with data.
             stream: Whether to stream the response body.
             timeout: Timeout for the API HTTP request. Use `short`, `medium`, or `long` tier literals for
@@ -456,15 +506,32 @@ class HttpClient(HttpClientBase):
 
         self._statistics.calls += 1
 
-        prepared_headers, prepared_params, content = self._prepare_request_call(
-            headers=headers,
-            params=params,
-            data=data,
-            json=json,
-        )
+        content: RequestContent | None
+        if data is not None and not isinstance(data, (str, bytes, bytearray)):
+            prepared_headers, prepared_params, body, compressor = self._prepare_streamed_request_call(
+                headers=headers,
+                params=params,
+                data=data,
+                json=json,
+            )
+            if isinstance(body, AsyncIterable):
+                raise TypeError('An async iterable request body needs the async client.')
+            content = body if compressor is None else CompressedRequestBody(body, compressor)
+        else:
+            prepared_headers, prepared_params, content = self._prepare_request_call(
+                headers=headers,
+                params=params,
+                data=data,
+                json=json,
+            )
 
-        return self._retry_with_exp_backoff(
-            lambda stop_retrying, attempt: self._make_request(
+        replayable = is_replayable_body(data)
+
+        def make_request(stop_retrying: Callable[[], None], attempt: int) -> HttpResponse:
+            if not replayable:
+                # The first attempt consumes the body, so there is nothing left to send again.
+                stop_retrying()
+            return self._make_request(
                 stop_retrying=stop_retrying,
                 attempt=attempt,
                 method=method,
@@ -474,7 +541,10 @@ class HttpClient(HttpClientBase):
                 content=content,
                 stream=stream,
                 timeout=timeout,
-            ),
+            )
+
+        return self._retry_with_exp_backoff(
+            make_request,
             max_retries=self._max_retries,
             backoff_base=self._min_delay_between_retries,
         )
@@ -491,7 +561,7 @@ class HttpClient(HttpClientBase):
         method: str,
         url: str,
         headers: dict[str, str],
-        content: bytes | None,
+        content: RequestContent | None,
         timeout: float | None,
         stream: bool,
     ) -> HttpResponse:
@@ -506,6 +576,8 @@ class HttpClient(HttpClientBase):
             url: Full request URL, with the query parameters already encoded into it.
             headers: Final request headers, with the client's default headers already merged in.
             content: Request body, already serialized and compressed, or None for a request without a body.
+                A streamed body arrives as an iterable of chunks (an async iterable in the async client), which
+                is compressed while it is iterated, and an uncompressed memory-mapped body arrives as a memoryview.
             timeout: Timeout for this attempt in seconds, or None for no timeout at all.
             stream: Whether to return the response with the body unread, so the caller can stream it.
 
@@ -558,7 +630,7 @@ class HttpClient(HttpClientBase):
         url: str,
         headers: dict[str, str],
         params: dict[str, Any] | None,
-        content: bytes | None,
+        content: RequestContent | None,
         stream: bool | None,
         timeout: Timeout,
     ) -> HttpResponse:
@@ -628,7 +700,7 @@ class HttpClientAsync(HttpClientBase):
         url: str,
         headers: dict[str, str] | None = None,
         params: dict[str, Any] | None = None,
-        data: str | bytes | bytearray | None = None,
+        data: RequestDataAsync | None = None,
         json: JsonSerializable | None = None,
         stream: bool | None = None,
         timeout: Timeout = 'medium',
@@ -640,7 +712,11 @@ class HttpClientAsync(HttpClientBase):
             url: Full URL to make the request to.
             headers: Additional headers to include.
             params: Query parameters to append to the URL.
-            data: Raw request body data. Cannot be used together with json.
+            data: Raw request body data. Besides bytes and strings, it can be a memory-mapped file or a memoryview,
+                which is read without being copied, or an iterable of bytes chunks, which is streamed (the async
+                client also takes an async iterable). Such a body is compressed chunk by chunk as it is sent. A
+                one-shot iterator, such as a generator, cannot be sent again, so the request is not retried.
+                Cannot be used together with json.
             json: JSON-serializable data for the request body. Cannot be used together with data.
             stream: Whether to stream the response body.
             timeout: Timeout for the API HTTP request. Use `short`, `medium`, or `long` tier literals for
@@ -663,7 +739,21 @@ class HttpClientAsync(HttpClientBase):
         # offload preparation to a worker thread whenever there is something to compress. A body the
         # client sends as it is costs less to prepare inline than the hop itself. A `json` body always
         # hops, as its size is only known once serialized.
-        if json is not None or self._is_body_worth_compressing(data):
+        content: RequestContentAsync | None
+        if data is not None and not isinstance(data, (str, bytes, bytearray)):
+            # A streamed or memory-mapped body is read and compressed off the event loop chunk by chunk while the
+            # transport sends it, so there is nothing to offload here.
+            prepared_headers, prepared_params, body, compressor = self._prepare_streamed_request_call(
+                headers=headers,
+                params=params,
+                data=data,
+                json=json,
+            )
+            if isinstance(body, memoryview) and compressor is None:
+                content = memoryview(body)
+            else:
+                content = AsyncRequestBody(body, compressor)
+        elif json is not None or self._is_body_worth_compressing(data):
             prepared_headers, prepared_params, content = await asyncio.to_thread(
                 self._prepare_request_call,
                 headers=headers,
@@ -679,8 +769,13 @@ class HttpClientAsync(HttpClientBase):
                 json=json,
             )
 
-        return await self._retry_with_exp_backoff(
-            lambda stop_retrying, attempt: self._make_request(
+        replayable = is_replayable_body(data)
+
+        async def make_request(stop_retrying: Callable[[], None], attempt: int) -> HttpResponse:
+            if not replayable:
+                # The first attempt consumes the body, so there is nothing left to send again.
+                stop_retrying()
+            return await self._make_request(
                 stop_retrying=stop_retrying,
                 attempt=attempt,
                 method=method,
@@ -690,7 +785,10 @@ class HttpClientAsync(HttpClientBase):
                 content=content,
                 stream=stream,
                 timeout=timeout,
-            ),
+            )
+
+        return await self._retry_with_exp_backoff(
+            make_request,
             max_retries=self._max_retries,
             backoff_base=self._min_delay_between_retries,
         )
@@ -707,7 +805,7 @@ class HttpClientAsync(HttpClientBase):
         method: str,
         url: str,
         headers: dict[str, str],
-        content: bytes | None,
+        content: RequestContentAsync | None,
         timeout: float | None,
         stream: bool,
     ) -> HttpResponse:
@@ -722,6 +820,8 @@ class HttpClientAsync(HttpClientBase):
             url: Full request URL, with the query parameters already encoded into it.
             headers: Final request headers, with the client's default headers already merged in.
             content: Request body, already serialized and compressed, or None for a request without a body.
+                A streamed body arrives as an iterable of chunks (an async iterable in the async client), which
+                is compressed while it is iterated, and an uncompressed memory-mapped body arrives as a memoryview.
             timeout: Timeout for this attempt in seconds, or None for no timeout at all.
             stream: Whether to return the response with the body unread, so the caller can stream it.
 
@@ -774,7 +874,7 @@ class HttpClientAsync(HttpClientBase):
         url: str,
         headers: dict[str, str],
         params: dict[str, Any] | None,
-        content: bytes | None,
+        content: RequestContentAsync | None,
         stream: bool | None,
         timeout: Timeout,
     ) -> HttpResponse:
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from typing import TYPE_CHECKING
 
 import impit
@@ -21,6 +22,7 @@ if TYPE_CHECKING:
 
     from apify_client._statistics import ClientStatistics
     from apify_client.http_compressors._base import HttpCompressor
+    from apify_client.types import RequestContent, RequestContentAsync
 
 
 _PERMANENT_ERRORS = (
@@ -39,6 +41,25 @@ _PERMANENT_ERRORS = (
 """Impit errors that a retry cannot fix. Everything else in the `impit.HTTPError` tree counts as transient."""
 
 
+# Impit takes the request body only as a whole `bytes` object, so a streamed or memory-mapped body is joined into one
+# here. It is still compressed chunk by chunk on the way, so only the compressed body is held in memory, not the raw
+# one as well. A memoryview is converted explicitly, Impit would otherwise read it byte by byte as a sequence.
+def _to_impit_content(content: RequestContent | None) -> bytes | None:
+    if content is None or isinstance(content, bytes):
+        return content
+    if isinstance(content, memoryview):
+        return content.tobytes()
+    return b''.join(content)
+
+
+async def _to_impit_content_async(content: RequestContentAsync | None) -> bytes | None:
+    if content is None or isinstance(content, bytes):
+        return content
+    if isinstance(content, memoryview):
+        return await asyncio.to_thread(content.tobytes)
+    return b''.join([chunk async for chunk in content])
+
+
 @docs_group('HTTP clients')
 class ImpitHttpClient(HttpClient):
     """Synchronous HTTP client for the Apify API built on top of [Impit](https://github.com/apify/impit).
@@ -121,7 +142,7 @@ class ImpitHttpClient(HttpClient):
         method: str,
         url: str,
         headers: dict[str, str],
-        content: bytes | None,
+        content: RequestContent | None,
         timeout: float | None,
         stream: bool,
     ) -> impit.Response:
@@ -133,7 +154,7 @@ class ImpitHttpClient(HttpClient):
             method=method,
             url=url,
             headers=headers,
-            content=content,
+            content=_to_impit_content(content),
             timeout=impit_timeout,
             stream=stream,
         )
@@ -219,7 +240,7 @@ class ImpitHttpClientAsync(HttpClientAsync):
         method: str,
         url: str,
         headers: dict[str, str],
-        content: bytes | None,
+        content: RequestContentAsync | None,
         timeout: float | None,
         stream: bool,
     ) -> impit.Response:
@@ -229,7 +250,7 @@ class ImpitHttpClientAsync(HttpClientAsync):
             method=method,
             url=url,
             headers=headers,
-            content=content,
+            content=await _to_impit_content_async(content),
             timeout=impit_timeout,
             stream=stream,
         )
@@ -2,7 +2,7 @@ from apify_client._utils.try_import import install_import_hook as _install_impor
 from apify_client._utils.try_import import try_import as _try_import
 
 # These imports have only mandatory dependencies, so they are imported directly.
-from apify_client.http_compressors._base import HttpCompressor
+from apify_client.http_compressors._base import HttpCompressionStream, HttpCompressor
 from apify_client.http_compressors._gzip import GzipHttpCompressor
 
 _install_import_hook(__name__)
@@ -13,6 +13,6 @@ with _try_import(__name__, 'BrotliHttpCompressor', dependency_name='brotli') as
     from apify_client.http_compressors._brotli import BrotliHttpCompressor
 
 if _brotli_import.available:
-    __all__ = ['BrotliHttpCompressor', 'GzipHttpCompressor', 'HttpCompressor']
+    __all__ = ['BrotliHttpCompressor', 'GzipHttpCompressor', 'HttpCompressionStream', 'HttpCompressor']
 else:
-    __all__ = ['GzipHttpCompressor', 'HttpCompressor']
+    __all__ = ['GzipHttpCompressor', 'HttpCompressionStream', 'HttpCompressor']
@@ -2,6 +2,21 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 
+from typing_extensions import Protocol
+
+
+class HttpCompressionStream(Protocol):
+    """Incremental compression of one request body that arrives in chunks.
+
+    Obtain an instance via `HttpCompressor.compress_stream`.
+    """
+
+    def compress(self, data: bytes, /) -> bytes:
+        """Compress the next chunk of the body, returning whatever compressed output is ready so far."""
+
+    def flush(self) -> bytes:
+        """Finish the body, returning the rest of the compressed output."""
+
 
 class HttpCompressor(ABC):
     """Strategy for compressing HTTP request bodies.
@@ -23,3 +38,29 @@ class HttpCompressor(ABC):
         Returns:
             The compressed bytes.
         """
+
+    def compress_stream(self) -> HttpCompressionStream:
+        """Start compressing a request body that is streamed in chunks.
+
+        The default collects the chunks and compresses them all at once with `compress` when the stream is
+        flushed, so a custom compressor works with streamed bodies as it is. Override it to compress on the fly.
+
+        Returns:
+            A stream that compresses the chunks of one body.
+        """
+        return _BufferedCompressionStream(self)
+
+
+class _BufferedCompressionStream:
+    """Compression stream that buffers the whole body and compresses it with `HttpCompressor.compress` on flush."""
+
+    def __init__(self, compressor: HttpCompressor) -> None:
+        self._compressor = compressor
+        self._buffer = bytearray()
+
+    def compress(self, data: bytes) -> bytes:
+        self._buffer += data
+        return b''
+
+    def flush(self) -> bytes:
+        return self._compressor.compress(bytes(self._buffer))
@@ -1,9 +1,14 @@
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 import brotli
 
 from apify_client.http_compressors._base import HttpCompressor
 
+if TYPE_CHECKING:
+    from apify_client.http_compressors._base import HttpCompressionStream
+
 
 class BrotliHttpCompressor(HttpCompressor):
     """Compresses request bodies using brotli.
@@ -36,3 +41,19 @@ class BrotliHttpCompressor(HttpCompressor):
 
     def compress(self, data: bytes) -> bytes:
         return brotli.compress(data, quality=self._quality)
+
+    def compress_stream(self) -> HttpCompressionStream:
+        return _BrotliCompressionStream(brotli.Compressor(quality=self._quality))
+
+
+class _BrotliCompressionStream:
+    """Adapts `brotli.Compressor` to the `compress`/`flush` methods of `HttpCompressionStream`."""
+
+    def __init__(self, compressor: brotli.Compressor) -> None:
+        self._compressor = compressor
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.finish()
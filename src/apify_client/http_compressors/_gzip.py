@@ -1,9 +1,14 @@
 from __future__ import annotations
 
 import gzip
+import zlib
+from typing import TYPE_CHECKING
 
 from apify_client.http_compressors._base import HttpCompressor
 
+if TYPE_CHECKING:
+    from apify_client.http_compressors._base import HttpCompressionStream
+
 
 class GzipHttpCompressor(HttpCompressor):
     """Compresses request bodies using gzip.
@@ -36,3 +41,7 @@ class GzipHttpCompressor(HttpCompressor):
 
     def compress(self, data: bytes) -> bytes:
         return gzip.compress(data, compresslevel=self._quality)
+
+    def compress_stream(self) -> HttpCompressionStream:
+        # A window size of 16 + `MAX_WBITS` makes zlib write the gzip header and trailer around the deflate data.
+        return zlib.compressobj(self._quality, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
@@ -0,0 +1,238 @@
+"""A compact, sorted index of the keys of a key-value store.
+
+Build a `KeyIndex` with `KeyValueStoreClient.build_key_index` to keep the listing of a large store around without
+holding a model object per key. The keys are packed into a single buffer, with their offsets and the sizes of the
+records in typed arrays, so an index of millions of keys takes little more memory than the key names themselves:
+
+```python
+from apify_client import ApifyClient
+from apify_client.key_index import KeyIndex
+
+kvs = ApifyClient(token='MY-APIFY-TOKEN').key_value_store('my-store')
+
+index = kvs.build_key_index()
+index.save('keys.idx')
+
+# Later, or in another process: load the index and fetch only the keys added since.
+index = KeyIndex.load('keys.idx')
+kvs.refresh_key_index(index)
+
+assert 'screenshots!home.png' in index
+total_size = sum(size for _, size in index.items(prefix='screenshots!'))
+```
+"""
+
+from __future__ import annotations
+
+import heapq
+import json
+import sys
+from array import array
+from bisect import bisect_left
+from collections.abc import Sequence
+from pathlib import Path
+from typing import TYPE_CHECKING, overload
+
+from apify_client._docs import docs_group
+
+if TYPE_CHECKING:
+    import os
+    from collections.abc import Iterable, Iterator
+
+__all__ = ['KeyIndex']
+
+_FORMAT_VERSION = 1
+
+
+class _KeyColumn(Sequence[str]):
+    """A read-only view of the keys of a `KeyIndex`, decoding each key from the packed buffer on access."""
+
+    def __init__(self, data: bytearray, offsets: array[int]) -> None:
+        self._data = data
+        self._offsets = offsets
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    @overload
+    def __getitem__(self, index: int) -> str: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[str]: ...
+
+    def __getitem__(self, index: int | slice) -> str | list[str]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('key index out of range')
+        return self._data[self._offsets[index] : self._offsets[index + 1]].decode('utf-8')
+
+
+@docs_group('Other')
+class KeyIndex:
+    """A sorted, array-backed index of the keys of a key-value store and the sizes of their records.
+
+    The keys are kept sorted in a single UTF-8 buffer, with their offsets and record sizes in packed arrays, which
+    takes a fraction of the memory of the `KeyValueStoreKey` models `iterate_keys` yields. Membership is checked and
+    prefix ranges are found by binary search. The index can be saved to a file and loaded back, and brought up to date
+    with `KeyValueStoreClient.refresh_key_index`, which lists only the keys after the last indexed one.
+    """
+
+    def __init__(self, *, prefix: str | None = None) -> None:
+        """Create an empty index.
+
+        Args:
+            prefix: Prefix of the keys the index covers, or None if it covers all the keys of the store.
+        """
+        self._prefix = prefix
+        self._data = bytearray()
+        self._offsets = array('Q', [0])
+        self._sizes = array('q')
+
+    @property
+    def prefix(self) -> str | None:
+        """Prefix of the keys the index covers, or None if it covers all the keys of the store."""
+        return self._prefix
+
+    @property
+    def last_key(self) -> str | None:
+        """The greatest key in the index, from which the listing continues on refresh, or None if it is empty."""
+        return self._keys[-1] if self._sizes else None
+
+    @property
+    def _keys(self) -> _KeyColumn:
+        return _KeyColumn(self._data, self._offsets)
+
+    def __len__(self) -> int:
+        """Return the number of keys in the index."""
+        return len(self._sizes)
+
+    def __contains__(self, key: object) -> bool:
+        """Check whether a key is in the index, by binary search."""
+        return isinstance(key, str) and self._find(key) is not None
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the keys in sorted order."""
+        return iter(self._keys)
+
+    def get_size(self, key: str) -> int | None:
+        """Return the size of the record under a key, in bytes.
+
+        Args:
+            key: The key to look up.
+
+        Returns:
+            The size of the record, or None if the key is not in the index.
+        """
+        position = self._find(key)
+        return self._sizes[position] if position is not None else None
+
+    def keys(self, prefix: str = '') -> Iterator[str]:
+        """Iterate over the keys that start with a prefix, in sorted order.
+
+        Args:
+            prefix: The prefix of the keys. All keys are iterated over by default.
+        """
+        for key, _ in self.items(prefix):
+            yield key
+
+    def items(self, prefix: str = '') -> Iterator[tuple[str, int]]:
+        """Iterate over the keys that start with a prefix, with the sizes of their records, in sorted order.
+
+        Args:
+            prefix: The prefix of the keys. All keys are iterated over by default.
+        """
+        keys = self._keys
+        for position in range(bisect_left(keys, prefix), len(keys)):
+            key = keys[position]
+            if not key.startswith(prefix):
+                return
+            yield key, self._sizes[position]
+
+    def extend(self, entries: Iterable[tuple[str, int]]) -> None:
+        """Add keys with the sizes of their records, replacing the sizes of keys already in the index.
+
+        Keys that sort after the last indexed key, such as a page listed after it, are appended. Others are merged
+        into the index, which rebuilds it.
+
+        Args:
+            entries: The keys to add, each with the size of its record.
+        """
+        new_entries = sorted(dict(entries).items())
+        if not new_entries:
+            return
+
+        last_key = self.last_key
+        if last_key is None or new_entries[0][0] > last_key:
+            self._append(new_entries)
+            return
+
+        merged = dict[str, int]()
+        for key, size in heapq.merge(self.items(), new_entries, key=lambda entry: entry[0]):
+            merged[key] = size
+        self._data = bytearray()
+        self._offsets = array('Q', [0])
+        self._sizes = array('q')
+        self._append(merged.items())
+
+    def save(self, path: str | os.PathLike[str]) -> None:
+        """Write the index to a file, replacing the file atomically.
+
+        Args:
+            path: Path of the file to write.
+        """
+        path = Path(path)
+        header = {
+            'version': _FORMAT_VERSION,
+            'prefix': self._prefix,
+            'count': len(self),
+            'key_bytes': len(self._data),
+            'byteorder': sys.byteorder,
+        }
+        temporary_path = path.with_name(f'.{path.name}.tmp')
+        with temporary_path.open('wb') as file:
+            file.write(json.dumps(header).encode() + b'\n')
+            file.write(self._data)
+            self._offsets.tofile(file)
+            self._sizes.tofile(file)
+        temporary_path.replace(path)
+
+    @classmethod
+    def load(cls, path: str | os.PathLike[str]) -> KeyIndex:
+        """Read an index written by `save`.
+
+        Args:
+            path: Path of the file to read.
+
+        Returns:
+            The loaded index.
+        """
+        with Path(path).open('rb') as file:
+            header = json.loads(file.readline())
+            if header.get('version') != _FORMAT_VERSION:
+                raise ValueError(f'Unsupported key index format version: {header.get("version")!r}')
+
+            index = cls(prefix=header['prefix'])
+            index._data = bytearray(file.read(header['key_bytes']))
+            index._offsets = array('Q')
+            index._offsets.fromfile(file, header['count'] + 1)
+            index._sizes.fromfile(file, header['count'])
+
+        if header['byteorder'] != sys.byteorder:
+            index._offsets.byteswap()
+            index._sizes.byteswap()
+        return index
+
+    def _append(self, entries: Iterable[tuple[str, int]]) -> None:
+        """Append entries that are sorted and all sort after the last indexed key."""
+        for key, size in entries:
+            self._data += key.encode('utf-8')
+            self._offsets.append(len(self._data))
+            self._sizes.append(size)
+
+    def _find(self, key: str) -> int | None:
+        keys = self._keys
+        position = bisect_left(keys, key)
+        return position if position < len(keys) and keys[position] == key else None
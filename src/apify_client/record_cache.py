@@ -0,0 +1,320 @@
+"""A persistent disk cache for key-value store records.
+
+Pass a `RecordCache` to `ApifyClient.key_value_store` to keep the records read with `get_record` and
+`get_record_as_bytes` on disk. A cached record is served again without downloading its body: it is revalidated with a
+conditional request, which the API answers with `304 Not Modified` while the record stays the same, or, within the
+`ttl`, served without any request at all:
+
+```python
+from datetime import timedelta
+
+from apify_client import ApifyClient
+from apify_client.record_cache import RecordCache
+
+client = ApifyClient(token='MY-APIFY-TOKEN')
+
+# Revalidate every read, download a record again only after it changed.
+cache = RecordCache('.record-cache', max_size_bytes=512 * 1024 * 1024)
+
+# Serve records for up to five minutes without asking the API, then revalidate them.
+short_lived_cache = RecordCache('.record-cache', ttl=timedelta(minutes=5))
+
+# Records that never change, such as versioned lookup tables, are never revalidated.
+immutable_cache = RecordCache('.record-cache', ttl=None, revalidate=False)
+
+config = client.key_value_store('my-store', record_cache=cache).get_record('CONFIG')
+```
+
+The cache keeps each record in its own file, writes the files atomically and evicts the least recently used records
+once they take more than `max_size_bytes`, so one cache directory can be shared by any number of clients, threads and
+processes.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+from contextlib import suppress
+from dataclasses import dataclass, replace
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from apify_client._consts import DEFAULT_RECORD_CACHE_MAX_SIZE_BYTES
+from apify_client._docs import docs_group
+
+if TYPE_CHECKING:
+    from datetime import timedelta
+
+__all__ = ['CachedRecord', 'RecordCache']
+
+_ENTRY_SUFFIX = '.record'
+
+
+@docs_group('Other')
+@dataclass(frozen=True)
+class CachedRecord:
+    """A key-value store record kept in a `RecordCache`."""
+
+    store_url: str
+    """API URL of the key-value store the record belongs to."""
+
+    key: str
+    """Key of the record."""
+
+    content: bytes
+    """The raw body of the record."""
+
+    content_type: str
+    """The `Content-Type` the record was served with."""
+
+    etag: str | None
+    """The `ETag` the record was served with, if any."""
+
+    last_modified: str | None
+    """The `Last-Modified` date the record was served with, if any."""
+
+    validated_at: datetime
+    """When the record was last downloaded or confirmed unchanged by the API."""
+
+
+@docs_group('Other')
+class RecordCache:
+    """A size-bounded disk cache of key-value store records, shared by clients, threads and processes.
+
+    Whether a cached record is served without asking the API depends on `ttl` and `revalidate`:
+
+    - By default, every read is revalidated with a conditional request carrying the `ETag` and `Last-Modified` of
+      the cached record, and only a changed record is downloaded again.
+    - With a `ttl`, a record is served without any request until the `ttl` passes since it was last validated.
+    - With `revalidate=False`, an expired record is downloaded again without a conditional request. With no `ttl`
+      either, a cached record never expires, which suits records that are known to be immutable.
+
+    Each record is stored in a file of its own, together with its content type and validators. Files are replaced
+    atomically, so a reader never sees a partially written record. Once the records take more than `max_size_bytes`,
+    the least recently used ones are deleted.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        *,
+        max_size_bytes: int = DEFAULT_RECORD_CACHE_MAX_SIZE_BYTES,
+        ttl: timedelta | None = None,
+        revalidate: bool = True,
+    ) -> None:
+        """Initialize the cache, creating its directory if it does not exist.
+
+        Args:
+            directory: Directory the cached records are stored in.
+            max_size_bytes: Total size the cached records may take before the least recently used ones are evicted.
+                A record larger than this is never cached.
+            ttl: How long a record is served from the cache without asking the API, counted from when it was last
+                validated. None serves a record without a request only when `revalidate` is False.
+            revalidate: Whether an expired record is revalidated with a conditional request, rather than downloaded
+                again.
+        """
+        if max_size_bytes <= 0:
+            raise ValueError(f'max_size_bytes must be positive, got {max_size_bytes}')
+
+        self._directory = Path(directory)
+        self._directory.mkdir(parents=True, exist_ok=True)
+        self._max_size_bytes = max_size_bytes
+        self._ttl = ttl
+        self._revalidate = revalidate
+
+    @property
+    def directory(self) -> Path:
+        """Directory the cached records are stored in."""
+        return self._directory
+
+    @property
+    def max_size_bytes(self) -> int:
+        """Total size the cached records may take before the least recently used ones are evicted."""
+        return self._max_size_bytes
+
+    def get(self, store_url: str, key: str) -> CachedRecord | None:
+        """Read a record from the cache and mark it as recently used.
+
+        Args:
+            store_url: API URL of the key-value store the record belongs to.
+            key: Key of the record.
+
+        Returns:
+            The cached record, or None, if the record is not cached.
+        """
+        path = self._entry_path(store_url, key)
+        try:
+            with path.open('rb') as file:
+                header = json.loads(file.readline())
+                content = file.read()
+                validated_at = os.fstat(file.fileno()).st_mtime
+        except FileNotFoundError:
+            return None
+        except ValueError:
+            # A file that cannot be read back is dropped, and the record is downloaded again.
+            path.unlink(missing_ok=True)
+            return None
+
+        if header.get('store_url') != store_url or header.get('key') != key:
+            return None
+
+        # The access time orders the records for eviction, the modification time records the last validation.
+        with suppress(OSError):
+            os.utime(path, (time.time(), validated_at))
+
+        return CachedRecord(
+            store_url=store_url,
+            key=key,
+            content=content,
+            content_type=header['content_type'],
+            etag=header.get('etag'),
+            last_modified=header.get('last_modified'),
+            validated_at=datetime.fromtimestamp(validated_at, tz=UTC),
+        )
+
+    def is_fresh(self, record: CachedRecord) -> bool:
+        """Whether a cached record can be served without asking the API.
+
+        Args:
+            record: The cached record.
+        """
+        if self._ttl is None:
+            return not self._revalidate
+        return datetime.now(UTC) - record.validated_at < self._ttl
+
+    def get_revalidation_headers(self, record: CachedRecord) -> dict[str, str] | None:
+        """Build the headers of a conditional request for an expired record.
+
+        Args:
+            record: The cached record.
+
+        Returns:
+            The `If-None-Match` and `If-Modified-Since` headers, or None, if the record has no validators or the cache
+            does not revalidate records.
+        """
+        if not self._revalidate:
+            return None
+
+        headers = {}
+        if record.etag is not None:
+            headers['If-None-Match'] = record.etag
+        if record.last_modified is not None:
+            headers['If-Modified-Since'] = record.last_modified
+        return headers or None
+
+    def put(
+        self,
+        store_url: str,
+        key: str,
+        content: bytes,
+        *,
+        content_type: str,
+        etag: str | None = None,
+        last_modified: str | None = None,
+    ) -> CachedRecord:
+        """Store a record in the cache, evicting the least recently used records if the cache grows too large.
+
+        Args:
+            store_url: API URL of the key-value store the record belongs to.
+            key: Key of the record.
+            content: The raw body of the record.
+            content_type: The `Content-Type` the record was served with.
+            etag: The `ETag` the record was served with.
+            last_modified: The `Last-Modified` date the record was served with.
+
+        Returns:
+            The record as it was stored.
+        """
+        record = CachedRecord(
+            store_url=store_url,
+            key=key,
+            content=content,
+            content_type=content_type,
+            etag=etag,
+            last_modified=last_modified,
+            validated_at=datetime.now(UTC),
+        )
+        path = self._entry_path(store_url, key)
+        if len(content) > self._max_size_bytes:
+            path.unlink(missing_ok=True)
+            return record
+
+        header = {
+            'store_url': store_url,
+            'key': key,
+            'content_type': content_type,
+            'etag': etag,
+            'last_modified': last_modified,
+        }
+        file_descriptor, temporary_name = tempfile.mkstemp(dir=self._directory, prefix='.', suffix='.tmp')
+        try:
+            with os.fdopen(file_descriptor, 'wb') as file:
+                file.write(json.dumps(header).encode() + b'\n')
+                file.write(content)
+            Path(temporary_name).replace(path)
+        except OSError:
+            # The cache only saves requests, so a record that cannot be written is simply not cached.
+            Path(temporary_name).unlink(missing_ok=True)
+            return record
+
+        self._evict()
+        return record
+
+    def mark_validated(self, record: CachedRecord) -> CachedRecord:
+        """Record that the API confirmed a cached record is unchanged.
+
+        Args:
+            record: The cached record.
+
+        Returns:
+            The record with its validation time updated.
+        """
+        now = time.time()
+        try:
+            os.utime(self._entry_path(record.store_url, record.key), (now, now))
+        except FileNotFoundError:
+            # Another client evicted the record since it was read.
+            return self.put(
+                record.store_url,
+                record.key,
+                record.content,
+                content_type=record.content_type,
+                etag=record.etag,
+                last_modified=record.last_modified,
+            )
+        return replace(record, validated_at=datetime.fromtimestamp(now, tz=UTC))
+
+    def invalidate(self, store_url: str, key: str) -> None:
+        """Remove a record from the cache, if it is cached.
+
+        Args:
+            store_url: API URL of the key-value store the record belongs to.
+            key: Key of the record.
+        """
+        self._entry_path(store_url, key).unlink(missing_ok=True)
+
+    def clear(self) -> None:
+        """Remove all records from the cache."""
+        for path in self._directory.glob(f'*{_ENTRY_SUFFIX}'):
+            path.unlink(missing_ok=True)
+
+    def _entry_path(self, store_url: str, key: str) -> Path:
+        digest = hashlib.sha256(f'{store_url}\0{key}'.encode()).hexdigest()
+        return self._directory / f'{digest}{_ENTRY_SUFFIX}'
+
+    def _evict(self) -> None:
+        entries = []
+        for path in self._directory.glob(f'*{_ENTRY_SUFFIX}'):
+            with suppress(FileNotFoundError):
+                entries.append((path, path.stat()))
+
+        total_size = sum(stat.st_size for _, stat in entries)
+        for path, stat in sorted(entries, key=lambda entry: entry[1].st_atime):
+            if total_size <= self._max_size_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total_size -= stat.st_size
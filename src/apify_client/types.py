@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+from collections.abc import AsyncIterable, Iterable
 from datetime import timedelta
+from mmap import mmap
 from typing import Literal
 
 from apify_client._models import WebhookCreate, WebhookRepresentation
@@ -11,6 +13,12 @@ from apify_client._typeddicts import (
     WebhookRepresentationDict,
 )
 
+DirectorySyncDirection = Literal['up', 'down']
+"""Accepted string literals for the `direction` parameter of `KeyValueStoreClient.sync_directory`.
+
+`'up'` makes the key-value store match the local directory, `'down'` makes the local directory match the store.
+"""
+
 HttpCompressionAlgorithm = Literal['brotli', 'gzip']
 """Accepted string literals for the `compression` parameter on `ApifyClient` and `ApifyClientAsync`."""
 
@@ -44,9 +52,36 @@ JsonSerializable = dict[str, 'JsonSerializable'] | list['JsonSerializable'] | st
 Based on the definition discussed in https://github.com/python/typing/issues/182.
 """
 
+RequestData = str | bytes | bytearray | memoryview | mmap | Iterable[bytes]
+"""Type for the `data` parameter of `HttpClient.call` - the raw body of a request.
+
+Bytes and strings are sent as they are. A memory-mapped file or a memoryview is read without copying it into a
+bytes object first, and an iterable of bytes chunks is streamed. The iterable should start over on each iteration
+for the request to be retried, a one-shot iterator such as a generator is sent only once.
+"""
+
+RequestDataAsync = RequestData | AsyncIterable[bytes]
+"""Type for the `data` parameter of `HttpClientAsync.call`. Like `RequestData`, plus async iterables of chunks."""
+
+RequestContent = bytes | memoryview | Iterable[bytes]
+"""Type for the `content` a transport receives in `HttpClient.send_request`.
+
+A streamed body arrives as an iterable of bytes chunks, compressed while it is iterated if the request is
+compressed. A memory-mapped body that is not compressed arrives as a memoryview.
+"""
+
+RequestContentAsync = bytes | memoryview | AsyncIterable[bytes]
+"""Type for the `content` a transport receives in `HttpClientAsync.send_request`. Like `RequestContent`, but a
+streamed body arrives as an async iterable, read and compressed off the event loop."""
+
 __all__ = [
+    'DirectorySyncDirection',
     'HttpCompressionAlgorithm',
     'JsonSerializable',
+    'RequestContent',
+    'RequestContentAsync',
+    'RequestData',
+    'RequestDataAsync',
     'Timeout',
     'WebhooksList',
 ]
@@ -2,18 +2,23 @@ from __future__ import annotations
 
 import gzip
 import json
+import logging
 import re
+from datetime import timedelta
 from typing import TYPE_CHECKING
 
 import pytest
 from werkzeug.wrappers import Response
 
 from apify_client import ApifyClient, ApifyClientAsync
+from apify_client._logging import logger_name
+from apify_client._models import RequestDraft
 from apify_client.errors import ApifyApiError
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import AsyncIterator, Callable, Iterator
 
+    from _pytest.logging import LogCaptureFixture
     from pytest_httpserver import HTTPServer
     from werkzeug.wrappers import Request
 
@@ -253,3 +258,186 @@ def test_batch_processed_partially_sync(httpserver: HTTPServer) -> None:
     assert requests[0]['unique_key'] in {request.unique_key for request in batch_response.processed_requests}
     assert len(batch_response.unprocessed_requests) == 1
     assert batch_response.unprocessed_requests[0].unique_key == requests[1]['unique_key']
+
+
+def _echoing_batch_handler(request: Request) -> Response:
+    """Respond to a batch-add request as if all of its requests were added."""
+    body = request.get_data()
+    batch = json.loads(gzip.decompress(body) if request.headers.get('Content-Encoding') == 'gzip' else body)
+    processed = [
+        {'requestId': f'id-{i}', 'uniqueKey': r['uniqueKey'], 'wasAlreadyPresent': False, 'wasAlreadyHandled': False}
+        for i, r in enumerate(batch)
+    ]
+    data = {'processedRequests': processed, 'unprocessedRequests': []}
+    return Response(json.dumps({'data': data}), status=200, content_type='application/json')
+
+
+def test_batch_add_requests_streamed_consumes_input_lazily_sync(httpserver: HTTPServer) -> None:
+    """Test that requests are consumed from a generator only as batches are sent, and each batch result is yielded."""
+    server_url = httpserver.url_for('/').removesuffix('/')
+    client = ApifyClient(token='placeholder_token', api_url=server_url, api_public_url=server_url)
+    httpserver.expect_request(re.compile(r'.*'), method='POST').respond_with_handler(_echoing_batch_handler)
+    consumed = 0
+
+    def generate_requests() -> Iterator[RequestDraftDict]:
+        nonlocal consumed
+        for i in range(60):
+            consumed += 1
+            yield {'unique_key': f'http://example.com/{i}', 'url': f'http://example.com/{i}', 'method': 'GET'}
+
+    results = client.request_queue(request_queue_id='whatever').batch_add_requests_streamed(generate_requests())
+    assert consumed == 0
+
+    first = next(results)
+    # The first batch is sent once the first request of the second batch has been read.
+    assert consumed == 26
+    assert len(first.processed_requests) == 25
+    assert [len(result.processed_requests) for result in results] == [25, 10]
+    assert consumed == 60
+
+
+async def test_batch_add_requests_streamed_async(httpserver: HTTPServer) -> None:
+    """Test that the async client adds requests from an async iterable and yields the result of each batch."""
+    server_url = httpserver.url_for('/').removesuffix('/')
+    client = ApifyClientAsync(token='placeholder_token', api_url=server_url, api_public_url=server_url)
+    httpserver.expect_request(re.compile(r'.*'), method='POST').respond_with_handler(_echoing_batch_handler)
+
+    async def generate_requests() -> AsyncIterator[RequestDraftDict]:
+        for i in range(130):
+            yield {'unique_key': f'http://example.com/{i}', 'url': f'http://example.com/{i}', 'method': 'GET'}
+
+    rq_client = client.request_queue(request_queue_id='whatever')
+    results = [result async for result in rq_client.batch_add_requests_streamed(generate_requests(), max_parallel=2)]
+
+    assert sorted(len(result.processed_requests) for result in results) == [5, 25, 25, 25, 25, 25]
+    unique_keys = {request.unique_key for result in results for request in result.processed_requests}
+    assert len(unique_keys) == 130
+
+
+class _ThrottlingBatchHandler:
+    """Respond to batch-add requests leaving the last request of each batch unprocessed for the first few calls."""
+
+    def __init__(self, throttled_calls: int) -> None:
+        self.throttled_calls = throttled_calls
+        self.batches: list[list[dict]] = []
+
+    def __call__(self, request: Request) -> Response:
+        body = request.get_data()
+        batch = json.loads(gzip.decompress(body) if request.headers.get('Content-Encoding') == 'gzip' else body)
+        self.batches.append(batch)
+        throttled = len(self.batches) <= self.throttled_calls
+        added, rejected = (batch[:-1], batch[-1:]) if throttled else (batch, [])
+        processed = [
+            {'requestId': 'id', 'uniqueKey': r['uniqueKey'], 'wasAlreadyPresent': False, 'wasAlreadyHandled': False}
+            for r in added
+        ]
+        # The API reports an unprocessed request without its user data.
+        unprocessed = [{'uniqueKey': r['uniqueKey'], 'url': r['url'], 'method': r['method']} for r in rejected]
+        data = {'processedRequests': processed, 'unprocessedRequests': unprocessed}
+        return Response(json.dumps({'data': data}), status=200, content_type='application/json')
+
+
+def _make_labelled_requests(count: int) -> list[RequestDraft]:
+    return [
+        RequestDraft.model_validate(
+            {
+                'uniqueKey': f'http://example.com/{i}',
+                'url': f'http://example.com/{i}',
+                'method': 'GET',
+                'userData': {'label': 'DETAIL'},
+            }
+        )
+        for i in range(count)
+    ]
+
+
+def test_batch_add_requests_retries_unprocessed_requests_sync(httpserver: HTTPServer) -> None:
+    """Test that unprocessed requests are re-sent as they were, re-packed into one batch, and the results merged."""
+    server_url = httpserver.url_for('/').removesuffix('/')
+    client = ApifyClient(token='placeholder_token', api_url=server_url, api_public_url=server_url)
+    handler = _ThrottlingBatchHandler(throttled_calls=3)
+    httpserver.expect_request(re.compile(r'.*'), method='POST').respond_with_handler(handler)
+
+    result = client.request_queue(request_queue_id='whatever').batch_add_requests(
+        _make_labelled_requests(60), unprocessed_retries=2, unprocessed_retry_delay=timedelta(0)
+    )
+
+    assert [len(batch) for batch in handler.batches] == [25, 25, 10, 3]
+    assert all(request['userData'] == {'label': 'DETAIL'} for request in handler.batches[-1])
+    assert len(result.processed_requests) == 60
+    assert not result.unprocessed_requests
+
+
+async def test_batch_add_requests_retries_unprocessed_requests_async(httpserver: HTTPServer) -> None:
+    """Test that retrying stops after the given number of rounds, returning the requests still left unprocessed."""
+    server_url = httpserver.url_for('/').removesuffix('/')
+    client = ApifyClientAsync(token='placeholder_token', api_url=server_url, api_public_url=server_url)
+    handler = _ThrottlingBatchHandler(throttled_calls=100)
+    httpserver.expect_request(re.compile(r'.*'), method='POST').respond_with_handler(handler)
+
+    result = await client.request_queue(request_queue_id='whatever').batch_add_requests(
+        _make_labelled_requests(30), unprocessed_retries=2, unprocessed_retry_delay=timedelta(0)
+    )
+
+    # The two requests left unprocessed go in one batch, of which the API again leaves one unprocessed, and so on.
+    assert sorted(len(batch) for batch in handler.batches) == [1, 2, 5, 25]
+    assert len(result.processed_requests) == 29
+    assert [request.unique_key for request in result.unprocessed_requests] == [handler.batches[-1][0]['uniqueKey']]
+
+
+def test_batch_add_requests_in_parallel_sync(httpserver: HTTPServer) -> None:
+    """Test that the sync client sends batches from several threads and merges their results."""
+    server_url = httpserver.url_for('/').removesuffix('/')
+    client = ApifyClient(token='placeholder_token', api_url=server_url, api_public_url=server_url)
+    httpserver.expect_request(re.compile(r'.*'), method='POST').respond_with_handler(_echoing_batch_handler)
+    requests: list[RequestDraftDict] = [
+        {'unique_key': f'http://example.com/{i}', 'url': f'http://example.com/{i}', 'method': 'GET'} for i in range(130)
+    ]
+
+    result = client.request_queue(request_queue_id='whatever').batch_add_requests(requests, max_parallel=3)
+
+    assert sorted(request.unique_key for request in result.processed_requests) == sorted(
+        request['unique_key'] for request in requests
+    )
+    assert not result.unprocessed_requests
+
+
+def test_batch_add_requests_in_parallel_keeps_log_context_sync(
+    httpserver: HTTPServer, caplog: LogCaptureFixture
+) -> None:
+    """Test that the requests sent from the worker threads are logged with the context of the client method."""
+    server_url = httpserver.url_for('/').removesuffix('/')
+    client = ApifyClient(token='placeholder_token', api_url=server_url, api_public_url=server_url)
+    httpserver.expect_request(re.compile(r'.*'), method='POST').respond_with_handler(_echoing_batch_handler)
+    requests: list[RequestDraftDict] = [
+        {'unique_key': f'http://example.com/{i}', 'url': f'http://example.com/{i}', 'method': 'GET'} for i in range(130)
+    ]
+
+    with caplog.at_level(logging.DEBUG, logger=logger_name):
+        client.request_queue(request_queue_id='whatever').batch_add_requests(requests, max_parallel=3)
+
+    sent = [record for record in caplog.records if record.message == 'Sending request']
+    assert len(sent) == 6
+    assert {(getattr(record, 'client_method', None), getattr(record, 'resource_id', None)) for record in sent} == {
+        ('RequestQueueClient.batch_add_requests', 'whatever')
+    }
+
+
+def test_batch_add_requests_in_parallel_raises_first_error_sync(httpserver: HTTPServer) -> None:
+    """Test that a failing batch fails the whole call with its error when batches are sent in parallel."""
+    server_url = httpserver.url_for('/').removesuffix('/')
+    client = ApifyClient(token='placeholder_token', api_url=server_url, api_public_url=server_url)
+
+    def handler(request: Request) -> Response:
+        body = request.get_data()
+        if b'http://example.com/40"' in (gzip.decompress(body) if request.headers.get('Content-Encoding') else body):
+            return Response('{"error": {"type": "invalid-input", "message": "Bad request"}}', status=400)
+        return _echoing_batch_handler(request)
+
+    httpserver.expect_request(re.compile(r'.*'), method='POST').respond_with_handler(handler)
+    requests: list[RequestDraftDict] = [
+        {'unique_key': f'http://example.com/{i}', 'url': f'http://example.com/{i}', 'method': 'GET'} for i in range(130)
+    ]
+
+    with pytest.raises(ApifyApiError, match='Bad request'):
+        client.request_queue(request_queue_id='whatever').batch_add_requests(requests, max_parallel=3)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from io import BytesIO
 from typing import TYPE_CHECKING
 
 from apify_client import ApifyClient, ApifyClientAsync
@@ -127,3 +128,82 @@ async def test_protocol_check_leaves_stream_unread_async(
         # `is_stream_consumed` is transport state, not part of the protocol, but the built-in client exposes it.
         raw: Any = response
         assert raw.is_stream_consumed is False
+
+
+def test_dataset_get_items_as_file_spools_to_disk_sync(
+    httpserver: HTTPServer,
+    http_client_class: type[HttpClient],
+) -> None:
+    """A body larger than the memory threshold rolls over to a temporary file on disk."""
+    content = b'{"id": 1}\n' * 1000
+    httpserver.expect_request(f'/v2/datasets/{DATASET_ID}/items').respond_with_data(content)
+    api_url = httpserver.url_for('/').removesuffix('/')
+    client = ApifyClient.with_custom_http_client(
+        api_url=api_url,
+        http_client=http_client_class(),
+    )
+
+    with client.dataset(DATASET_ID).get_items_as_file(item_format='jsonl', max_memory_bytes=1024) as file:
+        raw: Any = file
+        assert raw._rolled is True
+        assert file.read() == content
+
+
+async def test_dataset_get_items_as_file_writes_into_given_file_async(
+    httpserver: HTTPServer,
+    http_client_async_class: type[HttpClientAsync],
+) -> None:
+    """A caller's file receives the body and is returned as it is after the last write."""
+    httpserver.expect_request(f'/v2/datasets/{DATASET_ID}/items').respond_with_data(STREAM_CONTENT)
+    api_url = httpserver.url_for('/').removesuffix('/')
+    client = ApifyClientAsync.with_custom_http_client(
+        api_url=api_url,
+        http_client=http_client_async_class(),
+    )
+    buffer = BytesIO()
+
+    assert await client.dataset(DATASET_ID).get_items_as_file(buffer) is buffer
+    assert buffer.getvalue() == STREAM_CONTENT
+
+
+def test_key_value_store_get_record_as_file_sync(
+    httpserver: HTTPServer,
+    http_client_class: type[HttpClient],
+) -> None:
+    """A record is spooled into a file, and a missing record gives None."""
+    httpserver.expect_request(f'/v2/key-value-stores/{KVS_ID}/records/{RECORD_KEY}').respond_with_data(
+        STREAM_CONTENT, content_type='application/json'
+    )
+    httpserver.expect_request(f'/v2/key-value-stores/{KVS_ID}/records/missing').respond_with_json(
+        {'error': {'type': 'record-not-found', 'message': 'Record was not found'}}, status=404
+    )
+    api_url = httpserver.url_for('/').removesuffix('/')
+    client = ApifyClient.with_custom_http_client(
+        api_url=api_url,
+        http_client=http_client_class(),
+    )
+
+    record = client.key_value_store(KVS_ID).get_record_as_file(RECORD_KEY)
+    assert record is not None
+    assert record['content_type'] == 'application/json'
+    with record['value'] as file:
+        assert file.read() == STREAM_CONTENT
+    assert client.key_value_store(KVS_ID).get_record_as_file('missing') is None
+
+
+async def test_log_get_as_file_async(
+    httpserver: HTTPServer,
+    http_client_async_class: type[HttpClientAsync],
+) -> None:
+    """A log is spooled into a file."""
+    httpserver.expect_request('/v2/logs/test-run-id').respond_with_data(b'log line\n')
+    api_url = httpserver.url_for('/').removesuffix('/')
+    client = ApifyClientAsync.with_custom_http_client(
+        api_url=api_url,
+        http_client=http_client_async_class(),
+    )
+
+    file = await client.log('test-run-id').get_as_file()
+    assert file is not None
+    with file:
+        assert file.read() == b'log line\n'
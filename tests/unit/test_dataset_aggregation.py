@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING, Any
+
+import pytest
+from werkzeug import Request, Response
+
+from apify_client import ApifyClient, ApifyClientAsync
+from apify_client.aggregation import Count, DistinctCount, ItemAggregation, Max, Min, Sum, TopK
+
+if TYPE_CHECKING:
+    from pytest_httpserver import HTTPServer
+
+DATASET_ID = 'test-dataset-id'
+DATASET_PATH = f'/v2/datasets/{DATASET_ID}'
+ITEMS: list[dict[str, Any]] = [{'id': i, 'shop': f'shop-{i % 3}', 'price': i % 7 or None} for i in range(100)]
+
+
+def _has_price(item: dict[str, Any]) -> bool:
+    return item.get('price') is not None
+
+
+PRICES_BY_SHOP = (
+    ItemAggregation()
+    .filter(_has_price)
+    .group_by('shop')
+    .agg(count=Count(), total=Sum('price'), cheapest=Min('price'), priciest=Max('price'))
+)
+
+
+def _serve_dataset(httpserver: HTTPServer) -> list[tuple[int, int]]:
+    item_requests: list[tuple[int, int]] = []
+    dataset = {
+        'id': DATASET_ID,
+        'name': None,
+        'userId': 'test-user-id',
+        'createdAt': '2024-01-01T00:00:00.000Z',
+        'modifiedAt': '2024-01-01T00:00:00.000Z',
+        'accessedAt': '2024-01-01T00:00:00.000Z',
+        'itemCount': len(ITEMS),
+        'cleanItemCount': len(ITEMS),
+        'consoleUrl': f'https://console.apify.com/storage/datasets/{DATASET_ID}',
+    }
+
+    def items_handler(request: Request) -> Response:
+        assert request.args['format'] == 'jsonl'
+        offset, limit = int(request.args['offset']), int(request.args['limit'])
+        item_requests.append((offset, limit))
+        body = ''.join(json.dumps(item) + '\n' for item in ITEMS[offset : offset + limit])
+        return Response(body, content_type='application/jsonl')
+
+    httpserver.expect_request(DATASET_PATH, method='GET').respond_with_json({'data': dataset})
+    httpserver.expect_request(f'{DATASET_PATH}/items').respond_with_handler(items_handler)
+    return item_requests
+
+
+def test_apply_filters_maps_and_groups() -> None:
+    results = PRICES_BY_SHOP.apply(ITEMS)
+
+    priced = [item for item in ITEMS if item['price'] is not None]
+    assert set(results) == {'shop-0', 'shop-1', 'shop-2'}
+    for shop, result in results.items():
+        prices = [item['price'] for item in priced if item['shop'] == shop]
+        assert result == {'count': len(prices), 'total': sum(prices), 'cheapest': min(prices), 'priciest': max(prices)}
+
+    doubled = ItemAggregation().map(lambda item: {'price': 2 * (item['price'] or 0)}).agg(total=Sum('price'))
+    assert doubled.apply(ITEMS) == {'total': 2 * sum(item['price'] for item in priced)}
+    assert ItemAggregation().apply([]) == {'count': 0}
+
+
+def test_merge_of_shards_equals_single_pass() -> None:
+    aggregation = ItemAggregation().agg(shops=DistinctCount('shop'), top=TopK('id', k=3), count=Count())
+
+    state = aggregation.create_state()
+    for shard in (ITEMS[:40], ITEMS[40:]):
+        shard_state = aggregation.create_state()
+        for item in shard:
+            aggregation.update(shard_state, item)
+        aggregation.merge(state, shard_state)
+
+    assert aggregation.finish(state) == aggregation.apply(ITEMS) == {'shops': 3, 'top': ITEMS[99:96:-1], 'count': 100}
+
+
+def test_distinct_count_estimate_is_close() -> None:
+    items = [{'user': f'user-{i % 20_000}'} for i in range(50_000)]
+
+    estimate = ItemAggregation().agg(users=DistinctCount('user')).apply(items)['users']
+
+    assert abs(estimate - 20_000) / 20_000 < 0.03
+    with pytest.raises(ValueError, match='precision'):
+        DistinctCount('user', precision=30)
+
+
+def test_aggregate_sync(httpserver: HTTPServer) -> None:
+    item_requests = _serve_dataset(httpserver)
+    client = ApifyClient(token='test-token', api_url=httpserver.url_for('/').removesuffix('/'))
+
+    results = client.dataset(DATASET_ID).aggregate(PRICES_BY_SHOP, page_size=30, max_parallel=2)
+
+    assert results == PRICES_BY_SHOP.apply(ITEMS)
+    assert sorted(item_requests) == [(0, 30), (30, 30), (60, 30), (90, 10)]
+
+
+def test_aggregate_in_worker_processes_sync(httpserver: HTTPServer) -> None:
+    _serve_dataset(httpserver)
+    client = ApifyClient(token='test-token', api_url=httpserver.url_for('/').removesuffix('/'))
+
+    results = client.dataset(DATASET_ID).aggregate(PRICES_BY_SHOP, offset=10, limit=50, page_size=20, processes=2)
+
+    assert results == PRICES_BY_SHOP.apply(ITEMS[10:60])
+
+
+async def test_aggregate_async(httpserver: HTTPServer) -> None:
+    item_requests = _serve_dataset(httpserver)
+    client = ApifyClientAsync(token='test-token', api_url=httpserver.url_for('/').removesuffix('/'))
+
+    results = await client.dataset(DATASET_ID).aggregate(PRICES_BY_SHOP, page_size=40)
+
+    assert results == PRICES_BY_SHOP.apply(ITEMS)
+    assert sorted(item_requests) == [(0, 40), (40, 40), (80, 20)]
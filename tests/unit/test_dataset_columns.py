@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import json
+import math
+from array import array
+from typing import TYPE_CHECKING
+
+import pytest
+
+from apify_client import ApifyClient, ApifyClientAsync
+from apify_client._resource_clients import dataset as dataset_module
+from apify_client._utils.columns import ColumnBuilder
+
+if TYPE_CHECKING:
+    from pytest_httpserver import HTTPServer
+
+    from apify_client._utils.columns import _ColumnKind
+
+DATASET_ID = 'test-dataset-id'
+ITEMS_PATH = f'/v2/datasets/{DATASET_ID}/items'
+ITEMS = [
+    {'name': 'a', 'price': 1, 'rating': 4.5, 'in_stock': True},
+    {'name': 'b', 'price': 2, 'rating': 3, 'in_stock': False},
+    {'name': None, 'price': 3, 'in_stock': True},
+]
+
+
+@pytest.fixture
+def without_optional_dependencies(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(dataset_module, 'import_column_libraries', lambda: (None, None))
+
+
+def _build(values: list) -> object:
+    column = ColumnBuilder()
+    for value in values:
+        column.append(value)
+    return column.build(numpy=None, pyarrow=None)
+
+
+def test_column_builder_packs_scalars_into_typed_buffers() -> None:
+    assert _build([1, 2, 3]) == array('q', [1, 2, 3])
+    assert _build([True, False]) == array('B', [1, 0])
+    assert _build(['a', None]) == ['a', None]
+
+    leading_null = _build([None, 1.5])
+    assert isinstance(leading_null, array)
+    assert math.isnan(leading_null[0])
+    assert leading_null[1] == 1.5
+
+
+def test_column_builder_widens_mixed_values() -> None:
+    assert _build([1, 2.5]) == array('d', [1.0, 2.5])
+    assert _build([1, 'a']) == [1, 'a']
+    assert _build([True, None]) == [True, None]
+    assert _build([2**64, 1]) == [2**64, 1]
+
+    with_null = _build([1, None, 3])
+    assert isinstance(with_null, array)
+    assert with_null.typecode == 'd'
+    assert math.isnan(with_null[1])
+
+
+def test_column_builder_converts_a_large_mixed_column_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Integers in a float column and values in an object column are appended without rebuilding the column."""
+    conversions = list[str]()
+    convert = ColumnBuilder._convert
+
+    def counting_convert(column: ColumnBuilder, kind: _ColumnKind) -> None:
+        conversions.append(kind)
+        convert(column, kind)
+
+    monkeypatch.setattr(ColumnBuilder, '_convert', counting_convert)
+    numbers = [index if index % 2 else index + 0.5 for index in range(40_000)]
+
+    column = _build(numbers)
+    mixed = _build([*numbers, 'a', *numbers])
+
+    assert conversions == ['float', 'float', 'object']
+    assert column == array('d', numbers)
+    assert isinstance(mixed, list)
+    assert mixed[40_000] == 'a'
+    assert len(mixed) == 80_001
+
+
+@pytest.mark.usefixtures('without_optional_dependencies')
+def test_to_columns_sync(httpserver: HTTPServer) -> None:
+    httpserver.expect_request(ITEMS_PATH).respond_with_data(
+        ''.join(json.dumps(item) + '\n' for item in ITEMS), content_type='application/jsonl'
+    )
+    client = ApifyClient(token='test-token', api_url=httpserver.url_for('/').removesuffix('/'))
+
+    columns = client.dataset(DATASET_ID).to_columns(['name', 'price', 'rating', 'in_stock'])
+
+    assert columns['name'] == ['a', 'b', None]
+    assert columns['price'] == array('q', [1, 2, 3])
+    assert columns['rating'][:2] == array('d', [4.5, 3.0])
+    assert math.isnan(columns['rating'][2])
+    assert columns['in_stock'] == array('B', [1, 0, 1])
+    request, _ = httpserver.log[-1]
+    assert request.args['fields'] == 'name,price,rating,in_stock'
+
+
+@pytest.mark.usefixtures('without_optional_dependencies')
+async def test_to_columns_async(httpserver: HTTPServer) -> None:
+    httpserver.expect_request(ITEMS_PATH).respond_with_data(
+        ''.join(json.dumps(item) + '\n' for item in ITEMS), content_type='application/jsonl'
+    )
+    client = ApifyClientAsync(token='test-token', api_url=httpserver.url_for('/').removesuffix('/'))
+
+    columns = await client.dataset(DATASET_ID).to_columns(['price', 'missing'])
+
+    assert columns == {'price': array('q', [1, 2, 3]), 'missing': [None, None, None]}
+
+
+def test_to_columns_returns_numpy_arrays(httpserver: HTTPServer) -> None:
+    numpy = pytest.importorskip('numpy')
+    httpserver.expect_request(ITEMS_PATH).respond_with_data(
+        ''.join(json.dumps(item) + '\n' for item in ITEMS), content_type='application/jsonl'
+    )
+    client = ApifyClient(token='test-token', api_url=httpserver.url_for('/').removesuffix('/'))
+
+    columns = client.dataset(DATASET_ID).to_columns(['price', 'in_stock'])
+
+    assert columns['price'].dtype == numpy.int64
+    assert columns['in_stock'].tolist() == [True, False, True]
@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import json
+from itertools import chain
+from typing import TYPE_CHECKING
+
+import pytest
+from werkzeug import Request, Response
+
+from apify_client import ApifyClient, ApifyClientAsync
+from apify_client._resource_clients.dataset import _split_into_shards
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pytest_httpserver import HTTPServer
+
+DATASET_ID = 'test-dataset-id'
+DATASET_PATH = f'/v2/datasets/{DATASET_ID}'
+ITEMS = [{'id': i} for i in range(10)]
+
+
+def _dataset_response(items: list[dict]) -> dict:
+    return {
+        'data': {
+            'id': DATASET_ID,
+            'name': None,
+            'userId': 'test-user-id',
+            'createdAt': '2024-01-01T00:00:00.000Z',
+            'modifiedAt': '2024-01-01T00:00:00.000Z',
+            'accessedAt': '2024-01-01T00:00:00.000Z',
+            'itemCount': len(items),
+            'cleanItemCount': len(items),
+            'actId': None,
+            'actRunId': None,
+            'fields': [],
+            'consoleUrl': f'https://console.apify.com/storage/datasets/{DATASET_ID}',
+        }
+    }
+
+
+def _items_handler(request: Request, dataset_items: list[dict]) -> Response:
+    offset = int(request.args.get('offset', 0))
+    limit = int(request.args['limit'])
+    items = dataset_items[offset : offset + limit]
+    if request.args['format'] == 'csv':
+        # Like the API, the columns are the fields of the items in the response, unless `fields` selects them.
+        columns = request.args['fields'].split(',') if 'fields' in request.args else sorted({*chain(*items)})
+        header = '' if request.args.get('skipHeaderRow') == 'true' else ','.join(columns) + '\n'
+        bom = '' if request.args.get('bom') == 'false' else '﻿'
+        rows = ''.join(','.join(str(item.get(column, '')) for column in columns) + '\n' for item in items)
+        return Response((bom + header + rows).encode(), content_type='text/csv')
+    return Response(b''.join(json.dumps(item).encode() + b'\n' for item in items), content_type='application/jsonl')
+
+
+def _serve_dataset(httpserver: HTTPServer, items: list[dict] = ITEMS) -> None:
+    httpserver.expect_request(DATASET_PATH, method='GET').respond_with_json(_dataset_response(items))
+    httpserver.expect_request(f'{DATASET_PATH}/items').respond_with_handler(
+        lambda request: _items_handler(request, items)
+    )
+
+
+def _read_jsonl(path: Path) -> list[dict]:
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+def test_split_into_shards() -> None:
+    assert _split_into_shards(0, 10, 3) == [(0, 4), (4, 3), (7, 3)]
+    assert _split_into_shards(5, 7, 4) == [(5, 1), (6, 1)]
+    assert _split_into_shards(3, 3, 4) == []
+
+
+def test_export_to_files_writes_one_file_per_shard_sync(httpserver: HTTPServer, tmp_path: Path) -> None:
+    _serve_dataset(httpserver)
+    client = ApifyClient(token='test-token', api_url=httpserver.url_for('/').removesuffix('/'))
+
+    paths = client.dataset(DATASET_ID).export_to_files(tmp_path / 'export', shards=3)
+
+    assert [path.name for path in paths] == ['part-00000.jsonl', 'part-00001.jsonl', 'part-00002.jsonl']
+    assert [item for path in paths for item in _read_jsonl(path)] == ITEMS
+
+
+async def test_export_to_files_writes_one_file_per_shard_async(httpserver: HTTPServer, tmp_path: Path) -> None:
+    _serve_dataset(httpserver)
+    client = ApifyClientAsync(token='test-token', api_url=httpserver.url_for('/').removesuffix('/'))
+
+    paths = await client.dataset(DATASET_ID).export_to_files(tmp_path / 'export', shards=3, offset=2, limit=5)
+
+    assert len(paths) == 3
+    assert [item for path in paths for item in _read_jsonl(path)] == ITEMS[2:7]
+
+
+def test_export_to_files_concatenates_csv_with_single_header_sync(httpserver: HTTPServer, tmp_path: Path) -> None:
+    _serve_dataset(httpserver)
+    client = ApifyClient(token='test-token', api_url=httpserver.url_for('/').removesuffix('/'))
+    target = tmp_path / 'items.csv'
+
+    paths = client.dataset(DATASET_ID).export_to_files(target, item_format='csv', shards=4, concatenate=True)
+
+    assert paths == [target]
+    assert target.read_text(encoding='utf-8') == '﻿id\n' + ''.join(f'{item["id"]}\n' for item in ITEMS)
+    assert list(tmp_path.iterdir()) == [target]
+
+
+def test_export_to_files_rejects_csv_shards_with_different_columns_sync(httpserver: HTTPServer, tmp_path: Path) -> None:
+    items = [{'id': i} for i in range(5)] + [{'id': i, 'name': f'item-{i}'} for i in range(5, 10)]
+    _serve_dataset(httpserver, items)
+    client = ApifyClient(token='test-token', api_url=httpserver.url_for('/').removesuffix('/'))
+    target = tmp_path / 'items.csv'
+
+    with pytest.raises(ValueError, match='different CSV columns'):
+        client.dataset(DATASET_ID).export_to_files(target, item_format='csv', shards=2, concatenate=True)
+    assert list(tmp_path.iterdir()) == []
+
+    client.dataset(DATASET_ID).export_to_files(
+        target, item_format='csv', shards=2, concatenate=True, fields=['id', 'name'], skip_header_row=True
+    )
+    rows = ''.join(f'{item["id"]},{item.get("name", "")}\n' for item in items)
+    assert target.read_text(encoding='utf-8') == '\ufeff' + rows
+
+
+async def test_export_to_files_concatenates_jsonl_async(httpserver: HTTPServer, tmp_path: Path) -> None:
+    _serve_dataset(httpserver)
+    client = ApifyClientAsync(token='test-token', api_url=httpserver.url_for('/').removesuffix('/'))
+    target = tmp_path / 'items.jsonl'
+
+    await client.dataset(DATASET_ID).export_to_files(target, shards=4, concatenate=True)
+
+    assert _read_jsonl(target) == ITEMS
+    assert list(tmp_path.iterdir()) == [target]  # noqa: ASYNC240
+
+
+def test_export_to_files_rejects_concatenating_xlsx_sync(tmp_path: Path) -> None:
+    client = ApifyClient(token='test-token')
+
+    with pytest.raises(ValueError, match='cannot be concatenated'):
+        client.dataset(DATASET_ID).export_to_files(tmp_path / 'items.xlsx', item_format='xlsx', concatenate=True)
@@ -4,9 +4,12 @@ import json
 from typing import TYPE_CHECKING
 
 import pytest
+from pydantic import BaseModel, ValidationError
+from typing_extensions import TypedDict
 from werkzeug import Response
 
 from apify_client import ApifyClient, ApifyClientAsync
+from apify_client._resource_clients.dataset import _item_list_adapter
 
 if TYPE_CHECKING:
     from collections.abc import Callable
@@ -17,7 +20,15 @@ DATASET_ID = 'test-dataset-id'
 ITEMS_PATH = f'/v2/datasets/{DATASET_ID}/items'
 
 
-def _make_list_items_handler(*, desc_header_value: str) -> Callable:
+class _ItemModel(BaseModel):
+    id: int
+
+
+class _ItemDict(TypedDict):
+    id: int
+
+
+def _make_list_items_handler(*, desc_header_value: str = 'false', body: object = None) -> Callable:
     """Create a handler that returns a list_items response with the given desc header value."""
 
     def handler(_request: object) -> Response:
@@ -31,7 +42,7 @@ def _make_list_items_handler(*, desc_header_value: str) -> Callable:
                 'x-apify-pagination-desc': desc_header_value,
                 'content-type': 'application/json',
             },
-            response=json.dumps([{'id': 1}, {'id': 2}]),
+            response=json.dumps([{'id': 1}, {'id': 2}] if body is None else body),
         )
 
     return handler
@@ -87,3 +98,40 @@ async def test_list_items_desc_true_async(httpserver: HTTPServer, desc_header_va
     result = await client.dataset(DATASET_ID).list_items()
 
     assert result.desc is True
+
+
+def test_list_items_validates_into_pydantic_model_sync(httpserver: HTTPServer) -> None:
+    httpserver.expect_request(ITEMS_PATH).respond_with_handler(_make_list_items_handler())
+    client = ApifyClient(token='test-token', api_url=httpserver.url_for('/').removesuffix('/'))
+
+    result = client.dataset(DATASET_ID).list_items(item_model=_ItemModel)
+
+    assert result.items == [_ItemModel(id=1), _ItemModel(id=2)]
+    assert result.count == 2
+    assert _item_list_adapter(_ItemModel) is _item_list_adapter(_ItemModel)
+
+
+def test_list_items_wraps_single_object_response_sync(httpserver: HTTPServer) -> None:
+    httpserver.expect_request(ITEMS_PATH).respond_with_handler(_make_list_items_handler(body={'id': 3}))
+    client = ApifyClient(token='test-token', api_url=httpserver.url_for('/').removesuffix('/'))
+
+    result = client.dataset(DATASET_ID).list_items(item_model=_ItemDict)
+
+    assert result.items == [{'id': 3}]
+
+
+async def test_iterate_items_validates_into_typed_dict_async(httpserver: HTTPServer) -> None:
+    httpserver.expect_request(ITEMS_PATH).respond_with_handler(_make_list_items_handler(body=[{'id': '1'}]))
+    client = ApifyClientAsync(token='test-token', api_url=httpserver.url_for('/').removesuffix('/'))
+
+    items = [item async for item in client.dataset(DATASET_ID).iterate_items(item_model=_ItemDict, limit=1)]
+
+    assert items == [{'id': 1}]
+
+
+async def test_list_items_rejects_invalid_items_async(httpserver: HTTPServer) -> None:
+    httpserver.expect_request(ITEMS_PATH).respond_with_handler(_make_list_items_handler(body=[{'id': 'x'}]))
+    client = ApifyClientAsync(token='test-token', api_url=httpserver.url_for('/').removesuffix('/'))
+
+    with pytest.raises(ValidationError):
+        await client.dataset(DATASET_ID).list_items(item_model=_ItemModel)
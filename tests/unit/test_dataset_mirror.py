@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING
+
+import pytest
+from werkzeug import Request, Response
+
+from apify_client import ApifyClient, ApifyClientAsync
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pytest_httpserver import HTTPServer
+
+    from apify_client._dataset_mirror import MirrorStorage
+
+DATASET_ID = 'test-dataset-id'
+DATASET_PATH = f'/v2/datasets/{DATASET_ID}'
+
+
+class _GrowingDataset:
+    """Serve a dataset whose items can be appended to between syncs."""
+
+    def __init__(self, httpserver: HTTPServer) -> None:
+        self.items: list[dict] = []
+        self.item_requests: list[tuple[int, int]] = []
+        httpserver.expect_request(DATASET_PATH, method='GET').respond_with_handler(self._get_dataset)
+        httpserver.expect_request(f'{DATASET_PATH}/items', method='GET').respond_with_handler(self._get_items)
+
+    def _get_dataset(self, _request: Request) -> Response:
+        data = {
+            'id': DATASET_ID,
+            'name': None,
+            'userId': 'test-user-id',
+            'createdAt': '2024-01-01T00:00:00.000Z',
+            'modifiedAt': '2024-01-01T00:00:00.000Z',
+            'accessedAt': '2024-01-01T00:00:00.000Z',
+            'itemCount': len(self.items),
+            'cleanItemCount': len(self.items),
+            'consoleUrl': f'https://console.apify.com/storage/datasets/{DATASET_ID}',
+        }
+        return Response(json.dumps({'data': data}), content_type='application/json')
+
+    def _get_items(self, request: Request) -> Response:
+        assert request.args['format'] == 'jsonl'
+        offset, limit = int(request.args['offset']), int(request.args['limit'])
+        self.item_requests.append((offset, limit))
+        body = ''.join(json.dumps(item) + '\n' for item in self.items[offset : offset + limit])
+        return Response(body, content_type='application/jsonl')
+
+
+@pytest.mark.parametrize('storage', ['jsonl', 'sqlite'])
+def test_mirror_syncs_only_new_items_sync(httpserver: HTTPServer, tmp_path: Path, storage: MirrorStorage) -> None:
+    dataset = _GrowingDataset(httpserver)
+    client = ApifyClient(token='test-token', api_url=httpserver.url_for('/').removesuffix('/'))
+    path = tmp_path / f'mirror.{storage}'
+
+    dataset.items = [{'id': i} for i in range(7)]
+    mirror = client.dataset(DATASET_ID).get_mirror(path, storage=storage, page_size=3)
+    assert mirror.sync() == 7
+    assert sorted(dataset.item_requests) == [(0, 3), (3, 3), (6, 1)]
+
+    dataset.items += [{'id': i} for i in range(7, 9)]
+    dataset.item_requests.clear()
+    # A new mirror over the same path picks up the persisted state.
+    mirror = client.dataset(DATASET_ID).get_mirror(path, storage=storage, page_size=3)
+    assert mirror.offset == 7
+    assert mirror.sync() == 2
+    assert dataset.item_requests == [(7, 2)]
+    assert mirror.sync() == 0
+
+    assert list(mirror.iterate_items()) == dataset.items
+
+
+async def test_mirror_syncs_only_new_items_async(httpserver: HTTPServer, tmp_path: Path) -> None:
+    dataset = _GrowingDataset(httpserver)
+    client = ApifyClientAsync(token='test-token', api_url=httpserver.url_for('/').removesuffix('/'))
+    mirror = client.dataset(DATASET_ID).get_mirror(tmp_path / 'mirror.db', storage='sqlite', page_size=2)
+
+    dataset.items = [{'id': i} for i in range(5)]
+    assert await mirror.sync() == 5
+    dataset.items.append({'id': 5})
+    assert await mirror.sync() == 1
+
+    assert await mirror.get_offset() == 6
+    assert [item async for item in mirror.iterate_items()] == dataset.items
+
+
+def test_mirror_drops_items_appended_without_saved_state_sync(httpserver: HTTPServer, tmp_path: Path) -> None:
+    dataset = _GrowingDataset(httpserver)
+    client = ApifyClient(token='test-token', api_url=httpserver.url_for('/').removesuffix('/'))
+    path = tmp_path / 'mirror.jsonl'
+
+    dataset.items = [{'id': 0}, {'id': 1}]
+    client.dataset(DATASET_ID).get_mirror(path).sync()
+    # Simulate a sync interrupted between appending the items and saving the state.
+    with path.open('ab') as file:
+        file.write(b'{"id": 2}\n')
+
+    dataset.items.append({'id': 2})
+    mirror = client.dataset(DATASET_ID).get_mirror(path)
+    assert mirror.sync() == 1
+    assert list(mirror.iterate_items()) == dataset.items
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING
+
+import pytest
+from werkzeug import Request, Response
+
+from apify_client import ApifyClient, ApifyClientAsync
+from apify_client._resource_clients import dataset as dataset_module
+from apify_client.errors import ApifyApiError
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Iterator
+
+    from pytest_httpserver import HTTPServer
+
+DATASET_ID = 'test-dataset-id'
+ITEMS_PATH = f'/v2/datasets/{DATASET_ID}/items'
+
+
+def _generate_items(count: int) -> Iterator[dict]:
+    for i in range(count):
+        yield {'id': i, 'text': 'x' * 50}
+
+
+def _collect_pushed_batches(httpserver: HTTPServer) -> list[list[dict]]:
+    batches: list[list[dict]] = []
+
+    def handler(request: Request) -> Response:
+        batches.append(json.loads(request.get_data()))
+        return Response(status=201)
+
+    httpserver.expect_request(ITEMS_PATH, method='POST').respond_with_handler(handler)
+    return batches
+
+
+def test_push_items_batched_splits_generator_by_payload_size_sync(
+    httpserver: HTTPServer, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(dataset_module, 'PAYLOAD_SIZE_LIMIT_BYTES', 1000)
+    batches = _collect_pushed_batches(httpserver)
+    client = ApifyClient(token='test-token', api_url=httpserver.url_for('/').removesuffix('/'))
+
+    client.dataset(DATASET_ID).push_items_batched(_generate_items(100), max_parallel=3)
+
+    assert len(batches) > 1
+    assert all(len(json.dumps(batch)) <= 1000 for batch in batches)
+    assert sorted(item['id'] for batch in batches for item in batch) == list(range(100))
+
+
+async def test_push_items_batched_accepts_async_generator_async(
+    httpserver: HTTPServer, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(dataset_module, 'PAYLOAD_SIZE_LIMIT_BYTES', 1000)
+    batches = _collect_pushed_batches(httpserver)
+    client = ApifyClientAsync(token='test-token', api_url=httpserver.url_for('/').removesuffix('/'))
+
+    async def generate_items() -> AsyncIterator[dict]:
+        for item in _generate_items(100):
+            yield item
+
+    await client.dataset(DATASET_ID).push_items_batched(generate_items(), max_parallel=3)
+
+    assert len(batches) > 1
+    assert all(len(json.dumps(batch)) <= 1000 for batch in batches)
+    assert sorted(item['id'] for batch in batches for item in batch) == list(range(100))
+
+
+async def test_push_items_batched_sends_single_batch_for_small_input_async(httpserver: HTTPServer) -> None:
+    batches = _collect_pushed_batches(httpserver)
+    client = ApifyClientAsync(token='test-token', api_url=httpserver.url_for('/').removesuffix('/'))
+
+    await client.dataset(DATASET_ID).push_items_batched([{'id': 1}, {'id': 2}])
+
+    assert batches == [[{'id': 1}, {'id': 2}]]
+
+
+def test_push_items_batched_raises_batch_error_sync(httpserver: HTTPServer) -> None:
+    httpserver.expect_request(ITEMS_PATH, method='POST').respond_with_json(
+        {'error': {'type': 'invalid-input', 'message': 'Invalid item'}}, status=400
+    )
+    client = ApifyClient(token='test-token', api_url=httpserver.url_for('/').removesuffix('/'))
+
+    with pytest.raises(ApifyApiError, match='Invalid item'):
+        client.dataset(DATASET_ID).push_items_batched(_generate_items(10))
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING
+
+from werkzeug import Request, Response
+
+from apify_client import ApifyClient, ApifyClientAsync
+from apify_client._resource_clients.dataset import _group_into_windows
+
+if TYPE_CHECKING:
+    from pytest_httpserver import HTTPServer
+
+DATASET_ID = 'test-dataset-id'
+DATASET_PATH = f'/v2/datasets/{DATASET_ID}'
+ITEM_COUNT = 10_000
+
+
+def _serve_dataset(httpserver: HTTPServer) -> list[tuple[int, int]]:
+    item_requests: list[tuple[int, int]] = []
+    dataset = {
+        'id': DATASET_ID,
+        'name': None,
+        'userId': 'test-user-id',
+        'createdAt': '2024-01-01T00:00:00.000Z',
+        'modifiedAt': '2024-01-01T00:00:00.000Z',
+        'accessedAt': '2024-01-01T00:00:00.000Z',
+        'itemCount': ITEM_COUNT,
+        'cleanItemCount': ITEM_COUNT,
+        'consoleUrl': f'https://console.apify.com/storage/datasets/{DATASET_ID}',
+    }
+
+    def items_handler(request: Request) -> Response:
+        offset, limit = int(request.args['offset']), int(request.args['limit'])
+        item_requests.append((offset, limit))
+        items = [{'id': i} for i in range(offset, min(offset + limit, ITEM_COUNT))]
+        return Response(
+            json.dumps(items),
+            headers={
+                'content-type': 'application/json',
+                'x-apify-pagination-total': str(ITEM_COUNT),
+                'x-apify-pagination-offset': str(offset),
+                'x-apify-pagination-count': str(len(items)),
+                'x-apify-pagination-limit': str(limit),
+                'x-apify-pagination-desc': 'false',
+            },
+        )
+
+    httpserver.expect_request(DATASET_PATH, method='GET').respond_with_json({'data': dataset})
+    httpserver.expect_request(f'{DATASET_PATH}/items').respond_with_handler(items_handler)
+    return item_requests
+
+
+def test_group_into_windows() -> None:
+    assert _group_into_windows([1, 5, 200, 1500, 1600, 2450], max_gap=100, max_size=1000) == [
+        (1, [1, 5]),
+        (200, [200]),
+        (1500, [1500, 1600]),
+        (2450, [2450]),
+    ]
+    assert _group_into_windows([0, 50, 100, 150], max_gap=100, max_size=120) == [(0, [0, 50, 100]), (150, [150])]
+
+
+def test_sample_fetches_only_windows_sync(httpserver: HTTPServer) -> None:
+    item_requests = _serve_dataset(httpserver)
+    client = ApifyClient(token='test-token', api_url=httpserver.url_for('/').removesuffix('/'))
+
+    sample = client.dataset(DATASET_ID).sample(50, seed=42)
+
+    ids = [item['id'] for item in sample]
+    assert len(set(ids)) == 50
+    assert ids == sorted(ids)
+    assert sum(limit for _, limit in item_requests) < ITEM_COUNT // 2
+    assert client.dataset(DATASET_ID).sample(50, seed=42) == sample
+
+
+async def test_sample_is_reproducible_with_seed_async(httpserver: HTTPServer) -> None:
+    _serve_dataset(httpserver)
+    client = ApifyClientAsync(token='test-token', api_url=httpserver.url_for('/').removesuffix('/'))
+
+    sample = await client.dataset(DATASET_ID).sample(20, seed=1, max_gap=0)
+    same_seed_sample = await client.dataset(DATASET_ID).sample(20, seed=1)
+
+    assert len(sample) == 20
+    assert sample == same_seed_sample
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import json
+import re
+import threading
+from collections.abc import Generator
+from typing import TYPE_CHECKING
+
+from werkzeug import Request, Response
+
+from apify_client import ApifyClient, ApifyClientAsync
+
+if TYPE_CHECKING:
+    from pytest_httpserver import HTTPServer
+
+SHARDED_NAME = 'events'
+
+
+class _ShardDatasets:
+    """Serve named datasets that can be created, pushed to and listed."""
+
+    def __init__(self, httpserver: HTTPServer) -> None:
+        self.items: dict[str, list[dict]] = {}
+        self._lock = threading.Lock()
+        httpserver.expect_request('/v2/datasets', method='POST').respond_with_handler(self._get_or_create)
+        items_path = re.compile(r'/v2/datasets/[^/]+/items')
+        httpserver.expect_request(items_path, method='POST').respond_with_handler(self._push_items)
+        httpserver.expect_request(items_path, method='GET').respond_with_handler(self._list_items)
+
+    def _get_or_create(self, request: Request) -> Response:
+        name = request.args['name']
+        with self._lock:
+            self.items.setdefault(name, [])
+        data = {
+            'id': name,
+            'name': name,
+            'userId': 'test-user-id',
+            'createdAt': '2024-01-01T00:00:00.000Z',
+            'modifiedAt': '2024-01-01T00:00:00.000Z',
+            'accessedAt': '2024-01-01T00:00:00.000Z',
+            'itemCount': 0,
+            'cleanItemCount': 0,
+            'consoleUrl': f'https://console.apify.com/storage/datasets/{name}',
+        }
+        return Response(json.dumps({'data': data}), status=201, content_type='application/json')
+
+    def _push_items(self, request: Request) -> Response:
+        dataset_id = request.path.split('/')[3]
+        with self._lock:
+            self.items[dataset_id].extend(json.loads(request.get_data()))
+        return Response(status=201)
+
+    def _list_items(self, request: Request) -> Response:
+        items = self.items[request.path.split('/')[3]]
+        offset, limit = int(request.args.get('offset', 0)), int(request.args.get('limit', 0))
+        page = items[offset : offset + limit] if limit else items[offset:]
+        return Response(
+            json.dumps(page),
+            content_type='application/json',
+            headers={
+                'x-apify-pagination-total': str(len(items)),
+                'x-apify-pagination-offset': str(offset),
+                'x-apify-pagination-count': str(len(page)),
+                'x-apify-pagination-limit': str(limit or len(page)),
+                'x-apify-pagination-desc': 'false',
+            },
+        )
+
+
+def test_sharded_dataset_round_robin_sync(httpserver: HTTPServer) -> None:
+    datasets = _ShardDatasets(httpserver)
+    client = ApifyClient(token='test-token', api_url=httpserver.url_for('/').removesuffix('/'))
+
+    sharded = client.datasets().get_or_create_sharded(SHARDED_NAME, shards=3)
+    with sharded.get_writer(max_batch_items=5) as writer:
+        for i in range(30):
+            writer.add({'id': i})
+
+    assert sorted(datasets.items) == ['events-shard-0', 'events-shard-1', 'events-shard-2']
+    assert [len(items) for items in datasets.items.values()] == [10, 10, 10]
+    items = list(sharded.iterate_items())
+    assert sorted(item['id'] for item in items) == list(range(30))
+
+
+def test_sharded_dataset_reader_stops_early_sync(httpserver: HTTPServer) -> None:
+    _ShardDatasets(httpserver)
+    client = ApifyClient(token='test-token', api_url=httpserver.url_for('/').removesuffix('/'))
+    sharded = client.datasets().get_or_create_sharded(SHARDED_NAME, shards=2)
+    with sharded.get_writer() as writer:
+        for i in range(20):
+            writer.add({'id': i})
+
+    items = sharded.iterate_items(max_buffered_items=1)
+    assert isinstance(items, Generator)
+    first = [next(items) for _ in range(3)]
+    items.close()
+
+    assert len(first) == 3
+
+
+async def test_sharded_dataset_by_key_async(httpserver: HTTPServer) -> None:
+    datasets = _ShardDatasets(httpserver)
+    client = ApifyClientAsync(token='test-token', api_url=httpserver.url_for('/').removesuffix('/'))
+
+    sharded = await client.datasets().get_or_create_sharded(SHARDED_NAME, shards=4)
+    async with sharded.get_writer(shard_key='user') as writer:
+        for i in range(40):
+            await writer.add({'id': i, 'user': f'user-{i % 5}'})
+
+    shards_by_user: dict[str, set[str]] = {}
+    for shard, shard_items in datasets.items.items():
+        for item in shard_items:
+            shards_by_user.setdefault(item['user'], set()).add(shard)
+    assert all(len(shards) == 1 for shards in shards_by_user.values())
+    items = [item async for item in sharded.iterate_items()]
+    assert sorted(item['id'] for item in items) == list(range(40))
@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING
+
+import pytest
+from werkzeug import Request, Response
+
+from apify_client import ApifyClient, ApifyClientAsync
+from apify_client.errors import ApifyApiError
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+    from pytest_httpserver import HTTPServer
+
+DATASET_ID = 'test-dataset-id'
+ITEMS_PATH = f'/v2/datasets/{DATASET_ID}/items'
+ITEMS = [{'id': i} for i in range(5)]
+
+
+def _jsonl(items: list[dict]) -> bytes:
+    return b''.join(json.dumps(item).encode() + b'\n' for item in items)
+
+
+def _make_dropping_handler(*, drop_after: int, declare_length: bool) -> tuple[Callable, list[dict]]:
+    """Serve `ITEMS` as JSON Lines, cutting the first response off in the middle of item number `drop_after`.
+
+    With `declare_length`, the cut body falls short of its `Content-Length`, which the transport reports as an error.
+    Without it, the body just ends early, which only the incomplete last line gives away.
+    """
+    received_params: list[dict] = []
+
+    def handler(request: Request) -> Response:
+        received_params.append(dict(request.args))
+        offset = int(request.args.get('offset', 0))
+        limit = int(request.args['limit']) if 'limit' in request.args else None
+        body = _jsonl(ITEMS[offset : offset + limit if limit else None])
+
+        if len(received_params) > 1:
+            return Response(body, headers={'content-type': 'application/jsonl'})
+
+        cut = len(_jsonl(ITEMS[offset : offset + drop_after])) + 3
+        headers = {'content-type': 'application/jsonl'}
+        if declare_length:
+            headers['content-length'] = str(len(body))
+
+        def truncated_body() -> Iterator[bytes]:
+            yield body[:cut]
+
+        return Response(truncated_body(), headers=headers)
+
+    return handler, received_params
+
+
+@pytest.mark.parametrize('declare_length', [True, False], ids=['transport error', 'early end'])
+def test_iterate_streamed_items_resumes_after_drop_sync(httpserver: HTTPServer, *, declare_length: bool) -> None:
+    handler, received_params = _make_dropping_handler(drop_after=2, declare_length=declare_length)
+    httpserver.expect_request(ITEMS_PATH).respond_with_handler(handler)
+    client = ApifyClient(token='test-token', api_url=httpserver.url_for('/').removesuffix('/'))
+
+    items = list(client.dataset(DATASET_ID).iterate_streamed_items(fields=['id']))
+
+    assert items == ITEMS
+    assert [params['offset'] for params in received_params] == ['0', '2']
+    assert all(params['format'] == 'jsonl' and params['fields'] == 'id' for params in received_params)
+
+
+@pytest.mark.parametrize('declare_length', [True, False], ids=['transport error', 'early end'])
+async def test_iterate_streamed_items_resumes_after_drop_async(httpserver: HTTPServer, *, declare_length: bool) -> None:
+    handler, received_params = _make_dropping_handler(drop_after=2, declare_length=declare_length)
+    httpserver.expect_request(ITEMS_PATH).respond_with_handler(handler)
+    client = ApifyClientAsync(token='test-token', api_url=httpserver.url_for('/').removesuffix('/'))
+
+    items = [item async for item in client.dataset(DATASET_ID).iterate_streamed_items(fields=['id'])]
+
+    assert items == ITEMS
+    assert [params['offset'] for params in received_params] == ['0', '2']
+
+
+def test_iterate_streamed_items_resume_keeps_offset_and_limit_sync(httpserver: HTTPServer) -> None:
+    handler, received_params = _make_dropping_handler(drop_after=1, declare_length=True)
+    httpserver.expect_request(ITEMS_PATH).respond_with_handler(handler)
+    client = ApifyClient(token='test-token', api_url=httpserver.url_for('/').removesuffix('/'))
+
+    items = list(client.dataset(DATASET_ID).iterate_streamed_items(offset=1, limit=3))
+
+    assert items == ITEMS[1:4]
+    assert [(params['offset'], params['limit']) for params in received_params] == [('1', '3'), ('2', '2')]
+
+
+def test_iterate_streamed_items_skips_empty_items_locally_sync(httpserver: HTTPServer) -> None:
+    httpserver.expect_request(ITEMS_PATH).respond_with_data(
+        _jsonl([{'id': 0}, {}, {'id': 2}]), content_type='application/jsonl'
+    )
+    client = ApifyClient(token='test-token', api_url=httpserver.url_for('/').removesuffix('/'))
+
+    items = list(client.dataset(DATASET_ID).iterate_streamed_items(clean=True))
+
+    assert items == [{'id': 0}, {'id': 2}]
+    request, _ = httpserver.log[-1]
+    assert 'skipEmpty' not in request.args
+    assert request.args['skipHidden'] == 'true'
+
+
+async def test_iterate_streamed_items_does_not_resume_api_errors_async(httpserver: HTTPServer) -> None:
+    httpserver.expect_request(ITEMS_PATH).respond_with_data(status=403)
+    client = ApifyClientAsync(token='test-token', api_url=httpserver.url_for('/').removesuffix('/'))
+
+    with pytest.raises(ApifyApiError):
+        async for _ in client.dataset(DATASET_ID).iterate_streamed_items():
+            pass
+
+    assert len(httpserver.log) == 1
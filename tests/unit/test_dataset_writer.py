@@ -0,0 +1,207 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+import time
+from datetime import timedelta
+from queue import Empty
+from typing import TYPE_CHECKING
+
+import pytest
+from werkzeug import Request, Response
+
+from apify_client import ApifyClient, ApifyClientAsync
+
+if TYPE_CHECKING:
+    from pytest_httpserver import HTTPServer
+
+    from apify_client._dataset_writer import DatasetWriterBatchFailure
+
+DATASET_ID = 'test-dataset-id'
+ITEMS_PATH = f'/v2/datasets/{DATASET_ID}/items'
+
+
+def _collect_pushed_batches(httpserver: HTTPServer, *, fail_first: bool = False) -> list[list[dict]]:
+    batches: list[list[dict]] = []
+
+    def handler(request: Request) -> Response:
+        batch = json.loads(request.get_data())
+        if fail_first and not batches:
+            batches.append([])
+            return Response(json.dumps({'error': {'type': 'invalid-input', 'message': 'Invalid item'}}), status=400)
+        batches.append(batch)
+        return Response(status=201)
+
+    httpserver.expect_request(ITEMS_PATH, method='POST').respond_with_handler(handler)
+    return batches
+
+
+def test_dataset_writer_packs_items_by_count_sync(httpserver: HTTPServer) -> None:
+    batches = _collect_pushed_batches(httpserver)
+    client = ApifyClient(token='test-token', api_url=httpserver.url_for('/').removesuffix('/'))
+
+    with client.dataset(DATASET_ID).get_writer(max_batch_items=4) as writer:
+        for i in range(10):
+            writer.add({'id': i})
+
+    assert batches == [[{'id': i} for i in range(j, min(j + 4, 10))] for j in (0, 4, 8)]
+
+
+def test_dataset_writer_packs_items_by_size_sync(httpserver: HTTPServer) -> None:
+    batches = _collect_pushed_batches(httpserver)
+    client = ApifyClient(token='test-token', api_url=httpserver.url_for('/').removesuffix('/'))
+
+    with client.dataset(DATASET_ID).get_writer(max_batch_bytes=100) as writer:
+        for i in range(20):
+            writer.add({'id': i, 'text': 'x' * 10})
+
+    assert len(batches) > 1
+    assert all(len(json.dumps(batch, separators=(',', ':'))) <= 100 for batch in batches)
+    assert [item['id'] for batch in batches for item in batch] == list(range(20))
+
+
+def test_dataset_writer_flushes_after_interval_sync(httpserver: HTTPServer) -> None:
+    batches = _collect_pushed_batches(httpserver)
+    client = ApifyClient(token='test-token', api_url=httpserver.url_for('/').removesuffix('/'))
+
+    writer = client.dataset(DATASET_ID).get_writer(flush_interval=timedelta(milliseconds=50))
+    writer.add({'id': 1})
+    deadline = time.monotonic() + 5
+    while not batches and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert batches == [[{'id': 1}]]
+    writer.close()
+    assert len(batches) == 1
+
+
+def test_dataset_writer_reports_failed_batches_sync(httpserver: HTTPServer) -> None:
+    batches = _collect_pushed_batches(httpserver, fail_first=True)
+    client = ApifyClient(token='test-token', api_url=httpserver.url_for('/').removesuffix('/'))
+    reported: list[DatasetWriterBatchFailure] = []
+
+    with client.dataset(DATASET_ID).get_writer(max_batch_items=2, on_batch_error=reported.append) as writer:
+        for i in range(4):
+            writer.add({'id': i})
+
+    assert batches[1:] == [[{'id': 2}, {'id': 3}]]
+    assert [failure.items for failure in writer.failures] == [[{'id': 0}, {'id': 1}]]
+    assert reported == writer.failures
+
+    with pytest.raises(RuntimeError, match='already closed'):
+        writer.add({'id': 4})
+
+
+async def test_dataset_writer_flush_pushes_buffered_items_async(httpserver: HTTPServer) -> None:
+    batches = _collect_pushed_batches(httpserver)
+    client = ApifyClientAsync(token='test-token', api_url=httpserver.url_for('/').removesuffix('/'))
+
+    async with client.dataset(DATASET_ID).get_writer(max_batch_items=3) as writer:
+        for i in range(5):
+            await writer.add({'id': i})
+        await writer.flush()
+        assert batches == [[{'id': 0}, {'id': 1}, {'id': 2}], [{'id': 3}, {'id': 4}]]
+        await writer.add({'id': 5})
+
+    assert batches[-1] == [{'id': 5}]
+
+
+async def test_dataset_writer_flushes_after_interval_async(httpserver: HTTPServer) -> None:
+    batches = _collect_pushed_batches(httpserver)
+    client = ApifyClientAsync(token='test-token', api_url=httpserver.url_for('/').removesuffix('/'))
+
+    async with client.dataset(DATASET_ID).get_writer(flush_interval=timedelta(milliseconds=50)) as writer:
+        await writer.add({'id': 1})
+        for _ in range(500):
+            if batches:
+                break
+            await asyncio.sleep(0.01)
+        assert batches == [[{'id': 1}]]
+
+    assert len(batches) == 1
+
+
+def test_dataset_writer_survives_raising_error_callback_sync(httpserver: HTTPServer) -> None:
+    batches = _collect_pushed_batches(httpserver, fail_first=True)
+    client = ApifyClient(token='test-token', api_url=httpserver.url_for('/').removesuffix('/'))
+
+    def on_batch_error(failure: DatasetWriterBatchFailure) -> None:
+        raise RuntimeError(f'Cannot handle {len(failure.items)} items')
+
+    with client.dataset(DATASET_ID).get_writer(
+        max_batch_items=1, max_pending_batches=1, on_batch_error=on_batch_error
+    ) as writer:
+        for i in range(4):
+            writer.add({'id': i})
+        writer.flush()
+
+    assert batches[1:] == [[{'id': 1}], [{'id': 2}], [{'id': 3}]]
+    assert len(writer.failures) == 1
+
+
+def test_dataset_writer_keeps_order_with_concurrent_adders_sync(httpserver: HTTPServer) -> None:
+    batches = _collect_pushed_batches(httpserver)
+    client = ApifyClient(token='test-token', api_url=httpserver.url_for('/').removesuffix('/'))
+    counter = iter(range(400))
+
+    with client.dataset(DATASET_ID).get_writer(max_batch_items=3, max_pending_batches=1) as writer:
+
+        def add_items() -> None:
+            for _ in range(100):
+                # Taking the next number and adding it happen together, so the items are added in number order.
+                with lock:
+                    writer.add({'id': next(counter)})
+
+        lock = threading.Lock()
+        threads = [threading.Thread(target=add_items) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    assert [item['id'] for batch in batches for item in batch] == list(range(400))
+
+
+def test_dataset_writer_keeps_order_when_a_batch_is_queued_after_the_interval_sync(
+    httpserver: HTTPServer, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    batches = _collect_pushed_batches(httpserver)
+    client = ApifyClient(token='test-token', api_url=httpserver.url_for('/').removesuffix('/'))
+    writer = client.dataset(DATASET_ID).get_writer(max_batch_items=3)
+    get = writer._queue.get
+    raced = threading.Event()
+
+    def get_after_race(*, timeout: float) -> list[bytes] | threading.Event | None:
+        if raced.is_set():
+            return get(timeout=timeout)
+        # Items complete a batch right after the wait timed out, leaving newer items in the buffer.
+        for i in range(1, 4):
+            writer.add({'id': i})
+        raced.set()
+        raise Empty
+
+    monkeypatch.setattr(writer._queue, 'get', get_after_race)
+    writer.add({'id': 0})
+    raced.wait(timeout=5)
+    writer.close()
+
+    assert batches == [[{'id': 0}, {'id': 1}, {'id': 2}], [{'id': 3}]]
+
+
+async def test_dataset_writer_survives_raising_error_callback_async(httpserver: HTTPServer) -> None:
+    batches = _collect_pushed_batches(httpserver, fail_first=True)
+    client = ApifyClientAsync(token='test-token', api_url=httpserver.url_for('/').removesuffix('/'))
+
+    def on_batch_error(failure: DatasetWriterBatchFailure) -> None:
+        raise RuntimeError(f'Cannot handle {len(failure.items)} items')
+
+    async with client.dataset(DATASET_ID).get_writer(
+        max_batch_items=1, max_pending_batches=1, on_batch_error=on_batch_error
+    ) as writer:
+        for i in range(4):
+            await writer.add({'id': i})
+        await writer.flush()
+
+    assert batches[1:] == [[{'id': 1}], [{'id': 2}], [{'id': 3}]]
+    assert len(writer.failures) == 1
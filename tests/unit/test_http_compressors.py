@@ -13,7 +13,7 @@ from werkzeug import Request, Response
 
 from apify_client import ApifyClient, ApifyClientAsync
 from apify_client._consts import MIN_COMPRESSION_SIZE
-from apify_client.http_compressors import BrotliHttpCompressor, GzipHttpCompressor
+from apify_client.http_compressors import BrotliHttpCompressor, GzipHttpCompressor, HttpCompressor
 from apify_client.http_compressors._resolve import resolve_compressor
 
 if TYPE_CHECKING:
@@ -121,6 +121,33 @@ def test_brotli_compressor_round_trips_and_sets_content_encoding() -> None:
     assert brotli.decompress(compressor.compress(b'hello world')) == b'hello world'
 
 
+class _ReversingCompressor(HttpCompressor):
+    """A custom compressor that implements only `compress`."""
+
+    content_encoding = 'reversed'
+
+    def compress(self, data: bytes) -> bytes:
+        return data[::-1]
+
+
+@pytest.mark.parametrize(
+    ('compressor', 'decompress'),
+    [
+        pytest.param(GzipHttpCompressor(), gzip.decompress, id='gzip'),
+        pytest.param(BrotliHttpCompressor(), brotli.decompress, id='brotli'),
+        pytest.param(_ReversingCompressor(), lambda data: data[::-1], id='custom'),
+    ],
+)
+def test_compress_stream_round_trips_chunks(compressor: HttpCompressor, decompress: Callable[[bytes], bytes]) -> None:
+    """A body compressed chunk by chunk decompresses to the chunks joined, also with a compressor without a stream."""
+    chunks = [f'chunk {index} '.encode() * 500 for index in range(10)]
+
+    stream = compressor.compress_stream()
+    compressed = b''.join(stream.compress(chunk) for chunk in chunks) + stream.flush()
+
+    assert decompress(compressed) == b''.join(chunks)
+
+
 def test_resolve_compressor_gzip() -> None:
     """The `'gzip'` literal resolves to a `GzipHttpCompressor`."""
     assert isinstance(resolve_compressor('gzip'), GzipHttpCompressor)
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
 import gzip
+import hashlib
 import io
+import json
+import re
 import zlib
 from typing import TYPE_CHECKING, Any
 
@@ -11,9 +14,12 @@ from werkzeug import Request, Response
 
 from apify_client import ApifyClient, ApifyClientAsync
 from apify_client._consts import MIN_COMPRESSION_SIZE
+from apify_client._resource_clients import key_value_store as key_value_store_module
+from apify_client.errors import ApifyApiError, IncompleteDownloadError
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import AsyncIterator, Callable, Iterator
+    from pathlib import Path
 
     from pytest_httpserver import HTTPServer
 
@@ -225,3 +231,401 @@ async def test_set_record_rejects_declared_compression_of_non_bytes_value_async(
         await client.key_value_store(_MOCKED_KVS_ID).set_record('f', make_value(), content_encoding='gzip')
 
     assert captured_records == []
+
+
+def _serve_records(httpserver: HTTPServer) -> None:
+    """Serve JSON records `0` to `19` and a 404 for any other key."""
+
+    def get_record(request: Request) -> Response:
+        key = request.path.rsplit('/', 1)[-1]
+        if not key.isdigit() or int(key) >= 20:
+            return Response(
+                json.dumps({'error': {'type': 'record-not-found', 'message': 'Record was not found'}}), status=404
+            )
+        return Response(json.dumps({'index': int(key)}), content_type='application/json; charset=utf-8')
+
+    records_path = re.compile(rf'/v2/key-value-stores/{_MOCKED_KVS_ID}/records/.+')
+    httpserver.expect_request(records_path, method='GET').respond_with_handler(get_record)
+
+
+def test_get_records_sync(httpserver: HTTPServer, api_url: str) -> None:
+    """Records are fetched concurrently, parsed like `get_record`, and missing ones come back as None."""
+    _serve_records(httpserver)
+    client = ApifyClient(token='test_token', api_url=api_url)
+
+    records = dict(
+        client.key_value_store(_MOCKED_KVS_ID).get_records([*map(str, range(20)), 'missing'], max_parallel=4)
+    )
+
+    assert records.pop('missing') is None
+    assert records == {
+        str(i): {'key': str(i), 'value': {'index': i}, 'content_type': 'application/json; charset=utf-8'}
+        for i in range(20)
+    }
+
+
+async def test_get_records_async(httpserver: HTTPServer, api_url: str) -> None:
+    """Records are fetched concurrently from an async iterable of keys, and missing ones come back as None."""
+    _serve_records(httpserver)
+    client = ApifyClientAsync(token='test_token', api_url=api_url)
+
+    async def keys() -> AsyncIterator[str]:
+        for i in range(25):
+            yield str(i)
+
+    records = {key: record async for key, record in client.key_value_store(_MOCKED_KVS_ID).get_records(keys())}
+
+    assert sorted(key for key, record in records.items() if record is None) == [str(i) for i in range(20, 25)]
+    assert records['7'] == {'key': '7', 'value': {'index': 7}, 'content_type': 'application/json; charset=utf-8'}
+
+
+def _accept_records(httpserver: HTTPServer) -> dict[str, bytes]:
+    """Accept PUT records into the returned dict, rejecting the key `bad` with a 400."""
+    stored: dict[str, bytes] = {}
+
+    def put_record(request: Request) -> Response:
+        key = request.path.rsplit('/', 1)[-1]
+        if key == 'bad':
+            return Response(json.dumps({'error': {'type': 'invalid-value', 'message': 'Invalid value'}}), status=400)
+        stored[key] = request.get_data()
+        return Response(status=201)
+
+    records_path = re.compile(rf'/v2/key-value-stores/{_MOCKED_KVS_ID}/records/.+')
+    httpserver.expect_request(records_path, method='PUT').respond_with_handler(put_record)
+    return stored
+
+
+def test_set_records_sync(httpserver: HTTPServer, api_url: str) -> None:
+    """Records from a generator are uploaded concurrently, and a failed one is reported without stopping the rest."""
+    stored = _accept_records(httpserver)
+    client = ApifyClient(token='test_token', api_url=api_url)
+
+    pairs = ((key, {'key': key}) for key in [*map(str, range(20)), 'bad'])
+    results = client.key_value_store(_MOCKED_KVS_ID).set_records(pairs, max_parallel=4)
+
+    errors = {result.key: result.error for result in results}
+    assert len(errors) == 21
+    assert isinstance(errors.pop('bad'), ApifyApiError)
+    assert all(error is None for error in errors.values())
+    assert {key: json.loads(value) for key, value in stored.items()} == {str(i): {'key': str(i)} for i in range(20)}
+
+
+async def test_set_records_async(httpserver: HTTPServer, api_url: str) -> None:
+    """A mapping of records is uploaded concurrently, and a failed one is reported without stopping the rest."""
+    stored = _accept_records(httpserver)
+    client = ApifyClientAsync(token='test_token', api_url=api_url)
+
+    records = {'bad': b'x', **{str(i): f'text-{i}' for i in range(10)}}
+    results = await client.key_value_store(_MOCKED_KVS_ID).set_records(records, content_type='text/plain')
+
+    assert sorted(result.key for result in results if result.error is not None) == ['bad']
+    assert stored == {str(i): f'text-{i}'.encode() for i in range(10)}
+
+
+def _serve_blobs(httpserver: HTTPServer, stored: dict[str, bytes]) -> list[str]:
+    """Serve HEAD and PUT of the records in `stored`, returning the methods of the requests as they arrive."""
+    methods: list[str] = []
+
+    def handle(request: Request) -> Response:
+        methods.append(request.method)
+        key = request.path.rsplit('/', 1)[-1]
+        if request.method == 'PUT':
+            stored[key] = request.get_data()
+            return Response(status=201)
+        return Response(status=200 if key in stored else 404)
+
+    records_path = re.compile(rf'/v2/key-value-stores/{_MOCKED_KVS_ID}/records/.+')
+    httpserver.expect_request(records_path).respond_with_handler(handle)
+    return methods
+
+
+def test_blob_store_skips_stored_blobs_sync(httpserver: HTTPServer, api_url: str, tmp_path: Path) -> None:
+    """Only missing blobs are uploaded, duplicates once, and the manifest spares the checks of a later blob store."""
+    already_stored = b'already stored'
+    client = ApifyClient(token='test_token', api_url=api_url)
+    kvs = client.key_value_store(_MOCKED_KVS_ID)
+    manifest_path = tmp_path / 'manifest.txt'
+    blob_store = kvs.get_blob_store(manifest_path=manifest_path)
+    stored = {blob_store.key_for(already_stored): already_stored}
+    methods = _serve_blobs(httpserver, stored)
+
+    keys = blob_store.put_many([b'new', already_stored, b'new'], content_type='text/plain')
+    requests_of_first_batch = len(methods)
+    again = kvs.get_blob_store(manifest_path=manifest_path).put_many([already_stored, b'new'])
+
+    assert keys[0] == keys[2] == blob_store.key_for(b'new')
+    assert keys[1] == blob_store.key_for(already_stored)
+    assert stored[keys[0]] == b'new'
+    assert sorted(methods) == ['HEAD', 'HEAD', 'PUT']
+    assert len(methods) == requests_of_first_batch
+    assert again == [keys[1], keys[0]]
+
+
+def test_blob_store_ignores_manifest_of_another_store_sync(
+    httpserver: HTTPServer, api_url: str, tmp_path: Path
+) -> None:
+    """A manifest written for another store is not trusted, and is overwritten with the blobs of this store."""
+    client = ApifyClient(token='test_token', api_url=api_url)
+    manifest_path = tmp_path / 'manifest.txt'
+    other_store = client.key_value_store('other-store').get_blob_store(manifest_path=manifest_path)
+    other_store._remember([other_store.key_for(b'blob')])
+    stored: dict[str, bytes] = {}
+    methods = _serve_blobs(httpserver, stored)
+
+    blob_store = client.key_value_store(_MOCKED_KVS_ID).get_blob_store(manifest_path=manifest_path)
+    key = blob_store.put(b'blob')
+
+    assert blob_store.known_keys == {key}
+    assert stored == {key: b'blob'}
+    assert methods == ['HEAD', 'PUT']
+    assert manifest_path.read_text(encoding='utf-8').splitlines()[1:] == [key]
+    assert client.key_value_store(_MOCKED_KVS_ID).get_blob_store(manifest_path=manifest_path).known_keys == {key}
+
+
+async def test_blob_store_async(httpserver: HTTPServer, api_url: str) -> None:
+    """A blob is uploaded under its content hash once, and storing it again takes no request."""
+    stored: dict[str, bytes] = {}
+    methods = _serve_blobs(httpserver, stored)
+    client = ApifyClientAsync(token='test_token', api_url=api_url)
+    blob_store = client.key_value_store(_MOCKED_KVS_ID).get_blob_store(key_prefix='css-')
+
+    key = await blob_store.put(b'body { color: red }', content_type='text/css')
+    again = await blob_store.put(b'body { color: red }', content_type='text/css')
+
+    assert key == again == f'css-{hashlib.sha256(b"body { color: red }").hexdigest()}'
+    assert stored == {key: b'body { color: red }'}
+    assert methods == ['HEAD', 'PUT']
+    assert blob_store.known_keys == {key}
+
+
+def _capture_puts(httpserver: HTTPServer) -> list[Request]:
+    captured: list[Request] = []
+
+    def put_record(request: Request) -> Response:
+        captured.append(request)
+        return Response(status=201)
+
+    records_path = re.compile(rf'/v2/key-value-stores/{_MOCKED_KVS_ID}/records/.+')
+    httpserver.expect_request(records_path, method='PUT').respond_with_handler(put_record)
+    return captured
+
+
+def test_set_record_from_path_sync(httpserver: HTTPServer, api_url: str, tmp_path: Path) -> None:
+    """A file is uploaded from a memory mapping, compressed unless its guessed content type is already compressed."""
+    captured = _capture_puts(httpserver)
+    client = ApifyClient(token='test_token', api_url=api_url)
+    data = json.dumps([{'index': index} for index in range(10_000)]).encode()
+    (tmp_path / 'items.json').write_bytes(data)
+    (tmp_path / 'model.zip').write_bytes(data)
+
+    kvs = client.key_value_store(_MOCKED_KVS_ID)
+    kvs.set_record_from_path('items', tmp_path / 'items.json')
+    kvs.set_record_from_path('model', tmp_path / 'model.zip')
+
+    items, model = captured
+    assert items.headers['Content-Type'] == 'application/json'
+    assert items.headers['Content-Encoding'] == 'gzip'
+    assert gzip.decompress(items.get_data()) == data
+    assert model.headers['Content-Type'] == 'application/zip'
+    assert 'Content-Encoding' not in model.headers
+    assert model.get_data() == data
+
+
+async def test_set_record_from_path_async(httpserver: HTTPServer, api_url: str, tmp_path: Path) -> None:
+    """A file is uploaded with the content type given, and an empty file, which cannot be mapped, is uploaded too."""
+    captured = _capture_puts(httpserver)
+    client = ApifyClientAsync(token='test_token', api_url=api_url)
+    data = b'line of text\n' * 10_000
+    (tmp_path / 'log').write_bytes(data)
+    (tmp_path / 'empty').write_bytes(b'')
+
+    kvs = client.key_value_store(_MOCKED_KVS_ID)
+    await kvs.set_record_from_path('log', tmp_path / 'log', content_type='text/plain')
+    await kvs.set_record_from_path('empty', str(tmp_path / 'empty'))
+
+    log, empty = captured
+    assert log.headers['Content-Type'] == 'text/plain'
+    assert gzip.decompress(log.get_data()) == data
+    assert empty.headers['Content-Type'] == 'application/octet-stream'
+    assert empty.get_data() == b''
+
+
+_DOWNLOAD_DATA = bytes(range(256)) * 4096
+
+
+def _serve_download(
+    httpserver: HTTPServer,
+    *,
+    data: bytes = _DOWNLOAD_DATA,
+    break_after: int | None = None,
+    broken_request: int = 1,
+    ignore_range_end: bool = False,
+    etag: str = '"v1"',
+    changed_request: int | None = None,
+    content_type: str | None = 'application/octet-stream',
+) -> list[str | None]:
+    """Serve `data` as the record `f` with byte range support, and record the `Range` of each request.
+
+    With `break_after`, the response to the `broken_request`-th request drops the connection after that many bytes.
+    With `ignore_range_end`, a range response runs to the end of the record instead of the end of the range.
+    With `changed_request`, the record gets a new ETag from that request on, and a range request whose `If-Range`
+    does not match it gets the whole record.
+    """
+    ranges: list[str | None] = []
+
+    def get_record(request: Request) -> Response:
+        range_header = request.headers.get('Range')
+        ranges.append(range_header)
+        current_etag = etag if changed_request is None or len(ranges) < changed_request else f'{etag[:-1]}2"'
+        if request.headers.get('If-Range', current_etag) != current_etag:
+            range_header = None
+        start, end, status = 0, len(data), 200
+        headers = {'ETag': current_etag}
+        if range_header is not None:
+            first, _, last = range_header.removeprefix('bytes=').partition('-')
+            start, status = int(first), 206
+            end = int(last) + 1 if last and not ignore_range_end else len(data)
+            headers['Content-Range'] = f'bytes {start}-{end - 1}/{len(data)}'
+        headers['Content-Length'] = str(end - start)
+        body = data[start:end]
+        broken = break_after is not None and len(ranges) == broken_request
+
+        def generate() -> Iterator[bytes]:
+            if broken:
+                yield body[:break_after]
+                raise ConnectionAbortedError
+            yield body
+
+        response = Response(generate(), status=status, headers=headers)
+        if content_type is None:
+            del response.headers['Content-Type']
+        else:
+            response.headers['Content-Type'] = content_type
+        return response
+
+    httpserver.expect_request(_RECORD_PATH, method='GET').respond_with_handler(get_record)
+    return ranges
+
+
+def test_download_record_resumes_broken_download_sync(httpserver: HTTPServer, api_url: str, tmp_path: Path) -> None:
+    """A download that breaks off continues with a `Range` request from the bytes already written."""
+    ranges = _serve_download(httpserver, break_after=100_000)
+    client = ApifyClient(token='test_token', api_url=api_url)
+
+    record = client.key_value_store(_MOCKED_KVS_ID).download_record('f', tmp_path / 'f.bin')
+
+    assert record == {'key': 'f', 'value': tmp_path / 'f.bin', 'content_type': 'application/octet-stream'}
+    assert (tmp_path / 'f.bin').read_bytes() == _DOWNLOAD_DATA
+    assert ranges[0] is None
+    assert ranges[1] is not None
+    assert ranges[1].endswith(f'-{len(_DOWNLOAD_DATA) - 1}')
+
+
+def test_download_record_in_parallel_parts_sync(
+    httpserver: HTTPServer, api_url: str, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A large record is downloaded as several byte ranges, which together make up the whole record."""
+    monkeypatch.setattr(key_value_store_module, 'MIN_DOWNLOAD_PART_SIZE', len(_DOWNLOAD_DATA) // 4)
+    ranges = _serve_download(httpserver)
+    client = ApifyClient(token='test_token', api_url=api_url)
+
+    client.key_value_store(_MOCKED_KVS_ID).download_record('f', tmp_path / 'f.bin', parts=8)
+
+    part_size = len(_DOWNLOAD_DATA) // 4
+    assert (tmp_path / 'f.bin').read_bytes() == _DOWNLOAD_DATA
+    assert sorted(range_header for range_header in ranges[1:] if range_header is not None) == [
+        f'bytes={start}-{start + part_size - 1}' for start in range(0, 4 * part_size, part_size)
+    ]
+
+
+@pytest.mark.parametrize('etag', ['"v1"', 'W/"v1"'])
+def test_download_record_rejects_changed_record_sync(
+    httpserver: HTTPServer, api_url: str, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, etag: str
+) -> None:
+    """Ranges of a record that changed after the first response fail the download, whether the ETag is weak or not."""
+    monkeypatch.setattr(key_value_store_module, 'MIN_DOWNLOAD_PART_SIZE', len(_DOWNLOAD_DATA) // 2)
+    _serve_download(httpserver, etag=etag, changed_request=2)
+    client = ApifyClient(token='test_token', api_url=api_url)
+
+    with pytest.raises(IncompleteDownloadError, match='changed'):
+        client.key_value_store(_MOCKED_KVS_ID).download_record('f', tmp_path / 'f.bin', parts=2)
+
+
+def test_download_record_without_content_type_sync(httpserver: HTTPServer, api_url: str, tmp_path: Path) -> None:
+    """A record served without a `Content-Type` is downloaded as `application/octet-stream`."""
+    _serve_download(httpserver, content_type=None)
+    client = ApifyClient(token='test_token', api_url=api_url)
+
+    record = client.key_value_store(_MOCKED_KVS_ID).download_record('f', tmp_path / 'f.bin')
+
+    assert record is not None
+    assert record['content_type'] == 'application/octet-stream'
+
+
+async def test_download_record_async(
+    httpserver: HTTPServer, api_url: str, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Broken parallel ranges are resumed, and a missing record is reported as None without creating a file."""
+    monkeypatch.setattr(key_value_store_module, 'MIN_DOWNLOAD_PART_SIZE', len(_DOWNLOAD_DATA) // 2)
+    ranges = _serve_download(httpserver, break_after=1000, broken_request=2)
+    httpserver.expect_request(re.compile(rf'/v2/key-value-stores/{_MOCKED_KVS_ID}/records/missing')).respond_with_json(
+        {'error': {'type': 'record-not-found', 'message': 'Record was not found'}}, status=404
+    )
+    client = ApifyClientAsync(token='test_token', api_url=api_url)
+    kvs = client.key_value_store(_MOCKED_KVS_ID)
+
+    record = await kvs.download_record('f', str(tmp_path / 'f.bin'), parts=2)
+    missing = await kvs.download_record('missing', tmp_path / 'missing.bin')
+
+    assert record is not None
+    assert record['value'].read_bytes() == _DOWNLOAD_DATA
+    assert len(ranges) == 4
+    assert missing is None
+    assert not (tmp_path / 'missing.bin').exists()
+
+
+async def test_download_record_rejects_resume_of_changed_record_async(
+    httpserver: HTTPServer, api_url: str, tmp_path: Path
+) -> None:
+    """A broken download of a record that changed in the meantime is not resumed with bytes of the new version."""
+    _serve_download(httpserver, break_after=1000, changed_request=2)
+    client = ApifyClientAsync(token='test_token', api_url=api_url)
+
+    with pytest.raises(IncompleteDownloadError, match='changed'):
+        await client.key_value_store(_MOCKED_KVS_ID).download_record('f', tmp_path / 'f.bin')
+
+
+def test_download_record_empty_sync(httpserver: HTTPServer, api_url: str, tmp_path: Path) -> None:
+    """An empty record is downloaded into an empty file."""
+    _serve_download(httpserver, data=b'')
+    client = ApifyClient(token='test_token', api_url=api_url)
+
+    record = client.key_value_store(_MOCKED_KVS_ID).download_record('f', tmp_path / 'f.bin', parts=4)
+
+    assert record is not None
+    assert (tmp_path / 'f.bin').read_bytes() == b''
+
+
+def test_download_record_checks_written_size_sync(
+    httpserver: HTTPServer, api_url: str, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Ranges that write more bytes than the record has fail the download, although the file has the right size."""
+    monkeypatch.setattr(key_value_store_module, 'MIN_DOWNLOAD_PART_SIZE', len(_DOWNLOAD_DATA) // 2)
+    _serve_download(httpserver, ignore_range_end=True)
+    client = ApifyClient(token='test_token', api_url=api_url)
+
+    with pytest.raises(IncompleteDownloadError, match='wrote'):
+        client.key_value_store(_MOCKED_KVS_ID).download_record('f', tmp_path / 'f.bin', parts=2)
+
+    assert (tmp_path / 'f.bin').stat().st_size == len(_DOWNLOAD_DATA)
+
+
+async def test_download_record_empty_async(httpserver: HTTPServer, api_url: str, tmp_path: Path) -> None:
+    """The async client downloads an empty record into an empty file too."""
+    _serve_download(httpserver, data=b'')
+    client = ApifyClientAsync(token='test_token', api_url=api_url)
+
+    record = await client.key_value_store(_MOCKED_KVS_ID).download_record('f', tmp_path / 'f.bin')
+
+    assert record is not None
+    assert (tmp_path / 'f.bin').read_bytes() == b''
@@ -0,0 +1,195 @@
+from __future__ import annotations
+
+import gzip
+import json
+import re
+from typing import TYPE_CHECKING
+
+import pytest
+from werkzeug import Request, Response
+
+from apify_client import ApifyClient, ApifyClientAsync
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pytest_httpserver import HTTPServer
+
+    from apify_client._directory_sync import DirectorySyncProgress
+
+_MOCKED_KVS_ID = 'test_kvs_id'
+_MANIFEST_KEY = 'DIRECTORY-SYNC-MANIFEST'
+
+
+@pytest.fixture
+def api_url(httpserver: HTTPServer) -> str:
+    """The base URL of the mock server, in the form the clients expect."""
+    return httpserver.url_for('/').removesuffix('/')
+
+
+class _InMemoryStore:
+    """Serve a key-value store whose records are kept in memory, logging the requests as `(method, key)`.
+
+    Records are kept as they were uploaded, so the listed size of a compressed record is that of its compressed body,
+    as in the API.
+    """
+
+    def __init__(self, httpserver: HTTPServer) -> None:
+        self.records: dict[str, tuple[bytes, str, str | None]] = {}
+        self.requests: list[tuple[str, str]] = []
+        store_path = f'/v2/key-value-stores/{_MOCKED_KVS_ID}'
+        httpserver.expect_request(f'{store_path}/keys', method='GET').respond_with_handler(self._list_keys)
+        httpserver.expect_request(re.compile(rf'{store_path}/records/.+')).respond_with_handler(self._handle_record)
+
+    def _list_keys(self, _request: Request) -> Response:
+        items = [
+            {'key': key, 'size': len(value), 'recordPublicUrl': 'https://example.com'}
+            for key, (value, _, _) in sorted(self.records.items())
+        ]
+        data = {'items': items, 'count': len(items), 'limit': 1000, 'isTruncated': False}
+        return Response(json.dumps({'data': data}), content_type='application/json')
+
+    def _handle_record(self, request: Request) -> Response:
+        key = request.path.rsplit('/', 1)[-1]
+        self.requests.append((request.method, key))
+        if request.method == 'PUT':
+            self.records[key] = (
+                request.get_data(),
+                request.headers['Content-Type'],
+                request.headers.get('Content-Encoding'),
+            )
+            return Response(status=201)
+        if key not in self.records:
+            return Response(json.dumps({'error': {'type': 'record-not-found', 'message': 'Not found'}}), status=404)
+        if request.method == 'DELETE':
+            del self.records[key]
+            return Response(status=204)
+        value, content_type, content_encoding = self.records[key]
+        headers = {'Content-Encoding': content_encoding} if content_encoding else None
+        return Response(value, content_type=content_type, headers=headers)
+
+    def value(self, key: str) -> bytes:
+        value, _, content_encoding = self.records[key]
+        return gzip.decompress(value) if content_encoding == 'gzip' else value
+
+    def manifest(self) -> dict:
+        return json.loads(self.value(_MANIFEST_KEY))
+
+
+def _write_files(directory: Path, files: dict[str, str]) -> None:
+    for relative_path, content in files.items():
+        path = directory / relative_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+
+
+def test_sync_directory_up_and_down_sync(httpserver: HTTPServer, api_url: str, tmp_path: Path) -> None:
+    """Only new and changed files are uploaded, removed ones are deleted, and the tree is restored when syncing down."""
+    store = _InMemoryStore(httpserver)
+    kvs = ApifyClient(token='test_token', api_url=api_url).key_value_store(_MOCKED_KVS_ID)
+    source = tmp_path / 'source'
+    _write_files(source, {'a.txt': 'a', 'assets/b.css': 'b', 'assets/c.css': 'c'})
+    kvs.sync_directory(source)
+
+    (source / 'a.txt').unlink()
+    _write_files(source, {'assets/b.css': 'B', 'd.txt': 'd'})
+    store.requests.clear()
+    progress: list[DirectorySyncProgress] = []
+    result = kvs.sync_directory(source, delete=True, on_progress=progress.append)
+
+    assert sorted(result.transferred) == ['assets!b.css', 'd.txt']
+    assert result.deleted == ['a.txt']
+    assert result.unchanged == ['assets!c.css']
+    assert not result.failed
+    assert [(p.completed, p.total) for p in progress] == [(1, 3), (2, 3), (3, 3)]
+    assert sorted(p.action for p in progress) == ['deleted', 'transferred', 'transferred']
+    assert store.value('assets!b.css') == b'B'
+    assert 'a.txt' not in store.records
+    assert store.manifest()['files']['assets!b.css']['path'] == 'assets/b.css'
+
+    target = tmp_path / 'target'
+    down = kvs.sync_directory(target, direction='down')
+    store.requests.clear()
+    again = kvs.sync_directory(target, direction='down')
+
+    assert sorted(down.transferred) == ['assets!b.css', 'assets!c.css', 'd.txt']
+    assert (target / 'assets' / 'b.css').read_text() == 'B'
+    assert sorted(again.unchanged) == ['assets!b.css', 'assets!c.css', 'd.txt']
+    assert store.requests == [('GET', _MANIFEST_KEY)]
+
+
+async def test_sync_directory_async(httpserver: HTTPServer, api_url: str, tmp_path: Path) -> None:
+    """A second sync up transfers nothing, and syncing down with `delete` removes files that have no record."""
+    store = _InMemoryStore(httpserver)
+    kvs = ApifyClientAsync(token='test_token', api_url=api_url).key_value_store(_MOCKED_KVS_ID)
+    source = tmp_path / 'source'
+    _write_files(source, {'index.html': '<html></html>', 'js/app.js': 'run()'})
+
+    first = await kvs.sync_directory(source, max_parallel=2)
+    store.requests.clear()
+    second = await kvs.sync_directory(source)
+    requests_of_second = list(store.requests)
+    target = tmp_path / 'target'
+    _write_files(target, {'stale.txt': 'stale', 'js/app.js': 'old()'})
+    down = await kvs.sync_directory(target, direction='down', delete=True)
+
+    assert sorted(first.transferred) == ['index.html', 'js!app.js']
+    assert not second.transferred
+    assert requests_of_second == [('GET', _MANIFEST_KEY)]
+    assert sorted(down.transferred) == ['index.html', 'js!app.js']
+    assert down.deleted == ['stale.txt']
+    assert (target / 'js' / 'app.js').read_text() == 'run()'
+    assert not (target / 'stale.txt').exists()
+
+
+def test_sync_directory_compressed_records_unchanged_sync(httpserver: HTTPServer, api_url: str, tmp_path: Path) -> None:
+    """Files stored compressed, and so listed with a smaller size, are not transferred again by a later sync."""
+    store = _InMemoryStore(httpserver)
+    kvs = ApifyClient(token='test_token', api_url=api_url).key_value_store(_MOCKED_KVS_ID)
+    source = tmp_path / 'source'
+    content = 'compressible text\n' * 1000
+    _write_files(source, {'large.txt': content})
+
+    first = kvs.sync_directory(source)
+    store.requests.clear()
+    again = kvs.sync_directory(source)
+    target = tmp_path / 'target'
+    down = kvs.sync_directory(target, direction='down')
+    store.requests.clear()
+    down_again = kvs.sync_directory(target, direction='down')
+
+    assert store.records['large.txt'][2] == 'gzip'
+    assert len(store.records['large.txt'][0]) < len(content)
+    assert first.transferred == ['large.txt']
+    assert again.unchanged == ['large.txt']
+    assert store.requests == [('GET', _MANIFEST_KEY)]
+    assert down.transferred == ['large.txt']
+    assert (target / 'large.txt').read_text() == content
+    assert down_again.unchanged == ['large.txt']
+
+
+@pytest.mark.parametrize('direction', ['UP', 'upload', ''])
+def test_sync_directory_rejects_unknown_direction_sync(
+    httpserver: HTTPServer, api_url: str, tmp_path: Path, direction: str
+) -> None:
+    """An unknown direction fails before any request, and before any local file is touched."""
+    store = _InMemoryStore(httpserver)
+    kvs = ApifyClient(token='test_token', api_url=api_url).key_value_store(_MOCKED_KVS_ID)
+    _write_files(tmp_path, {'keep.txt': 'keep'})
+
+    with pytest.raises(ValueError, match='direction'):
+        kvs.sync_directory(tmp_path, direction=direction, delete=True)  # ty: ignore[invalid-argument-type]
+
+    assert not store.requests
+    assert (tmp_path / 'keep.txt').read_text() == 'keep'
+
+
+async def test_sync_directory_rejects_unknown_direction_async(
+    httpserver: HTTPServer, api_url: str, tmp_path: Path
+) -> None:
+    """The async client rejects an unknown direction too."""
+    _InMemoryStore(httpserver)
+    kvs = ApifyClientAsync(token='test_token', api_url=api_url).key_value_store(_MOCKED_KVS_ID)
+
+    with pytest.raises(ValueError, match='direction'):
+        await kvs.sync_directory(tmp_path, direction='Down', delete=True)  # ty: ignore[invalid-argument-type]
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import bisect
+import json
+from typing import TYPE_CHECKING
+
+import pytest
+from werkzeug import Request, Response
+
+from apify_client import ApifyClient, ApifyClientAsync
+from apify_client.key_index import KeyIndex
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pytest_httpserver import HTTPServer
+
+_MOCKED_KVS_ID = 'test_kvs_id'
+
+
+@pytest.fixture
+def api_url(httpserver: HTTPServer) -> str:
+    """The base URL of the mock server, in the form the clients expect."""
+    return httpserver.url_for('/').removesuffix('/')
+
+
+class _KeyListing:
+    """Serve a paginated, sorted key listing, recording the `exclusiveStartKey` of each request."""
+
+    def __init__(self, httpserver: HTTPServer, keys: dict[str, int]) -> None:
+        self.keys = keys
+        self.start_keys: list[str | None] = []
+        path = f'/v2/key-value-stores/{_MOCKED_KVS_ID}/keys'
+        httpserver.expect_request(path, method='GET').respond_with_handler(self._list_keys)
+
+    def _list_keys(self, request: Request) -> Response:
+        start_key = request.args.get('exclusiveStartKey')
+        self.start_keys.append(start_key)
+        prefix = request.args.get('prefix', '')
+        limit = int(request.args.get('limit', 1000))
+        keys = sorted(key for key in self.keys if key.startswith(prefix))
+        first = bisect.bisect_right(keys, start_key) if start_key is not None else 0
+        page = keys[first : first + limit]
+        is_truncated = first + limit < len(keys)
+        data = {
+            'items': [{'key': key, 'size': self.keys[key], 'recordPublicUrl': 'https://example.com'} for key in page],
+            'count': len(page),
+            'limit': limit,
+            'isTruncated': is_truncated,
+            'nextExclusiveStartKey': page[-1] if is_truncated else None,
+        }
+        return Response(json.dumps({'data': data}), content_type='application/json')
+
+
+def test_key_index_queries_and_persistence(tmp_path: Path) -> None:
+    """Keys are kept sorted whatever order they are added in, and survive a save and load."""
+    index = KeyIndex()
+    index.extend([('b', 2), ('a', 1), ('ča', 5)])
+    index.extend([('c!1', 3), ('c!2', 4)])
+    index.extend([('aa', 10), ('b', 20)])
+
+    assert list(index) == ['a', 'aa', 'b', 'c!1', 'c!2', 'ča']
+    assert index.get_size('b') == 20
+    assert index.get_size('missing') is None
+    assert 'c!2' in index
+    assert 'c' not in index
+    assert list(index.items(prefix='c!')) == [('c!1', 3), ('c!2', 4)]
+    assert list(index.keys(prefix='a')) == ['a', 'aa']
+    assert index.last_key == 'ča'
+
+    index.save(tmp_path / 'keys.idx')
+    loaded = KeyIndex.load(tmp_path / 'keys.idx')
+
+    assert list(loaded.items()) == list(index.items())
+    assert loaded.prefix is None
+
+
+def test_build_and_refresh_key_index_sync(httpserver: HTTPServer, api_url: str) -> None:
+    """The index is built from all pages, and a refresh lists only the keys after the last indexed one."""
+    listing = _KeyListing(httpserver, {f'key-{i:05}': i for i in range(2500)})
+    kvs = ApifyClient(token='test_token', api_url=api_url).key_value_store(_MOCKED_KVS_ID)
+
+    index = kvs.build_key_index()
+    listing.keys.update({'key-99999': 7, 'zzz': 8})
+    listing.start_keys.clear()
+    added = kvs.refresh_key_index(index)
+
+    assert len(index) == 2502
+    assert index.get_size('key-01234') == 1234
+    assert added == 2
+    assert listing.start_keys == ['key-02499']
+    assert index.last_key == 'zzz'
+
+
+async def test_build_key_index_with_prefix_async(httpserver: HTTPServer, api_url: str) -> None:
+    """Only the keys with the prefix are indexed, and a refresh keeps to the prefix."""
+    listing = _KeyListing(httpserver, {'img!1': 1, 'img!2': 2, 'txt!1': 3})
+    kvs = ApifyClientAsync(token='test_token', api_url=api_url).key_value_store(_MOCKED_KVS_ID)
+
+    index = await kvs.build_key_index(prefix='img!')
+    listing.keys.update({'img!3': 4, 'txt!2': 5})
+    added = await kvs.refresh_key_index(index)
+
+    assert list(index.items()) == [('img!1', 1), ('img!2', 2), ('img!3', 4)]
+    assert added == 1
+    assert index.prefix == 'img!'
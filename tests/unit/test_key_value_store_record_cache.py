@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING
+
+import pytest
+from werkzeug import Request, Response
+
+from apify_client import ApifyClient, ApifyClientAsync
+from apify_client.errors import InvalidResponseBodyError
+from apify_client.record_cache import RecordCache
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pytest_httpserver import HTTPServer
+
+_MOCKED_KVS_ID = 'test_kvs_id'
+_RECORD_PATH = f'/v2/key-value-stores/{_MOCKED_KVS_ID}/records/CONFIG'
+
+
+@pytest.fixture
+def api_url(httpserver: HTTPServer) -> str:
+    """The base URL of the mock server, in the form the clients expect."""
+    return httpserver.url_for('/').removesuffix('/')
+
+
+class _VersionedRecord:
+    """Serve a record tagged with its version, answering a request with the current `ETag` with a 304."""
+
+    def __init__(self, httpserver: HTTPServer) -> None:
+        self.version = 1
+        self.conditions = list[str | None]()
+        httpserver.expect_request(_RECORD_PATH, method='GET').respond_with_handler(self._get)
+        httpserver.expect_request(_RECORD_PATH, method='PUT').respond_with_handler(self._put)
+
+    @property
+    def etag(self) -> str:
+        return f'"v{self.version}"'
+
+    def _get(self, request: Request) -> Response:
+        condition = request.headers.get('If-None-Match')
+        self.conditions.append(condition)
+        if condition == self.etag:
+            return Response(status=304, headers={'ETag': self.etag})
+        return Response(
+            json.dumps({'version': self.version}),
+            content_type='application/json; charset=utf-8',
+            headers={'ETag': self.etag, 'Last-Modified': 'Wed, 01 Jan 2025 00:00:00 GMT'},
+        )
+
+    def _put(self, _request: Request) -> Response:
+        self.version += 1
+        return Response(status=201)
+
+
+def test_record_cache_revalidates_sync(httpserver: HTTPServer, api_url: str, tmp_path: Path) -> None:
+    """An unchanged record is served from disk after a 304, also to another client, and a write invalidates it."""
+    record = _VersionedRecord(httpserver)
+    cache = RecordCache(tmp_path)
+    kvs = ApifyClient(token='test_token', api_url=api_url).key_value_store(_MOCKED_KVS_ID, record_cache=cache)
+
+    first = kvs.get_record('CONFIG')
+    second = kvs.get_record('CONFIG')
+    other_client = ApifyClient(token='test_token', api_url=api_url)
+    shared = other_client.key_value_store(_MOCKED_KVS_ID, record_cache=RecordCache(tmp_path)).get_record('CONFIG')
+    kvs.set_record('CONFIG', {'version': 2})
+    updated = kvs.get_record('CONFIG')
+
+    assert first == second == shared
+    assert first == {'key': 'CONFIG', 'value': {'version': 1}, 'content_type': 'application/json; charset=utf-8'}
+    assert updated is not None
+    assert updated['value'] == {'version': 2}
+    assert record.conditions == [None, '"v1"', '"v1"', None]
+
+
+async def test_record_cache_immutable_async(httpserver: HTTPServer, api_url: str, tmp_path: Path) -> None:
+    """With `revalidate=False` and no TTL, a cached record is served without any request, parsed or as bytes."""
+    record = _VersionedRecord(httpserver)
+    cache = RecordCache(tmp_path, revalidate=False)
+    kvs = ApifyClientAsync(token='test_token', api_url=api_url).key_value_store(_MOCKED_KVS_ID, record_cache=cache)
+
+    first = await kvs.get_record('CONFIG')
+    second = await kvs.get_record('CONFIG')
+    raw = await kvs.get_record_as_bytes('CONFIG')
+
+    assert first == second
+    assert first is not None
+    assert first['value'] == {'version': 1}
+    assert raw is not None
+    assert json.loads(raw['value']) == {'version': 1}
+    assert record.conditions == [None]
+
+
+@pytest.mark.parametrize('revalidate', [True, False])
+def test_record_cache_unparsable_body_sync(
+    httpserver: HTTPServer, api_url: str, tmp_path: Path, *, revalidate: bool
+) -> None:
+    """An invalid JSON body cached as bytes is downloaded again when it is read parsed, and reported as invalid."""
+    requests = list[Request]()
+
+    def get_record(request: Request) -> Response:
+        requests.append(request)
+        return Response(b'{"broken', content_type='application/json', headers={'ETag': '"v1"'})
+
+    httpserver.expect_request(_RECORD_PATH, method='GET').respond_with_handler(get_record)
+    cache = RecordCache(tmp_path, revalidate=revalidate)
+    kvs = ApifyClient(token='test_token', api_url=api_url).key_value_store(_MOCKED_KVS_ID, record_cache=cache)
+
+    as_bytes = kvs.get_record_as_bytes('CONFIG')
+    with pytest.raises(InvalidResponseBodyError) as exc_info:
+        kvs.get_record('CONFIG')
+
+    assert as_bytes is not None
+    assert as_bytes['value'] == b'{"broken'
+    assert exc_info.value.response.content == b'{"broken'
+    assert [request.headers.get('If-None-Match') for request in requests] == [None, None]
+
+
+def test_record_cache_evicts_least_recently_used(tmp_path: Path) -> None:
+    """Once the records exceed the size limit, the least recently used ones are evicted, and too large ones skipped."""
+    cache = RecordCache(tmp_path, max_size_bytes=1000)
+
+    cache.put('store', 'a', b'a' * 300, content_type='application/octet-stream')
+    cache.put('store', 'b', b'b' * 300, content_type='application/octet-stream')
+    assert cache.get('store', 'a') is not None
+    cache.put('store', 'c', b'c' * 300, content_type='application/octet-stream')
+    cache.put('store', 'huge', b'h' * 2000, content_type='application/octet-stream')
+
+    assert cache.get('store', 'a') is not None
+    assert cache.get('store', 'b') is None
+    assert cache.get('store', 'c') is not None
+    assert cache.get('store', 'huge') is None
@@ -0,0 +1,208 @@
+from __future__ import annotations
+
+import gzip
+import json
+import zlib
+from typing import TYPE_CHECKING
+
+import brotli
+import pytest
+from werkzeug import Request, Response
+
+from apify_client import ApifyClient, ApifyClientAsync
+from apify_client._utils.content_decoding import RecordBodyDecoder, decode_record_body, looks_compressed, peek_head
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
+    from pytest_httpserver import HTTPServer
+
+_MOCKED_KVS_ID = 'test_kvs_id'
+
+
+@pytest.fixture
+def api_url(httpserver: HTTPServer) -> str:
+    """The base URL of the mock server, in the form the clients expect."""
+    return httpserver.url_for('/').removesuffix('/')
+
+
+class _RecordStore:
+    """Serve records stored exactly as uploaded, with the `Content-Encoding` they were uploaded with."""
+
+    def __init__(self, httpserver: HTTPServer, key: str) -> None:
+        self.body = b''
+        self.headers: dict[str, str] = {}
+        httpserver.expect_request(f'/v2/key-value-stores/{_MOCKED_KVS_ID}/records/{key}').respond_with_handler(
+            self._handle
+        )
+
+    def _handle(self, request: Request) -> Response:
+        if request.method == 'PUT':
+            self.body = request.get_data()
+            self.headers = {
+                name: value
+                for name in ('Content-Type', 'Content-Encoding')
+                if (value := request.headers.get(name)) is not None
+            }
+            return Response(status=201)
+        return Response(self.body, headers=self.headers)
+
+
+def test_set_and_get_compressed_record_sync(httpserver: HTTPServer, api_url: str) -> None:
+    """A large value is stored compressed with the record compressor and read back as the original value."""
+    store = _RecordStore(httpserver, 'data')
+    kvs = ApifyClient(token='test_token', api_url=api_url).key_value_store(
+        _MOCKED_KVS_ID, record_compression='brotli', record_compression_min_size=100
+    )
+    value = {'items': list(range(200))}
+
+    kvs.set_record('data', value)
+    record = kvs.get_record('data')
+
+    assert store.headers['Content-Encoding'] == 'br'
+    assert json.loads(brotli.decompress(store.body)) == value
+    assert record is not None
+    assert record['value'] == value
+
+
+def test_small_or_compressed_values_are_stored_as_they_are_sync(httpserver: HTTPServer, api_url: str) -> None:
+    """Values under the threshold and values of already compressed media types are not compressed."""
+    store = _RecordStore(httpserver, 'data')
+    kvs = ApifyClient(token='test_token', api_url=api_url).key_value_store(
+        _MOCKED_KVS_ID, record_compression='gzip', record_compression_min_size=100
+    )
+
+    kvs.set_record('data', 'short')
+    assert 'Content-Encoding' not in store.headers
+    assert store.body == b'short'
+
+    kvs.set_record('data', b'\x89PNG' * 100, content_type='image/png')
+    assert 'Content-Encoding' not in store.headers
+
+
+def test_set_record_from_path_compressed_sync(httpserver: HTTPServer, api_url: str, tmp_path: Path) -> None:
+    """A file is compressed with the record compressor while it is uploaded."""
+    store = _RecordStore(httpserver, 'report')
+    kvs = ApifyClient(token='test_token', api_url=api_url).key_value_store(
+        _MOCKED_KVS_ID, record_compression='brotli', record_compression_min_size=100
+    )
+    path = tmp_path / 'report.csv'
+    path.write_text('a,b\n1,2\n' * 100)
+
+    kvs.set_record_from_path('report', path)
+
+    assert store.headers['Content-Encoding'] == 'br'
+    assert brotli.decompress(store.body) == path.read_bytes()
+
+
+async def test_stream_compressed_record_async(httpserver: HTTPServer, api_url: str) -> None:
+    """A streamed record body the transport did not decode is decompressed chunk by chunk."""
+    payload = b'line\n' * 10_000
+    # The transport decodes the outer layer, leaving a body that is still compressed, as a transport that does
+    # not decode response bodies would.
+    body = gzip.compress(gzip.compress(payload))
+    httpserver.expect_request(f'/v2/key-value-stores/{_MOCKED_KVS_ID}/records/log').respond_with_data(
+        body, headers={'Content-Type': 'text/plain', 'Content-Encoding': 'gzip'}
+    )
+    kvs = ApifyClientAsync(token='test_token', api_url=api_url).key_value_store(
+        _MOCKED_KVS_ID, record_compression='gzip'
+    )
+
+    async with kvs.stream_record('log') as record:
+        assert record is not None
+        chunks = [chunk async for chunk in record['value'].aiter_bytes()]
+
+    assert b''.join(chunks) == payload
+
+
+def test_stream_decoded_brotli_record_sync(httpserver: HTTPServer, api_url: str) -> None:
+    """A streamed brotli record the transport decoded already is passed through, even if it is valid brotli data."""
+    # The record itself is a brotli file, so the body the transport decodes still decompresses.
+    payload = brotli.compress(b'line\n' * 10_000)
+    httpserver.expect_request(f'/v2/key-value-stores/{_MOCKED_KVS_ID}/records/archive').respond_with_data(
+        brotli.compress(payload), headers={'Content-Type': 'application/octet-stream', 'Content-Encoding': 'br'}
+    )
+    kvs = ApifyClient(token='test_token', api_url=api_url).key_value_store(_MOCKED_KVS_ID, record_compression='brotli')
+
+    with kvs.stream_record('archive') as record:
+        assert record is not None
+        chunks = list(record['value'].iter_bytes())
+
+    assert b''.join(chunks) == payload
+
+
+def test_gzip_value_stored_as_it_is_sync(httpserver: HTTPServer, api_url: str, tmp_path: Path) -> None:
+    """A value that is a gzip file already is not compressed again, and reads back as the stored gzip file."""
+    store = _RecordStore(httpserver, 'archive')
+    kvs = ApifyClient(token='test_token', api_url=api_url).key_value_store(
+        _MOCKED_KVS_ID, record_compression='gzip', record_compression_min_size=100
+    )
+    archive = gzip.compress(b'file contents\n' * 1000)
+
+    kvs.set_record('archive', archive, content_type='application/octet-stream')
+    record = kvs.get_record_as_bytes('archive')
+    with kvs.stream_record('archive') as streamed:
+        assert streamed is not None
+        streamed_value = b''.join(streamed['value'].iter_bytes())
+
+    assert 'Content-Encoding' not in store.headers
+    assert store.body == archive
+    assert record is not None
+    assert record['value'] == archive
+    assert streamed_value == archive
+
+    path = tmp_path / 'archive.tar.gz'
+    path.write_bytes(archive)
+    kvs.set_record_from_path('archive', path, content_type='application/octet-stream')
+
+    assert 'Content-Encoding' not in store.headers
+    assert store.body == archive
+
+
+def test_peek_head_keeps_all_chunks() -> None:
+    """The leading bytes are read across chunks, and the chunks are all still iterated afterwards."""
+    head, chunks = peek_head(iter([b'', b'\x1f', b'\x8b\x08', b'rest']))
+
+    assert head == b'\x1f\x8b'
+    assert b''.join(chunks) == b'\x1f\x8b\x08rest'
+    assert looks_compressed('gzip', head)
+    assert not looks_compressed('br', head)
+
+
+async def test_set_and_get_compressed_record_async(httpserver: HTTPServer, api_url: str) -> None:
+    """The async client stores large values compressed and decompresses them on read."""
+    store = _RecordStore(httpserver, 'page')
+    kvs = ApifyClientAsync(token='test_token', api_url=api_url).key_value_store(
+        _MOCKED_KVS_ID, record_compression='gzip', record_compression_min_size=100
+    )
+
+    await kvs.set_record('page', '<html>' + 'x' * 1000 + '</html>', content_type='text/html')
+    record = await kvs.get_record_as_bytes('page')
+
+    assert store.headers['Content-Encoding'] == 'gzip'
+    assert record is not None
+    assert record['value'] == b'<html>' + b'x' * 1000 + b'</html>'
+
+
+@pytest.mark.parametrize(
+    ('content_encoding', 'compress'),
+    [
+        pytest.param('gzip', gzip.compress, id='gzip'),
+        pytest.param('deflate', zlib.compress, id='deflate'),
+        pytest.param('br', brotli.compress, id='br'),
+    ],
+)
+def test_decode_record_body(content_encoding: str, compress: Callable[[bytes], bytes]) -> None:
+    """A body still compressed is decoded, one the transport decoded already is left alone."""
+    payload = b'{"hello": "world"}' * 50
+    compressed = compress(payload)
+    encoded_headers = {'content-encoding': content_encoding, 'content-length': str(len(compressed))}
+
+    assert decode_record_body(compressed, encoded_headers) == payload
+    assert decode_record_body(payload, encoded_headers) == payload
+    assert decode_record_body(payload, {'content-encoding': content_encoding}) == payload
+
+    decoder = RecordBodyDecoder(content_encoding, still_encoded=True)
+    decoded = b''.join(decoder.decode(compressed[i : i + 7]) for i in range(0, len(compressed), 7))
+    assert decoded + decoder.flush() == payload
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import asyncio
+import gzip
 import json as jsonlib
+from collections.abc import AsyncIterable
 from dataclasses import dataclass, field
 from datetime import timedelta
 from http.client import HTTPConnection
@@ -26,11 +28,11 @@ from apify_client.http_clients import (
 )
 
 if TYPE_CHECKING:
-    from collections.abc import AsyncIterator, Iterator
+    from collections.abc import AsyncIterator, Iterable, Iterator
 
     from pytest_httpserver import HTTPServer
 
-    from apify_client.types import Timeout
+    from apify_client.types import RequestContent, RequestContentAsync, RequestData, RequestDataAsync, Timeout
 
 
 @dataclass
@@ -90,7 +92,7 @@ class FakeHttpClient(HttpClient):
         url: str,
         headers: dict[str, str] | None = None,
         params: dict[str, Any] | None = None,
-        data: str | bytes | bytearray | None = None,
+        data: RequestData | None = None,
         json: Any = None,
         stream: bool | None = None,
         timeout: Timeout = 'medium',
@@ -124,7 +126,7 @@ class FakeHttpClientAsync(HttpClientAsync):
         url: str,
         headers: dict[str, str] | None = None,
         params: dict[str, Any] | None = None,
-        data: str | bytes | bytearray | None = None,
+        data: RequestDataAsync | None = None,
         json: Any = None,
         stream: bool | None = None,
         timeout: Timeout = 'medium',
@@ -149,7 +151,7 @@ def _stdlib_fetch(
     method: str,
     url: str,
     headers: dict[str, str],
-    content: bytes | None,
+    content: RequestContent | None,
     timeout: float | None,
 ) -> FakeResponse:
     """Send one request over `http.client` and adapt the result to the `HttpResponse` protocol."""
@@ -184,7 +186,7 @@ class StdlibHttpClient(HttpClient):
         method: str,
         url: str,
         headers: dict[str, str],
-        content: bytes | None,
+        content: RequestContent | None,
         timeout: float | None,
         stream: bool,
     ) -> HttpResponse:
@@ -201,11 +203,14 @@ class StdlibHttpClientAsync(HttpClientAsync):
         method: str,
         url: str,
         headers: dict[str, str],
-        content: bytes | None,
+        content: RequestContentAsync | None,
         timeout: float | None,
         stream: bool,
     ) -> HttpResponse:
         _ = stream
+        if isinstance(content, AsyncIterable):
+            # `http.client` reads the body in a worker thread, which cannot iterate an async iterable.
+            content = b''.join([chunk async for chunk in content])
         return await asyncio.to_thread(
             _stdlib_fetch, method=method, url=url, headers=headers, content=content, timeout=timeout
         )
@@ -500,10 +505,12 @@ class PreparingHttpClient(HttpClient):
         url: str,
         headers: dict[str, str] | None = None,
         params: dict[str, Any] | None = None,
-        data: str | bytes | bytearray | None = None,
+        data: RequestData | None = None,
         json: Any = None,
         **_kwargs: Any,
     ) -> HttpResponse:
+        if data is not None and not isinstance(data, (str, bytes, bytearray)):
+            raise TypeError('This client sends only bodies held in memory as a whole')
         headers, params, content = self._prepare_request_call(headers=headers, params=params, data=data, json=json)
         url = self._build_url_with_params(url, params=params)
         return self._impit_client.request(method=method, url=url, headers=headers, content=content)
@@ -523,10 +530,12 @@ class PreparingHttpClientAsync(HttpClientAsync):
         url: str,
         headers: dict[str, str] | None = None,
         params: dict[str, Any] | None = None,
-        data: str | bytes | bytearray | None = None,
+        data: RequestDataAsync | None = None,
         json: Any = None,
         **_kwargs: Any,
     ) -> HttpResponse:
+        if data is not None and not isinstance(data, (str, bytes, bytearray)):
+            raise TypeError('This client sends only bodies held in memory as a whole')
         headers, params, content = self._prepare_request_call(headers=headers, params=params, data=data, json=json)
         url = self._build_url_with_params(url, params=params)
         return await self._impit_client.request(method=method, url=url, headers=headers, content=content)
@@ -728,3 +737,120 @@ async def test_hooks_only_client_async_does_not_retry_an_unclassified_transport_
         await client.call(method='GET', url='https://example.com')
 
     send_request.assert_awaited_once()
+
+
+_UNAVAILABLE_TEXT = '{"error": {"type": "service-unavailable", "message": "Try again."}}'
+
+
+def _read_body(content: bytes | memoryview | Iterable[bytes] | None) -> bytes:
+    if content is None:
+        return b''
+    if isinstance(content, (bytes, memoryview)):
+        return bytes(content)
+    return b''.join(content)
+
+
+class StreamingHttpClient(HttpClient):
+    """A hooks-only sync client that records each request body and answers the first `failures` attempts with 503."""
+
+    def __init__(self, *, failures: int = 0) -> None:
+        super().__init__(min_delay_between_retries=timedelta(milliseconds=1))
+        self.requests: list[tuple[dict[str, str], bytes]] = []
+        self._failures = failures
+
+    def send_request(
+        self,
+        *,
+        method: str,
+        url: str,
+        headers: dict[str, str],
+        content: RequestContent | None,
+        timeout: float | None,
+        stream: bool,
+    ) -> HttpResponse:
+        _ = method, url, timeout, stream
+        self.requests.append((headers, _read_body(content)))
+        if len(self.requests) <= self._failures:
+            return FakeResponse(status_code=503, text=_UNAVAILABLE_TEXT)
+        return _make_fake_response()
+
+
+class StreamingHttpClientAsync(HttpClientAsync):
+    """A hooks-only async client that records each request body and answers the first `failures` attempts with 503."""
+
+    def __init__(self, *, failures: int = 0) -> None:
+        super().__init__(min_delay_between_retries=timedelta(milliseconds=1))
+        self.requests: list[tuple[dict[str, str], bytes]] = []
+        self._failures = failures
+
+    async def send_request(
+        self,
+        *,
+        method: str,
+        url: str,
+        headers: dict[str, str],
+        content: RequestContentAsync | None,
+        timeout: float | None,
+        stream: bool,
+    ) -> HttpResponse:
+        _ = method, url, timeout, stream
+        if content is None or isinstance(content, (bytes, memoryview)):
+            body = _read_body(content)
+        else:
+            body = b''.join([chunk async for chunk in content])
+        self.requests.append((headers, body))
+        if len(self.requests) <= self._failures:
+            return FakeResponse(status_code=503, text=_UNAVAILABLE_TEXT)
+        return _make_fake_response()
+
+
+def test_chunked_body_is_compressed_while_streamed_and_resent_on_retry() -> None:
+    """A re-iterable chunked body is compressed on the fly, and sent again from its start on a retry."""
+    client = StreamingHttpClient(failures=1)
+    chunks = [b'a' * 2000, b'b' * 2000]
+
+    client.call(method='PUT', url='https://example.com', headers={'Content-Type': 'text/plain'}, data=chunks)
+
+    assert len(client.requests) == 2
+    for headers, body in client.requests:
+        assert headers['Content-Encoding'] == 'gzip'
+        assert gzip.decompress(body) == b''.join(chunks)
+
+
+def test_one_shot_iterator_body_is_not_retried() -> None:
+    """A generator body is consumed by the first attempt, so a failed request is not sent again with an empty body."""
+    client = StreamingHttpClient(failures=1)
+
+    with pytest.raises(ApifyApiError):
+        client.call(method='PUT', url='https://example.com', data=(bytes([i]) * 100 for i in range(5)))
+
+    assert len(client.requests) == 1
+
+
+def test_small_buffer_body_is_sent_as_it_is() -> None:
+    """A memoryview below the compression threshold is sent uncompressed, like a bytes body of that size."""
+    client = StreamingHttpClient()
+
+    client.call(method='PUT', url='https://example.com', data=memoryview(b'short body'))
+
+    [(headers, body)] = client.requests
+    assert 'Content-Encoding' not in headers
+    assert body == b'short body'
+
+
+async def test_async_chunked_body_is_compressed_while_streamed() -> None:
+    """An async iterable body is compressed chunk by chunk, and a buffer body is resent in full on a retry."""
+    client = StreamingHttpClientAsync(failures=1)
+
+    async def chunks() -> AsyncIterator[bytes]:
+        for index in range(5):
+            yield str(index).encode() * 1000
+
+    with pytest.raises(ApifyApiError):
+        await client.call(method='PUT', url='https://example.com', data=chunks())
+    await client.call(method='PUT', url='https://example.com', data=memoryview(b'x' * 5000))
+
+    assert [gzip.decompress(body) for _, body in client.requests] == [
+        b''.join(str(index).encode() * 1000 for index in range(5)),
+        b'x' * 5000,
+    ]
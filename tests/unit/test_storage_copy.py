@@ -0,0 +1,214 @@
+from __future__ import annotations
+
+import gzip
+import json
+import re
+from typing import TYPE_CHECKING
+
+import pytest
+from werkzeug import Request, Response
+
+from apify_client import ApifyClient, ApifyClientAsync
+from apify_client._resource_clients import dataset as dataset_module
+
+if TYPE_CHECKING:
+    from pytest_httpserver import HTTPServer
+
+
+@pytest.fixture
+def api_url(httpserver: HTTPServer) -> str:
+    """The base URL of the mock server, in the form the clients expect."""
+    return httpserver.url_for('/').removesuffix('/')
+
+
+def _request_body(request: Request) -> bytes:
+    body = request.get_data()
+    return gzip.decompress(body) if request.headers.get('Content-Encoding') == 'gzip' else body
+
+
+class _KeyValueStores:
+    """Serve key-value stores whose records are kept in memory, by store ID and key."""
+
+    def __init__(self, httpserver: HTTPServer) -> None:
+        self.records: dict[str, dict[str, tuple[bytes, str]]] = {'source': {}, 'target': {}}
+        httpserver.expect_request(re.compile(r'/v2/key-value-stores/\w+/keys')).respond_with_handler(self._list_keys)
+        httpserver.expect_request(re.compile(r'/v2/key-value-stores/\w+/records/.+')).respond_with_handler(
+            self._handle_record
+        )
+
+    def _list_keys(self, request: Request) -> Response:
+        store = self.records[request.path.split('/')[3]]
+        items = [
+            {'key': key, 'size': len(value), 'recordPublicUrl': 'https://example.com'}
+            for key, (value, _) in sorted(store.items())
+        ]
+        data = {'items': items, 'count': len(items), 'limit': 1000, 'isTruncated': False}
+        return Response(json.dumps({'data': data}), content_type='application/json')
+
+    def _handle_record(self, request: Request) -> Response:
+        _, _, _, store_id, _, key = request.path.split('/')
+        store = self.records[store_id]
+        if request.method == 'PUT':
+            store[key] = (_request_body(request), request.headers['Content-Type'])
+            return Response(status=201)
+        if key not in store:
+            return Response(json.dumps({'error': {'type': 'record-not-found', 'message': 'Not found'}}), status=404)
+        value, content_type = store[key]
+        return Response(value, content_type=content_type)
+
+
+def test_key_value_store_copy_to_sync(httpserver: HTTPServer, api_url: str) -> None:
+    """All the records are copied with their content types, and missing keys are reported."""
+    stores = _KeyValueStores(httpserver)
+    stores.records['source'] = {
+        'a': (b'{"a": 1}', 'application/json'),
+        'b': (b'x' * 100_000, 'application/octet-stream'),
+        'c': (b'hello', 'text/plain'),
+    }
+    client = ApifyClient(token='test_token', api_url=api_url)
+
+    results = client.key_value_store('source').copy_to(client.key_value_store('target'), max_parallel=2)
+    partial = client.key_value_store('source').copy_to(client.key_value_store('target'), keys=['c', 'missing'])
+
+    assert sorted(result.key for result in results if result.error is None) == ['a', 'b', 'c']
+    assert stores.records['target'] == stores.records['source']
+    assert [(result.key, type(result.error)) for result in sorted(partial, key=lambda r: r.key)] == [
+        ('c', type(None)),
+        ('missing', LookupError),
+    ]
+
+
+async def test_key_value_store_copy_to_async(httpserver: HTTPServer, api_url: str) -> None:
+    """The async client copies all the records of the store."""
+    stores = _KeyValueStores(httpserver)
+    stores.records['source'] = {f'key-{i}': (f'value {i}'.encode(), 'text/plain') for i in range(20)}
+    client = ApifyClientAsync(token='test_token', api_url=api_url)
+
+    results = await client.key_value_store('source').copy_to(client.key_value_store('target'), max_parallel=4)
+
+    assert len(results) == 20
+    assert all(result.error is None for result in results)
+    assert stores.records['target'] == stores.records['source']
+
+
+class _Datasets:
+    """Serve a source dataset as JSON Lines, and collect the items pushed to a target dataset."""
+
+    def __init__(self, httpserver: HTTPServer, items: list[dict]) -> None:
+        self.items = items
+        self.pushed: list[dict] = []
+        httpserver.expect_request('/v2/datasets/source/items', method='GET').respond_with_handler(self._list_items)
+        httpserver.expect_request('/v2/datasets/target/items', method='POST').respond_with_handler(self._push_items)
+
+    def _list_items(self, request: Request) -> Response:
+        offset = int(request.args.get('offset', 0))
+        body = b''.join(json.dumps(item).encode() + b'\n' for item in self.items[offset:])
+        return Response(body, content_type='application/jsonl')
+
+    def _push_items(self, request: Request) -> Response:
+        self.pushed.extend(json.loads(_request_body(request)))
+        return Response(status=201)
+
+
+def test_dataset_copy_to_sync(httpserver: HTTPServer, api_url: str, monkeypatch: pytest.MonkeyPatch) -> None:
+    """By default the items are copied in their order, one batch at a time."""
+    monkeypatch.setattr(dataset_module, 'PAYLOAD_SIZE_LIMIT_BYTES', 2000)
+    datasets = _Datasets(httpserver, [{'id': i, 'text': 'x' * 100} for i in range(500)])
+    client = ApifyClient(token='test_token', api_url=api_url)
+
+    copied = client.dataset('source').copy_to(client.dataset('target'))
+
+    assert copied == 500
+    assert datasets.pushed == datasets.items
+
+
+async def test_dataset_copy_to_async(httpserver: HTTPServer, api_url: str, monkeypatch: pytest.MonkeyPatch) -> None:
+    """The async client copies the items in their order by default, and all of them with parallel batches."""
+    monkeypatch.setattr(dataset_module, 'PAYLOAD_SIZE_LIMIT_BYTES', 1000)
+    datasets = _Datasets(httpserver, [{'id': i} for i in range(300)])
+    client = ApifyClientAsync(token='test_token', api_url=api_url)
+
+    copied = await client.dataset('source').copy_to(client.dataset('target'))
+    pushed_in_order = datasets.pushed
+    datasets.pushed = []
+    copied_in_parallel = await client.dataset('source').copy_to(client.dataset('target'), max_parallel=4)
+
+    assert copied == copied_in_parallel == 300
+    assert pushed_in_order == datasets.items
+    assert sorted(item['id'] for item in datasets.pushed) == list(range(300))
+
+
+class _RequestQueues:
+    """Serve the requests of a source queue page by page, and collect the requests added to a target queue."""
+
+    def __init__(self, httpserver: HTTPServer, requests: list[dict]) -> None:
+        self.requests = requests
+        self.added: list[dict] = []
+        httpserver.expect_request('/v2/request-queues/source/requests', method='GET').respond_with_handler(
+            self._list_requests
+        )
+        httpserver.expect_request('/v2/request-queues/target/requests/batch', method='POST').respond_with_handler(
+            self._add_requests
+        )
+
+    def _list_requests(self, request: Request) -> Response:
+        start = int(request.args.get('cursor', 0))
+        limit = int(request.args['limit'])
+        items = self.requests[start : start + limit]
+        next_cursor = str(start + limit) if start + limit < len(self.requests) else None
+        data = {'items': items, 'limit': limit, 'nextCursor': next_cursor}
+        return Response(json.dumps({'data': data}), content_type='application/json')
+
+    def _add_requests(self, request: Request) -> Response:
+        batch = json.loads(_request_body(request))
+        self.added.extend(batch)
+        processed = [
+            {
+                'requestId': f'id-{r["uniqueKey"]}',
+                'uniqueKey': r['uniqueKey'],
+                'wasAlreadyPresent': False,
+                'wasAlreadyHandled': False,
+            }
+            for r in batch
+        ]
+        data = {'processedRequests': processed, 'unprocessedRequests': []}
+        return Response(json.dumps({'data': data}), content_type='application/json')
+
+
+def _stored_requests(count: int) -> list[dict]:
+    return [
+        {
+            'id': f'source-{i}',
+            'uniqueKey': f'https://example.com/{i}',
+            'url': f'https://example.com/{i}',
+            'method': 'GET',
+            'userData': {'label': 'DETAIL'},
+            **({'handledAt': '2024-01-01T00:00:00.000Z'} if i % 2 else {}),
+        }
+        for i in range(count)
+    ]
+
+
+def test_request_queue_copy_to_sync(httpserver: HTTPServer, api_url: str) -> None:
+    """All the requests are added to the target queue with their state, but without their IDs."""
+    queues = _RequestQueues(httpserver, _stored_requests(2500))
+    client = ApifyClient(token='test_token', api_url=api_url)
+
+    result = client.request_queue('source').copy_to(client.request_queue('target'), max_parallel=2)
+
+    assert len(result.processed_requests) == 2500
+    assert not result.unprocessed_requests
+    assert sorted(r['uniqueKey'] for r in queues.added) == sorted(r['uniqueKey'] for r in queues.requests)
+    assert all('id' not in r and r['userData'] == {'label': 'DETAIL'} for r in queues.added)
+    assert sum('handledAt' in r for r in queues.added) == 1250
+
+
+async def test_request_queue_copy_to_async(httpserver: HTTPServer, api_url: str) -> None:
+    """The async client copies all the requests of the queue."""
+    queues = _RequestQueues(httpserver, _stored_requests(1200))
+    client = ApifyClientAsync(token='test_token', api_url=api_url)
+
+    result = await client.request_queue('source').copy_to(client.request_queue('target'))
+
+    assert len(result.processed_requests) == 1200
+    assert len(queues.added) == 1200
@@ -250,3 +250,66 @@ async def test_kvs_record_public_url_async(api_url: str, api_public_url: str | N
             f'{(api_public_url or DEFAULT_API_URL).strip("/")}/v2/key-value-stores/{MOCKED_KVS_ID}/'
             f'records/{key}{expected_signature}'
         )
+
+
+def test_kvs_records_public_urls_fetch_signing_key_once_sync() -> None:
+    """Bulk record URLs are signed locally after a single metadata fetch."""
+    client = ApifyClient(token='dummy-token')
+    kvs = client.key_value_store(MOCKED_KVS_ID)
+    keys = [f'key-{i}' for i in range(100)]
+
+    with mock.patch.object(
+        client._http_client, 'call', return_value=_get_mocked_kvs_response(signing_key='custom-signing-key')
+    ) as call:
+        urls = kvs.get_records_public_urls(keys)
+
+    assert call.call_count == 1
+    assert list(urls) == keys
+    assert urls['key-7'] == (
+        f'{DEFAULT_API_URL}/v2/key-value-stores/{MOCKED_KVS_ID}/records/key-7'
+        f'?signature={create_hmac_signature("custom-signing-key", "key-7")}'
+    )
+
+
+async def test_kvs_records_public_urls_async() -> None:
+    """Bulk record URLs are signed locally after a single metadata fetch, with the async client."""
+    client = ApifyClientAsync(token='dummy-token')
+    kvs = client.key_value_store(MOCKED_KVS_ID)
+
+    with mock.patch.object(
+        client._http_client, 'call', return_value=_get_mocked_kvs_response(signing_key='custom-signing-key')
+    ) as call:
+        urls = await kvs.get_records_public_urls(['a', 'b'])
+
+    assert call.call_count == 1
+    assert urls['b'].endswith(f'?signature={create_hmac_signature("custom-signing-key", "b")}')
+
+
+def test_signing_key_is_cached_per_storage_until_invalidated_sync() -> None:
+    """The signing key is shared by the clients of one storage and fetched again after invalidation."""
+    client = ApifyClient(token='dummy-token')
+    kvs = client.key_value_store(MOCKED_KVS_ID)
+
+    with mock.patch.object(
+        client._http_client, 'call', return_value=_get_mocked_kvs_response(signing_key='custom-signing-key')
+    ) as call:
+        kvs.get_record_public_url('a')
+        client.key_value_store(MOCKED_KVS_ID).get_record_public_url('b')
+        client.key_value_store(MOCKED_KVS_ID).create_keys_public_url()
+        assert call.call_count == 1
+
+        client.key_value_store('otherID').get_record_public_url('a')
+        assert call.call_count == 2
+
+        client.key_value_store(MOCKED_KVS_ID).invalidate_signing_key()
+        client.key_value_store(MOCKED_KVS_ID).get_record_public_url('a')
+        assert call.call_count == 3
+
+    # A separate client does not share the cache.
+    other_client = ApifyClient(token='other-token')
+    other_kvs = other_client.key_value_store(MOCKED_KVS_ID)
+    with mock.patch.object(
+        other_client._http_client, 'call', return_value=_get_mocked_kvs_response(signing_key=None)
+    ) as call:
+        assert 'signature' not in other_kvs.get_record_public_url('a')
+        assert call.call_count == 1